@@ -4,6 +4,21 @@ import cvzone
 import numpy as np
 from database import get_lesson, get_all_lessons, get_lesson_list, get_topics, get_lessons_for_topic
 import random
+import argparse
+import sys
+
+# Package engine (record/replay landmark, display, UI cache) ada di folder python/ repo ini.
+# Jalankan lewat run.py, atau set PYTHONPATH sendiri: PYTHONPATH=../python python main.py
+try:
+    import engine
+except ModuleNotFoundError:
+    sys.exit("[X] Package 'engine' tidak ditemukan: jalankan 'python run.py' "
+             "atau 'PYTHONPATH=../python python main.py' (lihat README.md)")
+from engine.hand_recording import (HandRecorder, HandReplay, ReplayHandDetector,
+                                   RecordingHandDetector, add_replay_arguments)
+from engine.display import Display
+from engine.ui_layer import UILayer
+from engine.text_cache import TEXT_CACHE, draw_text, text_size
 
 # --- KONFIGURASI ---
 CAP_WIDTH = 1280
@@ -12,13 +27,35 @@ BLOCK_SIZE = [180, 80]
 SNAP_THRESHOLD = 120 
 SHAKA_HOLD_FRAMES = 6  # require shaka held for this many frames before undo
 
+# --- OPSI COMMAND LINE ---
+# --record sesi.hlr  : rekam landmark tangan selama bermain
+# --replay sesi.hlr  : putar ulang rekaman (tanpa kamera)
+# --headless         : tanpa window, untuk test/benchmark replay
+parser = add_replay_arguments(argparse.ArgumentParser(description="Magic Hands English Learning"))
+parser.add_argument("--headless", action="store_true", help="Jalankan tanpa window (pakai dengan --replay)")
+args = parser.parse_args()
+
+# Window dibuat sekali; show() = imshow + waitKey (headless: tanpa window)
+display = Display("Magic Hands RPLO", CAP_WIDTH, CAP_HEIGHT, headless=args.headless)
+header_layer = UILayer("lesson header")
+
 # Inisialisasi Kamera
-cap = cv2.VideoCapture(0)
+if args.replay:
+    cap = HandReplay(args.replay, realtime=not args.headless)
+else:
+    cap = cv2.VideoCapture(0)
 cap.set(3, CAP_WIDTH)
 cap.set(4, CAP_HEIGHT)
 
 # Inisialisasi Detektor Tangan
-detector = HandDetector(detectionCon=0.8)
+if args.replay:
+    detector = ReplayHandDetector(cap)
+else:
+    detector = HandDetector(detectionCon=0.8)
+recorder = None
+if args.record:
+    recorder = HandRecorder(args.record, save_frames=args.record_frames)
+    detector = RecordingHandDetector(detector, recorder)
 
 # --- CLASS UNTUK KOTAK KATA ---
 class DragBlock:
@@ -79,10 +116,10 @@ def draw_shadowed_block(img, cx, cy, w, h, base_color, text, text_color=(255,255
     rounded_rect(img, (x1, y1), (x2, y2), base_color, radius=20)
     # Text centered
     font = cv2.FONT_HERSHEY_SIMPLEX
-    text_size = cv2.getTextSize(text, font, 1.0, 3)[0]
-    tx = cx - text_size[0] // 2
-    ty = cy + text_size[1] // 2
-    cv2.putText(img, text, (tx, ty), font, 1.0, text_color, 3, cv2.LINE_AA)
+    (text_w, text_h), _ = text_size(text, font, 1.0, 3)
+    tx = cx - text_w // 2
+    ty = cy + text_h // 2
+    draw_text(img, text, (tx, ty), font, 1.0, text_color, 3)
 
 def draw_banner(img, title, subtitle=None):
     # Top banner with soft gradient and rounded corners
@@ -100,9 +137,45 @@ def draw_banner(img, title, subtitle=None):
     # Rounded area overlay for banner
     rounded_rect(img, (20, 10), (w-20, 10+banner_h-10), (255,255,255), radius=30)
     # Title text
-    cv2.putText(img, title, (60, 60), cv2.FONT_HERSHEY_DUPLEX, 1.6, (40,40,120), 3, cv2.LINE_AA)
+    draw_text(img, title, (60, 60), cv2.FONT_HERSHEY_DUPLEX, 1.6, (40,40,120), 3)
     if subtitle:
-        cv2.putText(img, subtitle, (60, 60+36), cv2.FONT_HERSHEY_COMPLEX, 0.7, (80,80,140), 2, cv2.LINE_AA)
+        draw_text(img, subtitle, (60, 60+36), cv2.FONT_HERSHEY_COMPLEX, 0.7, (80,80,140), 2)
+
+
+def draw_lesson_header(img, lesson):
+    # Banner judul + pill deskripsi + pill instruksi (statis selama lesson sama)
+    draw_banner(img, lesson['title'])
+    # Description magenta pill inside banner
+    desc_text = lesson.get('description', '')
+    if desc_text:
+        magenta = (200, 0, 200)
+        desc_x1, desc_y1 = 40, 22
+        desc_x2, desc_y2 = CAP_WIDTH - 420, 78
+        rounded_rect(img, (desc_x1, desc_y1), (desc_x2, desc_y2), magenta, radius=18)
+        # Put description text (left aligned with some padding)
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        desc_scale = 0.9
+        desc_thickness = 2
+        # shorten if too long for space (basic trim)
+        max_width = desc_x2 - desc_x1 - 24
+        display_text = desc_text
+        while text_size(display_text, font, desc_scale, desc_thickness)[0][0] > max_width and len(display_text) > 4:
+            display_text = display_text[:-4] + '...'
+        tx = desc_x1 + 16
+        ty = desc_y1 + (desc_y2 - desc_y1)//2 + 8
+        draw_text(img, display_text, (tx, ty), font, desc_scale, (255,255,255), desc_thickness)
+
+    # Instruction pill (right side, smaller)
+    instr_color = (170, 220, 255)  # light blue
+    rounded_rect(img, (CAP_WIDTH - 420, 20), (CAP_WIDTH - 20, 80), instr_color, radius=20)
+    instr_text = "Tunjuk kata, keluarkan jari untuk masuk slot berikutnya"
+    it_font = cv2.FONT_HERSHEY_SIMPLEX
+    it_scale = 0.50
+    it_thickness = 2
+    it_h = text_size(instr_text, it_font, it_scale, it_thickness)[0][1]
+    it_x = CAP_WIDTH - 420 + 18
+    it_y = 20 + (80 - 20)//2 + it_h//2
+    draw_text(img, instr_text, (it_x, it_y), it_font, it_scale, (40,40,80), it_thickness)
 
 
 # --- FUNGSI UNTUK SETUP LESSON ---
@@ -188,19 +261,25 @@ def topic_selection_screen(cap, topics):
     while True:
         success, frame = cap.read()
         if not success:
+            # Rekaman replay sudah habis
+            if not cap.isOpened():
+                break
             continue
+        # Mirror seperti game loop: rekaman --record-frames selalu berisi frame yang sudah
+        # di-flip (HandReplay.read membalikkannya lagi), dan menunjuk terasa seperti cermin
+        frame = cv2.flip(frame, 1)
         h, w = frame.shape[:2]
         overlay = frame.copy()
         # header
         cv2.rectangle(overlay, (0, 0), (w, 80), (255, 240, 230), -1)
-        cv2.putText(overlay, 'Pilih Materi (Tekan 1-4 atau tunjuk dengan telunjuk):', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (30, 30, 30), 2)
+        draw_text(overlay, 'Pilih Materi (Tekan 1-4 atau tunjuk dengan telunjuk):', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (30, 30, 30), 2, line_type=cv2.LINE_8)
 
         # Draw buttons and track hover
         hover_key = None
         for idx, (key, title, (x1, y1, x2, y2)) in enumerate(buttons):
             rounded_rect(overlay, (x1, y1), (x2, y2), (200, 230, 255), radius=16)
             cv2.rectangle(overlay, (x1, y1), (x2, y2), (120, 160, 200), 3)
-            cv2.putText(overlay, f"{idx+1}. {title}", (x1 + 18, y1 + btn_h // 2 + 10), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (20, 20, 40), 2)
+            draw_text(overlay, f"{idx+1}. {title}", (x1 + 18, y1 + btn_h // 2 + 10), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (20, 20, 40), 2, line_type=cv2.LINE_8)
 
         # Hand detection for pointing selection
         try:
@@ -232,16 +311,15 @@ def topic_selection_screen(cap, topics):
                     hover_key = key
                     break
 
-        cv2.imshow("Magic Hands RPLO", overlay)
-
-        # Keyboard fallback
-        k = cv2.waitKey(30) & 0xFF
+        # Tampilkan + keyboard fallback
+        TEXT_CACHE.end_frame()
+        k = display.show(overlay, 30) & 0xFF
         if k in (ord('1'), ord('2'), ord('3'), ord('4')):
             sel_idx = (k - ord('1'))
             if 0 <= sel_idx < len(keys):
                 sel = keys[sel_idx]
                 break
-        if k == 27 or k == ord('q') or k == ord('Q'):
+        if k == 27 or k == ord('q') or k == ord('Q') or display.closed:
             sel = None
             break
 
@@ -257,6 +335,8 @@ def topic_selection_screen(cap, topics):
 selected_topic = topic_selection_screen(cap, topics)
 if selected_topic is None:
     print('No topic selected, exiting')
+    if recorder:
+        recorder.close()
     cap.release()
     cv2.destroyAllWindows()
     exit()
@@ -269,6 +349,8 @@ blocks, target_positions, current_lesson = setup_lesson(current_lesson_key)
 
 if blocks is None:
     print("Error: Tidak bisa load lesson!")
+    if recorder:
+        recorder.close()
     cap.release()
     cv2.destroyAllWindows()
     exit()
@@ -282,6 +364,7 @@ last_index_finger_up = False  # Frame-by-frame tracking untuk deteksi rising edg
 # Shaka debounce state
 shaka_frames = 0
 shaka_triggered = False
+correct_count = 0
 
 # --- GAME LOOP ---
 while True:
@@ -328,38 +411,9 @@ while True:
         pass 
 
     # 1. Gambar banner judul dan deskripsi (mirip screenshot pengguna)
-    draw_banner(img, current_lesson['title'])
-    # Description magenta pill inside banner
-    desc_text = current_lesson.get('description', '')
-    if desc_text:
-        magenta = (200, 0, 200)
-        desc_x1, desc_y1 = 40, 22
-        desc_x2, desc_y2 = CAP_WIDTH - 420, 78
-        rounded_rect(img, (desc_x1, desc_y1), (desc_x2, desc_y2), magenta, radius=18)
-        # Put description text (left aligned with some padding)
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        desc_scale = 0.9
-        desc_thickness = 2
-        # shorten if too long for space (basic trim)
-        max_width = desc_x2 - desc_x1 - 24
-        display_text = desc_text
-        while cv2.getTextSize(display_text, font, desc_scale, desc_thickness)[0][0] > max_width and len(display_text) > 4:
-            display_text = display_text[:-4] + '...'
-        tx = desc_x1 + 16
-        ty = desc_y1 + (desc_y2 - desc_y1)//2 + 8
-        cv2.putText(img, display_text, (tx, ty), font, desc_scale, (255,255,255), desc_thickness, cv2.LINE_AA)
-
-    # Instruction pill (right side, smaller)
-    instr_color = (170, 220, 255)  # light blue
-    rounded_rect(img, (CAP_WIDTH - 420, 20), (CAP_WIDTH - 20, 80), instr_color, radius=20)
-    instr_text = "Tunjuk kata, keluarkan jari untuk masuk slot berikutnya"
-    it_font = cv2.FONT_HERSHEY_SIMPLEX
-    it_scale = 0.50
-    it_thickness = 2
-    text_size = cv2.getTextSize(instr_text, it_font, it_scale, it_thickness)[0]
-    it_x = CAP_WIDTH - 420 + 18
-    it_y = 20 + (80 - 20)//2 + text_size[1]//2
-    cv2.putText(img, instr_text, (it_x, it_y), it_font, it_scale, (40,40,80), it_thickness, cv2.LINE_AA)
+    # Statis per lesson: dirender sekali ke retained UI layer, tiap frame cukup composite
+    header_layer.draw(img, current_lesson_key,
+                      lambda canvas: draw_lesson_header(canvas, current_lesson))
 
     # Gambar Target Area (rounded pastel slots)
     slot_colors = [(255,180,200),(180,220,255),(200,255,200),(255,230,180),(220,200,255)]
@@ -427,7 +481,7 @@ while True:
             by = int(cy - h//2 + 24)
             # use green badge and ASCII 'V' to avoid unsupported glyphs
             cv2.circle(img, (bx, by), 20, (0, 200, 0), cv2.FILLED)
-            cv2.putText(img, 'V', (bx-10, by+8), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255,255,255), 3, cv2.LINE_AA)
+            draw_text(img, 'V', (bx-10, by+8), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255,255,255), 3)
 
         if block.is_correct:
             correct_count += 1
@@ -436,12 +490,10 @@ while True:
     if correct_count == len(blocks):
         cvzone.putTextRect(img, "BENAR! GOOD JOB!", (300, 360), scale=4, thickness=3, colorR=(0, 255, 0))
 
-    # Tampilkan Layar
-    cv2.imshow("Magic Hands RPLO", img)
-    
-    # Keluar atau Reset
-    key = cv2.waitKey(1)
-    if key == ord('q') or key == 27:  # Q or ESC
+    # Tampilkan Layar + keluar atau reset
+    TEXT_CACHE.end_frame()
+    key = display.show(img)
+    if key == ord('q') or key == 27 or display.closed:  # Q, ESC atau window ditutup
         break
     elif key == ord('r'):
         placed_blocks = []
@@ -474,5 +526,11 @@ while True:
         shaka_frames = 0
         shaka_triggered = False
 
+print(f"[RESULT] lesson: {current_lesson_key}, placed: {len(placed_blocks)}, correct: {correct_count}")
+header_layer.report()
+TEXT_CACHE.report()
+display.report()
+if recorder:
+    recorder.close()
 cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+cv2.destroyAllWindows()
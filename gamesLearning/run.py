@@ -3,8 +3,13 @@ Script untuk menjalankan main.py dengan error handling
 Gunakan ini jika ada masalah dengan library yang belum terinstall
 """
 
+import os
 import sys
 import subprocess
+from pathlib import Path
+
+# main.py memakai package engine dari folder python/ di root repo
+ENGINE_PATH = Path(__file__).resolve().parents[1] / "python"
 
 # List library yang dibutuhkan
 REQUIRED_LIBRARIES = [
@@ -26,8 +31,14 @@ def check_and_install_libraries():
             subprocess.check_call([sys.executable, '-m', 'pip', 'install', lib])
             print(f"✓ {lib} berhasil diinstall")
 
-def run_application():
-    """Jalankan aplikasi"""
+def main_env():
+    """Environment untuk main.py: folder engine ditambahkan ke PYTHONPATH"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(ENGINE_PATH), env.get('PYTHONPATH')]))
+    return env
+
+def run_application(args=()):
+    """Jalankan aplikasi (args diteruskan ke main.py, mis. --replay sesi.hlr)"""
     print("\n" + "=" * 70)
     print("MEMULAI MAGIC HANDS ENGLISH LEARNING")
     print("=" * 70)
@@ -35,12 +46,16 @@ def run_application():
     print("\n" + "=" * 70 + "\n")
     
     try:
-        subprocess.run([sys.executable, 'main.py'])
+        subprocess.run([sys.executable, str(Path(__file__).with_name('main.py')), *args], env=main_env())
     except Exception as e:
         print(f"Error menjalankan aplikasi: {e}")
         print("\nPastikan kamera tersambung dan library terinstall dengan benar!")
 
 if __name__ == "__main__":
+    # Argumen diteruskan ke main.py tanpa prompt (mis. python run.py --replay sesi.hlr --headless)
+    if len(sys.argv) > 1:
+        run_application(sys.argv[1:])
+        sys.exit()
     check_and_install_libraries()
     print("\nSemua library siap!")
     input("\nTekan Enter untuk memulai aplikasi...")
@@ -0,0 +1,235 @@
+"""
+Import pipeline gambar untuk Guess Game.
+
+Author cukup memilih gambar ORIGINAL. Saat import, pipeline membuat:
+- salinan original di assets/guess_game/original/<hash isi>.<ext> (lihat asset_store.py:
+  gambar yang sama di-import ulang tidak disalin dan tidak diproses ulang)
+- beberapa level blur (paling blur -> paling jelas) untuk progressive reveal,
+  sudah seukuran kotak quiz 800x550
+- derivative display-size: quiz (800x550) dan result (900x600)
+
+Semua path dicatat di bank soal questions.db (field "assets", relatif ke
+assets/guess_game), sehingga game tidak perlu resize foto besar saat runtime.
+"blurred_image" tetap diisi (level paling blur) supaya data lama tetap kompatibel.
+
+Bulk import / migrasi berjalan di process pool; throughput, gambar yang sudah ada di
+store dan tambahan disk dilaporkan di akhir:
+    python asset_pipeline.py foto1.jpg foto2.png ...   # tambah soal baru
+    python asset_pipeline.py --migrate                 # buat derivative untuk soal lama
+"""
+
+import argparse
+import os
+import random
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import cv2
+
+from asset_store import ASSET_DIR, disk_usage, replace_atomic, store_file, touch
+from engine.image_cache import fit_size
+from question_bank import QuestionBank
+
+QUIZ_IMAGE_BOX = (800, 550)
+RESULT_IMAGE_BOX = (900, 600)
+# Sigma Gaussian blur (pixel, di ukuran quiz). Index 0 = paling blur
+BLUR_SIGMAS = (24, 14, 8, 4)
+JPEG_QUALITY = 90
+
+
+def _resize_to_box(img, box):
+    img_h, img_w = img.shape[:2]
+    return cv2.resize(img, fit_size(img_w, img_h, *box), interpolation=cv2.INTER_AREA)
+
+
+def _write(img, path):
+    """Tulis JPEG lewat file sementara (worker lain yang memproses gambar yang sama tidak
+    pernah melihat file setengah jadi)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.stem}.{os.getpid()}.tmp{path.suffix}")
+    if not cv2.imwrite(str(tmp), img, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]):
+        raise IOError(f"Cannot write {path}")
+    replace_atomic(tmp, path)
+
+
+def derivative_names(original_name):
+    """Dict "assets" (path relatif ke asset_dir) untuk original_name, tanpa membuat file"""
+    stem = Path(original_name).stem
+    if stem.startswith("original_"):
+        stem = stem[len("original_"):]
+    return {
+        "quiz": f"derived/{stem}_quiz.jpg",
+        "result": f"derived/{stem}_result.jpg",
+        "blur_levels": [f"derived/{stem}_blur{i}.jpg" for i in range(len(BLUR_SIGMAS))],
+    }
+
+
+def build_derivatives(original_name, asset_dir=ASSET_DIR):
+    """Buat blur levels + derivative display-size dari assets/original/<original_name>.
+
+    Return dict "assets" (path relatif ke asset_dir).
+    """
+    asset_dir = Path(asset_dir)
+    img = cv2.imread(str(asset_dir / "original" / original_name))
+    if img is None:
+        raise ValueError(f"Cannot read image: {original_name}")
+
+    quiz = _resize_to_box(img, QUIZ_IMAGE_BOX)
+    result = _resize_to_box(img, RESULT_IMAGE_BOX)
+    assets = derivative_names(original_name)
+    _write(quiz, asset_dir / assets["quiz"])
+    _write(result, asset_dir / assets["result"])
+    for name, sigma in zip(assets["blur_levels"], BLUR_SIGMAS):
+        _write(cv2.GaussianBlur(quiz, (0, 0), sigma), asset_dir / name)
+    return assets
+
+
+def import_image(src_path, asset_dir=ASSET_DIR):
+    """Copy satu gambar original ke assets lalu buat semua derivative-nya.
+
+    Fungsi top-level (picklable) supaya bisa dijalankan di process pool.
+    Return dict field gambar untuk soal guess (lihat make_question), plus "reused"
+    (isi gambar sudah ada di store: tidak ada yang disalin atau diproses).
+    """
+    asset_dir = Path(asset_dir)
+    start = time.perf_counter()
+    original_name, copied = store_file(src_path, "original", asset_dir)
+
+    # Derivative bernama hash: jika semuanya sudah ada, gambar ini pernah di-import
+    assets = derivative_names(original_name)
+    blurred_name = f"{Path(original_name).stem}.jpg"
+    outputs = [asset_dir / assets["quiz"], asset_dir / assets["result"], asset_dir / "blurred" / blurred_name]
+    outputs += [asset_dir / name for name in assets["blur_levels"]]
+    missing = [path for path in outputs if not path.exists()]
+    if missing:
+        build_derivatives(original_name, asset_dir)
+        # Level paling blur juga disimpan di blurred/ untuk kompatibilitas format lama
+        blurred = asset_dir / "blurred" / blurred_name
+        blurred.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blurred.with_name(f".{blurred_name}.{os.getpid()}.tmp")
+        shutil.copyfile(asset_dir / assets["blur_levels"][0], tmp)
+        replace_atomic(tmp, blurred)
+    else:
+        # Dipakai ulang: mtime baru supaya --gc tidak membuangnya sebelum soal disimpan
+        touch(outputs)
+    return {
+        "blurred_image": blurred_name,
+        "original_image": original_name,
+        "assets": assets,
+        "reused": not missing and copied == 0,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _migrate_one(original_name, asset_dir):
+    start = time.perf_counter()
+    assets = build_derivatives(original_name, asset_dir)
+    return {"assets": assets, "seconds": time.perf_counter() - start}
+
+
+def run_pool(func, items, workers=None, progress=None):
+    """Jalankan func(item, ASSET_DIR) di process pool. Return list hasil (urutan sama dengan items).
+
+    Item yang gagal menghasilkan exception object di posisi yang sama.
+    """
+    results = [None] * len(items)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(func, item, str(ASSET_DIR)): i for i, item in enumerate(items)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = e
+            if progress:
+                progress(done, len(items))
+    return results
+
+
+def report_import(results, seconds, usage_before, asset_dir=ASSET_DIR):
+    """Print ringkasan bulk import: throughput, gambar yang sudah ada di store (dedup),
+    pemakaian disk. usage_before = disk_usage() sebelum import. Return teks satu baris"""
+    ok = [r for r in results if not isinstance(r, Exception)]
+    reused = sum(1 for r in ok if r.get("reused"))
+    files, total = disk_usage(asset_dir)
+    added = total - usage_before[1]
+    if ok:
+        per_image = sum(r["seconds"] for r in ok) / len(ok)
+        print(f"[STATS] {len(ok)}/{len(results)} images processed in {seconds:.2f} s "
+              f"({len(ok) / max(seconds, 1e-9):.1f} images/s, {per_image * 1000:.0f} ms/image per worker)")
+    print(f"[STATS] Asset store: {reused} images already stored (deduplicated), "
+          f"+{added / 1e6:.1f} MB in {files - usage_before[0]} new files, "
+          f"total {total / 1e6:.1f} MB in {files} files")
+    return (f"{len(ok)} images in {seconds:.1f} s, {reused} already stored, "
+            f"+{added / 1e6:.1f} MB (store {total / 1e6:.1f} MB)")
+
+
+def answer_from_filename(path):
+    """Tebakan jawaban dari nama file: 'golden_retriever.jpg' -> 'Golden Retriever'"""
+    return Path(path).stem.replace("_", " ").replace("-", " ").strip().title()
+
+
+def make_question(imported, answer, answer_pool):
+    """Soal baru dengan 3 opsi pengecoh dari jawaban lain (bisa diedit di editor)"""
+    distractors = [a for a in dict.fromkeys(answer_pool) if a and a != answer]
+    random.shuffle(distractors)
+    options = [answer] + distractors[:3]
+    while len(options) < 4:
+        options.append(f"Option {len(options) + 1}")
+    return {
+        "blurred_image": imported["blurred_image"],
+        "original_image": imported["original_image"],
+        "assets": imported["assets"],
+        "options": options,
+        "correct_answer": answer,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Guess Game asset import pipeline")
+    parser.add_argument("images", nargs="*", help="Gambar original yang akan di-import sebagai soal baru")
+    parser.add_argument("--migrate", action="store_true",
+                        help="Buat derivative untuk soal di bank soal yang belum punya")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: jumlah CPU)")
+    args = parser.parse_args()
+
+    bank = QuestionBank()
+    usage_before = disk_usage()
+    wall_start = time.perf_counter()
+
+    if args.migrate:
+        todo = [q for q in map(bank.get_guess, bank.guess_ids())
+                if "assets" not in q and q.get("original_image")]
+        print(f"[*] Migrating {len(todo)} questions...")
+        results = run_pool(_migrate_one, [q["original_image"] for q in todo], args.workers)
+        for question, result in zip(todo, results):
+            if isinstance(result, Exception):
+                print(f"[X] {question['original_image']}: {result}")
+                continue
+            # blurred_image lama (buatan author) dibiarkan, game memakai blur_levels
+            question["assets"] = result["assets"]
+            bank.update_guess(question["id"], question)
+    else:
+        if not args.images:
+            parser.error("give image files to import, or --migrate")
+        print(f"[*] Importing {len(args.images)} images...")
+        results = run_pool(import_image, args.images, args.workers)
+        pool = bank.guess_answers() + [answer_from_filename(p) for p in args.images]
+        questions = []
+        for path, result in zip(args.images, results):
+            if isinstance(result, Exception):
+                print(f"[X] {path}: {result}")
+                continue
+            questions.append(make_question(result, answer_from_filename(path), pool))
+        # Semua soal baru dalam satu transaksi
+        bank.add_guesses(questions)
+
+    report_import(results, time.perf_counter() - wall_start, usage_before)
+    print(f"[OK] Saved {bank.count_guess()} questions to {bank.path}")
+    bank.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Penyimpanan asset gambar Guess Game berbasis isi (content-addressed).
+
+Dulu editor menyalin gambar sebagai blurred_<detik>_<nama> / original_<detik>_<nama>:
+gambar yang sama di-import dua kali tersimpan dua kali, dan dua import di detik yang
+sama bisa bertabrakan. Sekarang nama file = hash isi gambar (blake2b), jadi:
+- satu salinan per isi, import ulang cukup memakai file yang sudah ada
+- derivative (blur levels, display-size) ikut bernama hash, tidak dibuat ulang
+- tidak ada tabrakan nama; file ditulis ke file sementara lalu os.replace
+
+Jumlah referensi dihitung dari bank soal (questions.db adalah sumber kebenaran):
+file di assets/guess_game yang tidak dipakai soal mana pun = orphan (mis. soal
+dihapus, atau gambar di-import tapi soal tidak disimpan) dan bisa dibuang dengan --gc.
+File asset lama (nama timestamp) tetap berlaku dan ikut dihitung.
+
+Contoh:
+    python asset_store.py --stats                 # ukuran store, referensi, orphan
+    python asset_store.py --gc --dry-run          # daftar orphan tanpa menghapus
+    python asset_store.py --gc                    # hapus orphan (dan thumbnail-nya) yang lebih tua dari 1 jam
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import time
+from collections import Counter
+from pathlib import Path
+
+from question_bank import QuestionBank
+
+BASE_DIR = Path(__file__).parent
+ASSET_DIR = BASE_DIR / "assets" / "guess_game"
+
+# Folder di ASSET_DIR yang dikelola store
+STORE_FOLDERS = ("original", "blurred", "derived")
+HASH_CHUNK = 1 << 20
+# Orphan yang lebih muda dari ini tidak dibuang: bisa jadi import editor yang soalnya
+# belum disimpan (import ulang file yang sudah ada memperbarui mtime-nya, lihat touch)
+GC_MIN_AGE = 3600
+# Ekstensi dengan isi format yang sama -> satu nama per hash
+SUFFIX_ALIASES = {".jpeg": ".jpg", ".jpe": ".jpg", ".tif": ".tiff"}
+
+
+def content_hash(path):
+    """Hash isi file (hex), dibaca per chunk"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def replace_atomic(tmp, path):
+    """Pasang file sementara di path (rename atomic). Menimpa file dengan nama yang sama
+    aman karena nama = hash isi; file sementara dibuang jika rename gagal"""
+    try:
+        os.replace(tmp, path)
+    finally:
+        if Path(tmp).exists():
+            os.unlink(tmp)
+
+
+def touch(paths):
+    """Perbarui mtime file yang dipakai ulang oleh import, supaya --gc menganggapnya baru"""
+    for path in paths:
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+
+def store_file(src, folder, asset_dir=ASSET_DIR):
+    """Simpan salinan src di asset_dir/folder dengan nama <hash><ext>.
+
+    Return (nama file, byte yang ditambahkan ke disk); 0 byte jika isi yang sama sudah ada.
+    """
+    src = Path(src)
+    target_dir = Path(asset_dir) / folder
+    target_dir.mkdir(parents=True, exist_ok=True)
+    suffix = src.suffix.lower()
+    name = f"{content_hash(src)}{SUFFIX_ALIASES.get(suffix, suffix)}"
+    target = target_dir / name
+    if target.exists():
+        touch([target])
+        return name, 0
+    tmp = target_dir / f".{name}.{os.getpid()}.tmp"
+    shutil.copyfile(src, tmp)
+    replace_atomic(tmp, target)
+    return name, target.stat().st_size
+
+
+def question_refs(question):
+    """Path (relatif ke asset_dir) semua file yang dipakai satu soal guess"""
+    refs = []
+    if question.get("blurred_image"):
+        refs.append(f"blurred/{question['blurred_image']}")
+    if question.get("original_image"):
+        refs.append(f"original/{question['original_image']}")
+    assets = question.get("assets") or {}
+    for key in ("quiz", "result"):
+        if assets.get(key):
+            refs.append(assets[key])
+    refs.extend(assets.get("blur_levels", []))
+    return refs
+
+
+def asset_refs(bank):
+    """Counter path relatif -> jumlah soal yang memakainya"""
+    refs = Counter()
+    for question_id in bank.guess_ids():
+        refs.update(set(question_refs(bank.get_guess(question_id))))
+    return refs
+
+
+def stored_files(asset_dir=ASSET_DIR):
+    """{path relatif: os.stat} semua file di folder store (file sementara dilewati)"""
+    asset_dir = Path(asset_dir)
+    files = {}
+    for folder in STORE_FOLDERS:
+        if not (asset_dir / folder).is_dir():
+            continue
+        for entry in os.scandir(asset_dir / folder):
+            if entry.is_file() and not entry.name.startswith("."):
+                files[f"{folder}/{entry.name}"] = entry.stat()
+    return files
+
+
+def disk_usage(asset_dir=ASSET_DIR):
+    """(jumlah file, total byte) di store"""
+    files = stored_files(asset_dir)
+    return len(files), sum(st.st_size for st in files.values())
+
+
+def find_orphans(bank, asset_dir=ASSET_DIR, min_age=GC_MIN_AGE):
+    """File store tanpa referensi dari bank soal, lebih tua dari min_age detik"""
+    refs = asset_refs(bank)
+    cutoff = time.time() - min_age
+    return {name: st for name, st in stored_files(asset_dir).items()
+            if name not in refs and st.st_mtime < cutoff}
+
+
+def collect_garbage(bank, asset_dir=ASSET_DIR, min_age=GC_MIN_AGE, dry_run=False, verbose=True):
+    """Hapus orphan. Return (jumlah file, byte) yang dihapus (atau akan dihapus jika dry_run)"""
+    orphans = find_orphans(bank, asset_dir, min_age)
+    freed = 0
+    for name, st in sorted(orphans.items()):
+        if verbose:
+            print(f"[*] {'Orphan' if dry_run else 'Removing'}: {name} ({st.st_size / 1024:.0f} KB)")
+        if not dry_run:
+            try:
+                os.unlink(Path(asset_dir) / name)
+            except FileNotFoundError:
+                continue
+        freed += st.st_size
+    return len(orphans), freed
+
+
+def report_store(bank, asset_dir=ASSET_DIR):
+    refs = asset_refs(bank)
+    files = stored_files(asset_dir)
+    total = sum(st.st_size for st in files.values())
+    orphans = [name for name in files if name not in refs]
+    missing = [name for name in refs if name not in files]
+    shared = sum(1 for count in refs.values() if count > 1)
+    print(f"[STATS] Asset store {Path(asset_dir).name}: {len(files)} files, {total / 1e6:.1f} MB; "
+          f"{len(refs)} referenced by {bank.count_guess()} questions ({shared} shared)")
+    print(f"[STATS] Orphans: {len(orphans)} files, "
+          f"{sum(files[name].st_size for name in orphans) / 1e6:.1f} MB (python asset_store.py --gc)")
+    if missing:
+        print(f"[!] {len(missing)} referenced files are missing, e.g. {missing[0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed Guess Game asset store")
+    parser.add_argument("--stats", action="store_true", help="Ukuran store, referensi, orphan")
+    parser.add_argument("--gc", action="store_true", help="Hapus file yang tidak dipakai soal mana pun")
+    parser.add_argument("--dry-run", action="store_true", help="Dengan --gc: hanya tampilkan orphan")
+    parser.add_argument("--min-age", type=float, default=GC_MIN_AGE,
+                        help="Dengan --gc: hanya orphan yang lebih tua dari ini (detik)")
+    parser.add_argument("--db", default=None, help="Path questions.db (default: bank soal game)")
+    args = parser.parse_args()
+
+    bank = QuestionBank(args.db) if args.db else QuestionBank()
+    if args.gc:
+        count, freed = collect_garbage(bank, min_age=args.min_age, dry_run=args.dry_run)
+        verb = "Would free" if args.dry_run else "Freed"
+        print(f"[OK] {verb} {freed / 1e6:.1f} MB in {count} orphan files")
+        # Thumbnail editor untuk gambar yang sudah tidak ada (import lokal: thumbnails
+        # memakai content_hash dari modul ini)
+        from thumbnails import ThumbnailCache
+        thumbs = ThumbnailCache(workers=1)
+        count, freed = thumbs.collect_garbage(min_age=args.min_age, dry_run=args.dry_run)
+        thumbs.close()
+        print(f"[OK] {verb} {freed / 1e6:.1f} MB in {count} orphan thumbnails")
+    if args.stats or not args.gc:
+        report_store(bank)
+    bank.close()
+
+
+if __name__ == "__main__":
+    main()
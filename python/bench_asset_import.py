@@ -0,0 +1,108 @@
+"""
+Benchmark bulk import Guess Game ke asset store content-addressed (asset_store.py).
+
+Foto sintetis (default 120 unik, 1600x1200) di-import sebagai satu batch di mana setiap
+foto muncul dua kali (mis. folder yang sama dipilih dua kali), lalu batch yang sama
+di-import ulang. Diukur throughput (process pool, seperti editor) dan pemakaian disk
+dibanding tanpa dedup (setiap import menyimpan salinan + derivative sendiri, seperti
+penamaan timestamp yang lama). Terakhir: soal hanya dibuat untuk separuh foto, lalu
+--gc membuang asset sisanya (orphan).
+
+Contoh:
+    python bench_asset_import.py
+    python bench_asset_import.py --images 300 --workers 4
+"""
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from asset_pipeline import import_image, make_question
+from asset_store import asset_refs, collect_garbage, disk_usage, question_refs
+from question_bank import QuestionBank
+
+
+def make_images(folder, count, size):
+    """Foto sintetis unik: gradient + warna dasar acak + nomor"""
+    rng = np.random.default_rng(0)
+    w, h = size
+    yy, xx = np.mgrid[0:h, 0:w]
+    gradient = np.stack([(xx * (c + 1) // 8 + yy // (c + 2)) % 256 for c in range(3)], axis=2).astype(np.uint8)
+    paths = []
+    for i in range(count):
+        img = Image.fromarray(gradient + rng.integers(0, 256, 3).astype(np.uint8))
+        ImageDraw.Draw(img).text((w // 3, h // 3), f"#{i}", fill=(255, 255, 255))
+        path = folder / f"photo_{i:04d}.jpg"
+        img.save(path, "JPEG", quality=90)
+        paths.append(path)
+    return paths
+
+
+def bulk_import(paths, asset_dir, workers):
+    """Seperti run_pool, dengan asset_dir sementara. Return (hasil, detik, byte ditambahkan)"""
+    before = disk_usage(asset_dir)[1]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(import_image, paths, [str(asset_dir)] * len(paths)))
+    return results, time.perf_counter() - start, disk_usage(asset_dir)[1] - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import throughput and disk use with deduplication")
+    parser.add_argument("--images", type=int, default=120)
+    parser.add_argument("--size", default="1600x1200", help="Ukuran foto sintetis WxH")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.split("x"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "photos").mkdir()
+        asset_dir = tmp / "guess_game"
+        photos = make_images(tmp / "photos", args.images, size)
+        # Setiap foto dua kali dalam satu batch
+        batch = photos + photos
+
+        rows = []
+        for name in ("first import", "re-import"):
+            results, seconds, added = bulk_import(batch, asset_dir, args.workers)
+            reused = sum(1 for r in results if r["reused"])
+            rows.append((name, len(results), seconds, reused, added))
+
+        # Tanpa dedup: setiap import = original + semua derivative-nya sendiri
+        files, total = disk_usage(asset_dir)
+        per_import = total / len(photos)
+        imports = sum(row[1] for row in rows)
+
+        # Soal hanya untuk separuh foto; sisanya orphan
+        bank = QuestionBank(tmp / "questions.db", tmp / "none.json", tmp / "none.json")
+        half = results[:len(photos) // 2]
+        bank.add_guesses([make_question(r, f"Photo {i}", ["A", "B", "C"]) for i, r in enumerate(half)])
+        refs = asset_refs(bank)
+        referenced = len({ref for r in half for ref in question_refs(r)})
+        start = time.perf_counter()
+        removed, freed = collect_garbage(bank, asset_dir, min_age=0, verbose=False)
+        gc_ms = (time.perf_counter() - start) * 1000
+        files_after, total_after = disk_usage(asset_dir)
+        bank.close()
+
+    print("\n" + "=" * 72)
+    print(f"{'batch':<14} {'images':>7} {'time':>8} {'images/s':>9} {'reused':>7} {'disk added':>11}")
+    for name, count, seconds, reused, added in rows:
+        print(f"{name:<14} {count:>7} {seconds:>6.2f} s {count / seconds:>9.1f} {reused:>7} "
+              f"{added / 1e6:>8.1f} MB")
+    print(f"store: {files} files, {total / 1e6:.1f} MB for {imports} imports of {len(photos)} photos "
+          f"(without dedup: {per_import * imports / 1e6:.1f} MB)")
+    print(f"gc: {len(half)} questions reference {len(refs)} files ({referenced} expected); "
+          f"removed {removed} orphans, {freed / 1e6:.1f} MB in {gc_ms:.0f} ms -> "
+          f"{files_after} files, {total_after / 1e6:.1f} MB")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
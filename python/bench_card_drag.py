@@ -0,0 +1,121 @@
+"""
+Benchmark drag-and-drop word card: biaya render per frame selama animasi reflow,
+terhadap jumlah card di baris jawaban.
+
+Satu card di-drag bolak-balik di atas baris jawaban yang sudah berisi N-1 card, jadi
+celah sisip berpindah terus dan semua card di baris terus meluncur (animasi aktif di
+hampir setiap frame). Diukur untuk:
+- redraw: setiap card yang bergerak = objek Button baru di posisinya + draw() (kotak dan
+  teks digambar ulang setiap frame, seperti update_answer_display yang lama)
+- sprite: card dari SpriteCache, hanya ditempel di posisi animasinya
+
+Contoh:
+    python bench_card_drag.py
+    python bench_card_drag.py --frames 600 --cards 4 8 12
+"""
+
+import argparse
+import random
+
+import numpy as np
+
+from engine import GameLoop
+from engine.hand_tracking import Landmark, TrackedHand
+from engine.layout import REF_HEIGHT, REF_WIDTH
+from engine.perf_stats import TimingStats
+from engine.text_cache import TEXT_CACHE
+
+
+def make_hand(x, y, pinching):
+    """Tangan sintetis di koordinat desain: telunjuk di (x, y), jempol dekat saat pinch"""
+    nx, ny = x / REF_WIDTH, y / REF_HEIGHT
+    landmark = [Landmark(nx, ny + 0.1, 0.0)] * 21
+    landmark[8] = Landmark(nx, ny, 0.0)
+    landmark[4] = Landmark(nx + (0.005 if pinching else 0.06), ny, 0.0)
+    return TrackedHand(landmark, "Right", 0.9)
+
+
+def make_game(count, redraw):
+    from quiz_game import Button, QuizGame
+
+    class RedrawQuiz(QuizGame):
+        def draw_card(self, frame, btn, x, y):
+            card = Button(int(x), int(y), btn.width, btn.height, btn.text, btn.id)
+            card.hovered, card.selected = btn.hovered, btn.selected
+            card.draw(frame)
+
+    random.seed(0)
+    game = (RedrawQuiz if redraw else QuizGame)(sampler_path=None)
+    game.current_category, game.current_difficulty = "Present", "easy"
+    game.start_quiz()
+    game.time_limit = 10 ** 6
+    # Soal sintetis dengan count kata; count - 1 kata sudah ada di baris jawaban
+    game.available_words = [f"word{i}" for i in range(count)]
+    game.buttons = []
+    game.create_word_buttons()
+    player = game.players[0]
+    for i in range(count - 1):
+        game.insert_answer(player, i, i, (game.buttons[i].x, game.buttons[i].y))
+    game.sync_word_selection()
+    return game
+
+
+def run(count, redraw, frames, n):
+    game = make_game(count, redraw)
+    loop = GameLoop(game)
+    source = game.buttons[-1]
+    start = (source.x + source.width // 2, source.y + source.height // 2)
+    row_y = game.answer_row_y(game.players[0]) + 35
+    slots = game.answer_slots(game.players[0], count)
+    left, right = slots[0], slots[-1] + 140
+
+    stats = TimingStats("render")
+    for i in range(n):
+        if i < 5:
+            # Pinch di word card terakhir lalu angkat
+            hand = make_hand(*start, i >= 2)
+        elif i < 15:
+            u = (i - 5) / 10
+            hand = make_hand(start[0] + (left - start[0]) * u, start[1] + (row_y - start[1]) * u, True)
+        else:
+            # Bolak-balik sepanjang baris, sekitar satu slot setiap 3 frame
+            period = max(2, 6 * count)
+            phase = (i - 15) % period / period
+            x = left + (right - left) * (1 - abs(2 * phase - 1))
+            hand = make_hand(x, row_y, True)
+        frame = frames[i % len(frames)].copy()
+        loop.frame(frame, hand, i / 30.0)
+        TEXT_CACHE.end_frame()
+        if i >= 15:
+            stats.add(loop.render_stats.samples[-1])
+    return stats.summary(), game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drag-and-drop reflow animation cost vs number of cards")
+    parser.add_argument("--frames", type=int, default=400)
+    parser.add_argument("--cards", type=int, nargs="+", default=[4, 8, 12])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (REF_HEIGHT, REF_WIDTH, 3), dtype=np.uint8) for _ in range(4)]
+
+    rows = []
+    for count in args.cards:
+        for redraw in (True, False):
+            summary, game = run(count, redraw, frames, args.frames)
+            rows.append((count, redraw, summary, game))
+
+    print("\n" + "=" * 74)
+    print(f"{'cards':>6} {'cards drawn by':<16} {'render avg':>11} {'p95':>9} {'max':>9} {'sprites':>9}")
+    for count, redraw, summary, game in rows:
+        sprites = "-" if redraw else str(game.card_sprites.misses)
+        print(f"{count:>6} {'redraw' if redraw else 'sprite':<16} {summary['avg_ms']:>8.2f} ms "
+              f"{summary['p95_ms']:>6.2f} ms {summary['max_ms']:>6.2f} ms {sprites:>9}")
+    print("(render = seluruh layar soal 1920x1080 saat card di-drag dan baris jawaban meluncur;\n"
+          " sprites = jumlah sprite yang dirender selama benchmark)")
+    print("=" * 74)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark overhead window per frame: pola lama (namedWindow + resizeWindow +
+imshow + waitKey setiap frame) vs Display.show() (window dibuat sekali).
+
+Contoh:
+    python bench_display.py --frames 300
+    QT_QPA_PLATFORM=offscreen python bench_display.py   # tanpa layar (build OpenCV Qt)
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from engine.display import Display
+from engine.perf_stats import TimingStats
+
+
+def make_frames(width, height, count=8):
+    """Beberapa frame berbeda supaya imshow benar-benar meng-upload gambar baru"""
+    frames = []
+    for i in range(count):
+        frame = np.full((height, width, 3), 30 + i * 10, dtype=np.uint8)
+        cv2.putText(frame, f"frame {i}", (100, 200), cv2.FONT_HERSHEY_DUPLEX, 3, (255, 255, 255), 4)
+        frames.append(frame)
+    return frames
+
+
+def run_legacy(frames, n, width, height):
+    stats = TimingStats("legacy: namedWindow+resizeWindow+imshow+waitKey")
+    title = "bench legacy"
+    for i in range(n):
+        start = time.perf_counter()
+        cv2.namedWindow(title, cv2.WINDOW_NORMAL)
+        cv2.resizeWindow(title, width, height)
+        cv2.imshow(title, frames[i % len(frames)])
+        cv2.waitKey(1)
+        stats.add(time.perf_counter() - start)
+    cv2.destroyWindow(title)
+    return stats
+
+
+def run_display(frames, n, width, height):
+    display = Display("bench display", width, height)
+    stats = TimingStats("Display.show (imshow+waitKey)")
+    for i in range(n):
+        start = time.perf_counter()
+        display.show(frames[i % len(frames)])
+        stats.add(time.perf_counter() - start)
+    display.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-frame window overhead benchmark")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    frames = make_frames(args.width, args.height)
+    # Warm-up: pembuatan window pertama kali tidak ikut diukur
+    run_display(frames, 10, args.width, args.height)
+
+    legacy = run_legacy(frames, args.frames, args.width, args.height)
+    current = run_display(frames, args.frames, args.width, args.height)
+
+    print("\n" + "=" * 70)
+    legacy.report()
+    current.report()
+    saved = legacy.summary()["avg_ms"] - current.summary()["avg_ms"]
+    print(f"[STATS] Removed per-frame overhead: {saved:.3f} ms/frame "
+          f"({saved * 30:.1f} ms per second at 30 FPS)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark preview gambar di editor Tk: latency saat soal dipilih, dengan 1000 gambar.
+
+Gambar sintetis (default 1000 JPEG 3000x2000, semuanya berbeda) dibuat di folder
+sementara, lalu setiap gambar "dipilih" sekali dalam urutan acak. Yang diukur adalah
+kerja di event thread Tk sampai gambar siap untuk ImageTk.PhotoImage (PhotoImage sendiri
+butuh window Tk dan biayanya sama untuk kedua cara: gambar sudah 200x150):
+- full-size: Image.open + thumbnail((200, 150)) (cara lama)
+- cache: ThumbnailCache.get + buka JPEG thumbnail (setelah prefetch di background)
+Juga diukur: waktu prefetch (thread pool) untuk semua gambar, dan pembukaan editor
+berikutnya (index.json sudah ada, tidak ada gambar yang di-decode).
+
+Contoh:
+    python bench_editor_preview.py
+    python bench_editor_preview.py --images 200 --size 4000x3000
+"""
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from engine.perf_stats import TimingStats
+from thumbnails import THUMB_SIZE, ThumbnailCache
+
+
+def make_images(folder, count, size):
+    """Foto sintetis: gradient halus + warna dasar acak + nomor, supaya setiap file (dan hash-nya) unik"""
+    rng = np.random.default_rng(0)
+    w, h = size
+    yy, xx = np.mgrid[0:h, 0:w]
+    gradient = np.stack([(xx * (c + 1) // 16 + yy // (c + 2)) % 256 for c in range(3)], axis=2).astype(np.uint8)
+    paths = []
+    for i in range(count):
+        img = gradient + rng.integers(0, 256, 3).astype(np.uint8)
+        img = Image.fromarray(img)
+        ImageDraw.Draw(img).text((w // 3, h // 3), f"#{i}", fill=(255, 255, 255))
+        path = folder / f"original_{i:04d}.jpg"
+        img.save(path, "JPEG", quality=90)
+        paths.append(path)
+    return paths
+
+
+def select_full(path):
+    img = Image.open(path)
+    img.thumbnail(THUMB_SIZE)
+    img.load()
+    return img
+
+
+def select_cached(thumbs, path):
+    with Image.open(thumbs.get(path)) as img:
+        img.load()
+        return img
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Editor preview latency: full-size decode vs thumbnail cache")
+    parser.add_argument("--images", type=int, default=1000)
+    parser.add_argument("--size", default="3000x2000", help="Ukuran gambar sintetis WxH")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.split("x"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "original").mkdir()
+        start = time.perf_counter()
+        paths = make_images(tmp / "original", args.images, size)
+        disk_mb = sum(p.stat().st_size for p in paths) / 1e6
+        print(f"[*] {len(paths)} images {size[0]}x{size[1]} ({disk_mb:.0f} MB) "
+              f"in {time.perf_counter() - start:.1f} s")
+        order = random.Random(0).sample(paths, len(paths))
+
+        full = TimingStats("full-size")
+        for path in order:
+            start = time.perf_counter()
+            select_full(path)
+            full.add(time.perf_counter() - start)
+
+        # Editor dibuka: prefetch semua gambar di background
+        thumbs = ThumbnailCache(tmp / "thumbnails", workers=args.workers)
+        finished = threading.Event()
+        start = time.perf_counter()
+        thumbs.prefetch(paths, done=finished.set)
+        finished.wait()
+        prefetch_s = time.perf_counter() - start
+        generate = thumbs.generate_stats.summary()
+        thumb_kb = sum(p.stat().st_size for p in (tmp / "thumbnails").rglob("*.jpg")) / 1e3
+        thumbs.close()
+
+        # Pembukaan editor berikutnya: index.json dimuat, semua thumbnail sudah ada
+        start = time.perf_counter()
+        thumbs = ThumbnailCache(tmp / "thumbnails", workers=args.workers)
+        finished.clear()
+        thumbs.prefetch(paths, done=finished.set)
+        finished.wait()
+        reopen_s = time.perf_counter() - start
+
+        cached = TimingStats("cache")
+        for path in order:
+            start = time.perf_counter()
+            select_cached(thumbs, path)
+            cached.add(time.perf_counter() - start)
+        thumbs.close()
+
+        print("\n" + "=" * 70)
+        print(f"{'selection':<12} {'avg':>9} {'p95':>9} {'max':>9}")
+        for name, stats in (("full-size", full), ("cache", cached)):
+            s = stats.summary()
+            print(f"{name:<12} {s['avg_ms']:>6.2f} ms {s['p95_ms']:>6.2f} ms {s['max_ms']:>6.2f} ms")
+        print(f"prefetch {len(paths)} images: {prefetch_s:.1f} s in background "
+              f"({generate['avg_ms']:.1f} ms/image per worker), "
+              f"thumbnails {thumb_kb / 1e3:.1f} MB")
+        print(f"reopen (index.json, nothing to decode): {reopen_s * 1000:.0f} ms; "
+              f"cache hit rate {thumbs.hits / max(thumbs.hits + thumbs.misses, 1):.1%}")
+        print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
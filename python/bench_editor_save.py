@@ -0,0 +1,154 @@
+"""
+Benchmark save editor: latency satu soal terhadap ukuran bank soal, plus uji crash.
+
+Untuk setiap ukuran bank (soal kalimat + soal guess, masing-masing --sizes) diukur
+latency satu save (baca soal, ubah, simpan) untuk:
+- json: tulis ulang seluruh quiz_data.json (indent=2), seperti save_data lama
+- rollback: SQLite satu baris per transaksi, journal_mode=DELETE + synchronous=FULL
+  (default SQLite, sebelum mode WAL)
+- wal: QuestionBank sekarang (WAL + synchronous=NORMAL, checkpoint otomatis)
+
+Uji crash: proses editor sintetis terus menyimpan soal lalu di-kill (SIGKILL) di waktu
+acak, sementara game membaca. Setelah setiap kill, DB harus lolos integrity_check dan
+setiap soal tetap utuh (semua field dari save yang sama).
+
+Contoh:
+    python bench_editor_save.py
+    python bench_editor_save.py --sizes 1000 100000 --saves 500 --crashes 20
+"""
+
+import argparse
+import json
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_question_bank import write_json
+from engine.perf_stats import TimingStats
+from question_bank import QuestionBank
+
+CRASH_WRITER = """
+import random, sys
+from question_bank import QuestionBank
+bank = QuestionBank(sys.argv[1])
+ids = bank.sentence_ids("Present", "easy")
+i = 0
+print("ready", flush=True)
+while True:
+    i += 1
+    question_id = random.choice(ids)
+    question = bank.get_sentence(question_id)
+    # Semua field dari save yang sama: timer == panjang teks soal
+    question["question"] = "x" * (i % 97 + 1)
+    question["timer"] = i % 97 + 1
+    bank.update_sentence(question_id, question)
+"""
+
+
+def bench_json(quiz_json, saves):
+    with open(quiz_json, "r", encoding="utf-8") as f:
+        quiz_data = json.load(f)
+    questions = quiz_data["Present"]["easy"]
+    rng = random.Random(1)
+    stats = TimingStats("json save")
+    for i in range(saves):
+        start = time.perf_counter()
+        rng.choice(questions)["timer"] = 20 + i % 10
+        with open(quiz_json, "w", encoding="utf-8") as f:
+            json.dump(quiz_data, f, indent=2, ensure_ascii=False)
+        stats.add(time.perf_counter() - start)
+    return stats.summary()
+
+
+def bench_bank(db_path, saves, wal):
+    bank = QuestionBank(db_path)
+    if not wal:
+        bank.conn.execute("PRAGMA journal_mode=DELETE")
+        bank.conn.execute("PRAGMA synchronous=FULL")
+    ids = bank.sentence_ids("Present", "easy")
+    guess_ids = bank.guess_ids()
+    rng = random.Random(1)
+    stats = TimingStats("bank save")
+    for i in range(saves):
+        start = time.perf_counter()
+        if i % 2:
+            question_id = rng.choice(guess_ids)
+            question = bank.get_guess(question_id)
+            question["correct_answer"] = question["options"][i % 4]
+            bank.update_guess(question_id, question)
+        else:
+            question_id = rng.choice(ids)
+            question = bank.get_sentence(question_id)
+            question["timer"] = 20 + i % 10
+            bank.update_sentence(question_id, question)
+        stats.add(time.perf_counter() - start)
+    bank.close()
+    return stats.summary()
+
+
+def crash_test(db_path, crashes):
+    """Kill writer di tengah save berkali-kali; return berapa kali DB/soal rusak"""
+    rng = random.Random(2)
+    reader = QuestionBank(db_path)
+    ids = reader.sentence_ids("Present", "easy")
+    corrupt = 0
+    for _ in range(crashes):
+        writer = subprocess.Popen([sys.executable, "-c", CRASH_WRITER, str(db_path)],
+                                  cwd=Path(__file__).parent, stdout=subprocess.PIPE, text=True)
+        writer.stdout.readline()
+        # Game tetap membaca selama editor menyimpan
+        deadline = time.perf_counter() + rng.uniform(0.05, 0.3)
+        while time.perf_counter() < deadline:
+            reader.get_sentence(rng.choice(ids))
+        writer.send_signal(signal.SIGKILL)
+        writer.wait()
+
+        check = QuestionBank(db_path)
+        ok = check.conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        for question_id in ids:
+            question = check.get_sentence(question_id)
+            if question["question"].startswith("x") and len(question["question"]) != question["timer"]:
+                ok = False
+        check.close()
+        corrupt += not ok
+    reader.close()
+    return corrupt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Editor save latency vs bank size, and crash safety")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--saves", type=int, default=200)
+    parser.add_argument("--json-saves", type=int, default=5)
+    parser.add_argument("--crashes", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for size in args.sizes:
+            folder = tmp / str(size)
+            folder.mkdir()
+            quiz_json, guess_json = write_json(folder, size)
+            QuestionBank(folder / "questions.db", quiz_json, guess_json).close()
+            rows.append((size, "json", bench_json(quiz_json, args.json_saves)))
+            for wal in (False, True):
+                rows.append((size, "wal" if wal else "rollback",
+                             bench_bank(folder / "questions.db", args.saves, wal)))
+        corrupt = crash_test(tmp / str(args.sizes[0]) / "questions.db", args.crashes)
+
+    print("\n" + "=" * 66)
+    print(f"{'questions':>10} {'save':<9} {'avg':>10} {'p95':>10} {'max':>10}")
+    for size, mode, s in rows:
+        print(f"{size:>10} {mode:<9} {s['avg_ms']:>7.2f} ms {s['p95_ms']:>7.2f} ms {s['max_ms']:>7.2f} ms")
+    print(f"crash test: {args.crashes} editor kills mid-save while reading, {corrupt} corrupt")
+    print("(save = baca + ubah + simpan satu soal; questions = jumlah soal kalimat dan soal guess)")
+    print("=" * 66)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark hand tracking: MediaPipe Tasks HandLandmarker (VIDEO mode) vs legacy
+mp.solutions.hands, dijalankan pada rekaman video yang sama.
+
+Contoh:
+    python bench_hand_tracking.py rekaman.mp4
+    python bench_hand_tracking.py rekaman.mp4 --width 480 --roi
+
+hand_landmarker.task di-download otomatis saat pertama dijalankan (butuh internet sekali).
+"""
+
+import argparse
+import time
+
+import cv2
+
+from engine.hand_tracking import HandTracker, DEFAULT_INFERENCE_WIDTH, ensure_model
+
+
+def load_frames(video_path, max_frames):
+    """Decode rekaman sekali saja agar decoding tidak ikut terukur"""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise SystemExit(f"[X] Cannot open video: {video_path}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.flip(frame, 1))
+    cap.release()
+    return frames, fps
+
+
+def run(backend, frames, fps, inference_width, use_roi):
+    tracker = HandTracker(max_num_hands=1, inference_width=inference_width,
+                          use_roi=use_roi, backend=backend)
+    detected = 0
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for i, frame in enumerate(frames):
+        hands = tracker.process(frame, timestamp_ms=int(i * 1000 / fps))
+        if hands:
+            detected += 1
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    tracker.close()
+    n = len(frames)
+    return {
+        "backend": tracker.backend.name,
+        "fps": n / wall if wall > 0 else 0.0,
+        "ms_per_frame": wall / n * 1000.0,
+        "cpu_ms_per_frame": cpu / n * 1000.0,
+        "cpu_percent": cpu / wall * 100.0 if wall > 0 else 0.0,
+        "detection_rate": detected / n * 100.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Tasks HandLandmarker vs mp.solutions.hands")
+    parser.add_argument("video", help="Rekaman video (mp4/avi) yang dipakai kedua backend")
+    parser.add_argument("--frames", type=int, default=600, help="Jumlah frame maksimum")
+    parser.add_argument("--width", type=int, default=DEFAULT_INFERENCE_WIDTH,
+                        help="Inference width untuk backend tasks (0 = resolusi asli)")
+    parser.add_argument("--roi", action="store_true", help="Aktifkan ROI cropping untuk backend tasks")
+    args = parser.parse_args()
+
+    frames, fps = load_frames(args.video, args.frames)
+    if not frames:
+        raise SystemExit("[X] Video has no frames")
+    h, w = frames[0].shape[:2]
+    print(f"[*] Loaded {len(frames)} frames ({w}x{h} @ {fps:.0f} fps)")
+
+    results = [run("legacy", frames, fps, None, False)]
+    # Model di-download saat pertama dipakai; tanpa model baris tasks tidak bisa diukur
+    if ensure_model():
+        results.append(run("tasks", frames, fps, args.width or None, args.roi))
+    else:
+        print("[!] Hand model unavailable, tasks backend not measured")
+
+    print("\n" + "=" * 70)
+    print(f"{'backend':10s} {'FPS':>8s} {'ms/frame':>10s} {'CPU ms/frame':>14s} {'CPU %':>8s} {'detected':>10s}")
+    for r in results:
+        print(f"{r['backend']:10s} {r['fps']:8.1f} {r['ms_per_frame']:10.2f} "
+              f"{r['cpu_ms_per_frame']:14.2f} {r['cpu_percent']:8.0f} {r['detection_rate']:9.0f}%")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
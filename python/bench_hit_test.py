@@ -0,0 +1,124 @@
+"""
+Benchmark hover/hit-test + gambar word card terhadap jumlah card di layar:
+- linear: update_hover memeriksa semua card setiap frame, semua card digambar ulang
+- grid: HitGrid (dibangun sekali per layout) + set_hovered, card dari WidgetLayer
+  (hanya card yang hover-nya berubah digambar ulang, lalu composite)
+
+Cursor menyapu baris card kiri-kanan sehingga hover berpindah kira-kira setiap 4 frame.
+Biaya build (HitGrid + WidgetLayer pertama kali) diukur terpisah, sekali per layout.
+
+Contoh:
+    python bench_hit_test.py
+    python bench_hit_test.py --frames 600 --cards 8 32 96
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from engine.layout import REF_HEIGHT, REF_WIDTH
+from engine.perf_stats import TimingStats
+from engine.text_cache import TEXT_CACHE
+from engine.ui_layer import WidgetLayer
+from engine.widgets import HitGrid, set_hovered, update_hover
+
+CARD_W, CARD_H, SPACING = 140, 70, 18
+PER_ROW = 11
+
+
+def make_cards(count):
+    """Word card seperti create_word_buttons, 11 per baris mulai y=120"""
+    from quiz_game import Button
+
+    cards = []
+    for i in range(count):
+        row, col = divmod(i, PER_ROW)
+        x = 60 + col * (CARD_W + SPACING)
+        y = 120 + row * (CARD_H + SPACING)
+        cards.append(Button(x, y, CARD_W, CARD_H, f"word{i}", f"word_{i}"))
+    return cards
+
+
+def cursor_path(cards, n):
+    """Cursor menyapu semua baris card (kecepatan tetap, tidak bergantung jumlah card)"""
+    rows = (len(cards) + PER_ROW - 1) // PER_ROW
+    span = PER_ROW * (CARD_W + SPACING)
+    for i in range(n):
+        x = 60 + (i * 40) % span
+        row = (i * 40 // span) % rows
+        yield x, 120 + row * (CARD_H + SPACING) + CARD_H // 2
+
+
+def draw_card(frame, card):
+    card.draw(frame)
+
+
+def run(count, grid, frames, n):
+    cards = make_cards(count)
+    update_stats = TimingStats("update")
+    draw_stats = TimingStats("draw")
+
+    start = time.perf_counter()
+    if grid:
+        index = HitGrid(cards)
+        layer = WidgetLayer("cards")
+        layer.draw(frames[0].copy(), cards, draw_card)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    previous = [None]
+    for i, point in enumerate(cursor_path(cards, n)):
+        frame = frames[i % len(frames)].copy()
+
+        start = time.perf_counter()
+        if grid:
+            target = index.hit(point)
+            dirty = set_hovered(previous, [target])
+            previous = [target]
+        else:
+            update_hover(cards, point)
+        update_stats.add(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        if grid:
+            layer.draw(frame, cards, draw_card, dirty=dirty)
+        else:
+            for card in cards:
+                card.draw(frame)
+        draw_stats.add(time.perf_counter() - start)
+        TEXT_CACHE.end_frame()
+
+    redraws = layer.redraws if grid else n * count
+    return update_stats.summary(), draw_stats.summary(), build_ms, redraws
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hit-test + word card cost vs number of cards")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--cards", type=int, nargs="+", default=[8, 16, 32, 64, 88])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (REF_HEIGHT, REF_WIDTH, 3), dtype=np.uint8) for _ in range(4)]
+    # Pemanasan sprite teks supaya kedua mode memakai TEXT_CACHE yang sama
+    run(max(args.cards), False, frames, 10)
+
+    rows = []
+    for count in args.cards:
+        for grid in (False, True):
+            rows.append((count, grid) + run(count, grid, frames, args.frames))
+
+    print("\n" + "=" * 80)
+    print(f"{'cards':>6} {'mode':<7} {'update avg':>11} {'draw avg':>10} {'draw p95':>10} "
+          f"{'build':>9} {'cards drawn':>12}")
+    for count, grid, update, draw, build_ms, redraws in rows:
+        print(f"{count:>6} {'grid' if grid else 'linear':<7} {update['avg_ms'] * 1000:>8.1f} us "
+              f"{draw['avg_ms']:>7.2f} ms {draw['p95_ms']:>7.2f} ms "
+              f"{build_ms if grid else 0:>6.1f} ms {redraws:>12}")
+    print("(update = hit-test + hover per frame; draw = semua card ke frame 1920x1080;\n"
+          " build = HitGrid + WidgetLayer sekali per layout; cards drawn = total selama benchmark)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Benchmark input tangan: cursor + pinch cara lama vs engine/hand_input.py.
+
+Cara lama:
+- cursor mentah (quiz/guess) atau weighted moving average 5 titik (finger_draw_emoji)
+- pinch = jarak telunjuk-jempol < 40 px (koordinat desain), klik berikutnya diabaikan
+  selama 15 step (0.5 detik)
+Cara baru: One Euro filter + pinch hysteresis pada jarak / ukuran tangan + debounce waktu.
+
+Default memakai rekaman sintetis (.hlr, ditulis lewat HandRecorder lalu diputar ulang):
+tangan berpindah ke target acak lalu diam sambil pinch sekali atau dua kali cepat
+(double tap), dengan ukuran tangan dekat/sedang/jauh dari kamera dan jitter landmark
+gaussian. Karena posisi dan waktu pinch yang sebenarnya diketahui, diukur:
+- jitter cursor saat jari diam (px per frame) dan lag saat bergerak (ms)
+- latency klik dari awal gerakan pinch, klik yang hilang dan klik berlebih
+
+Dengan --replay FILE (rekaman asli) tidak ada ground truth: referensi cursor =
+rata-rata tengah (tanpa lag) posisi mentah, klik dibandingkan antar pipeline.
+
+Contoh:
+    python bench_input_latency.py
+    python bench_input_latency.py --jitter 3 --segments 60 --save sintetis.hlr
+    python bench_input_latency.py --replay sesi.hlr
+"""
+
+import argparse
+import math
+import random
+import tempfile
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from engine.hand_input import HandInput
+from engine.hand_recording import HandRecorder, read_recording
+from engine.hand_tracking import INDEX_TIP, THUMB_TIP, Landmark, TrackedHand
+from engine.layout import REF_HEIGHT, REF_WIDTH
+from engine.perf_stats import TimingStats
+
+# Perilaku lama (lihat docstring)
+OLD_PINCH_DISTANCE = 40
+OLD_COOLDOWN = 15 / 30
+
+# Skeleton tangan kanan menghadap kamera, satuan = jarak pergelangan -> pangkal jari tengah.
+# Index 4 (ujung jempol) dihitung dari jarak pinch, index 3 di tengah 2 dan 4
+SKELETON = [(0, 0), (-0.35, -0.2), (-0.6, -0.45), None, None,
+            (-0.25, -0.95), (-0.28, -1.35), (-0.3, -1.6), (-0.32, -1.85),
+            (0, -1), (0, -1.45), (0, -1.75), (0, -2.0),
+            (0.22, -0.93), (0.25, -1.3), (0.27, -1.55), (0.28, -1.75),
+            (0.42, -0.82), (0.48, -1.1), (0.5, -1.3), (0.52, -1.45)]
+THUMB_DIRECTION = (-0.8, 0.6)
+
+# Ukuran tangan relatif ke lebar frame: dekat / sedang / jauh dari kamera
+HAND_SIZES = (0.11, 0.07, 0.035)
+OPEN_RATIO = 0.7     # jari rileks saat menunjuk
+CLOSED_RATIO = 0.18  # ujung jari bersentuhan (landmark ujung tidak pernah berimpit)
+CLOSE_TIME, HOLD_TIME, OPEN_TIME = 0.08, 0.12, 0.1
+DOUBLE_TAP_GAP = 0.3
+
+
+def min_jerk(u):
+    return u * u * u * (10 - 15 * u + 6 * u * u)
+
+
+def pinch_ratio(t, taps):
+    """Jarak pinch / ukuran tangan pada waktu t untuk daftar awal pinch"""
+    for onset in taps:
+        u = t - onset
+        if 0 <= u < CLOSE_TIME:
+            return OPEN_RATIO + (CLOSED_RATIO - OPEN_RATIO) * min_jerk(u / CLOSE_TIME)
+        if CLOSE_TIME <= u < CLOSE_TIME + HOLD_TIME:
+            return CLOSED_RATIO
+        u -= CLOSE_TIME + HOLD_TIME
+        if 0 <= u < OPEN_TIME:
+            return CLOSED_RATIO + (OPEN_RATIO - CLOSED_RATIO) * min_jerk(u / OPEN_TIME)
+    return OPEN_RATIO
+
+
+def make_hand(cursor, size, ratio, rng, jitter, aspect):
+    """TrackedHand (koordinat ternormalisasi) dengan ujung telunjuk di cursor.
+
+    size dan jitter relatif lebar frame; sumbu y dikali aspect (lebar / tinggi) supaya
+    tangan tidak gepeng di frame 16:9
+    """
+    tip = SKELETON[INDEX_TIP]
+    norm = math.hypot(*THUMB_DIRECTION)
+    thumb = (tip[0] + ratio * THUMB_DIRECTION[0] / norm, tip[1] + ratio * THUMB_DIRECTION[1] / norm)
+    offsets = list(SKELETON)
+    offsets[THUMB_TIP] = thumb
+    offsets[3] = ((offsets[2][0] + thumb[0]) / 2, (offsets[2][1] + thumb[1]) / 2)
+    landmark = [Landmark(cursor[0] + (x - tip[0]) * size + rng.gauss(0, jitter),
+                         cursor[1] + ((y - tip[1]) * size + rng.gauss(0, jitter)) * aspect, 0.0)
+                for x, y in offsets]
+    return TrackedHand(landmark, "Right", 0.95)
+
+
+def synthesize(path, segments, fps, width, height, jitter_px, seed):
+    """Tulis rekaman sintetis. Return (taps, truth) dengan truth = {timestamp_ms: (x, y) desain}"""
+    rng = random.Random(seed)
+    jitter = jitter_px / width
+    aspect = width / height
+    timeline = []  # (start, end, from, to, size_from, size_to, taps)
+    t, cursor, size = 0.5, (0.5, 0.5), HAND_SIZES[0]
+    taps = []
+    for i in range(segments):
+        target = (rng.uniform(0.2, 0.8), rng.uniform(0.3, 0.75))
+        new_size = HAND_SIZES[i % len(HAND_SIZES)]
+        move = rng.uniform(0.25, 0.5)
+        timeline.append((t, t + move, cursor, target, size, new_size))
+        t += move
+        first = t + 0.4
+        taps.append(first)
+        if rng.random() < 0.5:
+            taps.append(first + DOUBLE_TAP_GAP)
+        cursor, size = target, new_size
+        t += 1.2
+    duration = t + 0.5
+
+    def state(now):
+        for start, end, a, b, size_a, size_b in timeline:
+            if now < start:
+                return a, size_a
+            if now < end:
+                u = min_jerk((now - start) / (end - start))
+                return ((a[0] + (b[0] - a[0]) * u, a[1] + (b[1] - a[1]) * u),
+                        size_a + (size_b - size_a) * u)
+        return cursor, size
+
+    truth = {}
+    blank = np.zeros((height, width, 3), dtype=np.uint8)
+    with HandRecorder(str(path)) as recorder:
+        frame_index = 0
+        while frame_index / fps < duration:
+            # Timestamp kamera tidak pernah tepat 1/fps
+            now = frame_index / fps + rng.uniform(-0.003, 0.003)
+            timestamp_ms = max(0, int(round(now * 1000)))
+            point, hand_size = state(timestamp_ms / 1000.0)
+            hand = make_hand(point, hand_size, pinch_ratio(timestamp_ms / 1000.0, taps),
+                             rng, jitter, aspect)
+            recorder.write([hand], blank, timestamp_ms)
+            truth[timestamp_ms] = (point[0] * REF_WIDTH, point[1] * REF_HEIGHT)
+            frame_index += 1
+    return taps, truth
+
+
+class OldInput:
+    """Input lama: cursor mentah / weighted moving average + pinch 40 px + cooldown 0.5 s"""
+    def __init__(self):
+        self.recent = deque(maxlen=5)
+        self.pinching = False
+        self.last_click = None
+
+    def update(self, hand, width, height, now):
+        if hand is None:
+            self.recent.clear()
+            self.pinching = False
+            return None, None, False
+        index_x, index_y = hand.point(INDEX_TIP, width, height)
+        thumb_x, thumb_y = hand.point(THUMB_TIP, width, height)
+
+        self.recent.append((index_x, index_y))
+        total = sum(range(1, len(self.recent) + 1))
+        average = (sum(p[0] * (i + 1) for i, p in enumerate(self.recent)) / total,
+                   sum(p[1] * (i + 1) for i, p in enumerate(self.recent)) / total)
+
+        was_pinching = self.pinching
+        self.pinching = math.hypot(index_x - thumb_x, index_y - thumb_y) < OLD_PINCH_DISTANCE
+        clicked = self.pinching and not was_pinching
+        if clicked and self.last_click is not None and now - self.last_click < OLD_COOLDOWN:
+            clicked = False
+        if clicked:
+            self.last_click = now
+        return (index_x, index_y), average, clicked
+
+
+def run_pipelines(entries):
+    """Jalankan semua pipeline pada rekaman. Return times, paths {nama: array}, clicks {nama: list}"""
+    old, new = OldInput(), HandInput()
+    times, paths = [], {"raw (old quiz/guess)": [], "moving avg (old draw)": [], "One Euro (new)": []}
+    clicks = {"old: 40 px + 0.5 s cooldown": [], "new: hysteresis + debounce": []}
+    for timestamp_ms, hands, _ in entries:
+        now = timestamp_ms / 1000.0
+        hand = hands[0] if hands else None
+        raw, average, old_click = old.update(hand, REF_WIDTH, REF_HEIGHT, now)
+        new.update(hand, REF_WIDTH, REF_HEIGHT, now)
+        if old_click:
+            clicks["old: 40 px + 0.5 s cooldown"].append(now)
+        if new.take_click():
+            clicks["new: hysteresis + debounce"].append(now)
+        if hand is None:
+            continue
+        times.append(now)
+        paths["raw (old quiz/guess)"].append(raw)
+        paths["moving avg (old draw)"].append(average)
+        paths["One Euro (new)"].append(new.cursor.value)
+    return (np.array(times), {name: np.array(path, dtype=np.float64) for name, path in paths.items()},
+            clicks)
+
+
+def cursor_metrics(times, path, reference):
+    """Jitter saat diam (px/frame), lag saat bergerak (ms) dan error tracking RMS (px)"""
+    dt = np.diff(times)
+    speed = np.linalg.norm(np.diff(reference, axis=0), axis=1) / np.maximum(dt, 1e-3)
+    still = np.concatenate([[False], speed < 30])
+    moving = np.concatenate([[False], speed > 300])
+    steps = np.linalg.norm(np.diff(path, axis=0), axis=1)
+    jitter = float(np.sqrt(np.mean(steps[still[1:]] ** 2))) if still.any() else float("nan")
+    if not moving.any():
+        return jitter, float("nan"), float("nan")
+
+    def error(shift):
+        x = np.interp(times[moving] - shift, times, reference[:, 0])
+        y = np.interp(times[moving] - shift, times, reference[:, 1])
+        return float(np.sqrt(np.mean((path[moving, 0] - x) ** 2 + (path[moving, 1] - y) ** 2)))
+
+    shifts = np.arange(0.0, 0.2, 0.002)
+    lag = float(shifts[int(np.argmin([error(s) for s in shifts]))])
+    return jitter, lag * 1000.0, error(0.0)
+
+
+def click_metrics(clicks, taps, window=0.3):
+    """Cocokkan klik ke awal pinch yang sebenarnya. Return (latency stats, missed, extra)"""
+    latency = TimingStats("click latency")
+    remaining = sorted(clicks)
+    missed = 0
+    for onset in taps:
+        match = next((c for c in remaining if onset - 0.05 <= c <= onset + window), None)
+        if match is None:
+            missed += 1
+            continue
+        remaining.remove(match)
+        latency.add(match - onset)
+    return latency, missed, len(remaining)
+
+
+def centered_average(path, radius=4):
+    """Referensi tanpa lag untuk rekaman asli: rata-rata jendela tengah"""
+    kernel = np.ones(2 * radius + 1) / (2 * radius + 1)
+    padded = np.pad(path, ((radius, radius), (0, 0)), mode="edge")
+    return np.stack([np.convolve(padded[:, i], kernel, mode="valid") for i in range(2)], axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cursor filter and pinch latency on landmark streams")
+    parser.add_argument("--replay", help="Rekaman .hlr asli (tanpa ground truth)")
+    parser.add_argument("--segments", type=int, default=40, help="Sintetis: jumlah target")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--jitter", type=float, default=2.0,
+                        help="Sintetis: std jitter landmark (px di frame 1280x720)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="Sintetis: simpan rekaman ke file ini")
+    args = parser.parse_args()
+
+    taps = truth = None
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.replay
+        if path is None:
+            path = args.save or str(Path(tmp) / "synthetic.hlr")
+            taps, truth = synthesize(path, args.segments, args.fps, 1280, 720, args.jitter, args.seed)
+        _, _, _, entries = read_recording(path)
+
+    times, paths, clicks = run_pipelines(entries)
+    raw = paths["raw (old quiz/guess)"]
+    if truth is not None:
+        reference = np.array([truth[int(round(t * 1000))] for t in times])
+    else:
+        reference = centered_average(raw)
+
+    print("\n" + "=" * 70)
+    source = args.replay or f"synthetic, {len(taps)} pinches, jitter {args.jitter} px"
+    print(f"[STATS] {len(entries)} frames ({source})")
+    print(f"{'cursor':<26} {'jitter still':>14} {'lag moving':>12} {'error moving':>14}")
+    for name, path in paths.items():
+        jitter, lag, error = cursor_metrics(times, path, reference)
+        print(f"{name:<26} {jitter:>9.2f} px/f {lag:>9.0f} ms {error:>11.1f} px")
+
+    if taps is not None:
+        print(f"{'pinch -> click':<30} {'latency avg':>12} {'p95':>8} {'missed':>8} {'extra':>7}")
+        for name, times_clicked in clicks.items():
+            latency, missed, extra = click_metrics(times_clicked, taps)
+            s = latency.summary()
+            print(f"{name:<30} {s['avg_ms']:>9.0f} ms {s['p95_ms']:>5.0f} ms {missed:>8} {extra:>7}")
+        print("(latency dari awal gerakan pinch; jempol-telunjuk bersentuhan setelah "
+              f"{CLOSE_TIME * 1000:.0f} ms)")
+    else:
+        (old_name, old_clicks), (new_name, new_clicks) = clicks.items()
+        latency, missed, extra = click_metrics(new_clicks, old_clicks, window=0.2)
+        s = latency.summary()
+        print(f"[STATS] clicks: {old_name} {len(old_clicks)}, {new_name} {len(new_clicks)}")
+        print(f"[STATS] new click vs matching old click: avg {s['avg_ms']:+.0f} ms, "
+              f"{missed} old clicks without new, {extra} new clicks without old")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Benchmark bank soal: file JSON (cara lama) vs SQLite (question_bank.py).
+
+Soal sintetis dibuat di folder sementara (default 100k soal kalimat, tersebar di
+4 category x 3 difficulty, plus 100k soal guess), lalu diukur:
+- load: JSON = json.load seluruh file; SQLite = buka DB + daftar id (lewat index)
+- select: pilih soal acak untuk satu category/difficulty (random.choice + baca baris)
+- edit: ubah satu soal; JSON = tulis ulang seluruh file (indent=2), SQLite = UPDATE satu baris
+- migrasi sekali JSON -> SQLite
+- sampler tanpa pengulangan (question_sampler.py): draw, ronde penuh, simpan/muat posisi
+
+Contoh:
+    python bench_question_bank.py
+    python bench_question_bank.py --questions 20000 --selects 5000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+from engine.perf_stats import TimingStats
+from question_bank import DEFAULT_CATEGORIES, DIFFICULTIES, QuestionBank
+from question_sampler import QuestionSampler
+
+WORDS = ["I", "you", "she", "they", "eat", "ate", "will", "play", "played", "rice",
+         "football", "yesterday", "tomorrow", "every", "day", "at", "school", "home"]
+
+
+def make_sentence(rng, i):
+    words = rng.sample(WORDS, 6)
+    return {"question": f"Susun kalimat nomor {i}", "words": words,
+            "correct_answer": words[:4], "timer": 30}
+
+
+def make_guess(rng, i):
+    options = rng.sample(WORDS, 4)
+    return {"blurred_image": f"blur_{i}.jpg", "original_image": f"img_{i}.jpg",
+            "options": options, "correct_answer": options[0],
+            "assets": {"quiz": f"quiz/{i}.jpg", "result": f"result/{i}.jpg",
+                       "blur_levels": [f"blur/{i}_{level}.jpg" for level in range(4)]}}
+
+
+def write_json(directory, n):
+    rng = random.Random(0)
+    quiz_data = {category: {difficulty: [] for difficulty in DIFFICULTIES}
+                 for category in DEFAULT_CATEGORIES}
+    for i in range(n):
+        category = DEFAULT_CATEGORIES[i % len(DEFAULT_CATEGORIES)]
+        difficulty = DIFFICULTIES[(i // len(DEFAULT_CATEGORIES)) % len(DIFFICULTIES)]
+        quiz_data[category][difficulty].append(make_sentence(rng, i))
+    guess_data = [make_guess(rng, i) for i in range(n)]
+
+    quiz_json, guess_json = directory / "quiz_data.json", directory / "guess_data.json"
+    with open(quiz_json, "w", encoding="utf-8") as f:
+        json.dump(quiz_data, f, indent=2, ensure_ascii=False)
+    with open(guess_json, "w", encoding="utf-8") as f:
+        json.dump(guess_data, f, indent=2, ensure_ascii=False)
+    return quiz_json, guess_json
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def bench_json(quiz_json, guess_json, selects, edits):
+    def load():
+        with open(quiz_json, "r", encoding="utf-8") as f:
+            quiz_data = json.load(f)
+        with open(guess_json, "r", encoding="utf-8") as f:
+            guess_data = json.load(f)
+        return quiz_data, guess_data
+
+    (quiz_data, guess_data), load_ms = timed(load)
+    rng = random.Random(1)
+    select = TimingStats("json select")
+    for i in range(selects):
+        start = time.perf_counter()
+        questions = quiz_data.get(DEFAULT_CATEGORIES[i % 4], {}).get("easy", [])
+        random.choice(questions)
+        random.choice(guess_data)
+        select.add(time.perf_counter() - start)
+
+    edit = TimingStats("json edit")
+    for i in range(edits):
+        start = time.perf_counter()
+        quiz_data["Present"]["easy"][rng.randrange(100)]["timer"] = 20 + i
+        with open(quiz_json, "w", encoding="utf-8") as f:
+            json.dump(quiz_data, f, indent=2, ensure_ascii=False)
+        edit.add(time.perf_counter() - start)
+    return load_ms, select.summary(), edit.summary()
+
+
+def bench_sqlite(db_path, quiz_json, guess_json, selects, edits):
+    _, migrate_ms = timed(QuestionBank, db_path, quiz_json, guess_json)
+
+    def load():
+        bank = QuestionBank(db_path)
+        ids = {(category, difficulty): bank.sentence_ids(category, difficulty)
+               for category in bank.categories() for difficulty in DIFFICULTIES}
+        return bank, ids, bank.guess_ids()
+
+    (bank, ids, guess_ids), load_ms = timed(load)
+    select = TimingStats("sqlite select")
+    for i in range(selects):
+        start = time.perf_counter()
+        bank.get_sentence(random.choice(ids[(DEFAULT_CATEGORIES[i % 4], "easy")]))
+        bank.get_guess(random.choice(guess_ids))
+        select.add(time.perf_counter() - start)
+
+    edit = TimingStats("sqlite edit")
+    for i in range(edits):
+        question_id = random.choice(ids[("Present", "easy")])
+        start = time.perf_counter()
+        question = bank.get_sentence(question_id)
+        question["timer"] = 20 + i
+        bank.update_sentence(question_id, question)
+        edit.add(time.perf_counter() - start)
+
+    ids_bytes = sum(len(a) * a.itemsize for a in ids.values()) + len(guess_ids) * guess_ids.itemsize
+    bank.close()
+    return migrate_ms, load_ms, select.summary(), edit.summary(), ids_bytes
+
+
+def bench_sampler(directory, n):
+    """Satu ronde penuh (n draw) di deck n soal + satu draw pertama ronde berikutnya"""
+    ids = array("q", range(1, n + 1))
+    sampler = QuestionSampler(directory / "sampler_state.npz")
+    draw = TimingStats("sampler draw")
+    seen = set()
+    for _ in range(n + 1):
+        start = time.perf_counter()
+        question_id = sampler.draw("guess", ids)
+        draw.add(time.perf_counter() - start)
+        seen.add(question_id)
+    _, save_ms = timed(sampler.save)
+    _, load_ms = timed(QuestionSampler, directory / "sampler_state.npz")
+    deck_bytes = sampler.decks["guess"].ids.nbytes
+    # Semua soal keluar tepat sekali per ronde
+    return draw.summary(), len(seen) == n, save_ms, load_ms, deck_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON vs SQLite question bank latency")
+    parser.add_argument("--questions", type=int, default=100000,
+                        help="Jumlah soal kalimat (dan soal guess) sintetis")
+    parser.add_argument("--selects", type=int, default=2000)
+    parser.add_argument("--edits", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        print(f"[*] Writing {args.questions} sentence + {args.questions} guess questions...")
+        quiz_json, guess_json = write_json(directory, args.questions)
+        size_mb = (quiz_json.stat().st_size + guess_json.stat().st_size) / 1e6
+        # Bank SQLite dimigrasi dari JSON asli (sebelum edit JSON di bawah)
+        sqlite = bench_sqlite(directory / "questions.db", quiz_json, guess_json,
+                              args.selects, args.edits)
+        db_mb = (directory / "questions.db").stat().st_size / 1e6
+        json_load, json_select, json_edit = bench_json(quiz_json, guess_json,
+                                                       args.selects, args.edits)
+        sampler_draw, full_round, sampler_save, sampler_load, deck_bytes = bench_sampler(
+            directory, args.questions)
+    migrate_ms, db_load, db_select, db_edit, ids_bytes = sqlite
+
+    print("\n" + "=" * 70)
+    print(f"{'':<22} {'JSON':>20} {'SQLite':>20}")
+    print(f"{'file size':<22} {size_mb:>17.1f} MB {db_mb:>17.1f} MB")
+    print(f"{'load':<22} {json_load:>17.1f} ms {db_load:>17.1f} ms")
+    print(f"{'select avg':<22} {json_select['avg_ms'] * 1000:>17.1f} us "
+          f"{db_select['avg_ms'] * 1000:>17.1f} us")
+    print(f"{'select p95':<22} {json_select['p95_ms'] * 1000:>17.1f} us "
+          f"{db_select['p95_ms'] * 1000:>17.1f} us")
+    print(f"{'edit one question':<22} {json_edit['avg_ms']:>17.1f} ms {db_edit['avg_ms']:>17.2f} ms")
+    print(f"[STATS] one-shot migration: {migrate_ms:.0f} ms, id arrays in memory: "
+          f"{ids_bytes / 1e6:.1f} MB")
+    print(f"[STATS] sampler: draw avg {sampler_draw['avg_ms'] * 1000:.2f} us "
+          f"p95 {sampler_draw['p95_ms'] * 1000:.2f} us max {sampler_draw['max_ms'] * 1000:.1f} us, "
+          f"round of {args.questions} without repeats: {full_round}, deck {deck_bytes / 1e6:.1f} MB, "
+          f"save {sampler_save:.1f} ms, resume {sampler_load:.1f} ms")
+    print("(select = satu soal kalimat + satu soal guess; JSON select dari dict di memori)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
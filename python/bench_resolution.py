@@ -0,0 +1,134 @@
+"""
+Benchmark FPS per resolusi capture untuk QuizGame dan GuessGame (layout engine).
+
+Per frame diukur pipeline yang bergantung resolusi, tanpa kamera dan tanpa MediaPipe:
+- capture prep: cv2.flip + downscale ke lebar inference + BGR->RGB (seperti HandTracker)
+- game: GameLoop.frame (fixed step + render UI di resolusi frame)
+- upscale: resize ke 1920x1080 (perkiraan biaya window yang meng-upscale untuk tampilan)
+
+Tangan sintetis menyapu layar (hover berpindah antar tombol) kecuali --replay diberikan.
+
+Contoh:
+    python bench_resolution.py --frames 200
+    python bench_resolution.py --resolution 1280x720 --resolution 640x360 --replay sesi.hlr
+"""
+
+import argparse
+import random
+import time
+
+import cv2
+import numpy as np
+
+from engine import GameLoop
+from engine.hand_recording import HandReplay
+from engine.hand_tracking import DEFAULT_INFERENCE_WIDTH, Landmark, TrackedHand
+from engine.layout import LAYOUT, REF_WIDTH, REF_HEIGHT, parse_resolution
+from engine.perf_stats import TimingStats
+from engine.text_cache import TEXT_CACHE
+
+RESOLUTIONS = ["1920x1080", "1280x720", "960x540", "640x360"]
+
+
+def synthetic_hands(n):
+    """Telunjuk menyapu layar (tanpa pinch), koordinat ternormalisasi seperti hasil tracker"""
+    for i in range(n):
+        t = (i % 120) / 119.0
+        x, y = 0.5 + 0.3 * np.sin(t * 2 * np.pi), 0.25 + 0.65 * (1 - abs(2 * t - 1))
+        landmark = [Landmark(x, y + 0.1, 0.0)] * 21
+        landmark[8] = Landmark(x, y, 0.0)
+        landmark[4] = Landmark(x + 0.06, y, 0.0)
+        yield [TrackedHand(landmark, "Right", 0.9)]
+
+
+def recorded_hands(path, n):
+    replay = HandReplay(path, realtime=False, loop=True)
+    for _ in range(n):
+        replay.read()
+        yield replay.process(None)
+
+
+def make_game(name):
+    if name == "quiz":
+        from quiz_game import QuizGame
+        game = QuizGame(sampler_path=None)
+        loop = GameLoop(game)
+        game.current_category, game.current_difficulty = "Present", "easy"
+        game.start_quiz()
+    else:
+        from guess_game import GuessGame
+        game = GuessGame(sampler_path=None)
+        loop = GameLoop(game)
+        game.start_game()
+    return game, loop
+
+
+def run(name, size, n, replay_path):
+    width, height = size
+    random.seed(0)
+    LAYOUT.resize(width, height)
+    game, loop = make_game(name)
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+    capture = TimingStats(f"{name} {width}x{height} capture prep")
+    update = TimingStats(f"{name} {width}x{height} game")
+    upscale = TimingStats(f"{name} {width}x{height} upscale")
+
+    hands_source = recorded_hands(replay_path, n) if replay_path else synthetic_hands(n)
+    for i, hands in enumerate(hands_source):
+        start = time.perf_counter()
+        frame = cv2.flip(frames[i % len(frames)], 1)
+        image = frame
+        if image.shape[1] > DEFAULT_INFERENCE_WIDTH:
+            scale = DEFAULT_INFERENCE_WIDTH / image.shape[1]
+            image = cv2.resize(image, (DEFAULT_INFERENCE_WIDTH, int(image.shape[0] * scale)),
+                               interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        prepared = time.perf_counter()
+        capture.add(prepared - start)
+
+        loop.frame(frame, hands[0] if hands else None, i / 30.0)
+        TEXT_CACHE.end_frame()
+        drawn = time.perf_counter()
+        update.add(drawn - prepared)
+
+        if (width, height) != (REF_WIDTH, REF_HEIGHT):
+            cv2.resize(frame, (REF_WIDTH, REF_HEIGHT), interpolation=cv2.INTER_LINEAR)
+        upscale.add(time.perf_counter() - drawn)
+
+    if hasattr(game, "images"):
+        game.images.shutdown()
+    return capture.summary()["avg_ms"], update.summary()["avg_ms"], upscale.summary()["avg_ms"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-resolution FPS of the hand-driven games")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--game", choices=["quiz", "guess"], action="append",
+                        help="Game yang diukur (boleh berulang, default keduanya)")
+    parser.add_argument("--resolution", action="append", metavar="WxH",
+                        help=f"Resolusi capture (boleh berulang, default {', '.join(RESOLUTIONS)})")
+    parser.add_argument("--replay", metavar="FILE", help="Pakai landmark dari rekaman .hlr")
+    args = parser.parse_args()
+
+    rows = []
+    for name in args.game or ["quiz", "guess"]:
+        for text in args.resolution or RESOLUTIONS:
+            size = parse_resolution(text)
+            # Putaran pertama = warm-up (sprite teks, UI layer, gambar) untuk resolusi ini
+            run(name, size, 30, args.replay)
+            rows.append((name, size) + run(name, size, args.frames, args.replay))
+
+    print("\n" + "=" * 78)
+    print(f"{'game':<6} {'resolution':>10} {'capture':>10} {'game':>10} {'upscale':>10} "
+          f"{'total':>10} {'FPS':>7}")
+    for name, (width, height), capture_ms, game_ms, upscale_ms in rows:
+        total = capture_ms + game_ms + upscale_ms
+        print(f"{name:<6} {f'{width}x{height}':>10} {capture_ms:>7.2f} ms {game_ms:>7.2f} ms "
+              f"{upscale_ms:>7.2f} ms {total:>7.2f} ms {1000.0 / total:>7.0f}")
+    print("(tanpa inference MediaPipe dan tanpa imshow; FPS = batas atas dari pipeline ini)")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark overhead scheduler spaced repetition (spaced_repetition.py) untuk banyak
+learner sekaligus, mis. satu proses server kelas.
+
+Default 1000 learner x 10000 soal; setiap learner sudah punya riwayat review untuk
+sebagian soal (--reviewed), dengan due acak di sekitar waktu sekarang. Diukur:
+- load state learner dari DB (query lewat primary key learner_id)
+- build antrian pertama (heap due + deck soal baru) untuk deck 10k soal
+- next_question (heap, O(log n)) vs scan linear semua soal (cara naif, O(n))
+- record jawaban (SM-2 + satu transaksi SQLite)
+
+Contoh:
+    python bench_spaced_repetition.py
+    python bench_spaced_repetition.py --learners 200 --items 10000 --answers 20
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+from engine.perf_stats import TimingStats
+from spaced_repetition import DAY, ReviewScheduler
+
+
+def populate(path, learners, items, reviewed):
+    """Isi DB dengan riwayat review sintetis (satu transaksi)"""
+    rng = random.Random(0)
+    now = time.time()
+    scheduler = ReviewScheduler(path)
+    with scheduler.conn:
+        scheduler.conn.executemany("INSERT INTO learners (name) VALUES (?)",
+                                   ((f"learner{i}",) for i in range(learners)))
+        for learner_id in range(1, learners + 1):
+            scheduler.conn.executemany(
+                "INSERT INTO reviews (learner_id, question_id, repetitions, interval, easiness, due) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((learner_id, question_id, rng.randint(1, 6), rng.choice((1.0, 6.0, 15.0)),
+                  rng.uniform(1.3, 2.8), now + rng.uniform(-3, 10) * DAY)
+                 for question_id in rng.sample(range(1, items + 1), reviewed)))
+    scheduler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Spaced repetition scheduling overhead")
+    parser.add_argument("--learners", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--reviewed", type=int, default=2000,
+                        help="Jumlah soal yang sudah pernah dijawab per learner")
+    parser.add_argument("--answers", type=int, default=10, help="Jawaban per learner yang disimulasikan")
+    args = parser.parse_args()
+
+    ids = array("q", range(1, args.items + 1))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "learner_progress.db"
+        start = time.perf_counter()
+        populate(path, args.learners, args.items, args.reviewed)
+        populate_s = time.perf_counter() - start
+        db_mb = path.stat().st_size / 1e6
+
+        scheduler = ReviewScheduler(path)
+        load = TimingStats("learner load")
+        build = TimingStats("queue build")
+        next_heap = TimingStats("next_question (heap)")
+        next_scan = TimingStats("next_question (linear scan)")
+        record = TimingStats("record (SM-2 + commit)")
+        rng = random.Random(1)
+
+        learners = []
+        for i in range(args.learners):
+            start = time.perf_counter()
+            learners.append(scheduler.learner(f"learner{i}"))
+            load.add(time.perf_counter() - start)
+        for learner in learners:
+            start = time.perf_counter()
+            scheduler.next_question(learner, "all", ids)
+            build.add(time.perf_counter() - start)
+
+        wall = time.perf_counter()
+        for _ in range(args.answers):
+            for learner in learners:
+                now = time.time()
+                start = time.perf_counter()
+                question_id = scheduler.next_question(learner, "all", ids, now)
+                next_heap.add(time.perf_counter() - start)
+
+                # Cara naif: cari due paling awal dengan scan semua soal deck
+                start = time.perf_counter()
+                reviews = learner.reviews
+                min((reviews[q][3], q) for q in ids if q in reviews)
+                next_scan.add(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                scheduler.record(learner, "all", question_id, rng.choice((1, 3, 4, 5)), now)
+                record.add(time.perf_counter() - start)
+        wall = time.perf_counter() - wall
+        scheduler.close()
+
+    answers = args.learners * args.answers
+    print("\n" + "=" * 70)
+    print(f"[STATS] {args.learners} learners x {args.items} items, {args.reviewed} reviewed each: "
+          f"populate {populate_s:.1f} s, DB {db_mb:.0f} MB")
+    for stats in (load, build, next_heap, next_scan, record):
+        s = stats.summary()
+        print(f"{stats.name:<30} avg {s['avg_ms']:>8.3f} ms  p95 {s['p95_ms']:>8.3f} ms  "
+              f"max {s['max_ms']:>8.3f} ms")
+    print(f"[STATS] {answers} answers in {wall:.2f} s (incl. linear scan baseline), "
+          f"scheduling+record only: {answers / ((next_heap.total + record.total) or 1):.0f} answers/s")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
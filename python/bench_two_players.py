@@ -0,0 +1,122 @@
+"""
+Benchmark QuizGame mode dua pemain: biaya per frame dengan 2 tangan vs 1 tangan.
+
+Layar soal dijalankan lewat GameLoop (fixed step + render) dengan tangan sintetis:
+setiap pemain menyapu word card dan baris jawabannya sendiri, pinch kira-kira setiap
+0.7 detik (jawaban berubah -> overlay soal dibangun ulang). Urutan tangan dari
+"tracker" diacak setiap frame, seperti hasil tracker asli. Diukur untuk:
+- immediate: semua elemen digambar ulang setiap frame (tanpa UI layer)
+- retained: satu UI layer bersama untuk kedua pemain + tombol yang di-hover
+
+Biaya hand tracker sendiri (max_num_hands=2) tidak termasuk: lihat bench_hand_tracking.py.
+
+Contoh:
+    python bench_two_players.py
+    python bench_two_players.py --frames 900
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from engine import GameLoop
+from engine.hand_tracking import Landmark, TrackedHand
+from engine.layout import REF_HEIGHT, REF_WIDTH
+from engine.perf_stats import TimingStats
+from engine.text_cache import TEXT_CACHE, TextCache
+from engine.ui_layer import UILayer
+
+# Pinch selama PINCH_FRAMES di akhir setiap PERIOD frame (cursor sudah diam di target)
+PERIOD = 20
+PINCH_FRAMES = 4
+
+
+def make_hand(x, y, pinching):
+    """Tangan sintetis di koordinat desain: telunjuk di (x, y), jempol dekat saat pinch"""
+    nx, ny = x / REF_WIDTH, y / REF_HEIGHT
+    landmark = [Landmark(nx, ny + 0.1, 0.0)] * 21
+    landmark[8] = Landmark(nx, ny, 0.0)
+    landmark[4] = Landmark(nx + (0.005 if pinching else 0.06), ny, 0.0)
+    return TrackedHand(landmark, "Right", 0.9)
+
+
+def center(btn):
+    return btn.x + btn.width // 2, btn.y + btn.height // 2
+
+
+def player_targets(game, player):
+    """Titik yang dikunjungi pemain: word card (urutan berbeda per pemain) + baris jawabannya"""
+    words = [center(btn) for btn in game.buttons]
+    if player.index % 2:
+        words.reverse()
+    answer_slot = (REF_WIDTH // 2, game.answer_row_y(player) + 35)
+    return words[:4] + [answer_slot] + words[4:] + [answer_slot, answer_slot]
+
+
+def run(players, frames, n):
+    from quiz_game import QuizGame
+
+    random.seed(0)
+    rng = random.Random(1)
+    game = QuizGame(sampler_path=None, players=players)
+    loop = GameLoop(game)
+    game.current_category, game.current_difficulty = "Present", "easy"
+    game.start_quiz()
+    # Soal tidak selesai karena waktu habis selama benchmark
+    game.time_limit = 10 ** 6
+    targets = [player_targets(game, player) for player in game.players]
+
+    stats = TimingStats(f"{players} player(s)")
+    for i in range(n):
+        hands = []
+        for points in targets:
+            step, phase = divmod(i, PERIOD)
+            x0, y0 = points[step % len(points)]
+            x1, y1 = points[(step + 1) % len(points)]
+            # Bergerak ke target berikutnya di paruh pertama periode, lalu diam + pinch
+            u = min(1.0, phase / (PERIOD / 2))
+            hands.append(make_hand(x0 + (x1 - x0) * u, y0 + (y1 - y0) * u,
+                                   phase >= PERIOD - PINCH_FRAMES))
+        rng.shuffle(hands)
+        frame = frames[i % len(frames)].copy()
+        start = time.perf_counter()
+        loop.frame_hands(frame, hands, i / 30.0)
+        TEXT_CACHE.end_frame()
+        # Periode pertama = pemanasan (sprite teks + overlay soal pertama kali dibuat)
+        if i >= PERIOD:
+            stats.add(time.perf_counter() - start)
+
+    clicks = sum(len(player.picked) for player in game.players)
+    return stats.summary(), loop.update_stats.summary(), game.quiz_layer.rebuilds, clicks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Two-player quiz frame cost, 2 hands vs 1")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (REF_HEIGHT, REF_WIDTH, 3), dtype=np.uint8) for _ in range(4)]
+    rows = []
+    for retained in (False, True):
+        UILayer.enabled = retained
+        TextCache.enabled = True
+        for players in (1, 2):
+            rows.append((players, retained) + run(players, frames, args.frames))
+
+    print("\n" + "=" * 78)
+    print(f"{'players/hands':<14} {'drawing':<10} {'frame avg':>10} {'p95':>9} {'max':>9} "
+          f"{'update avg':>11} {'rebuilds':>9} {'picked':>7}")
+    for players, retained, frame, update, rebuilds, picked in rows:
+        print(f"{players:<14} {'retained' if retained else 'immediate':<10} {frame['avg_ms']:>7.2f} ms "
+              f"{frame['p95_ms']:>6.2f} ms {frame['max_ms']:>6.2f} ms {update['avg_ms'] * 1000:>8.0f} us "
+              f"{rebuilds:>9} {picked:>7}")
+    print("(frame = GameLoop.frame_hands di 1920x1080: input semua tangan + fixed step + render;\n"
+          " update = hover/hit-test + klik untuk semua pemain; picked = kata di jawaban akhir)")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark retained UI layer + text sprite cache per layar:
+- immediate: semua elemen dan teks digambar ulang setiap frame (perilaku lama)
+- text cache: teks lewat TextCache, elemen lain tetap digambar ulang
+- retained: TextCache + UILayer (overlay statis di-cache, hanya composite + tombol hover)
+
+Cursor bergerak menyapu layar sehingga hover berpindah-pindah antar tombol
+(rebuild overlay ikut terukur di frame time).
+
+Contoh:
+    python bench_ui_layer.py --frames 300
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from engine.perf_stats import TimingStats
+from engine.text_cache import TextCache
+from engine.ui_layer import UILayer
+
+WIDTH, HEIGHT = 1920, 1080
+
+
+def make_frames(count=4):
+    """Frame 'kamera' sintetis (noise) supaya composite tidak bisa curang dengan nilai konstan"""
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def cursor_path(n):
+    """Cursor bolak-balik vertikal di tengah layar (melewati tombol menu)"""
+    for i in range(n):
+        t = (i % 120) / 119.0
+        yield 960, int(250 + 700 * (1 - abs(2 * t - 1)))
+
+
+def quiz_screen(state):
+    from quiz_game import QuizGame
+
+    game = QuizGame(sampler_path=None)
+    if state == "MENU":
+        game.setup_menu()
+        return game, game.draw_menu, [game.menu_layer]
+    game.current_category = "Present"
+    game.setup_difficulty()
+    return game, game.draw_difficulty, [game.difficulty_layer]
+
+
+def guess_screen():
+    from guess_game import GuessGame
+
+    game = GuessGame(sampler_path=None)
+    game.setup_menu()
+    return game, game.draw_menu, [game.menu_layer]
+
+
+def draw_screen(word_mode):
+    from finger_draw_emoji import EmojiDrawer
+
+    drawer = EmojiDrawer(verbose=False)
+    if word_mode:
+        drawer.toggle_word_mode()
+    return drawer, drawer.draw_ui, [drawer.ui_layer]
+
+
+SCREENS = {
+    "quiz menu": lambda: quiz_screen("MENU"),
+    "quiz difficulty": lambda: quiz_screen("DIFFICULTY"),
+    "guess menu": guess_screen,
+    "draw ui (emoji)": lambda: draw_screen(False),
+    "draw ui (word)": lambda: draw_screen(True),
+}
+
+
+def run(name, frames, n, text_cache, retained):
+    TextCache.enabled = text_cache
+    UILayer.enabled = retained
+    target, draw, layers = SCREENS[name]()
+    stats = TimingStats(name)
+    buttons = getattr(target, "buttons", [])
+    for i, (x, y) in enumerate(cursor_path(n)):
+        frame = frames[i % len(frames)].copy()
+        start = time.perf_counter()
+        for btn in buttons:
+            btn.hovered = btn.contains_point(x, y)
+        draw(frame)
+        stats.add(time.perf_counter() - start)
+    rebuilds = sum(layer.rebuilds for layer in layers)
+    if hasattr(target, "images"):
+        target.images.shutdown()
+    return stats, rebuilds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retained UI layer vs immediate drawing")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--screen", choices=sorted(SCREENS), action="append",
+                        help="Layar yang diukur (boleh berulang, default semua)")
+    args = parser.parse_args()
+
+    frames = make_frames()
+    rows = []
+    for name in args.screen or SCREENS:
+        immediate, _ = run(name, frames, args.frames, text_cache=False, retained=False)
+        text_only, _ = run(name, frames, args.frames, text_cache=True, retained=False)
+        retained, rebuilds = run(name, frames, args.frames, text_cache=True, retained=True)
+        rows.append((name, immediate.summary(), text_only.summary(), retained.summary(), rebuilds))
+
+    print("\n" + "=" * 78)
+    print(f"{'screen':<18} {'immediate':>12} {'text cache':>12} {'retained':>12} "
+          f"{'p95 ret.':>10} {'rebuilds':>9}")
+    for name, imm, txt, ret, rebuilds in rows:
+        print(f"{name:<18} {imm['avg_ms']:>9.2f} ms {txt['avg_ms']:>9.2f} ms {ret['avg_ms']:>9.2f} ms "
+              f"{ret['p95_ms']:>7.2f} ms {rebuilds:>9}")
+    print("(retained termasuk biaya rebuild overlay saat hover pertama kali berpindah)")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
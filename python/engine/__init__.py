@@ -0,0 +1,26 @@
+"""
+Engine bersama untuk game OpenCV berbasis tangan (quiz_game.py, guess_game.py, ...).
+
+Isi package:
+    camera        kamera / replay rekaman + hand tracker (+ --record)
+    hand_input    cursor jari (One Euro filter) + pinch (hysteresis, debounce waktu)
+    game / loop   basis Game (state machine + hover/klik, multi-player) dan fixed-timestep GameLoop
+    widgets       Widget dasar + hit-testing (HitGrid: index grid per layout)
+    layout        koordinat desain 1920x1080 -> pixel frame (resolusi bebas)
+    animation     tween posisi widget (Slide/Motion) di clock simulasi
+    sprites       SpriteCache: widget dirender sekali, ditempel di posisi mana pun
+    data_watcher  hot reload: poll mtime file data, parse di background thread
+    display, ui_layer, text_cache, image_cache, perf_stats, hand_tracking, hand_recording
+
+Optimasi di sini (cache, capture, timing) langsung berlaku untuk semua game dan
+cukup di-benchmark sekali.
+"""
+
+from .animation import Motion, Slide
+from .camera import Camera
+from .game import Game
+from .hand_input import HandInput
+from .layout import LAYOUT, Layout
+from .loop import GameLoop, parse_game_args, run_game
+from .sprites import SpriteCache
+from .widgets import HitGrid, Widget, hit_test, set_hovered, update_hover
@@ -0,0 +1,76 @@
+"""
+Animasi posisi sederhana (tween) untuk widget UI: card yang pindah tempat meluncur
+dengan easing, bukan teleport.
+
+Waktu = clock game (waktu simulasi GameLoop), jadi animasi deterministik saat replay
+dan tidak bergantung FPS render. Slide hanya menghitung posisi; gambar tetap memakai
+sprite yang sudah di-cache (lihat sprites.py), sehingga biaya per frame animasi sama
+dengan biaya card yang diam.
+
+Contoh:
+    slide = Slide(start=(x0, y0), end=(btn.x, btn.y), now=self.clock())
+    x, y = slide.position(self.clock())
+"""
+
+# Durasi default perpindahan card (detik)
+SLIDE_TIME = 0.18
+
+
+def ease_out_cubic(t):
+    """Cepat di awal, melambat di akhir (0..1 -> 0..1)"""
+    return 1 - (1 - t) ** 3
+
+
+class Slide:
+    """Gerak dari start ke end (koordinat desain) dalam duration detik"""
+    def __init__(self, start, end, now, duration=SLIDE_TIME, ease=ease_out_cubic):
+        self.start = start
+        self.end = end
+        self.start_time = now
+        self.duration = duration
+        self.ease = ease
+
+    def progress(self, now):
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (now - self.start_time) / self.duration))
+
+    def position(self, now):
+        u = self.ease(self.progress(now))
+        return (self.start[0] + (self.end[0] - self.start[0]) * u,
+                self.start[1] + (self.end[1] - self.start[1]) * u)
+
+    def done(self, now):
+        return now - self.start_time >= self.duration
+
+
+class Motion:
+    """Posisi tampil untuk banyak widget: widget yang tidak sedang meluncur tampil di
+    posisi layout-nya (widget.x, widget.y)"""
+    def __init__(self, duration=SLIDE_TIME, ease=ease_out_cubic):
+        self.duration = duration
+        self.ease = ease
+        self.slides = {}  # widget -> Slide
+
+    def position(self, widget, now):
+        slide = self.slides.get(widget)
+        if slide is None:
+            return widget.x, widget.y
+        return slide.position(now)
+
+    def move(self, widget, x, y, now, start=None):
+        """Pindahkan widget ke (x, y): posisi layout langsung berubah (hit-test), tampilan
+        meluncur dari posisi tampil sekarang (atau dari start)"""
+        if start is None:
+            start = self.position(widget, now)
+        widget.x, widget.y = x, y
+        if start != (x, y):
+            self.slides[widget] = Slide(start, (x, y), now, self.duration, self.ease)
+
+    def prune(self, now):
+        """Buang slide yang sudah selesai (dipanggil dari step, bukan dari render)"""
+        for widget in [w for w, slide in self.slides.items() if slide.done(now)]:
+            del self.slides[widget]
+
+    def clear(self):
+        self.slides.clear()
@@ -0,0 +1,95 @@
+"""
+Sumber frame + hand tracker bersama untuk game berbasis tangan.
+
+Camera membuka kamera (atau HandReplay jika --replay) dan tracker yang cocok:
+saat replay, HandReplay sekaligus berperan sebagai tracker sehingga game jalan
+tanpa kamera dan tanpa MediaPipe. --record ikut ditangani di sini.
+
+Contoh:
+    camera = Camera(parse_replay_args())
+    if camera.open():
+        while True:
+            ok, frame, hands = camera.read()
+"""
+
+import time
+
+import cv2
+
+from .hand_recording import HandRecorder, HandReplay
+from .hand_tracking import HandTracker
+
+
+class Camera:
+    def __init__(self, args, index=0, api=cv2.CAP_ANY, width=1920, height=1080, fps=30,
+                 max_num_hands=1):
+        self.args = args
+        self.index = index
+        self.api = api
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.max_num_hands = max_num_hands
+        self.replaying = bool(args.replay)
+        self.cap = None
+        self.tracker = None
+        self.recorder = None
+
+    def open(self):
+        """Buka kamera/rekaman + tracker. Return False jika kamera tidak bisa dibuka"""
+        if self.replaying:
+            self.cap = HandReplay(self.args.replay)
+        else:
+            self.cap = cv2.VideoCapture(self.index, self.api)
+
+        if not self.cap.isOpened():
+            print("[X] ERROR: Cannot access camera!")
+            return False
+        print("[OK] Camera accessed successfully!")
+
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+
+        if self.replaying:
+            self.tracker = self.cap  # HandReplay juga berperan sebagai hand tracker
+        else:
+            self.tracker = HandTracker(
+                max_num_hands=self.max_num_hands,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.7
+            )
+
+        if self.args.record:
+            self.recorder = HandRecorder(self.args.record, save_frames=self.args.record_frames)
+        return True
+
+    def isOpened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def read(self):
+        """Frame berikutnya (sudah di-mirror) + tangan. Return (ok, frame, hands)"""
+        ret, frame = self.cap.read()
+        if not ret:
+            return False, None, []
+        frame = cv2.flip(frame, 1)
+        hands = self.tracker.process(frame)
+        if self.recorder:
+            self.recorder.write(hands, frame)
+        return True, frame, hands
+
+    def timestamp(self):
+        """Waktu frame terakhir dalam detik: timestamp rekaman saat replay, jam monotonic saat live"""
+        if self.replaying:
+            return self.cap.timestamp_ms() / 1000.0
+        return time.perf_counter()
+
+    def close(self):
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+        if self.tracker is not None and self.tracker is not self.cap:
+            self.tracker.close()
+        self.tracker = None
+        if self.cap is not None:
+            self.cap.release()
@@ -0,0 +1,100 @@
+"""
+Hot reload data game: deteksi save dari editor lalu parse data baru di background.
+
+Thread watcher mem-poll mtime + ukuran file data (murah: beberapa os.stat per
+interval). Saat berubah, fungsi load dipanggil di thread itu juga, jadi waktu
+parse tidak masuk frame time. Hasilnya disimpan sebagai satu objek baru; game
+mengambilnya dengan take() di awal step dan menukar referensinya sekaligus
+(tidak ada struktur data yang diubah setengah jalan).
+
+Contoh:
+    watcher = DataWatcher([DB_PATH], load_question_ids, "quiz data")
+    ...
+    data = watcher.take()      # None jika tidak ada data baru
+    if data is not None:
+        self.question_ids = data
+"""
+
+import os
+import threading
+import time
+
+from .perf_stats import TimingStats
+
+POLL_INTERVAL = 0.5
+
+
+class DataWatcher:
+    def __init__(self, paths, load, name, interval=POLL_INTERVAL):
+        self.paths = [str(path) for path in paths]
+        self.load = load
+        self.name = name
+        self.interval = interval
+        self.signature = self._signature()
+        self.pending = None  # hasil load terbaru yang belum diambil game
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopped = threading.Event()
+        self.forced = False
+        self.reloads = 0
+        self.parse_stats = TimingStats(f"{name} reload parse (background)")
+        self.thread = threading.Thread(target=self._run, name=f"{name} watcher", daemon=True)
+        self.thread.start()
+
+    def _signature(self):
+        """(mtime, ukuran) per file; file yang tidak ada = None"""
+        signature = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _run(self):
+        while not self.stopped.is_set():
+            self.wake.wait(self.interval)
+            self.wake.clear()
+            if self.stopped.is_set():
+                break
+            signature = self._signature()
+            if signature == self.signature and not self.forced:
+                continue
+            self.signature = signature
+            self.forced = False
+
+            start = time.perf_counter()
+            try:
+                data = self.load()
+            except Exception as e:
+                # Mis. file sedang ditulis: coba lagi di poll berikutnya
+                print(f"[X] {self.name} reload failed: {e}")
+                self.signature = None
+                continue
+            self.parse_stats.add(time.perf_counter() - start)
+            with self.lock:
+                self.pending = data
+                self.reloads += 1
+
+    def request(self):
+        """Paksa reload di background (mis. tombol 'r'), tanpa menunggu file berubah"""
+        self.forced = True
+        self.wake.set()
+
+    def take(self):
+        """Data baru sejak take() terakhir, atau None. Murah, aman dipanggil tiap step"""
+        if self.pending is None:
+            return None
+        with self.lock:
+            data, self.pending = self.pending, None
+        return data
+
+    def stop(self):
+        self.stopped.set()
+        self.wake.set()
+
+    def report(self):
+        print(f"[STATS] {self.name} hot reloads: {self.reloads}")
+        if self.reloads:
+            self.parse_stats.report()
@@ -0,0 +1,109 @@
+"""
+Window / display manager bersama untuk semua game OpenCV.
+
+Window dibuat dan dikonfigurasi SEKALI (bukan namedWindow + resizeWindow setiap
+frame), lalu setiap frame cukup satu panggilan show() = imshow + waitKey.
+
+- F: toggle fullscreen
+- ukuran window dicek berkala (bukan tiap frame) untuk resize, aspect ratio dijaga
+  oleh WINDOW_KEEPRATIO
+- window ditutup lewat tombol X -> display.closed = True
+- headless=True: tidak ada window sama sekali (replay / benchmark)
+
+Contoh:
+    with Display("Guess The Picture") as display:
+        while not display.closed:
+            key = display.show(frame) & 0xFF
+"""
+
+import time
+
+import cv2
+
+from .perf_stats import TimingStats
+
+# Cek properti window (visible / ukuran) tiap N frame saja, karena tiap cek = round-trip HighGUI
+POLL_EVERY = 15
+
+
+class Display:
+    def __init__(self, title, width=1920, height=1080, fullscreen=False, headless=False):
+        self.title = title
+        self.width = width
+        self.height = height
+        self.fullscreen = fullscreen
+        self.headless = headless
+        self.created = False
+        self.closed = False
+        self.window_size = (width, height)
+        self.frames = 0
+        self.stats = TimingStats(f"Display present ({title})")
+
+    def _create(self):
+        cv2.namedWindow(self.title, cv2.WINDOW_NORMAL | cv2.WINDOW_KEEPRATIO)
+        cv2.resizeWindow(self.title, self.width, self.height)
+        if self.fullscreen:
+            cv2.setWindowProperty(self.title, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+        self.created = True
+
+    def toggle_fullscreen(self):
+        self.fullscreen = not self.fullscreen
+        if self.created:
+            cv2.setWindowProperty(self.title, cv2.WND_PROP_FULLSCREEN,
+                                  cv2.WINDOW_FULLSCREEN if self.fullscreen else cv2.WINDOW_NORMAL)
+            if not self.fullscreen:
+                cv2.resizeWindow(self.title, self.width, self.height)
+        print(f"[*] Fullscreen: {'on' if self.fullscreen else 'off'}")
+
+    def _poll_window(self):
+        """Deteksi window ditutup dan perubahan ukuran"""
+        try:
+            if cv2.getWindowProperty(self.title, cv2.WND_PROP_VISIBLE) < 1:
+                self.closed = True
+                return
+            _, _, w, h = cv2.getWindowImageRect(self.title)
+        except cv2.error:
+            self.closed = True
+            return
+        if w > 0 and h > 0 and (w, h) != self.window_size:
+            self.window_size = (w, h)
+            self.on_resize(w, h)
+
+    def on_resize(self, width, height):
+        """Dipanggil saat ukuran window berubah (override/replace jika perlu)"""
+        pass
+
+    def show(self, frame, delay=1):
+        """Tampilkan frame dan proses event window. Return key seperti cv2.waitKey (-1 = tidak ada)"""
+        if self.headless:
+            return -1
+        start = time.perf_counter()
+        if not self.created:
+            self._create()
+        cv2.imshow(self.title, frame)
+        key = cv2.waitKey(delay)
+        self.frames += 1
+        if self.frames % POLL_EVERY == 0:
+            self._poll_window()
+        if key != -1 and (key & 0xFF) in (ord('f'), ord('F')):
+            self.toggle_fullscreen()
+        self.stats.add(time.perf_counter() - start)
+        return key
+
+    def close(self):
+        if self.created:
+            try:
+                cv2.destroyWindow(self.title)
+            except cv2.error:
+                pass
+            self.created = False
+
+    def report(self):
+        if self.stats.count:
+            self.stats.report()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
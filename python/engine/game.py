@@ -0,0 +1,195 @@
+"""
+Basis game layar-tombol yang digerakkan tangan (dipakai QuizGame dan GuessGame).
+
+Update dan render dipisah:
+    step(now)      satu fixed step logika: hover, klik (event "click") dan event "tick"
+    render(frame)  gambar state sekarang lewat draw_<state>(frame), lalu pointer jari
+
+Subclass menyediakan (lihat state_machine.py untuk konvensi nama):
+    enter_<state>() / on_<state>_click(btn) / on_<state>_tick(now)
+    draw_<state>(frame), clickable_buttons(), draw_pointer(frame)
+    reload() untuk tombol 'r', report() untuk statistik saat keluar
+    apply_data(data) untuk data baru dari self.watcher (DataWatcher, hot reload)
+
+Multi-player (players > 1): satu HandInput per pemain di self.hands, tombol per pemain
+dari clickable_buttons(player) dan event "click" membawa player=<index>.
+
+Hit-test memakai HitGrid per pemain yang dibangun ulang hanya saat layout bisa berubah:
+transisi state, klik, data baru, atau invalidate_layout() dari subclass. Widget yang
+hover-nya berubah (atau ditandai subclass lewat mark_dirty) dikumpulkan di self.dirty
+sampai render berikutnya, supaya hanya widget itu yang digambar ulang.
+"""
+
+import time
+
+from .hand_input import HandInput, assign_hands
+from .state_machine import StateMachine
+from .widgets import HitGrid, set_hovered
+
+
+class Game:
+    # Gaya skeleton tangan untuk draw_hand (diisi subclass)
+    hand_style = {}
+
+    def __init__(self, players=1):
+        # clock bisa diganti (GameLoop memakai waktu simulasi) supaya timer deterministik saat replay
+        self.clock = time.time
+        self.fsm = StateMachine(self, clock=lambda: self.clock())
+        self.hand = HandInput()
+        # Satu HandInput per pemain; pemain pertama = self.hand
+        self.hands = [self.hand] + [HandInput() for _ in range(players - 1)]
+        # Mode multi-player: pemain yang kliknya dicek pertama bergiliran (adil saat bersamaan)
+        self.next_player = 0
+        self.buttons = []
+        # Index hit-test per pemain untuk layout sekarang + target hover terakhir per pemain
+        self.layout_version = 0
+        self.hit_grids = {}
+        self.hit_grids_version = None
+        self.hover_targets = [None] * players
+        # Widget yang tampilannya berubah sejak render terakhir (hover, pilihan, ...)
+        self.dirty = set()
+        # DataWatcher opsional: data yang di-parse di background ditukar di awal step
+        self.watcher = None
+
+    @property
+    def state(self):
+        return self.fsm.state
+
+    @property
+    def finger_pos(self):
+        return self.hand.pos
+
+    @property
+    def is_pinching(self):
+        return self.hand.pinching
+
+    def set_hand(self, hand, width, height, now=None):
+        """Update finger position dan pinch state dari hasil hand tracking (None = tidak ada tangan)"""
+        self.hand.update(hand, width, height, now)
+
+    def set_hands(self, hands, width, height, now=None):
+        """Semua tangan hasil tracking -> HandInput per pemain"""
+        if len(self.hands) == 1:
+            self.set_hand(hands[0] if hands else None, width, height, now)
+            return
+        for hand_input, hand in zip(self.hands, assign_hands(self.hands, hands, width, height)):
+            hand_input.update(hand, width, height, now)
+
+    def clickable_buttons(self):
+        """Semua button yang bisa di-hover/klik di state sekarang"""
+        return self.buttons
+
+    def hovered_button(self):
+        """Button yang sedang di-hover (digambar langsung di atas UI layer), atau None"""
+        return next((btn for btn in self.buttons if btn.hovered), None)
+
+    def hovered_buttons(self):
+        """Semua button yang sedang di-hover (multi-player: bisa lebih dari satu)"""
+        return [btn for btn in self.buttons if btn.hovered]
+
+    def handle_button_click(self, btn):
+        """Klik button = event "click" untuk state sekarang"""
+        self.fsm.dispatch("click", btn=btn)
+        self.invalidate_layout()
+
+    def invalidate_layout(self):
+        """Daftar button berubah di luar klik/transisi: bangun ulang index hit-test"""
+        self.layout_version += 1
+
+    def mark_dirty(self, widgets):
+        """Tandai widget yang tampilannya berubah (digambar ulang di render berikutnya)"""
+        self.dirty.update(widgets)
+
+    def hit_grid(self, player=0):
+        """HitGrid untuk clickable_buttons pemain, dibangun sekali per layout"""
+        version = (self.fsm.transitions, self.layout_version)
+        if version != self.hit_grids_version:
+            self.hit_grids = {}
+            self.hit_grids_version = version
+        grid = self.hit_grids.get(player)
+        if grid is None:
+            buttons = self.clickable_buttons(player) if len(self.hands) > 1 else self.clickable_buttons()
+            grid = self.hit_grids[player] = HitGrid(buttons)
+        return grid
+
+    def update_hover(self):
+        """Hit-test cursor setiap pemain. Return target per pemain (button atau None).
+
+        Satu pemain: cursor yang hilang (tidak ada tangan) membiarkan hover terakhir apa
+        adanya. Multi-player: hover pemain itu dilepas.
+        """
+        keep = len(self.hands) == 1
+        targets = []
+        hovered = []
+        for player, hand in enumerate(self.hands):
+            target = self.hit_grid(player).hit(hand.pos)
+            targets.append(target)
+            hovered.append(self.hover_targets[player] if keep and hand.pos is None else target)
+        if hovered != self.hover_targets:
+            self.dirty |= set_hovered(self.hover_targets, hovered)
+            self.hover_targets = hovered
+        return targets
+
+    def step(self, now):
+        """Satu fixed step: input -> event (transisi state). Tidak menggambar apa pun"""
+        if self.watcher is not None:
+            data = self.watcher.take()
+            if data is not None:
+                self.apply_data(data)
+                self.invalidate_layout()
+
+        targets = self.update_hover()
+        if len(self.hands) > 1:
+            self.step_players(targets)
+        elif self.hand.take_click() and targets[0] is not None:
+            # Paling banyak satu klik per step (button list bisa berubah setelah klik).
+            # Klik ganda dicegah di HandInput (hysteresis + debounce waktu), bukan cooldown frame
+            self.handle_button_click(targets[0])
+
+        self.fsm.dispatch("tick", now=now)
+
+    def step_players(self, targets):
+        """Klik multi-player. Tetap satu klik per step: klik pemain lain di-latch
+        ke step berikutnya, dihitung ulang terhadap button list yang baru"""
+        count = len(self.hands)
+        clicked = None
+        for offset in range(count):
+            player = (self.next_player + offset) % count
+            if targets[player] is None:
+                # Pinch di luar button tidak disimpan sampai cursor kena button
+                self.hands[player].take_click()
+            elif clicked is None and self.hands[player].take_click():
+                clicked = player
+        if clicked is not None:
+            self.next_player = (clicked + 1) % count
+            self.fsm.dispatch("click", btn=targets[clicked], player=clicked)
+            self.invalidate_layout()
+
+    def render(self, frame):
+        """Gambar state sekarang (tidak mengubah state)"""
+        draw = getattr(self, f"draw_{self.state.lower()}", None)
+        if draw:
+            draw(frame)
+        self.dirty.clear()
+        self.draw_pointer(frame)
+
+    def update(self, frame):
+        """Satu step + render tanpa GameLoop (mis. benchmark satu layar)"""
+        self.step(self.clock())
+        self.render(frame)
+
+    def draw_pointer(self, frame):
+        pass
+
+    def draw_overlay(self, frame):
+        """Status bar di atas game (quit/reload)"""
+        pass
+
+    def reload(self):
+        pass
+
+    def apply_data(self, data):
+        pass
+
+    def report(self):
+        pass
@@ -0,0 +1,177 @@
+"""
+Input tangan bersama: posisi ujung telunjuk + pinch (telunjuk dan jempol berdekatan).
+
+Cursor difilter One Euro filter (Casiez dkk. 2012): saat jari diam cutoff rendah
+(jitter landmark diredam), saat jari bergerak cepat cutoff naik sehingga cursor
+hampir tanpa lag. Berbeda dengan moving average yang selalu tertinggal beberapa frame.
+
+Pinch memakai jarak telunjuk-jempol dibagi ukuran tangan (pergelangan -> pangkal jari
+tengah), jadi sama saja untuk tangan dekat atau jauh dari kamera, dengan hysteresis:
+mulai pinch di bawah PINCH_ON, lepas baru di atas PINCH_OFF (tidak berkedip di batas).
+Klik = pinch yang baru dimulai, paling cepat CLICK_DEBOUNCE detik setelah klik
+sebelumnya (berbasis waktu, bukan jumlah frame).
+
+Klik di-latch sampai diambil oleh update game (take_click), sehingga tidak hilang
+walaupun di frame itu tidak ada fixed step.
+
+Mode multi-player: assign_hands memasangkan tangan hasil tracking ke HandInput
+masing-masing pemain.
+
+Contoh:
+    hand_input.update(hands[0] if hands else None, w, h, now)
+    if hand_input.take_click():
+        ...
+"""
+
+import itertools
+import math
+import time
+
+from .hand_tracking import INDEX_TIP, MIDDLE_MCP, THUMB_TIP, WRIST
+
+# Jarak telunjuk-jempol / ukuran tangan: mulai pinch di bawah ON, lepas di atas OFF
+PINCH_ON = 0.3
+PINCH_OFF = 0.45
+# Ukuran tangan (pergelangan -> pangkal jari tengah) relatif ke lebar frame, dipakai jika
+# landmark tidak memberi ukuran (mis. tangan sintetis). 0.3 x 130 px ~ ambang lama 40 px di 1920
+REFERENCE_HAND_SIZE = 130 / 1920
+# Klik berikutnya paling cepat setelah N detik (pengganti cooldown 15 frame)
+CLICK_DEBOUNCE = 0.15
+
+# One Euro filter untuk cursor (koordinat pixel/desain, kecepatan dalam pixel per detik)
+MIN_CUTOFF = 1.0
+BETA = 0.01
+D_CUTOFF = 1.0
+
+
+def _alpha(cutoff, dt):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """One Euro filter 2D: cutoff = MIN_CUTOFF + BETA x kecepatan (yang juga difilter)"""
+    def __init__(self, min_cutoff=MIN_CUTOFF, beta=BETA, d_cutoff=D_CUTOFF):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.value = None
+        self.speed = 0.0
+        self.last_time = None
+
+    def filter(self, point, now):
+        """point (x, y) pada waktu now (detik) -> (x, y) terfilter (float)"""
+        if self.value is None:
+            self.value = (float(point[0]), float(point[1]))
+            self.last_time = now
+            return self.value
+        dt = now - self.last_time
+        if dt <= 0:
+            # Timestamp sama (mis. dua update di frame yang sama): anggap satu frame 30 FPS
+            dt = 1.0 / 30
+        self.last_time = now
+
+        x, y = self.value
+        speed = math.hypot(point[0] - x, point[1] - y) / dt
+        self.speed += _alpha(self.d_cutoff, dt) * (speed - self.speed)
+        a = _alpha(self.min_cutoff + self.beta * self.speed, dt)
+        self.value = (x + a * (point[0] - x), y + a * (point[1] - y))
+        return self.value
+
+
+def hand_size(hand, width, height):
+    """Jarak pergelangan -> pangkal jari tengah (pixel), atau ukuran referensi jika nol"""
+    wrist, middle = hand.landmark[WRIST], hand.landmark[MIDDLE_MCP]
+    size = math.hypot((wrist.x - middle.x) * width, (wrist.y - middle.y) * height)
+    return size if size > 1e-3 * width else REFERENCE_HAND_SIZE * width
+
+
+class PinchDetector:
+    """Pinch dengan hysteresis pada jarak ternormalisasi ukuran tangan + debounce waktu"""
+    def __init__(self, pinch_on=PINCH_ON, pinch_off=PINCH_OFF, debounce=CLICK_DEBOUNCE):
+        self.pinch_on = pinch_on
+        self.pinch_off = pinch_off
+        self.debounce = debounce
+        self.pinching = False
+        self.ratio = None
+        self.last_click = None
+
+    def update(self, hand, width, height, now):
+        """Return True jika pinch baru dimulai (klik) di update ini"""
+        if hand is None:
+            self.pinching = False
+            self.ratio = None
+            return False
+        index, thumb = hand.landmark[INDEX_TIP], hand.landmark[THUMB_TIP]
+        distance = math.hypot((index.x - thumb.x) * width, (index.y - thumb.y) * height)
+        self.ratio = distance / hand_size(hand, width, height)
+
+        was_pinching = self.pinching
+        self.pinching = self.ratio < (self.pinch_off if was_pinching else self.pinch_on)
+        if not self.pinching or was_pinching:
+            return False
+        if self.last_click is not None and now - self.last_click < self.debounce:
+            return False
+        self.last_click = now
+        return True
+
+
+class HandInput:
+    def __init__(self):
+        self.cursor = OneEuroFilter()
+        self.pinch = PinchDetector()
+        self.pos = None
+        self.raw_pos = None
+        self.pinching = False
+        self.clicked = False
+
+    def update(self, hand, width, height, now=None):
+        """Update dari hasil hand tracking (None = tidak ada tangan), now = timestamp frame (detik)"""
+        now = time.perf_counter() if now is None else now
+        if self.pinch.update(hand, width, height, now):
+            self.clicked = True
+        self.pinching = self.pinch.pinching
+
+        if hand is None:
+            self.pos = None
+            self.raw_pos = None
+            self.cursor.reset()
+            return
+
+        index = hand.landmark[INDEX_TIP]
+        self.raw_pos = (index.x * width, index.y * height)
+        x, y = self.cursor.filter(self.raw_pos, now)
+        self.pos = (int(x), int(y))
+
+    def take_click(self):
+        """True sekali untuk setiap pinch baru (lalu di-reset)"""
+        clicked, self.clicked = self.clicked, False
+        return clicked
+
+
+def assign_hands(inputs, hands, width, height):
+    """Pasangkan tangan ke HandInput pemain. Return list sejajar inputs (tangan atau None).
+
+    Urutan hasil tracker tidak stabil, jadi tangan dipasangkan ke cursor terakhir yang
+    terdekat (total jarak minimum) supaya pemain tidak tertukar; pemain yang belum punya
+    cursor memakai sisi layarnya (pemain 1 kiri, pemain 2 kanan, ...).
+    """
+    count = len(inputs)
+    slots = list(hands) + [None] * max(0, count - len(hands))
+
+    def cost(player, hand):
+        if hand is None:
+            return 0.0
+        index = hand.landmark[INDEX_TIP]
+        x, y = index.x * width, index.y * height
+        last = inputs[player].raw_pos
+        if last is None:
+            return abs(x - (player + 0.5) * width / count)
+        return math.hypot(x - last[0], y - last[1])
+
+    best = min(itertools.permutations(range(len(slots)), count),
+               key=lambda order: sum(cost(player, slots[slot]) for player, slot in enumerate(order)))
+    return [slots[slot] for slot in best]
@@ -0,0 +1,296 @@
+"""
+Rekam dan putar ulang (replay) stream landmark tangan tanpa kamera dan tanpa MediaPipe.
+
+Format file (.hlr, little-endian, ringkas):
+    header : magic "HLRC", version u8, flags u8 (bit0 = ada frame), width u16, height u16
+    record : timestamp_ms u32, num_hands u8, has_frame u8
+             per tangan: handedness u8 (0=Left, 1=Right, 2=Unknown), score f16,
+                         21 x (x, y, z) f16
+             jika has_frame: panjang u32 + bytes JPEG
+
+Satu frame tanpa gambar = 6 + 129 byte per tangan, jadi rekaman 1 menit @30fps
+dengan 1 tangan hanya ~240 KB.
+
+Pemakaian di game:
+    python quiz_game.py --record sesi.hlr [--record-frames]
+    python quiz_game.py --replay sesi.hlr
+"""
+
+import argparse
+import struct
+import time
+
+import cv2
+import numpy as np
+
+from .hand_tracking import Landmark, TrackedHand
+
+MAGIC = b"HLRC"
+VERSION = 1
+FLAG_FRAMES = 1
+
+_HEADER = struct.Struct("<4sBBHH")
+_RECORD = struct.Struct("<IBB")
+_HAND = struct.Struct("<Be")
+_NUM_VALUES = 21 * 3
+
+_HANDEDNESS_CODES = {"Left": 0, "Right": 1}
+_HANDEDNESS_NAMES = {0: "Left", 1: "Right"}
+
+
+class HandRecorder:
+    """Simpan landmark tangan (dan opsional frame JPEG) per frame ke file biner"""
+    def __init__(self, path, save_frames=False, jpeg_quality=80):
+        self.path = path
+        self.save_frames = save_frames
+        self.jpeg_quality = jpeg_quality
+        self.start = None
+        self.frames_written = 0
+        self.file = open(path, "wb")
+        self.header_written = False
+        print(f"[OK] Recording hand landmarks to: {path}")
+
+    def write(self, hands, frame, timestamp_ms=None):
+        """Tulis satu frame. timestamp_ms default = waktu sejak rekaman dimulai"""
+        if not self.header_written:
+            # Ukuran frame baru diketahui saat frame pertama
+            height, width = frame.shape[:2]
+            self.file.write(_HEADER.pack(MAGIC, VERSION, FLAG_FRAMES if self.save_frames else 0,
+                                         width, height))
+            self.header_written = True
+
+        if timestamp_ms is None:
+            now = time.perf_counter()
+            if self.start is None:
+                self.start = now
+            timestamp_ms = int((now - self.start) * 1000)
+
+        jpeg = None
+        if self.save_frames:
+            ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+            if ok:
+                jpeg = buf.tobytes()
+
+        chunks = [_RECORD.pack(int(timestamp_ms), len(hands), 1 if jpeg is not None else 0)]
+        for hand in hands:
+            chunks.append(_HAND.pack(_HANDEDNESS_CODES.get(hand.handedness, 2), hand.score))
+            values = np.array([(lm.x, lm.y, lm.z) for lm in hand.landmark], dtype=np.float16)
+            chunks.append(values.tobytes())
+        if jpeg is not None:
+            chunks.append(struct.pack("<I", len(jpeg)))
+            chunks.append(jpeg)
+        self.file.write(b"".join(chunks))
+        self.frames_written += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+            print(f"[OK] Recorded {self.frames_written} frames to: {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_recording(path):
+    """Baca seluruh rekaman. Return (width, height, has_frames, list of (timestamp_ms, hands, jpeg_bytes))"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, flags, width, height = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"Not a hand recording file: {path}")
+    if version != VERSION:
+        raise ValueError(f"Unsupported recording version {version}: {path}")
+
+    entries = []
+    offset = _HEADER.size
+    hand_bytes = _NUM_VALUES * 2
+    while offset + _RECORD.size <= len(data):
+        timestamp_ms, num_hands, has_frame = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        hands = []
+        for _ in range(num_hands):
+            code, score = _HAND.unpack_from(data, offset)
+            offset += _HAND.size
+            values = np.frombuffer(data, dtype=np.float16, count=_NUM_VALUES, offset=offset)
+            offset += hand_bytes
+            values = values.astype(np.float32).reshape(21, 3)
+            landmark = [Landmark(float(x), float(y), float(z)) for x, y, z in values]
+            hands.append(TrackedHand(landmark, _HANDEDNESS_NAMES.get(code, "Unknown"), float(score)))
+        jpeg = None
+        if has_frame:
+            (length,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            jpeg = data[offset:offset + length]
+            offset += length
+        entries.append((timestamp_ms, hands, jpeg))
+
+    return width, height, bool(flags & FLAG_FRAMES), entries
+
+
+class HandReplay:
+    """Pengganti kamera + HandTracker yang memutar ulang rekaman .hlr.
+
+    read() meniru cv2.VideoCapture.read() (frame rekaman, atau frame gelap jika
+    rekaman tidak berisi gambar) dan process() meniru HandTracker.process()
+    dengan mengembalikan landmark dari frame yang terakhir dibaca.
+
+    realtime=True  -> tempo diatur sesuai timestamp rekaman (untuk main game)
+    realtime=False -> secepat mungkin (untuk benchmark / test headless)
+    """
+    def __init__(self, path, realtime=True, loop=False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.width, self.height, self.has_frames, self.entries = read_recording(path)
+        self.index = -1
+        self.current_hands = []
+        self.start = None
+        self.blank = np.full((self.height, self.width, 3), 30, dtype=np.uint8)
+        print(f"[OK] Replaying {len(self.entries)} frames from: {path} ({self.width}x{self.height})")
+
+    # --- cv2.VideoCapture-like ---
+    def isOpened(self):
+        return self.loop or self.index + 1 < len(self.entries)
+
+    def set(self, prop, value):
+        return False
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.entries))
+        return 0.0
+
+    def read(self):
+        if not self.entries:
+            return False, None
+        self.index += 1
+        if self.index >= len(self.entries):
+            if not self.loop:
+                return False, None
+            self.index = 0
+            self.start = None
+
+        timestamp_ms, hands, jpeg = self.entries[self.index]
+        if self.realtime:
+            now = time.perf_counter()
+            if self.start is None:
+                self.start = now - timestamp_ms / 1000.0
+            delay = self.start + timestamp_ms / 1000.0 - now
+            if delay > 0:
+                time.sleep(delay)
+
+        self.current_hands = hands
+        if jpeg is None:
+            return True, self.blank.copy()
+        frame = cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+        # Rekaman disimpan setelah cv2.flip, game akan flip lagi -> balikkan dulu
+        return True, cv2.flip(frame, 1)
+
+    def release(self):
+        pass
+
+    # --- HandTracker-like ---
+    def process(self, frame_bgr, timestamp_ms=None):
+        return self.current_hands
+
+    def timestamp_ms(self):
+        """Timestamp rekaman dari frame yang terakhir dibaca"""
+        if 0 <= self.index < len(self.entries):
+            return self.entries[self.index][0]
+        return 0
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ReplayHandDetector:
+    """Adapter cvzone HandDetector (findHands/fingersUp) di atas HandReplay, untuk gamesLearning"""
+    tipIds = [4, 8, 12, 16, 20]
+
+    def __init__(self, replay):
+        self.replay = replay
+
+    def findHands(self, img, draw=True, flipType=True):
+        h, w = img.shape[:2]
+        all_hands = []
+        for hand in self.replay.process(img):
+            lm_list = [[int(lm.x * w), int(lm.y * h), int(lm.z * w)] for lm in hand.landmark]
+            xs = [p[0] for p in lm_list]
+            ys = [p[1] for p in lm_list]
+            bbox = (min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+            hand_type = hand.handedness
+            if flipType and hand_type in ("Left", "Right"):
+                hand_type = "Left" if hand_type == "Right" else "Right"
+            all_hands.append({
+                "lmList": lm_list,
+                "bbox": bbox,
+                "center": (bbox[0] + bbox[2] // 2, bbox[1] + bbox[3] // 2),
+                "type": hand_type,
+            })
+        return all_hands, img
+
+    def fingersUp(self, hand):
+        lm_list = hand["lmList"]
+        fingers = []
+        # Thumb (sumbu x, tergantung tangan kiri/kanan) - sama seperti cvzone
+        if hand["type"] == "Right":
+            fingers.append(1 if lm_list[self.tipIds[0]][0] > lm_list[self.tipIds[0] - 1][0] else 0)
+        else:
+            fingers.append(1 if lm_list[self.tipIds[0]][0] < lm_list[self.tipIds[0] - 1][0] else 0)
+        # 4 jari lainnya (sumbu y)
+        for tip in self.tipIds[1:]:
+            fingers.append(1 if lm_list[tip][1] < lm_list[tip - 2][1] else 0)
+        return fingers
+
+
+class RecordingHandDetector:
+    """Bungkus cvzone HandDetector: teruskan findHands dan rekam landmark-nya (gamesLearning)"""
+    def __init__(self, detector, recorder):
+        self.detector = detector
+        self.recorder = recorder
+
+    def findHands(self, img, draw=True, flipType=True):
+        hands, img_out = self.detector.findHands(img, draw=draw, flipType=flipType)
+        h, w = img.shape[:2]
+        tracked = []
+        for hand in hands or []:
+            landmark = [Landmark(x / w, y / h, z / w) for x, y, z in hand["lmList"]]
+            hand_type = hand.get("type", "Unknown")
+            if flipType and hand_type in ("Left", "Right"):
+                hand_type = "Left" if hand_type == "Right" else "Right"
+            tracked.append(TrackedHand(landmark, hand_type, 1.0))
+        self.recorder.write(tracked, img)
+        return hands, img_out
+
+    def fingersUp(self, hand):
+        return self.detector.fingersUp(hand)
+
+
+def add_replay_arguments(parser):
+    """Tambahkan opsi --record/--record-frames/--replay ke argparse parser"""
+    parser.add_argument("--record", metavar="FILE", help="Rekam landmark tangan ke file .hlr")
+    parser.add_argument("--record-frames", action="store_true",
+                        help="Ikut simpan frame kamera (JPEG) di rekaman")
+    parser.add_argument("--replay", metavar="FILE", help="Putar ulang rekaman .hlr (tanpa kamera)")
+    return parser
+
+
+def parse_replay_args(argv=None):
+    """Parse opsi record/replay, abaikan argumen lain (mis. camera index)"""
+    parser = add_replay_arguments(argparse.ArgumentParser(add_help=False))
+    args, _unknown = parser.parse_known_args(argv)
+    return args
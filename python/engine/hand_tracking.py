@@ -0,0 +1,298 @@
+"""
+Shared hand tracking untuk semua game berbasis tangan.
+
+Memakai MediaPipe Tasks HandLandmarker dalam mode VIDEO (detect_for_video dengan
+timestamp), sama seperti detect_face.py memakai FaceLandmarker + file .task.
+Frame bisa di-downscale ke resolusi inference yang lebih kecil, dan (opsional)
+hanya area di sekitar tangan (ROI) yang diproses.
+
+File model hand_landmarker.task tidak ada di repo: saat pertama dipakai model di-download
+dari MODEL_URL lalu diverifikasi (bundle zip utuh berisi model detector + landmarks)
+sebelum dipasang. Jika download gagal (mis. offline), tracker fallback ke legacy
+mp.solutions.hands supaya game tetap bisa jalan; backend yang aktif selalu dicetak.
+
+MediaPipe baru di-import saat backend dibuat, sehingga TrackedHand dan
+draw_hand bisa dipakai (misalnya oleh replay rekaman) tanpa MediaPipe.
+"""
+
+import os
+import shutil
+import time
+import urllib.request
+import zipfile
+from collections import namedtuple
+
+import cv2
+
+# File model ada di folder python/ (di atas package engine), sama seperti face_landmarker.task
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_PATH = os.path.join(BASE_DIR, "hand_landmarker.task")
+MODEL_URL = ("https://storage.googleapis.com/mediapipe-models/hand_landmarker/"
+             "hand_landmarker/float16/1/hand_landmarker.task")
+# Isi wajib bundle .task (zip); file download yang terpotong/rusak gagal di testzip (CRC)
+MODEL_MEMBERS = {"hand_detector.tflite", "hand_landmarks_detector.tflite"}
+MODEL_DOWNLOAD_TIMEOUT = 30
+
+# Lebar frame yang dikirim ke model (tinggi mengikuti aspect ratio).
+# Model internal MediaPipe bekerja di ~224px, jadi 640 sudah lebih dari cukup.
+DEFAULT_INFERENCE_WIDTH = 640
+
+# Index landmark yang sering dipakai
+WRIST = 0
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+
+HAND_CONNECTIONS = [
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+]
+
+Landmark = namedtuple("Landmark", ["x", "y", "z"])
+
+
+class TrackedHand:
+    """Satu tangan hasil tracking. Koordinat landmark dinormalisasi ke frame penuh (0..1)"""
+    def __init__(self, landmark, handedness="Unknown", score=0.0):
+        self.landmark = landmark
+        self.handedness = handedness
+        self.score = score
+
+    def point(self, index, width, height):
+        """Koordinat pixel (int) dari landmark index"""
+        lm = self.landmark[index]
+        return int(lm.x * width), int(lm.y * height)
+
+    def bbox(self):
+        """Bounding box ternormalisasi (x1, y1, x2, y2)"""
+        xs = [lm.x for lm in self.landmark]
+        ys = [lm.y for lm in self.landmark]
+        return min(xs), min(ys), max(xs), max(ys)
+
+
+def draw_hand(frame, hand, point_color=(0, 255, 100), line_color=(0, 180, 255),
+              thickness=2, radius=2):
+    """Gambar skeleton tangan (pengganti mp_draw.draw_landmarks)"""
+    h, w = frame.shape[:2]
+    pts = [(int(lm.x * w), int(lm.y * h)) for lm in hand.landmark]
+    for a, b in HAND_CONNECTIONS:
+        cv2.line(frame, pts[a], pts[b], line_color, thickness, cv2.LINE_AA)
+    for p in pts:
+        cv2.circle(frame, p, radius, point_color, -1, cv2.LINE_AA)
+
+
+def verify_model(path):
+    """True jika path adalah bundle .task yang utuh"""
+    try:
+        with zipfile.ZipFile(path) as bundle:
+            return MODEL_MEMBERS <= set(bundle.namelist()) and bundle.testzip() is None
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def ensure_model(path=MODEL_PATH, url=MODEL_URL):
+    """Pastikan model hand landmarker ada dan utuh; download sekali jika belum.
+    File ditulis ke file sementara dan baru dipasang (os.replace) setelah lolos verifikasi.
+    Return True jika model siap dipakai"""
+    if os.path.exists(path):
+        if verify_model(path):
+            return True
+        print(f"[!] Hand model is corrupt, downloading again: {path}")
+    print(f"[*] Downloading hand model (first run): {url}")
+    tmp = f"{path}.{os.getpid()}.download"
+    try:
+        with urllib.request.urlopen(url, timeout=MODEL_DOWNLOAD_TIMEOUT) as response, open(tmp, "wb") as f:
+            shutil.copyfileobj(response, f)
+        if not verify_model(tmp):
+            print(f"[X] Downloaded hand model is not a valid .task bundle: {url}")
+            return False
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[X] Hand model download failed: {e}")
+        return False
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+    print(f"[OK] Hand model saved: {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    return True
+
+
+class _TasksBackend:
+    """MediaPipe Tasks HandLandmarker, running mode VIDEO"""
+    name = "tasks"
+
+    def __init__(self, max_num_hands, min_detection_confidence, min_tracking_confidence, model_path):
+        import mediapipe as mp
+        self.mp = mp
+        vision = mp.tasks.vision
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.VIDEO,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def process(self, rgb, timestamp_ms):
+        mp_img = self.mp.Image(image_format=self.mp.ImageFormat.SRGB, data=rgb)
+        result = self.landmarker.detect_for_video(mp_img, timestamp_ms)
+        hands = []
+        for i, landmarks in enumerate(result.hand_landmarks):
+            handedness, score = "Unknown", 0.0
+            if i < len(result.handedness) and result.handedness[i]:
+                handedness = result.handedness[i][0].category_name
+                score = result.handedness[i][0].score
+            hands.append(TrackedHand([Landmark(lm.x, lm.y, lm.z) for lm in landmarks],
+                                     handedness, score))
+        return hands
+
+    def close(self):
+        self.landmarker.close()
+
+
+class _LegacyBackend:
+    """Legacy mp.solutions.hands (fallback dan pembanding benchmark)"""
+    name = "legacy"
+
+    def __init__(self, max_num_hands, min_detection_confidence, min_tracking_confidence):
+        import mediapipe as mp
+        self.hands = mp.solutions.hands.Hands(
+            max_num_hands=max_num_hands,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+        )
+
+    def process(self, rgb, timestamp_ms):
+        results = self.hands.process(rgb)
+        hands = []
+        if results.multi_hand_landmarks:
+            for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
+                handedness, score = "Unknown", 0.0
+                if results.multi_handedness and i < len(results.multi_handedness):
+                    cls = results.multi_handedness[i].classification[0]
+                    handedness, score = cls.label, cls.score
+                hands.append(TrackedHand([Landmark(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark],
+                                         handedness, score))
+        return hands
+
+    def close(self):
+        self.hands.close()
+
+
+class HandTracker:
+    """Hand tracker bersama untuk finger_draw_emoji, quiz_game dan guess_game.
+
+    inference_width: lebar frame yang dikirim ke model (None = resolusi asli)
+    use_roi: proses hanya area sekitar tangan terakhir (ROI dibuat "sticky" dan
+             baru digeser saat tangan mendekati tepi, supaya tracking VIDEO mode stabil)
+    backend: "tasks" (default), atau "legacy" untuk mp.solutions.hands
+    """
+    def __init__(self, max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.7,
+                 inference_width=DEFAULT_INFERENCE_WIDTH, use_roi=False, roi_margin=0.35,
+                 backend="tasks", model_path=MODEL_PATH):
+        self.inference_width = inference_width
+        self.use_roi = use_roi
+        self.roi_margin = roi_margin
+        self.roi = None  # (x1, y1, x2, y2) ternormalisasi
+        self.last_timestamp_ms = -1
+
+        if backend == "tasks" and not ensure_model(model_path):
+            print(f"[!] Hand model unavailable, place it at {model_path} (from {MODEL_URL})")
+            print("[!] Falling back to legacy mp.solutions.hands")
+            backend = "legacy"
+
+        if backend == "tasks":
+            self.backend = _TasksBackend(max_num_hands, min_detection_confidence,
+                                         min_tracking_confidence, model_path)
+        else:
+            self.backend = _LegacyBackend(max_num_hands, min_detection_confidence,
+                                          min_tracking_confidence)
+        details = (f"inference width: {inference_width or 'full'}, "
+                   f"ROI: {'on' if use_roi else 'off'}")
+        if self.backend.name == "tasks":
+            print(f"[OK] Hand tracking backend: tasks HandLandmarker ({os.path.basename(model_path)}, {details})")
+        else:
+            print(f"[!] Hand tracking backend: legacy mp.solutions.hands ({details})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.backend.close()
+
+    def _next_timestamp(self, timestamp_ms):
+        # detect_for_video butuh timestamp yang naik terus (monotonic)
+        if timestamp_ms is None:
+            timestamp_ms = int(time.perf_counter() * 1000)
+        timestamp_ms = int(timestamp_ms)
+        if timestamp_ms <= self.last_timestamp_ms:
+            timestamp_ms = self.last_timestamp_ms + 1
+        self.last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+
+    def _update_roi(self, hands):
+        """Geser ROI hanya jika tangan keluar dari area aman ROI sekarang"""
+        if not hands:
+            self.roi = None
+            return
+        x1 = min(h.bbox()[0] for h in hands)
+        y1 = min(h.bbox()[1] for h in hands)
+        x2 = max(h.bbox()[2] for h in hands)
+        y2 = max(h.bbox()[3] for h in hands)
+
+        if self.roi is not None:
+            rx1, ry1, rx2, ry2 = self.roi
+            pad_x = (rx2 - rx1) * 0.1
+            pad_y = (ry2 - ry1) * 0.1
+            if (x1 > rx1 + pad_x and y1 > ry1 + pad_y and
+                    x2 < rx2 - pad_x and y2 < ry2 - pad_y):
+                return
+
+        size = max(x2 - x1, y2 - y1)
+        margin = size * self.roi_margin + 0.05
+        cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+        half = size / 2 + margin
+        self.roi = (max(0.0, cx - half), max(0.0, cy - half),
+                    min(1.0, cx + half), min(1.0, cy + half))
+
+    def process(self, frame_bgr, timestamp_ms=None):
+        """Deteksi tangan pada frame BGR. Return list of TrackedHand (koordinat frame penuh)"""
+        h, w = frame_bgr.shape[:2]
+        timestamp_ms = self._next_timestamp(timestamp_ms)
+
+        # Crop ROI (jika aktif dan tangan sudah pernah terlihat)
+        x0, y0, crop_w, crop_h = 0, 0, w, h
+        image = frame_bgr
+        if self.use_roi and self.roi is not None:
+            rx1, ry1, rx2, ry2 = self.roi
+            x0, y0 = int(rx1 * w), int(ry1 * h)
+            crop_w, crop_h = max(1, int(rx2 * w) - x0), max(1, int(ry2 * h) - y0)
+            image = frame_bgr[y0:y0 + crop_h, x0:x0 + crop_w]
+
+        # Downscale ke resolusi inference
+        if self.inference_width and image.shape[1] > self.inference_width:
+            scale = self.inference_width / image.shape[1]
+            image = cv2.resize(image, (self.inference_width, max(1, int(image.shape[0] * scale))),
+                               interpolation=cv2.INTER_AREA)
+
+        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        hands = self.backend.process(rgb, timestamp_ms)
+
+        # Map koordinat crop -> koordinat frame penuh
+        if (x0, y0, crop_w, crop_h) != (0, 0, w, h):
+            for hand in hands:
+                hand.landmark = [Landmark((x0 + lm.x * crop_w) / w, (y0 + lm.y * crop_h) / h, lm.z)
+                                 for lm in hand.landmark]
+
+        if self.use_roi:
+            self._update_roi(hands)
+        return hands
@@ -0,0 +1,154 @@
+"""
+Cache gambar yang sudah di-decode dan di-resize ke ukuran tampilan.
+
+Key = (path, mtime, ukuran file, kotak tampilan), jadi gambar yang diganti editor
+otomatis dianggap entry baru. Entry lama dibuang dengan LRU. Prefetch berjalan di
+background thread sehingga render loop cukup mengambil gambar dari memori.
+
+get() tidak pernah membaca disk: gambar yang belum ada di cache dimuat oleh worker
+prefetch dan get() mengembalikan None sampai siap, jadi render thread tidak pernah
+menunggu decode. lookup() mengembalikan gambar beserta state-nya (READY / LOADING /
+MISSING) dalam satu kali lock untuk membedakan "masih dimuat" dari "file tidak ada".
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+_MISSING = object()
+
+# State hasil ImageCache.lookup()
+READY = "ready"
+LOADING = "loading"
+MISSING = "missing"
+
+
+def fit_size(img_w, img_h, max_width, max_height):
+    """Ukuran (w, h) terbesar yang muat di kotak max_width x max_height, aspect ratio tetap"""
+    scale = min(max_width / img_w, max_height / img_h)
+    return int(img_w * scale), int(img_h * scale)
+
+
+class ImageCache:
+    """LRU cache gambar display-size, thread-safe, dengan background prefetch"""
+    def __init__(self, capacity=32):
+        self.capacity = capacity
+        self.entries = OrderedDict()  # (path, mtime_ns, size, box) -> image
+        self.latest = {}  # (path, box) -> key terbaru (tanpa stat per frame)
+        self.stale = {}  # latest sebelum invalidate(): tetap ditampilkan selama stat ulang
+        self.pending = set()  # (path, box) yang sedang dimuat worker
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-prefetch")
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+
+    def _load(self, path, box):
+        """Stat + decode + resize. Return key (atau _MISSING jika file tidak ada/rusak)"""
+        path = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            with self.lock:
+                self.latest[(path, box)] = _MISSING
+            return _MISSING
+
+        key = (path, st.st_mtime_ns, st.st_size, box)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.latest[(path, box)] = key
+                return key
+
+        img = cv2.imread(path)
+        if img is None:
+            with self.lock:
+                self.latest[(path, box)] = _MISSING
+            return _MISSING
+        img_h, img_w = img.shape[:2]
+        new_w, new_h = fit_size(img_w, img_h, *box)
+        img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
+
+        with self.lock:
+            self.entries[key] = img
+            self.entries.move_to_end(key)
+            self.latest[(path, box)] = key
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+        return key
+
+    def get(self, path, box):
+        """Gambar yang sudah di-resize agar muat di box (w, h), atau None jika tidak ada
+        atau belum selesai dimuat (lihat loading). Tidak ada akses disk sama sekali:
+        miss dijadwalkan ke worker prefetch.
+        """
+        return self.lookup(path, box)[0]
+
+    def lookup(self, path, box):
+        """(gambar, state) dalam satu kali lock, state salah satu dari READY, LOADING, MISSING.
+
+        Tidak bisa balapan dengan worker prefetch seperti get() lalu loading(): miss
+        langsung ditandai pending di bawah lock yang sama. Selama LOADING, gambar adalah
+        versi lama setelah invalidate() atau None.
+        """
+        lookup = (str(path), box)
+        with self.lock:
+            key = self.latest.get(lookup)
+            if key is _MISSING:
+                self.hits += 1
+                return None, MISSING
+            if key is not None and key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key], READY
+            schedule = lookup not in self.pending
+            if schedule:
+                self.misses += 1
+                self.pending.add(lookup)
+            # Setelah invalidate: gambar lama tetap tampil sampai stat ulang selesai
+            previous = self.entries.get(self.stale.get(lookup))
+        if schedule:
+            self.executor.submit(self._prefetch_one, path, box)
+        return previous, LOADING
+
+    def loading(self, path, box):
+        """True jika gambar sedang dimuat worker (get() mengembalikan None sementara)"""
+        with self.lock:
+            return (str(path), box) in self.pending
+
+    def _prefetch_one(self, path, box):
+        try:
+            key = self._load(path, box)
+        finally:
+            with self.lock:
+                self.pending.discard((str(path), box))
+        if key is not _MISSING:
+            with self.lock:
+                self.prefetched += 1
+
+    def prefetch(self, items):
+        """Muat list of (path, box) di background thread (yang sudah antre dilewati)"""
+        for path, box in items:
+            with self.lock:
+                if (str(path), box) in self.pending:
+                    continue
+                self.pending.add((str(path), box))
+            self.executor.submit(self._prefetch_one, path, box)
+
+    def invalidate(self):
+        """Paksa stat ulang semua file (misalnya setelah reload data dari editor)"""
+        with self.lock:
+            self.stale = self.latest
+            self.latest = {}
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def report(self):
+        total = self.hits + self.misses
+        rate = self.hits / total * 100.0 if total else 0.0
+        print(f"[STATS] Image cache: hits={self.hits} misses={self.misses} "
+              f"({rate:.1f}% hit rate), prefetched={self.prefetched}, entries={len(self.entries)}")
@@ -0,0 +1,126 @@
+"""
+Layout independen resolusi untuk UI game.
+
+Semua posisi UI ditulis dalam koordinat desain 1920x1080 (= koordinat ternormalisasi
+x REF_WIDTH/REF_HEIGHT), lalu dikonversi ke pixel frame sebenarnya dengan scale factor
+saat digambar. Game bisa capture + proses di 1280x720 atau lebih kecil dan window
+(WINDOW_NORMAL) yang meng-upscale hanya untuk tampilan. Di 1920x1080 scale = 1 dan
+hasil gambar identik dengan koordinat pixel langsung.
+
+Input tangan juga dalam koordinat desain (landmark ternormalisasi x REF_*), jadi
+hit-test dan jarak pinch tidak bergantung resolusi kamera.
+
+Contoh:
+    LAYOUT.rectangle(frame, (710, 450), (1210, 550), (60, 60, 60), -1)
+    LAYOUT.text(frame, "Score: 3", (40, 60), cv2.FONT_HERSHEY_DUPLEX, 1.1, (255, 255, 255), 3)
+    img = images.get(path, LAYOUT.box(QUIZ_IMAGE_BOX))
+"""
+
+import cv2
+
+from .text_cache import draw_text, text_size
+
+REF_WIDTH, REF_HEIGHT = 1920, 1080
+
+
+def parse_resolution(text):
+    """'1280x720' -> (1280, 720)"""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+class Layout:
+    def __init__(self, width=REF_WIDTH, height=REF_HEIGHT):
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        self.sx = width / REF_WIDTH
+        self.sy = height / REF_HEIGHT
+        # Ukuran (font, tebal garis, gambar) memakai satu scale supaya aspect ratio tetap
+        self.scale = min(self.sx, self.sy)
+
+    def fit(self, frame):
+        """Sesuaikan scale dengan ukuran frame (murah jika ukurannya tidak berubah)"""
+        h, w = frame.shape[:2]
+        if w != self.width or h != self.height:
+            self.resize(w, h)
+        return self
+
+    # --- Konversi koordinat desain -> pixel ---
+    def point(self, x, y):
+        return int(round(x * self.sx)), int(round(y * self.sy))
+
+    def length(self, value):
+        return int(round(value * self.scale))
+
+    def thickness(self, value):
+        """Tebal garis (negatif = isi penuh, tidak di-scale)"""
+        if value < 0:
+            return value
+        return max(1, self.length(value))
+
+    def text_thickness(self, value):
+        """Tebal teks: 1 tetap 1, >= 2 tidak turun ke 1 (putText tebal 1 memakai jalur
+        gambar tipis dengan lebar huruf berbeda, teks dan shadow-nya jadi tidak sejajar)"""
+        if value <= 1:
+            return value
+        return max(2, self.length(value))
+
+    def box(self, box):
+        """Kotak gambar (w, h) dalam pixel, untuk ImageCache"""
+        return max(1, self.length(box[0])), max(1, self.length(box[1]))
+
+    def design_size(self, img):
+        """Ukuran gambar (pixel) dalam koordinat desain: (w, h)"""
+        h, w = img.shape[:2]
+        return int(round(w / self.scale)), int(round(h / self.scale))
+
+    @staticmethod
+    def normalized(nx, ny):
+        """Koordinat ternormalisasi (0..1) -> koordinat desain"""
+        return nx * REF_WIDTH, ny * REF_HEIGHT
+
+    # --- Gambar dengan koordinat desain ---
+    def rectangle(self, frame, pt1, pt2, color, thickness=1, line_type=cv2.LINE_8):
+        self.fit(frame)
+        cv2.rectangle(frame, self.point(*pt1), self.point(*pt2), color,
+                      self.thickness(thickness), line_type)
+
+    def circle(self, frame, center, radius, color, thickness=1, line_type=cv2.LINE_8):
+        self.fit(frame)
+        cv2.circle(frame, self.point(*center), max(1, self.length(radius)), color,
+                   self.thickness(thickness), line_type)
+
+    def text(self, frame, text, pos, font, scale, color, thickness, shadow_offset=0,
+             shadow_thickness=None, **kwargs):
+        """draw_text (TEXT_CACHE) dengan posisi, font scale dan tebal yang di-scale"""
+        self.fit(frame)
+        if shadow_offset:
+            shadow_offset = max(1, self.length(shadow_offset))
+        if shadow_thickness is not None:
+            shadow_thickness = self.text_thickness(shadow_thickness)
+        draw_text(frame, text, self.point(*pos), font, scale * self.scale, color,
+                  self.text_thickness(thickness), shadow_offset=shadow_offset,
+                  shadow_thickness=shadow_thickness, **kwargs)
+
+    @staticmethod
+    def text_size(text, font, scale, thickness):
+        """Ukuran teks dalam koordinat desain (untuk centering)"""
+        return text_size(text, font, scale, thickness)
+
+    def blit(self, frame, img, x, y):
+        """Tempel gambar (sudah berukuran pixel, mis. dari LAYOUT.box) dengan pojok kiri atas di (x, y)"""
+        self.fit(frame)
+        x0, y0 = self.point(x, y)
+        h, w = img.shape[:2]
+        fh, fw = frame.shape[:2]
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1, cy1 = min(x0 + w, fw), min(y0 + h, fh)
+        if cx0 < cx1 and cy0 < cy1:
+            frame[cy0:cy1, cx0:cx1] = img[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]
+
+
+# Satu layout untuk seluruh proses (satu game per proses, scale mengikuti frame yang digambar)
+LAYOUT = Layout()
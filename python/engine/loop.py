@@ -0,0 +1,168 @@
+"""
+Game loop bersama: fixed-timestep update + render per frame.
+
+Logika game maju dengan langkah tetap (STEP_HZ) berdasarkan waktu frame, terlepas
+dari FPS kamera/render: timer soal dan reveal berjalan sama cepat di
+kamera 15 FPS maupun 60 FPS, dan replay rekaman selalu menghasilkan urutan step yang
+sama. Render dilakukan sekali per frame kamera.
+
+Contoh (headless, mis. replay_games.py):
+    loop = GameLoop(game)
+    loop.frame(frame, hands[0] if hands else None, replay.timestamp_ms() / 1000.0)
+
+Contoh (game dengan kamera + window):
+    run_game(game, "Guess The Picture", parse_game_args())
+
+--resolution WxH mengatur ukuran capture + proses (default 1920x1080); window tetap
+1920x1080 dan meng-upscale frame hanya untuk tampilan (lihat layout.py).
+"""
+
+import argparse
+import time
+import traceback
+
+import cv2
+
+from .camera import Camera
+from .display import Display
+from .hand_recording import add_replay_arguments
+from .hand_tracking import draw_hand
+from .layout import REF_WIDTH, REF_HEIGHT, parse_resolution
+from .perf_stats import FrameTimer, TimingStats
+from .text_cache import TEXT_CACHE
+
+STEP_HZ = 30
+# Frame yang sangat telat tidak mengejar lebih dari N step (hindari spiral of death)
+MAX_STEPS_PER_FRAME = 5
+
+
+class GameLoop:
+    def __init__(self, game, step_hz=STEP_HZ, max_steps=MAX_STEPS_PER_FRAME):
+        self.game = game
+        self.dt = 1.0 / step_hz
+        self.max_steps = max_steps
+        self.sim_time = 0.0
+        self.accumulator = 0.0
+        self.last_time = None
+        self.frames = 0
+        self.steps = 0
+        self.dropped_steps = 0
+        self.update_stats = TimingStats("Game update (fixed steps)")
+        self.render_stats = TimingStats("Game render")
+        # Semua waktu di game (timer, state entered_at) = waktu simulasi
+        game.clock = lambda: self.sim_time
+
+    def due_steps(self, now):
+        """Jumlah fixed step yang jatuh tempo sampai waktu frame now (detik)"""
+        if self.last_time is None:
+            # Frame pertama langsung mendapat satu step
+            self.last_time = now - self.dt
+        self.accumulator += max(0.0, now - self.last_time)
+        self.last_time = now
+        # 1e-6: toleransi pembulatan float (mis. 3 x 0.0333.. harus tepat 3 step)
+        steps = int(self.accumulator / self.dt + 1e-6)
+        self.accumulator = max(0.0, self.accumulator - steps * self.dt)
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+        return steps
+
+    def frame(self, frame, hand, now):
+        """Satu frame dengan satu tangan (None = tidak ada tangan)"""
+        self.frame_hands(frame, [] if hand is None else [hand], now)
+
+    def frame_hands(self, frame, hands, now):
+        """Satu frame: input semua tangan -> fixed steps -> render ke frame"""
+        # Posisi jari dalam koordinat desain, apa pun resolusi frame
+        self.game.set_hands(hands, REF_WIDTH, REF_HEIGHT, now)
+
+        start = time.perf_counter()
+        for _ in range(self.due_steps(now)):
+            self.sim_time += self.dt
+            self.game.step(self.sim_time)
+            self.steps += 1
+        rendered = time.perf_counter()
+        self.update_stats.add(rendered - start)
+
+        self.game.render(frame)
+        self.render_stats.add(time.perf_counter() - rendered)
+        self.frames += 1
+
+    def report(self):
+        self.update_stats.report()
+        self.render_stats.report()
+        print(f"[STATS] Fixed timestep: {self.steps} steps @ {1.0 / self.dt:.0f} Hz over "
+              f"{self.frames} frames, {self.dropped_steps} dropped")
+
+
+def parse_game_args(argv=None):
+    """Opsi record/replay + --resolution capture, abaikan argumen lain (mis. camera index)"""
+    parser = add_replay_arguments(argparse.ArgumentParser(add_help=False))
+    parser.add_argument("--resolution", type=parse_resolution, default=(REF_WIDTH, REF_HEIGHT),
+                        metavar="WxH", help="Resolusi capture + proses, mis. 1280x720")
+    args, _unknown = parser.parse_known_args(argv)
+    return args
+
+
+def run_game(game, title, args, camera_index=0, camera_api=cv2.CAP_ANY):
+    """Main loop bersama: kamera/replay -> tangan -> GameLoop -> window. 'q' keluar, 'r' reload"""
+    width, height = getattr(args, "resolution", (REF_WIDTH, REF_HEIGHT))
+    # Mode multi-player: tracker mencari satu tangan per pemain
+    camera = Camera(args, index=camera_index, api=camera_api, width=width, height=height,
+                    max_num_hands=len(game.hands))
+    if not camera.open():
+        return
+
+    loop = GameLoop(game)
+    # Window dibuat sekali di ukuran desain; frame yang lebih kecil di-upscale oleh window
+    display = Display(title, REF_WIDTH, REF_HEIGHT)
+    frame_timer = FrameTimer()
+    frame_size = None
+
+    print(f"[*] Capture/process resolution: {width}x{height}, window: {REF_WIDTH}x{REF_HEIGHT}")
+    print("\n[*] Starting main loop...")
+    print("[*] Data reloads automatically after editor saves ('r' forces a reload)")
+    print("=" * 70 + "\n")
+
+    try:
+        while camera.isOpened() and not display.closed:
+            ok, frame, hands = camera.read()
+            if not ok:
+                break
+            frame_size = frame.shape[1], frame.shape[0]
+
+            hands = hands[:len(game.hands)]
+            for hand in hands:
+                draw_hand(frame, hand, **game.hand_style)
+
+            loop.frame_hands(frame, hands, camera.timestamp())
+            game.draw_overlay(frame)
+            TEXT_CACHE.end_frame()
+
+            key = display.show(frame) & 0xFF
+            frame_timer.tick()
+            if key in (ord('q'), ord('Q')):
+                print("\n[*] Goodbye!\n")
+                break
+            elif key in (ord('r'), ord('R')):
+                print("\n[*] Reloading data in background...")
+                game.reload()
+
+    except KeyboardInterrupt:
+        print("\n[*] Interrupted by user")
+    except Exception as e:
+        print(f"\n[X] ERROR: {e}")
+        traceback.print_exc()
+    finally:
+        print("[*] Cleaning up...")
+        camera.close()
+        game.report()
+        loop.report()
+        TEXT_CACHE.report(loop.render_stats)
+        display.report()
+        if frame_size and frame_timer.count:
+            print(f"[STATS] FPS at {frame_size[0]}x{frame_size[1]}: {frame_timer.fps():.1f} "
+                  f"(frame avg {frame_timer.summary()['avg_ms']:.2f} ms)")
+        display.close()
+        cv2.destroyAllWindows()
+        print("[*] Application closed")
@@ -0,0 +1,74 @@
+"""
+Helper kecil untuk mengukur waktu (frame time, latency) di game OpenCV.
+Dipakai oleh game-game di folder ini untuk laporan performa di console.
+"""
+
+import time
+
+
+class TimingStats:
+    """Kumpulkan durasi (detik) lalu laporkan avg / p95 / max dalam milidetik"""
+    def __init__(self, name, max_samples=10000):
+        self.name = name
+        self.max_samples = max_samples
+        self.samples = []
+        self.count = 0
+        self.total = 0.0
+        self.max_value = 0.0
+
+    def add(self, seconds):
+        """Tambah satu sampel durasi (detik)"""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max_value:
+            self.max_value = seconds
+        if len(self.samples) < self.max_samples:
+            self.samples.append(seconds)
+        else:
+            # Ring buffer: simpan sampel terbaru saja untuk percentile
+            self.samples[self.count % self.max_samples] = seconds
+
+    def summary(self):
+        """Return dict statistik dalam milidetik"""
+        if self.count == 0:
+            return {"count": 0, "avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count * 1000.0,
+            "p95_ms": p95 * 1000.0,
+            "max_ms": self.max_value * 1000.0,
+        }
+
+    def report(self):
+        """Print ringkasan statistik ke console"""
+        s = self.summary()
+        if s["count"] == 0:
+            print(f"[STATS] {self.name}: no samples")
+            return
+        print(f"[STATS] {self.name}: n={s['count']} avg={s['avg_ms']:.2f} ms "
+              f"p95={s['p95_ms']:.2f} ms max={s['max_ms']:.2f} ms")
+
+
+class FrameTimer(TimingStats):
+    """TimingStats untuk frame time: panggil tick() sekali per frame"""
+    def __init__(self, name="Frame time", max_samples=10000):
+        super().__init__(name, max_samples)
+        self.last_tick = None
+
+    def tick(self):
+        """Catat jarak waktu sejak tick() sebelumnya"""
+        now = time.perf_counter()
+        if self.last_tick is not None:
+            self.add(now - self.last_tick)
+        self.last_tick = now
+
+    def fps(self):
+        """Rata-rata FPS dari semua frame yang tercatat"""
+        return self.count / self.total if self.total > 0 else 0.0
+
+    def report(self):
+        super().report()
+        if self.count:
+            print(f"[STATS] {self.name}: avg FPS={self.fps():.1f}")
@@ -0,0 +1,132 @@
+"""
+Cache sprite widget: widget (mis. word card) dirender SEKALI per tampilan (teks, ukuran,
+hover/terpilih, skala) ke sprite premultiplied, lalu setiap frame cukup ditempel di
+posisi mana pun. Card yang bergerak (drag, animasi reflow) tidak perlu digambar ulang
+dan tidak perlu objek Button baru untuk setiap posisi.
+
+Widget digambar dengan fungsi gambar game yang sama di kanvas hitam/putih (lihat
+ui_layer.render_premultiplied), pada salinan widget di pojok kanvas. Sprite yang alpha-
+nya hanya 0 atau 1 (card opaque) ditempel dengan copy + mask, selain itu di-blend.
+Transform skala (card yang sedang diangkat) juga di-cache per skala.
+
+Contoh:
+    sprites = SpriteCache("quiz cards")
+    sprite = sprites.get(frame, btn, (btn.text, btn.hovered), draw_widget)
+    sprites.blit(frame, sprite, x, y)                  # pojok kiri atas widget di (x, y)
+"""
+
+import copy
+import time
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from .layout import LAYOUT
+from .perf_stats import TimingStats
+from .ui_layer import blend_premultiplied
+
+# Ruang di sekitar widget untuk shadow dan border tebal (koordinat desain)
+MARGIN = 8
+
+
+class Sprite:
+    def __init__(self, premult, inv, width, height, margin=MARGIN):
+        self.premult = premult
+        self.inv = inv
+        # Card opaque tanpa anti-aliasing: cukup copy dengan mask
+        self.mask = None
+        if np.all((inv == 0) | (inv == 255)):
+            self.mask = (inv[:, :, 0] == 0).astype(np.uint8)
+        # Ukuran widget dan margin di sekelilingnya (koordinat desain)
+        self.width = width
+        self.height = height
+        self.margin = margin
+
+
+class SpriteCache:
+    """LRU sprite per (key, ukuran frame, skala)"""
+
+    def __init__(self, name, capacity=256):
+        self.name = name
+        self.capacity = capacity
+        self.sprites = OrderedDict()
+        # Kanvas hitam/putih seukuran frame, dipakai ulang (hanya pojoknya yang dikotori)
+        self.canvas = None
+        self.hits = 0
+        self.misses = 0
+        self.render_stats = TimingStats(f"Sprites '{name}' render")
+
+    def get(self, frame, widget, key, draw_widget, scale=1.0):
+        """Sprite untuk widget dengan tampilan key; draw_widget(canvas, widget) hanya
+        dipanggil jika belum ada di cache"""
+        cache_key = (key, widget.width, widget.height, frame.shape, scale)
+        sprite = self.sprites.get(cache_key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(cache_key)
+            return sprite
+        self.misses += 1
+        start = time.perf_counter()
+        if scale == 1.0:
+            sprite = self._render(frame.shape, widget, draw_widget)
+        else:
+            base = self.get(frame, widget, key, draw_widget)
+            size = (max(1, round(base.premult.shape[1] * scale)), max(1, round(base.premult.shape[0] * scale)))
+            sprite = Sprite(cv2.resize(base.premult, size, interpolation=cv2.INTER_LINEAR),
+                            cv2.resize(base.inv, size, interpolation=cv2.INTER_LINEAR),
+                            widget.width * scale, widget.height * scale, MARGIN * scale)
+        self.sprites[cache_key] = sprite
+        while len(self.sprites) > self.capacity:
+            self.sprites.popitem(last=False)
+        self.render_stats.add(time.perf_counter() - start)
+        return sprite
+
+    def _render(self, shape, widget, draw_widget):
+        """Gambar salinan widget di (MARGIN, MARGIN) pada kanvas seukuran frame (LAYOUT
+        memakai ukuran kanvas untuk skala), lalu potong kotaknya"""
+        if self.canvas is None or self.canvas[0].shape != shape:
+            self.canvas = (np.zeros(shape, dtype=np.uint8), np.full(shape, 255, dtype=np.uint8))
+        black, white = self.canvas
+        ghost = copy.copy(widget)
+        ghost.x, ghost.y = MARGIN, MARGIN
+        x1, y1 = LAYOUT.point(widget.width + 2 * MARGIN, widget.height + 2 * MARGIN)
+        x1, y1 = min(x1, shape[1]), min(y1, shape[0])
+        draw_widget(black, ghost)
+        draw_widget(white, ghost)
+        premult = black[:y1, :x1].copy()
+        inv = cv2.subtract(white[:y1, :x1], premult)
+        black[:y1, :x1] = 0
+        white[:y1, :x1] = 255
+        return Sprite(premult, inv, widget.width, widget.height)
+
+    @staticmethod
+    def blit(frame, sprite, x, y):
+        """Tempel sprite dengan pojok kiri atas widget di (x, y) koordinat desain (boleh float)"""
+        LAYOUT.fit(frame)
+        px, py = LAYOUT.point(x - sprite.margin, y - sprite.margin)
+        h, w = sprite.premult.shape[:2]
+        fh, fw = frame.shape[:2]
+        x0, y0 = max(px, 0), max(py, 0)
+        x1, y1 = min(px + w, fw), min(py + h, fh)
+        if x0 >= x1 or y0 >= y1:
+            return
+        roi = frame[y0:y1, x0:x1]
+        sx, sy = x0 - px, y0 - py
+        premult = sprite.premult[sy:sy + y1 - y0, sx:sx + x1 - x0]
+        if sprite.mask is not None:
+            cv2.copyTo(premult, sprite.mask[sy:sy + y1 - y0, sx:sx + x1 - x0], roi)
+        else:
+            blend_premultiplied(roi, premult, sprite.inv[sy:sy + y1 - y0, sx:sx + x1 - x0])
+
+    def blit_centered(self, frame, sprite, cx, cy):
+        """Tempel sprite dengan pusat widget di (cx, cy) (untuk sprite yang di-scale)"""
+        self.blit(frame, sprite, cx - sprite.width / 2, cy - sprite.height / 2)
+
+    def report(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return
+        render_ms = self.render_stats.summary()["avg_ms"]
+        print(f"[STATS] Sprites '{self.name}': {len(self.sprites)} cached, "
+              f"hit rate {self.hits / total:.1%}, {self.misses} renders (avg {render_ms:.2f} ms)")
@@ -0,0 +1,64 @@
+"""
+State machine kecil yang dipakai bersama oleh QuizGame dan GuessGame.
+
+Transisi state HANYA terjadi karena event input ("click", "tick", ...), tidak pernah
+dari dalam kode gambar. Hasil (skor, benar/salah, tombol layar) dihitung SEKALI saat
+masuk state, sehingga fungsi draw_* cukup membaca state yang sudah di-cache.
+
+Owner (game) menyediakan method dengan konvensi nama (semua opsional):
+    enter_<state>()              sekali saat masuk state; boleh return state lain (redirect)
+    exit_<state>()               sekali saat keluar state
+    on_<state>_<event>(**data)   handler event; return nama state tujuan atau None (tetap)
+
+Waktu diambil dari clock yang bisa diganti (default time.time), sehingga replay test
+bisa memakai timestamp rekaman dan hasilnya deterministik.
+
+Contoh:
+    self.fsm = StateMachine(self, clock=lambda: self.clock())
+    self.fsm.transition("MENU")
+    self.fsm.dispatch("click", btn=btn)
+"""
+
+import time
+
+
+class StateMachine:
+    def __init__(self, owner, clock=time.time):
+        self.owner = owner
+        self.clock = clock
+        self.state = None
+        self.entered_at = 0.0
+        self.transitions = 0
+
+    def _hook(self, prefix, state, suffix=""):
+        return getattr(self.owner, f"{prefix}_{state.lower()}{suffix}", None)
+
+    def transition(self, state):
+        """Keluar dari state sekarang, masuk ke state baru (enter_* boleh redirect)"""
+        while state is not None:
+            if self.state is not None:
+                on_exit = self._hook("exit", self.state)
+                if on_exit:
+                    on_exit()
+            self.state = state
+            self.entered_at = self.clock()
+            self.transitions += 1
+            on_enter = self._hook("enter", state)
+            state = on_enter() if on_enter else None
+
+    def dispatch(self, event, **data):
+        """Kirim event ke handler state sekarang. Return True jika state berubah"""
+        if self.state is None:
+            return False
+        handler = self._hook("on", self.state, f"_{event}")
+        if handler is None:
+            return False
+        target = handler(**data)
+        if target is None:
+            return False
+        self.transition(target)
+        return True
+
+    def time_in_state(self):
+        """Detik sejak masuk state sekarang (menurut clock)"""
+        return self.clock() - self.entered_at
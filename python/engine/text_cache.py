@@ -0,0 +1,144 @@
+"""
+Cache sprite teks untuk cv2.putText (dengan atau tanpa shadow).
+
+Teks UI yang sama (judul, label tombol, instruksi, skor) dulu digambar ulang setiap
+frame: getTextSize + dua putText anti-aliased per string. Di sini teks + shadow-nya
+dirender SEKALI ke sprite kecil premultiplied (lihat ui_layer.render_premultiplied),
+lalu setiap frame cukup di-blend ke frame. Key = (teks, font, scale, warna, thickness,
+shadow, line type), entry lama dibuang dengan LRU.
+
+Budget: waktu yang dihabiskan untuk teks dikumpulkan per frame (panggil end_frame()
+sekali per frame) sehingga terlihat berapa bagian frame time yang dipakai teks.
+
+Contoh:
+    from engine.text_cache import draw_text
+    draw_text(frame, "Score: 3", (40, 60), cv2.FONT_HERSHEY_DUPLEX, 1.1, (255, 255, 255), 2,
+              shadow_offset=3, shadow_thickness=3)
+"""
+
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+import cv2
+
+from .perf_stats import TimingStats
+from .ui_layer import render_premultiplied, blend_premultiplied
+
+
+@lru_cache(maxsize=1024)
+def text_size(text, font, scale, thickness):
+    """cv2.getTextSize yang di-memoize: return ((w, h), baseline)"""
+    return cv2.getTextSize(text, font, scale, thickness)
+
+
+class TextCache:
+    """LRU cache sprite teks (premultiplied) + statistik waktu teks per frame"""
+
+    # False = putText langsung setiap frame (perilaku lama), untuk A/B benchmark
+    enabled = True
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.sprites = OrderedDict()  # key -> (dx, dy, premult, inv)
+        self.hits = 0
+        self.misses = 0
+        self.calls = 0
+        self.frame_seconds = 0.0
+        self.per_frame = TimingStats("Text per frame")
+
+    def _render(self, text, font, scale, color, thickness, shadow_offset,
+                shadow_thickness, shadow_color, line_type):
+        """Sprite untuk satu string. Return (dx, dy, premult, inv); dx/dy relatif ke origin teks"""
+        widest = max(thickness, shadow_thickness)
+        (w, h), baseline = text_size(text, font, scale, widest)
+        # Margin untuk tebal garis + anti-aliasing di luar bounding box getTextSize
+        margin = widest + 2
+        origin = (margin, h + margin)
+        size = (h + baseline + shadow_offset + 2 * margin, w + shadow_offset + 2 * margin, 3)
+
+        def render(canvas):
+            if shadow_offset:
+                cv2.putText(canvas, text, (origin[0] + shadow_offset, origin[1] + shadow_offset),
+                            font, scale, shadow_color, shadow_thickness, line_type)
+            cv2.putText(canvas, text, origin, font, scale, color, thickness, line_type)
+
+        premult, inv = render_premultiplied(size, render)
+        return -origin[0], -origin[1], premult, inv
+
+    def draw(self, frame, text, pos, font, scale, color, thickness, shadow_offset=0,
+             shadow_thickness=None, shadow_color=(0, 0, 0), line_type=cv2.LINE_AA):
+        """Gambar teks di pos (origin kiri-bawah seperti putText), shadow di pos + shadow_offset"""
+        start = time.perf_counter()
+        x, y = int(pos[0]), int(pos[1])
+        if shadow_thickness is None:
+            shadow_thickness = thickness
+        if not self.enabled:
+            if shadow_offset:
+                cv2.putText(frame, text, (x + shadow_offset, y + shadow_offset),
+                            font, scale, shadow_color, shadow_thickness, line_type)
+            cv2.putText(frame, text, (x, y), font, scale, color, thickness, line_type)
+            self._count(start)
+            return
+
+        key = (text, font, scale, tuple(color), thickness, shadow_offset,
+               shadow_thickness, tuple(shadow_color), line_type)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            self.misses += 1
+            sprite = self._render(text, font, scale, color, thickness, shadow_offset,
+                                  shadow_thickness, shadow_color, line_type)
+            self.sprites[key] = sprite
+            if len(self.sprites) > self.capacity:
+                self.sprites.popitem(last=False)
+        else:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+
+        dx, dy, premult, inv = sprite
+        x0, y0 = x + dx, y + dy
+        sh, sw = premult.shape[:2]
+        fh, fw = frame.shape[:2]
+        # Clip sprite ke dalam frame
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1, cy1 = min(x0 + sw, fw), min(y0 + sh, fh)
+        if cx0 < cx1 and cy0 < cy1:
+            src = (slice(cy0 - y0, cy1 - y0), slice(cx0 - x0, cx1 - x0))
+            blend_premultiplied(frame[cy0:cy1, cx0:cx1], premult[src], inv[src])
+        self._count(start)
+
+    def _count(self, start):
+        self.calls += 1
+        self.frame_seconds += time.perf_counter() - start
+
+    def end_frame(self):
+        """Tutup satu frame: catat total waktu teks di frame ini"""
+        self.per_frame.add(self.frame_seconds)
+        self.frame_seconds = 0.0
+
+    def report(self, frame_stats=None):
+        """Ringkasan cache + budget teks (opsional relatif ke TimingStats frame time)"""
+        if self.enabled:
+            lookups = self.hits + self.misses
+            rate = self.hits / lookups * 100.0 if lookups else 0.0
+            print(f"[STATS] Text sprite cache: calls={self.calls} hits={self.hits} misses={self.misses} "
+                  f"({rate:.1f}% hit rate), sprites={len(self.sprites)}")
+        else:
+            print(f"[STATS] Text (immediate putText): calls={self.calls}")
+        if self.per_frame.count:
+            text_ms = self.per_frame.summary()["avg_ms"]
+            line = (f"[STATS] Text budget: {text_ms:.2f} ms/frame, "
+                    f"{self.calls / self.per_frame.count:.1f} strings/frame")
+            if frame_stats is not None and frame_stats.count:
+                frame_ms = frame_stats.summary()["avg_ms"]
+                line += f" = {text_ms / frame_ms * 100.0:.1f}% of {frame_ms:.2f} ms frame time"
+            print(line)
+
+
+# Satu cache untuk seluruh proses (satu game per proses)
+TEXT_CACHE = TextCache()
+
+
+def draw_text(frame, text, pos, font, scale, color, thickness, **kwargs):
+    """putText lewat TEXT_CACHE (kwargs: shadow_offset, shadow_thickness, shadow_color, line_type)"""
+    TEXT_CACHE.draw(frame, text, pos, font, scale, color, thickness, **kwargs)
@@ -0,0 +1,358 @@
+"""
+Retained-mode UI layer untuk game OpenCV.
+
+Elemen statis sebuah layar (judul, subtitle, panel transparan, tombol yang tidak
+di-hover, teks instruksi) dirender SEKALI ke overlay yang di-cache, lalu setiap frame
+overlay itu cukup di-composite ke frame kamera. Overlay dibangun ulang hanya jika key
+berubah (state, kategori, tombol yang di-hover, ...). Bagian dinamis (timer, cursor,
+tombol yang sedang di-hover) tetap digambar langsung setelah composite.
+
+Alpha didapat dengan menjalankan fungsi gambar yang SAMA di atas kanvas hitam dan putih:
+    hitam = warna * alpha                  (premultiplied)
+    putih - hitam = 255 * (1 - alpha)      (per channel)
+sehingga efek transparan lama (addWeighted, anti-aliasing) hasilnya identik tanpa
+menulis ulang kode gambar. Composite:  frame = hitam + frame * (putih - hitam) / 255
+
+Overlay disimpan per region (tile TILE x TILE yang digabung): region kosong tidak
+disimpan sama sekali, region opaque cukup di-copy, hanya region transparan yang di-blend.
+
+WidgetLayer: overlay yang sama untuk banyak widget yang tampilannya berubah satu-satu
+(word card: hover, terpilih). Dibangun sekali per daftar widget, lalu hanya widget dirty
+yang digambar ulang di tempatnya; composite per frame tidak bergantung jumlah widget
+yang berubah.
+
+Contoh:
+    layer = UILayer("quiz menu")
+    layer.draw(frame, key=("MENU", hovered_id), render=self.draw_menu_static)
+    cards = WidgetLayer("quiz cards")
+    cards.draw(frame, self.buttons, self.draw_word_button, dirty=self.dirty)
+"""
+
+import time
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from .perf_stats import TimingStats
+
+TILE = 32
+_EMPTY, _BLEND, _OPAQUE = 0, 1, 2
+
+
+def render_premultiplied(shape, render):
+    """Jalankan render(canvas) di atas kanvas hitam dan putih.
+
+    Return (premult, inv): warna premultiplied dan 255 * (1 - alpha) per channel.
+    """
+    black = np.zeros(shape, dtype=np.uint8)
+    white = np.full(shape, 255, dtype=np.uint8)
+    render(black)
+    render(white)
+    return black, cv2.subtract(white, black)
+
+
+def blend_premultiplied(roi, premult, inv):
+    """roi = premult + roi * inv / 255 (in-place, roi boleh berupa view dari frame)"""
+    cv2.multiply(roi, inv, dst=roi, scale=1.0 / 255.0)
+    cv2.add(roi, premult, dst=roi)
+
+
+def _tile_kinds(premult, inv, tile=TILE):
+    """Klasifikasi tile: kosong / transparan / opaque. Return array (rows, cols)"""
+    h, w = inv.shape[:2]
+    rows, cols = -(-h // tile), -(-w // tile)
+    pad = ((0, rows * tile - h), (0, cols * tile - w), (0, 0))
+    inv_t = np.pad(inv, pad, constant_values=255).reshape(rows, tile, cols, tile, 3)
+    pre_t = np.pad(premult, pad).reshape(rows, tile, cols, tile, 3)
+
+    empty = (inv_t.min(axis=(1, 3, 4)) == 255) & (pre_t.max(axis=(1, 3, 4)) == 0)
+    opaque = inv_t.max(axis=(1, 3, 4)) == 0
+    kinds = np.full((rows, cols), _BLEND, dtype=np.uint8)
+    kinds[empty] = _EMPTY
+    kinds[opaque] = _OPAQUE
+    return kinds
+
+
+def _merge_regions(kinds):
+    """Gabungkan tile sejenis: run horizontal per baris, lalu run yang sama persis
+    di baris berikutnya diperpanjang ke bawah. Return list (row0, row1, col0, col1, kind)"""
+    done = []
+    open_runs = {}  # (col0, col1, kind) -> row0
+    for r, row in enumerate(kinds):
+        runs = set()
+        c = 0
+        while c < len(row):
+            kind = row[c]
+            start = c
+            while c < len(row) and row[c] == kind:
+                c += 1
+            if kind != _EMPTY:
+                runs.add((start, c, int(kind)))
+        for run, row0 in list(open_runs.items()):
+            if run not in runs:
+                done.append((row0, r, run[0], run[1], run[2]))
+                del open_runs[run]
+        for run in runs:
+            open_runs.setdefault(run, r)
+    for run, row0 in open_runs.items():
+        done.append((row0, len(kinds), run[0], run[1], run[2]))
+    return done
+
+
+class UILayer:
+    """Overlay UI statis yang di-cache per key (LRU), di-composite tiap frame"""
+
+    # False = immediate mode (render langsung ke frame setiap frame), untuk A/B benchmark
+    enabled = True
+
+    def __init__(self, name, capacity=8):
+        self.name = name
+        self.capacity = capacity
+        self.layers = OrderedDict()  # (key, shape) -> list region
+        self.rebuilds = 0
+        self.render_stats = TimingStats(f"UI layer '{name}' immediate render")
+        self.build_stats = TimingStats(f"UI layer '{name}' rebuild")
+        self.composite_stats = TimingStats(f"UI layer '{name}' composite")
+
+    def _build(self, shape, render):
+        start = time.perf_counter()
+
+        timings = []
+
+        def timed_render(canvas):
+            render_start = time.perf_counter()
+            render(canvas)
+            timings.append(time.perf_counter() - render_start)
+
+        black, inv = render_premultiplied(shape, timed_render)
+        # Biaya satu kali render = biaya yang dulu dibayar setiap frame
+        self.render_stats.add(timings[0])
+
+        regions = []
+        for row0, row1, col0, col1, kind in _merge_regions(_tile_kinds(black, inv)):
+            y0, y1 = row0 * TILE, min(row1 * TILE, shape[0])
+            x0, x1 = col0 * TILE, min(col1 * TILE, shape[1])
+            premult = black[y0:y1, x0:x1].copy()
+            blend = inv[y0:y1, x0:x1].copy() if kind == _BLEND else None
+            regions.append((y0, y1, x0, x1, premult, blend))
+
+        self.rebuilds += 1
+        self.build_stats.add(time.perf_counter() - start)
+        return regions
+
+    def draw(self, frame, key, render):
+        """Composite overlay untuk key ke frame; render(canvas) dipanggil hanya jika key baru"""
+        if not self.enabled:
+            start = time.perf_counter()
+            render(frame)
+            self.composite_stats.add(time.perf_counter() - start)
+            return
+
+        cache_key = (key, frame.shape)
+        regions = self.layers.get(cache_key)
+        if regions is None:
+            regions = self._build(frame.shape, render)
+            self.layers[cache_key] = regions
+            while len(self.layers) > self.capacity:
+                self.layers.popitem(last=False)
+        else:
+            self.layers.move_to_end(cache_key)
+
+        start = time.perf_counter()
+        for y0, y1, x0, x1, premult, blend in regions:
+            roi = frame[y0:y1, x0:x1]
+            if blend is None:
+                roi[:] = premult
+            else:
+                blend_premultiplied(roi, premult, blend)
+        self.composite_stats.add(time.perf_counter() - start)
+
+    def invalidate(self):
+        """Buang semua overlay (misalnya setelah data/teks berubah di luar key)"""
+        self.layers.clear()
+
+    def report(self):
+        """Ringkasan per layar: biaya render immediate vs composite per frame"""
+        frames = self.composite_stats.count
+        if frames == 0:
+            return
+        composite_ms = self.composite_stats.summary()["avg_ms"]
+        if not self.enabled:
+            print(f"[STATS] UI layer '{self.name}' (immediate mode): n={frames} "
+                  f"avg={composite_ms:.2f} ms/frame")
+            return
+        render_ms = self.render_stats.summary()["avg_ms"]
+        build_ms = self.build_stats.summary()["avg_ms"]
+        saved = render_ms - composite_ms
+        print(f"[STATS] UI layer '{self.name}': n={frames} rebuilds={self.rebuilds} "
+              f"(avg {build_ms:.1f} ms) | immediate {render_ms:.2f} ms -> composite "
+              f"{composite_ms:.2f} ms, saved {saved:.2f} ms/frame")
+
+
+class WidgetLayer:
+    """Overlay retained untuk satu daftar widget dengan redraw per widget (dirty).
+
+    Kanvas hitam/putih disimpan selama daftar widget sama, sehingga widget dirty cukup
+    dihapus dan digambar ulang di kotaknya (+ MARGIN untuk shadow/border). Region tile
+    dihitung sekali saat build (semua tile di kotak widget masuk region); jika redraw
+    membuat tile opaque jadi transparan atau kotak widget saling tumpang tindih, layer
+    dibangun ulang penuh.
+    """
+
+    # Ruang di sekitar widget untuk shadow dan border tebal (koordinat desain)
+    MARGIN = 8
+    # Tile lebih kecil dari UILayer: tepi widget yang di-blend tetap sempit
+    TILE = 16
+
+    def __init__(self, name):
+        self.name = name
+        self.widgets = None
+        self.shape = None
+        self.redraws = 0
+        self.rebuilds = 0
+        self.build_stats = TimingStats(f"Widget layer '{name}' rebuild")
+        self.redraw_stats = TimingStats(f"Widget layer '{name}' dirty redraw")
+        self.composite_stats = TimingStats(f"Widget layer '{name}' composite")
+
+    def _bounds(self, widget, shape):
+        """Kotak pixel (y0, y1, x0, x1) widget + margin, di-clip ke frame"""
+        # Import lokal: layout -> text_cache -> ui_layer (import melingkar di level modul)
+        from .layout import LAYOUT
+        x0, y0 = LAYOUT.point(widget.x - self.MARGIN, widget.y - self.MARGIN)
+        x1, y1 = LAYOUT.point(widget.x + widget.width + self.MARGIN,
+                              widget.y + widget.height + self.MARGIN)
+        return max(0, y0), min(shape[0], y1), max(0, x0), min(shape[1], x1)
+
+    def _build(self, shape, widgets, draw_widget):
+        start = time.perf_counter()
+        self.widgets = widgets
+        self.shape = shape
+        self.black = np.zeros(shape, dtype=np.uint8)
+        self.white = np.full(shape, 255, dtype=np.uint8)
+        self.inv = np.full(shape, 255, dtype=np.uint8)
+        self.bounds = {widget: self._bounds(widget, shape) for widget in widgets}
+        self.regions = []
+        if not widgets:
+            self.rebuilds += 1
+            return
+        for widget in widgets:
+            draw_widget(self.black, widget)
+            draw_widget(self.white, widget)
+
+        # Region hanya di area semua widget (tile-aligned), sisanya kosong
+        tile = self.TILE
+        boxes = list(self.bounds.values())
+        self.origin = (min(b[0] for b in boxes) // tile, min(b[2] for b in boxes) // tile)
+        y0, x0 = self.origin[0] * tile, self.origin[1] * tile
+        y1, x1 = max(b[1] for b in boxes), max(b[3] for b in boxes)
+        cv2.subtract(self.white[y0:y1, x0:x1], self.black[y0:y1, x0:x1], dst=self.inv[y0:y1, x0:x1])
+        self.kinds = _tile_kinds(self.black[y0:y1, x0:x1], self.inv[y0:y1, x0:x1], tile)
+        # Tile kosong di dalam kotak widget tetap masuk region (widget boleh melebar saat redraw)
+        for by0, by1, bx0, bx1 in boxes:
+            area = self.kinds[by0 // tile - self.origin[0]:-(-by1 // tile) - self.origin[0],
+                              bx0 // tile - self.origin[1]:-(-bx1 // tile) - self.origin[1]]
+            area[area == _EMPTY] = _BLEND
+        for row0, row1, col0, col1, kind in _merge_regions(self.kinds):
+            ry0, ry1 = y0 + row0 * tile, min(y0 + row1 * tile, shape[0])
+            rx0, rx1 = x0 + col0 * tile, min(x0 + col1 * tile, shape[1])
+            # View ke kanvas (bukan copy): redraw widget langsung terlihat di composite
+            blend = self.inv[ry0:ry1, rx0:rx1] if kind == _BLEND else None
+            mask = None
+            if blend is not None and np.all((blend == 0) | (blend == 255)):
+                # Tepi widget tanpa anti-aliasing: pixel opaque atau kosong -> copy dengan mask
+                mask = (blend[:, :, 0] == 0).astype(np.uint8)
+            self.regions.append((ry0, ry1, rx0, rx1, self.black[ry0:ry1, rx0:rx1], blend, mask))
+
+        # Region dengan mask yang harus diperbarui jika alpha widget berubah saat redraw
+        self.masked = {
+            widget: [region for region in self.regions if region[6] is not None and
+                     region[0] < box[1] and box[0] < region[1] and region[2] < box[3] and box[2] < region[3]]
+            for widget, box in self.bounds.items()}
+
+        # Redraw per widget hanya aman jika kotak widget tidak saling tumpang tindih
+        self.isolated = not any(
+            a[0] < b[1] and b[0] < a[1] and a[2] < b[3] and b[2] < a[3]
+            for i, a in enumerate(boxes) for b in boxes[i + 1:])
+        self.rebuilds += 1
+        self.build_stats.add(time.perf_counter() - start)
+
+    def _redraw(self, widget, draw_widget):
+        """Gambar ulang satu widget. Return False jika jenis tile berubah (perlu rebuild)"""
+        y0, y1, x0, x1 = self.bounds[widget]
+        alpha = self.inv[y0:y1, x0:x1].copy()
+        self.black[y0:y1, x0:x1] = 0
+        self.white[y0:y1, x0:x1] = 255
+        draw_widget(self.black, widget)
+        draw_widget(self.white, widget)
+        cv2.subtract(self.white[y0:y1, x0:x1], self.black[y0:y1, x0:x1], dst=self.inv[y0:y1, x0:x1])
+        if np.array_equal(alpha, self.inv[y0:y1, x0:x1]):
+            # Hanya warna yang berubah (kasus umum hover): region dari build tetap berlaku
+            return True
+
+        # Bentuk berubah (mis. border lebih tebal): tile opaque harus tetap opaque
+        tile = self.TILE
+        oy, ox = self.origin
+        r0, r1 = y0 // tile - oy, -(-y1 // tile) - oy
+        c0, c1 = x0 // tile - ox, -(-x1 // tile) - ox
+        ty0, ty1 = (oy + r0) * tile, min((oy + r1) * tile, self.shape[0])
+        tx0, tx1 = (ox + c0) * tile, min((ox + c1) * tile, self.shape[1])
+        kinds = _tile_kinds(self.black[ty0:ty1, tx0:tx1], self.inv[ty0:ty1, tx0:tx1], tile)
+        if np.any(kinds[self.kinds[r0:r1, c0:c1] == _OPAQUE] != _OPAQUE):
+            return False
+        for _, _, _, _, _, blend, mask in self.masked[widget]:
+            if not np.all((blend == 0) | (blend == 255)):
+                return False
+            mask[:] = blend[:, :, 0] == 0
+        return True
+
+    def draw(self, frame, widgets, draw_widget, dirty=()):
+        """Composite semua widget ke frame; draw_widget(canvas, widget) hanya dipanggil
+        untuk widget baru (daftar berbeda) atau yang ada di dirty"""
+        if not UILayer.enabled:
+            start = time.perf_counter()
+            for widget in widgets:
+                draw_widget(frame, widget)
+            self.composite_stats.add(time.perf_counter() - start)
+            return
+
+        if widgets is not self.widgets or frame.shape != self.shape:
+            self._build(frame.shape, widgets, draw_widget)
+        else:
+            changed = [widget for widget in dirty if widget in self.bounds]
+            if changed:
+                start = time.perf_counter()
+                ok = self.isolated
+                for widget in changed:
+                    ok = ok and self._redraw(widget, draw_widget)
+                if ok:
+                    self.redraws += len(changed)
+                    self.redraw_stats.add(time.perf_counter() - start)
+                else:
+                    self._build(frame.shape, widgets, draw_widget)
+
+        start = time.perf_counter()
+        for y0, y1, x0, x1, premult, blend, mask in self.regions:
+            roi = frame[y0:y1, x0:x1]
+            if blend is None:
+                roi[:] = premult
+            elif mask is not None:
+                cv2.copyTo(premult, mask, roi)
+            else:
+                blend_premultiplied(roi, premult, blend)
+        self.composite_stats.add(time.perf_counter() - start)
+
+    def report(self):
+        frames = self.composite_stats.count
+        if frames == 0:
+            return
+        composite_ms = self.composite_stats.summary()["avg_ms"]
+        if not UILayer.enabled:
+            print(f"[STATS] Widget layer '{self.name}' (immediate mode): n={frames} "
+                  f"avg={composite_ms:.2f} ms/frame")
+            return
+        build_ms = self.build_stats.summary()["avg_ms"]
+        redraw_ms = self.redraw_stats.summary()["avg_ms"]
+        print(f"[STATS] Widget layer '{self.name}': n={frames} rebuilds={self.rebuilds} "
+              f"(avg {build_ms:.1f} ms) | dirty redraws={self.redraws} (avg {redraw_ms:.2f} ms) | "
+              f"composite {composite_ms:.2f} ms/frame")
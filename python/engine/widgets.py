@@ -0,0 +1,105 @@
+"""
+Widget dasar (kotak yang bisa di-hover/diklik) + hit-testing.
+
+Posisi dan ukuran widget dalam koordinat desain 1920x1080 (lihat layout.py), sama
+seperti posisi jari dari HandInput, jadi hit-test tidak bergantung resolusi kamera.
+
+Setiap game tetap punya gaya gambar sendiri dengan men-subclass Widget dan
+mengisi draw(); posisi, hit-test dan label di tengah kotak ada di sini.
+
+HitGrid: index grid (sel HIT_CELL x HIT_CELL) yang dibangun sekali per layout, jadi
+hit-test cukup memeriksa widget di sel cursor (O(1), tidak bergantung jumlah widget).
+set_hovered memindahkan .hovered hanya di widget yang berubah dan mengembalikannya
+(dirty, untuk digambar ulang oleh WidgetLayer).
+"""
+
+from .layout import LAYOUT
+
+# Ukuran sel grid hit-test (koordinat desain): kira-kira ukuran satu word card
+HIT_CELL = 128
+
+
+class Widget:
+    def __init__(self, x, y, width, height, text, id=None):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.text = text
+        self.id = id
+        self.hovered = False
+        self.selected = False
+
+    def contains_point(self, x, y):
+        """Check if point is inside widget"""
+        return (self.x <= x <= self.x + self.width and
+                self.y <= y <= self.y + self.height)
+
+    def draw_label(self, frame, font, scale, color, thickness, shadow_offset=2):
+        """Teks di tengah kotak (koordinat desain, sprite di-cache oleh TEXT_CACHE)"""
+        (text_w, text_h), _ = LAYOUT.text_size(self.text, font, scale, thickness)
+        text_x = self.x + (self.width - text_w) // 2
+        text_y = self.y + (self.height + text_h) // 2
+        LAYOUT.text(frame, self.text, (text_x, text_y), font, scale, color, thickness,
+                    shadow_offset=shadow_offset)
+
+    def draw(self, frame, color=None):
+        raise NotImplementedError
+
+
+def hit_test(widgets, point):
+    """Widget pertama yang berisi point (x, y), atau None"""
+    if point is None:
+        return None
+    x, y = point
+    return next((w for w in widgets if w.contains_point(x, y)), None)
+
+
+class HitGrid:
+    """Index hit-test untuk satu daftar widget (urutan daftar = prioritas, sama seperti hit_test)"""
+    def __init__(self, widgets, cell=HIT_CELL):
+        self.widgets = list(widgets)
+        self.cell = cell
+        self.cells = {}  # (col, row) -> widget di sel itu, urut sesuai daftar
+        for widget in self.widgets:
+            for col in range(widget.x // cell, (widget.x + widget.width) // cell + 1):
+                for row in range(widget.y // cell, (widget.y + widget.height) // cell + 1):
+                    self.cells.setdefault((col, row), []).append(widget)
+
+    def hit(self, point):
+        """Widget pertama yang berisi point (x, y), atau None"""
+        if point is None:
+            return None
+        x, y = point
+        candidates = self.cells.get((int(x) // self.cell, int(y) // self.cell), ())
+        return next((w for w in candidates if w.contains_point(x, y)), None)
+
+
+def set_hovered(previous, targets):
+    """Pindahkan .hovered dari target lama ke target baru (satu per cursor, boleh None).
+
+    Return set widget yang .hovered-nya berubah; widget lain tidak disentuh.
+    """
+    old = {w for w in previous if w is not None}
+    new = {w for w in targets if w is not None}
+    changed = old ^ new
+    for widget in changed:
+        widget.hovered = widget in new
+    return changed
+
+
+def update_hover(widgets, point):
+    """Set .hovered untuk semua widget; return widget pertama yang di-hover.
+
+    point None (tidak ada tangan) membiarkan hover terakhir apa adanya.
+    """
+    if point is None:
+        return None
+    x, y = point
+    first = None
+    for widget in widgets:
+        widget.hovered = widget.contains_point(x, y)
+        if widget.hovered and first is None:
+            first = widget
+    return first
+
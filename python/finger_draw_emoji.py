@@ -1,5 +1,4 @@
 import cv2
-import mediapipe as mp
 import numpy as np
 import math
 import os
@@ -8,11 +7,20 @@ from pathlib import Path
 import time
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
+from engine.perf_stats import TimingStats, FrameTimer
+from engine.hand_tracking import HandTracker, draw_hand, INDEX_TIP
+from engine.hand_input import OneEuroFilter, PinchDetector
+from engine.hand_recording import HandRecorder, HandReplay, parse_replay_args
+from letter_recognizer import AirWriter
+from engine.display import Display
+from engine.ui_layer import UILayer
+from engine.text_cache import TEXT_CACHE, draw_text
 
-# Initialize MediaPipe
-mp_hands = mp.solutions.hands
-mp_draw = mp.solutions.drawing_utils
-
+# Pinch untuk menggambar: jarak telunjuk-jempol / ukuran tangan (lebih longgar dari klik UI,
+# ~ ambang lama 50 px untuk tangan ukuran sedang di kamera 640 px)
+DRAW_PINCH_ON = 0.4
+DRAW_PINCH_OFF = 0.55
 
 # Emoji database
 EMOJI_PATTERNS = {
@@ -61,10 +69,16 @@ EMOJI_PATTERNS = {
 }
 
 class EmojiDrawer:
-    def __init__(self):
+    def __init__(self, verbose=True):
+        # verbose=False mematikan log debug (dipakai benchmark / worker)
+        self.log = print if verbose else (lambda *args, **kwargs: None)
         self.drawing = False
         self.points = deque(maxlen=2048)
-        self.smoothed_points = deque(maxlen=5)
+        # Cursor kuas difilter One Euro (diam = tidak bergetar, cepat = tanpa lag);
+        # pinch dengan hysteresis pada jarak ternormalisasi ukuran tangan, tanpa debounce
+        # karena menggambar mengikuti status pinch, bukan klik
+        self.cursor_filter = OneEuroFilter()
+        self.pinch = PinchDetector(pinch_on=DRAW_PINCH_ON, pinch_off=DRAW_PINCH_OFF, debounce=0.0)
         self.canvas = None
         self.prev_point = None
         self.brush_size = 15
@@ -75,6 +89,15 @@ class EmojiDrawer:
         self.emoji_position = None
         self.show_emoji_frames = 0
         self.emoji_alpha = 1.0
+        self.analyzing = False
+        self.detection_history = []  # Semua hasil recognition (untuk replay test)
+        self.errors = 0  # Exception di detector (dihitung shape_corpus sebagai error recognizer)
+        
+        # Word mode (air-writing huruf -> kata), dibuat saat pertama kali diaktifkan
+        self.mode = "emoji"
+        self.writer = None
+        self.word_history = []
+        self.word_popup_frames = 0
         
         # Load emoji images
         self.emoji_images = {}
@@ -85,6 +108,7 @@ class EmojiDrawer:
         
         # Font untuk UI (lebih bagus)
         self.font = cv2.FONT_HERSHEY_DUPLEX
+        self.ui_layer = UILayer("draw ui")
     
     def load_emoji_images(self):
         """Load emoji PNG images dari folder assets"""
@@ -92,16 +116,16 @@ class EmojiDrawer:
             script_dir = Path(__file__).parent
             emoji_dir = script_dir / "assets" / "emojis"
             
-            print("=" * 70)
-            print("[*] EMOJI DRAWER - Loading Resources")
-            print("=" * 70)
-            print(f"[*] Emoji directory: {emoji_dir}")
+            self.log("=" * 70)
+            self.log("[*] EMOJI DRAWER - Loading Resources")
+            self.log("=" * 70)
+            self.log(f"[*] Emoji directory: {emoji_dir}")
             
             if not emoji_dir.exists():
-                print(f"\n[!] WARNING: Emoji directory not found!")
-                print(f"[*] Creating directory: {emoji_dir}")
+                self.log(f"\n[!] WARNING: Emoji directory not found!")
+                self.log(f"[*] Creating directory: {emoji_dir}")
                 emoji_dir.mkdir(parents=True, exist_ok=True)
-                print(f"\n[TIP] Add emoji PNG files to: {emoji_dir}")
+                self.log(f"\n[TIP] Add emoji PNG files to: {emoji_dir}")
                 return
             
             # Load each emoji image
@@ -114,24 +138,24 @@ class EmojiDrawer:
                         img = cv2.imread(str(file_path), cv2.IMREAD_UNCHANGED)
                         if img is not None:
                             self.emoji_images[emoji_key] = img
-                            print(f"[OK] Loaded: {emoji_data['file']:20s} -> {emoji_data['name']}")
+                            self.log(f"[OK] Loaded: {emoji_data['file']:20s} -> {emoji_data['name']}")
                             loaded_count += 1
                         else:
-                            print(f"[!] Failed to load: {emoji_data['file']} (file corrupted?)")
+                            self.log(f"[!] Failed to load: {emoji_data['file']} (file corrupted?)")
                     except Exception as e:
                         print(f"[X] Error loading {emoji_data['file']}: {e}")
                 else:
-                    print(f"[!] Not found: {emoji_data['file']}")
+                    self.log(f"[!] Not found: {emoji_data['file']}")
             
-            print("=" * 70)
+            self.log("=" * 70)
             if loaded_count == len(EMOJI_PATTERNS):
-                print(f"[SUCCESS] All emojis loaded! ({loaded_count}/{len(EMOJI_PATTERNS)})")
+                self.log(f"[SUCCESS] All emojis loaded! ({loaded_count}/{len(EMOJI_PATTERNS)})")
             elif loaded_count > 0:
-                print(f"[WARNING] Partially loaded: {loaded_count}/{len(EMOJI_PATTERNS)} emojis")
+                self.log(f"[WARNING] Partially loaded: {loaded_count}/{len(EMOJI_PATTERNS)} emojis")
             else:
-                print(f"[ERROR] No emojis loaded!")
-            print("=" * 70)
-            print()
+                self.log(f"[ERROR] No emojis loaded!")
+            self.log("=" * 70)
+            self.log()
             
         except Exception as e:
             print(f"[X] CRITICAL ERROR in load_emoji_images: {e}")
@@ -181,27 +205,10 @@ class EmojiDrawer:
         except Exception as e:
             print(f"[!] Error in overlay_png: {e}")
     
-    def smooth_point(self, point):
-        """Apply moving average smoothing to point"""
-        self.smoothed_points.append(point)
-        if len(self.smoothed_points) < 2:
-            return point
-        
-        # Calculate weighted average
-        total_weight = 0
-        weighted_x = 0
-        weighted_y = 0
-        
-        for i, pt in enumerate(self.smoothed_points):
-            weight = i + 1
-            weighted_x += pt[0] * weight
-            weighted_y += pt[1] * weight
-            total_weight += weight
-        
-        smoothed_x = int(weighted_x / total_weight)
-        smoothed_y = int(weighted_y / total_weight)
-        
-        return (smoothed_x, smoothed_y)
+    def smooth_point(self, point, now):
+        """Filter One Euro untuk titik kuas (timestamp now dalam detik)"""
+        x, y = self.cursor_filter.filter(point, now)
+        return (int(x), int(y))
     
     def smooth_line(self, p1, p2):
         """Interpolasi untuk garis smooth"""
@@ -251,12 +258,14 @@ class EmojiDrawer:
             aspect_ratio = float(bw) / bh if bh > 0 else 0
             
             if width_ratio > 1.2 and 1.0 < aspect_ratio < 2.5:
-                print(f"   [CHECK] Width ratio: {width_ratio:.2f}, Aspect: {aspect_ratio:.2f}")
+                self.log(f"   [CHECK] Width ratio: {width_ratio:.2f}, Aspect: {aspect_ratio:.2f}")
                 return True
             
             return False
             
         except Exception as e:
+            self.errors += 1
+            self.log(f"   [!] Error in is_check_mark: {e}")
             return False
 
     def is_heart_shape(self, contour):
@@ -270,18 +279,17 @@ class EmojiDrawer:
             if defects is None:
                 return False
             
-            count_defects = 0
-            for i in range(defects.shape[0]):
-                s, e, f, d = defects[i, 0]
-                if d > 1000:
-                    count_defects += 1
+            # OpenCV 4: shape (N, 1, 4), OpenCV 5: (N, 4)
+            count_defects = int((defects.reshape(-1, 4)[:, 3] > 1000).sum())
             
             if count_defects == 2:
-                print(f"   [HEART] Convexity defects count: {count_defects}")
+                self.log(f"   [HEART] Convexity defects count: {count_defects}")
                 return True
             
             return False
-        except:
+        except Exception as e:
+            self.errors += 1
+            self.log(f"   [!] Error in is_heart_shape: {e}")
             return False
 
     def is_star_shape(self, contour, corners, solidity, circularity):
@@ -289,12 +297,12 @@ class EmojiDrawer:
         try:
             # Kriteria 1: Many corners + low solidity (classic star)
             if 7 <= corners <= 20 and solidity < 0.75 and circularity < 0.65:
-                print(f"   [STAR] Type A: corners={corners}, solidity={solidity:.2f}")
+                self.log(f"   [STAR] Type A: corners={corners}, solidity={solidity:.2f}")
                 return True
             
             # Kriteria 2: Moderate corners + very low solidity (rough star)
             if 5 <= corners <= 12 and solidity < 0.60:
-                print(f"   [STAR] Type B: corners={corners}, solidity={solidity:.2f}")
+                self.log(f"   [STAR] Type B: corners={corners}, solidity={solidity:.2f}")
                 return True
             
             # Kriteria 3: Check convexity defects (star has many points)
@@ -302,20 +310,22 @@ class EmojiDrawer:
             if hull is not None and len(hull) >= 3:
                 defects = cv2.convexityDefects(contour, hull)
                 if defects is not None:
-                    deep_defects = sum(1 for i in range(defects.shape[0]) if defects[i, 0, 3] > 800)
+                    # OpenCV 4: shape (N, 1, 4), OpenCV 5: (N, 4)
+                    deep_defects = int((defects.reshape(-1, 4)[:, 3] > 800).sum())
                     if deep_defects >= 4 and corners >= 6:
-                        print(f"   [STAR] Type C: deep_defects={deep_defects}, corners={corners}")
+                        self.log(f"   [STAR] Type C: deep_defects={deep_defects}, corners={corners}")
                         return True
             
             # Kriteria 4: Alternative - banyak corners dengan circularity rendah
             if corners >= 8 and circularity < 0.70 and solidity < 0.80:
-                print(f"   [STAR] Type D: corners={corners}, circularity={circularity:.2f}")
+                self.log(f"   [STAR] Type D: corners={corners}, circularity={circularity:.2f}")
                 return True
                 
             return False
             
         except Exception as e:
-            print(f"   [!] Error in is_star_shape: {e}")
+            self.errors += 1
+            self.log(f"   [!] Error in is_star_shape: {e}")
             return False
 
     def detect_emoji_from_drawing(self, canvas):
@@ -340,7 +350,7 @@ class EmojiDrawer:
             area = cv2.contourArea(main_contour)
             
             if area < 800:
-                print(f"   [!] Area too small: {area:.0f} (minimum: 800)")
+                self.log(f"   [!] Area too small: {area:.0f} (minimum: 800)")
                 return None, None
             
             # Get properties
@@ -362,10 +372,10 @@ class EmojiDrawer:
             solidity = float(area) / hull_area if hull_area > 0 else 0
             
             # Debug info
-            print(f"\n[DEBUG] Detection Analysis:")
-            print(f"   Area: {area:.0f} | Circularity: {circularity:.2f}")
-            print(f"   Aspect Ratio: {aspect_ratio:.2f} | Corners: {corners}")
-            print(f"   Solidity: {solidity:.2f} | W: {w}, H: {h}")
+            self.log(f"\n[DEBUG] Detection Analysis:")
+            self.log(f"   Area: {area:.0f} | Circularity: {circularity:.2f}")
+            self.log(f"   Aspect Ratio: {aspect_ratio:.2f} | Corners: {corners}")
+            self.log(f"   Solidity: {solidity:.2f} | W: {w}, H: {h}")
             
             detected = None
             
@@ -374,45 +384,46 @@ class EmojiDrawer:
             # 1. CHECK MARK - PRIORITY
             if self.is_check_mark(main_contour, w, h):
                 detected = "check"
-                print(f"   [OK] Detected: CHECK MARK")
+                self.log(f"   [OK] Detected: CHECK MARK")
             
             # 2. STAR - IMPROVED DETECTION (check early to avoid confusion with other shapes)
             elif self.is_star_shape(main_contour, corners, solidity, circularity):
                 detected = "star"
-                print(f"   [OK] Detected: STAR")
+                self.log(f"   [OK] Detected: STAR")
             
             # 3. TRIANGLE - 3-4 corners, low circularity
             elif 3 <= corners <= 4 and circularity < 0.75 and 0.7 < aspect_ratio < 1.5:
                 detected = "triangle"
-                print(f"   [OK] Detected: TRIANGLE")
+                self.log(f"   [OK] Detected: TRIANGLE")
             
             # 4. SQUARE - 4-6 corners, square-like, medium-high solidity
             elif 4 <= corners <= 6 and 0.7 < aspect_ratio < 1.3 and solidity > 0.75:
                 detected = "square"
-                print(f"   [OK] Detected: SQUARE")
+                self.log(f"   [OK] Detected: SQUARE")
             
             # 5. CIRCLE (Smile) - High circularity
             elif circularity > 0.70 and 0.75 < aspect_ratio < 1.30:
                 detected = "smile"
-                print(f"   [OK] Detected: SMILE")
+                self.log(f"   [OK] Detected: SMILE")
             
             # 6. HEART - Medium circularity, somewhat concave
             elif 0.40 < circularity < 0.75 and 0.70 < aspect_ratio < 1.40 and solidity < 0.88:
                 if self.is_heart_shape(main_contour):
                     detected = "heart"
-                    print(f"   [OK] Detected: HEART")
+                    self.log(f"   [OK] Detected: HEART")
             
             # 7. THUMBS UP - Very vertical
             elif aspect_ratio < 0.60 and corners >= 6:
                 detected = "thumbs_up"
-                print(f"   [OK] Detected: THUMBS UP")
+                self.log(f"   [OK] Detected: THUMBS UP")
             
             if detected is None:
-                print(f"   [X] No match found")
+                self.log(f"   [X] No match found")
             
             return detected, center
             
         except Exception as e:
+            self.errors += 1
             print(f"[X] Error in detect_emoji_from_drawing: {e}")
             import traceback
             traceback.print_exc()
@@ -438,58 +449,262 @@ class EmojiDrawer:
         except Exception as e:
             print(f"[!] Error in draw_emoji_popup: {e}")
     
+    def handle_hand(self, frame, hand, recognizer, now=None):
+        """Proses satu frame input tangan: gambar saat pinch, kirim ke recognizer saat tangan dibuka
+
+        now = timestamp frame (detik); default waktu sekarang, replay memberi timestamp rekaman
+        """
+        h, w = frame.shape[:2]
+        now = time.perf_counter() if now is None else now
+        self.pinch.update(hand, w, h, now)
+        
+        if hand is None:
+            if self.mode == "word" and self.drawing and self.points:
+                self.writer.add_stroke(self.points)
+                self.points.clear()
+            self.drawing = False
+            self.prev_point = None
+            self.cursor_filter.reset()
+            return
+        
+        # Draw hand skeleton
+        draw_hand(frame, hand, point_color=(0, 255, 100), line_color=(0, 180, 255),
+                  thickness=2, radius=3)
+        
+        # Get finger tip
+        index_x, index_y = hand.point(INDEX_TIP, w, h)
+        
+        # Drawing mode (pinch, hysteresis)
+        if self.pinch.pinching:
+            self.drawing = True
+            
+            # Apply smoothing
+            raw_point = (index_x, index_y)
+            current_point = self.smooth_point(raw_point, now)
+            
+            if self.prev_point is not None:
+                smooth_points = self.smooth_line(self.prev_point, current_point)
+                for pt in smooth_points:
+                    self.points.append(pt)
+                    cv2.circle(self.canvas, pt, self.brush_size, 
+                             self.color, -1, lineType=cv2.LINE_AA)
+                    cv2.circle(frame, pt, self.brush_size, 
+                             self.color, -1, lineType=cv2.LINE_AA)
+            
+            self.prev_point = current_point
+            
+            # Visual feedback
+            cv2.circle(frame, current_point, 20, (0, 255, 255), 3, cv2.LINE_AA)
+            cv2.circle(frame, current_point, 6, (0, 255, 255), -1, cv2.LINE_AA)
+        
+        else:
+            # Word mode: stroke dikumpulkan, huruf dikenali setelah jeda (update_word_mode)
+            if self.mode == "word":
+                if self.drawing and self.points:
+                    self.writer.add_stroke(self.points)
+                    self.points.clear()
+            
+            # Selesai drawing - kirim snapshot ke worker, render loop jalan terus
+            elif self.drawing and len(self.points) > 20:
+                print("\n[*] Analyzing drawing (background)...")
+                # Canvas lama diserahkan ke worker, render loop pakai canvas baru
+                recognizer.submit(self.canvas)
+                self.canvas = np.zeros_like(frame)
+                self.points.clear()
+            
+            self.drawing = False
+            self.prev_point = None
+            self.cursor_filter.reset()
+            
+            cv2.circle(frame, (index_x, index_y), 10, (255, 100, 100), 3, cv2.LINE_AA)
+            cv2.circle(frame, (index_x, index_y), 4, (255, 100, 100), -1, cv2.LINE_AA)
+
+    def toggle_word_mode(self):
+        """Ganti antara mode emoji dan mode menulis kata"""
+        if self.writer is None:
+            self.writer = AirWriter()
+            print(f"[OK] Word mode ready ({len(self.writer.vocabulary)} vocabulary words)")
+        self.mode = "word" if self.mode == "emoji" else "emoji"
+        self.writer.strokes = []
+        self.writer.letters = []
+        if self.canvas is not None:
+            self.canvas[:] = 0
+        self.points.clear()
+        print(f"\n[*] Mode: {self.mode.upper()}\n")
+    
+    def update_word_mode(self, finish_word=False):
+        """Panggil sekali per frame: selesaikan huruf/kata setelah tangan diam sejenak"""
+        if self.mode != "word":
+            return
+        if finish_word:
+            event = "word" if self.writer.finish_word() else None
+        else:
+            event = self.writer.update(self.drawing)
+        
+        if event == "letter":
+            # Huruf selesai: bersihkan canvas untuk huruf berikutnya
+            self.canvas[:] = 0
+            letter = self.writer.text()[-1]
+            print(f"[*] Letter: {letter} -> {self.writer.text()} "
+                  f"({self.writer.recognizer.last_latency * 1000:.1f} ms)")
+        elif event == "word":
+            self.canvas[:] = 0
+            written, word = self.writer.last_word
+            self.word_history.append(word or f"?{written}")
+            self.word_popup_frames = 90
+            if word:
+                print(f"[SUCCESS] Word: {word} (written: {written})\n")
+            else:
+                print(f"[!] '{written}' is not in the quiz vocabulary\n")
+    
+    def apply_recognition_results(self, recognizer):
+        """Terapkan hasil recognition yang sudah selesai (non-blocking) ke popup emoji"""
+        for emoji, position, latency in recognizer.poll():
+            self.detection_history.append(emoji)
+            if emoji:
+                self.detected_emoji = emoji
+                self.emoji_position = position
+                self.show_emoji_frames = 90
+                self.emoji_alpha = 1.0
+                print(f"[SUCCESS] Detected: {EMOJI_PATTERNS[emoji]['name']} ({latency * 1000:.0f} ms)\n")
+            else:
+                print(f"[!] No emoji detected. Try drawing larger and clearer! ({latency * 1000:.0f} ms)\n")
+        self.analyzing = recognizer.busy()
+    
     def draw_text_with_shadow(self, frame, text, pos, font, scale, color, thickness):
         """Draw text with shadow for better readability"""
-        x, y = pos
-        # Shadow
-        cv2.putText(frame, text, (x+3, y+3), font, scale, (0, 0, 0), thickness+2, cv2.LINE_AA)
-        # Main text
-        cv2.putText(frame, text, (x, y), font, scale, color, thickness, cv2.LINE_AA)
+        # Shadow +3px, lebih tebal 2; dirender sekali ke sprite oleh TEXT_CACHE
+        draw_text(frame, text, pos, font, scale, color, thickness,
+                  shadow_offset=3, shadow_thickness=thickness + 2)
     
     def draw_ui(self, frame):
         """Draw UI for 1920x1080 resolution"""
         try:
-            h, w = frame.shape[:2]
-            
             # Top-left: Simple status
-            status = "DRAWING..." if self.drawing else f"Ready ({len(self.emoji_images)}/{len(EMOJI_PATTERNS)} emojis)"
-            color = (0, 255, 255) if self.drawing else (0, 255, 100)
-            self.draw_text_with_shadow(frame, status, (25, 50), 
-                                       self.font, 1.0, color, 2)
-            
-            # Bottom-left: Instructions
-            instructions = [
-                "Pinch fingers = Draw",
-                "Open hand = Detect",
-                "H = Show/Hide hints",
-                "C = Clear canvas",
-                "Q = Quit"
-            ]
-            
-            y_start = h - 180
-            for i, inst in enumerate(instructions):
-                self.draw_text_with_shadow(frame, inst, (25, y_start + i*35), 
-                                          self.font, 0.7, (255, 255, 255), 1)
-            
-            # Top-right: Hints (if enabled)
-            if self.show_hints:
-                hint_x = w - 380
-                hint_y = 40
-                
-                self.draw_text_with_shadow(frame, "DRAW THESE:", (hint_x, hint_y), 
-                                          self.font, 0.8, (0, 255, 100), 2)
-                
-                y_offset = hint_y + 40
-                for emoji_key, emoji_data in EMOJI_PATTERNS.items():
-                    hint = f"{emoji_data['hint']} = {emoji_data['name']}"
-                    color = (255, 255, 255) if emoji_key in self.emoji_images else (120, 120, 120)
-                    self.draw_text_with_shadow(frame, hint, (hint_x, y_offset), 
-                                              self.font, 0.65, color, 1)
-                    y_offset += 35
+            if self.drawing:
+                status, color = "DRAWING...", (0, 255, 255)
+            elif self.analyzing:
+                status, color = "ANALYZING...", (255, 200, 0)
+            elif self.mode == "word":
+                status, color = "WORD MODE: write one letter at a time", (255, 200, 0)
+            else:
+                status, color = f"Ready ({len(self.emoji_images)}/{len(EMOJI_PATTERNS)} emojis)", (0, 255, 100)
+            
+            # Status, instruksi dan hints hanya berubah karena event -> retained UI layer
+            key = (status, self.mode, self.show_hints, tuple(self.emoji_images))
+            self.ui_layer.draw(frame, key, lambda canvas: self.draw_ui_static(canvas, status, color))
+            
+            if self.mode == "word":
+                self.draw_word_panel(frame)
                     
         except Exception as e:
             print(f"[!] Error in draw_ui: {e}")
 
+    def draw_ui_static(self, frame, status, color):
+        """Status, instruksi (kiri bawah) dan hints (kanan atas)"""
+        h, w = frame.shape[:2]
+        self.draw_text_with_shadow(frame, status, (25, 50), 
+                                   self.font, 1.0, color, 2)
+        
+        # Bottom-left: Instructions
+        instructions = [
+            "Pinch fingers = Draw",
+            "Open hand = Detect",
+            "H = Show/Hide hints",
+            "C = Clear canvas",
+            "W = Emoji/Word mode",
+            "Q = Quit"
+        ]
+        if self.mode == "word":
+            instructions[1] = "Pause = Next letter"
+            instructions.insert(-1, "Backspace = Undo, Enter = Check word")
+        
+        y_start = h - 40 - len(instructions) * 35
+        for i, inst in enumerate(instructions):
+            self.draw_text_with_shadow(frame, inst, (25, y_start + i*35), 
+                                      self.font, 0.7, (255, 255, 255), 1)
+        
+        # Top-right: Hints (if enabled, tidak di word mode)
+        if self.mode != "word" and self.show_hints:
+            hint_x = w - 380
+            hint_y = 40
+            
+            self.draw_text_with_shadow(frame, "DRAW THESE:", (hint_x, hint_y), 
+                                      self.font, 0.8, (0, 255, 100), 2)
+            
+            y_offset = hint_y + 40
+            for emoji_key, emoji_data in EMOJI_PATTERNS.items():
+                hint = f"{emoji_data['hint']} = {emoji_data['name']}"
+                color = (255, 255, 255) if emoji_key in self.emoji_images else (120, 120, 120)
+                self.draw_text_with_shadow(frame, hint, (hint_x, y_offset), 
+                                          self.font, 0.65, color, 1)
+                y_offset += 35
+
+    def draw_word_panel(self, frame):
+        """Word mode: huruf yang sudah ditulis dan hasil pengecekan kata terakhir"""
+        h, w = frame.shape[:2]
+        text = self.writer.text()
+        if self.writer.strokes:
+            text += "_"
+        self.draw_text_with_shadow(frame, text or "...", (w // 2 - 30 * max(1, len(text)), 110),
+                                   self.font, 2.5, (255, 255, 255), 4)
+        
+        if self.word_popup_frames > 0 and self.writer.last_word:
+            written, word = self.writer.last_word
+            if word:
+                message, color = f"{word.upper()}  - correct!", (0, 255, 100)
+            else:
+                message, color = f"{written}  - not in vocabulary", (0, 100, 255)
+            self.draw_text_with_shadow(frame, message, (w // 2 - 300, 200),
+                                       self.font, 1.5, color, 3)
+            self.word_popup_frames -= 1
+
+class RecognitionWorker:
+    """Jalankan detect_emoji_from_drawing di background thread agar render loop tidak tersendat"""
+    def __init__(self, drawer):
+        self.drawer = drawer
+        # Satu worker cukup: job diproses berurutan, hasil muncul sesuai urutan submit
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recognizer")
+        self.pending = deque()
+        self.latency = TimingStats("Recognition latency (submit -> result)")
+        self.compute = TimingStats("Recognition compute")
+
+    def _run(self, canvas):
+        start = time.perf_counter()
+        emoji, position = self.drawer.detect_emoji_from_drawing(canvas)
+        return emoji, position, time.perf_counter() - start
+
+    def submit(self, canvas):
+        """Kirim snapshot canvas ke worker. Canvas tidak boleh diubah lagi oleh caller."""
+        future = self.executor.submit(self._run, canvas)
+        self.pending.append((time.perf_counter(), future))
+
+    def busy(self):
+        return len(self.pending) > 0
+
+    def poll(self):
+        """Ambil hasil yang sudah selesai (non-blocking). Return list of (emoji, position, latency)"""
+        results = []
+        while self.pending and self.pending[0][1].done():
+            submitted_at, future = self.pending.popleft()
+            latency = time.perf_counter() - submitted_at
+            try:
+                emoji, position, compute_time = future.result()
+            except Exception as e:
+                print(f"[X] Error in recognition worker: {e}")
+                continue
+            self.latency.add(latency)
+            self.compute.add(compute_time)
+            results.append((emoji, position, latency))
+        return results
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def report(self):
+        self.latency.report()
+        self.compute.report()
+
 def main():
     print("\n" + "=" * 70)
     print("[*] EMOJI DRAWER - Starting Application (1920x1080)")
@@ -497,7 +712,9 @@ def main():
     
     # Test camera access
     print("[*] Testing camera access...")
-    cap = cv2.VideoCapture(0)
+    # --replay memutar rekaman landmark, tanpa kamera dan tanpa MediaPipe
+    args = parse_replay_args()
+    cap = HandReplay(args.replay) if args.replay else cv2.VideoCapture(0)
     
     if not cap.isOpened():
         print("[X] ERROR: Cannot access camera!")
@@ -536,23 +753,32 @@ def main():
     
     print("[OK] Emoji drawer initialized!")
     
-    # Create window with specific size (windowed fullscreen)
-    window_name = "Emoji Drawer - 1920x1080"
-    cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-    cv2.resizeWindow(window_name, 1920, 1080)
+    # Shape recognition berjalan di background thread
+    recognizer = RecognitionWorker(drawer)
+    frame_timer = FrameTimer()
+    
+    # Create window with specific size (windowed fullscreen), dibuat sekali oleh Display
+    display = Display("Emoji Drawer - 1920x1080", 1920, 1080)
     
     print("\n[*] Starting main loop...")
     print("[*] Pinch fingers to draw, open hand to detect!")
     print("=" * 70 + "\n")
     
+    recorder = HandRecorder(args.record, save_frames=args.record_frames) if args.record else None
+    
     try:
-        with mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        ) as hands:
+        if args.replay:
+            tracker = cap  # HandReplay juga berperan sebagai hand tracker
+        else:
+            tracker = HandTracker(
+                max_num_hands=1,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.7
+            )
+        
+        with tracker:
             
-            while cap.isOpened():
+            while cap.isOpened() and not display.closed:
                 ret, frame = cap.read()
                 if not ret:
                     print("[!] Failed to read frame")
@@ -566,91 +792,15 @@ def main():
                     drawer.canvas = np.zeros_like(frame)
                 
                 # Process hand
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = hands.process(rgb_frame)
+                hands = tracker.process(frame)
+                if recorder:
+                    recorder.write(hands, frame)
                 
-                current_point = None
-                
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
-                    
-                    # Draw hand skeleton
-                    mp_draw.draw_landmarks(
-                        frame, 
-                        hand_landmarks, 
-                        mp_hands.HAND_CONNECTIONS,
-                        mp_draw.DrawingSpec(color=(0, 255, 100), thickness=3, circle_radius=3),
-                        mp_draw.DrawingSpec(color=(0, 180, 255), thickness=2)
-                    )
-                    
-                    # Get finger tips
-                    index_tip = hand_landmarks.landmark[8]
-                    thumb_tip = hand_landmarks.landmark[4]
-                    
-                    index_x = int(index_tip.x * w)
-                    index_y = int(index_tip.y * h)
-                    thumb_x = int(thumb_tip.x * w)
-                    thumb_y = int(thumb_tip.y * h)
-                    
-                    # Distance between thumb and index
-                    distance = math.sqrt((index_x - thumb_x)**2 + (index_y - thumb_y)**2)
-                    
-                    # Drawing mode (pinch)
-                    if distance < 50:
-                        drawer.drawing = True
-                        
-                        # Apply smoothing
-                        raw_point = (index_x, index_y)
-                        current_point = drawer.smooth_point(raw_point)
-                        
-                        if drawer.prev_point is not None:
-                            smooth_points = drawer.smooth_line(drawer.prev_point, current_point)
-                            for pt in smooth_points:
-                                drawer.points.append(pt)
-                                cv2.circle(drawer.canvas, pt, drawer.brush_size, 
-                                         drawer.color, -1, lineType=cv2.LINE_AA)
-                                cv2.circle(frame, pt, drawer.brush_size, 
-                                         drawer.color, -1, lineType=cv2.LINE_AA)
-                        
-                        drawer.prev_point = current_point
-                        
-                        # Visual feedback
-                        cv2.circle(frame, current_point, 20, (0, 255, 255), 3, cv2.LINE_AA)
-                        cv2.circle(frame, current_point, 6, (0, 255, 255), -1, cv2.LINE_AA)
-                    
-                    else:
-                        # Selesai drawing
-                        if drawer.drawing and len(drawer.points) > 20:
-                            print("\n[*] Analyzing drawing...")
-                            emoji, position = drawer.detect_emoji_from_drawing(drawer.canvas)
-                            if emoji:
-                                drawer.detected_emoji = emoji
-                                drawer.emoji_position = position
-                                drawer.show_emoji_frames = 90
-                                drawer.emoji_alpha = 1.0
-                                print(f"[SUCCESS] Detected: {EMOJI_PATTERNS[emoji]['name']}")
-                                
-                                # CLEAR CANVAS IMMEDIATELY
-                                drawer.canvas = np.zeros_like(frame)
-                                drawer.points.clear()
-                                print("[*] Canvas cleared!\n")
-                            else:
-                                print(f"[!] No emoji detected. Try drawing larger and clearer!\n")
-                                # Auto clear
-                                drawer.canvas = np.zeros_like(frame)
-                                drawer.points.clear()
-                        
-                        drawer.drawing = False
-                        drawer.prev_point = None
-                        drawer.smoothed_points.clear()
-                        
-                        cv2.circle(frame, (index_x, index_y), 10, (255, 100, 100), 3, cv2.LINE_AA)
-                        cv2.circle(frame, (index_x, index_y), 4, (255, 100, 100), -1, cv2.LINE_AA)
+                drawer.handle_hand(frame, hands[0] if hands else None, recognizer)
                 
-                else:
-                    drawer.drawing = False
-                    drawer.prev_point = None
-                    drawer.smoothed_points.clear()
+                # Ambil hasil recognition yang sudah selesai (non-blocking)
+                drawer.apply_recognition_results(recognizer)
+                drawer.update_word_mode()
                 
                 # Merge canvas dengan frame
                 frame = cv2.addWeighted(frame, 1, drawer.canvas, 0.7, 0)
@@ -678,12 +828,11 @@ def main():
                 
                 # Draw UI
                 drawer.draw_ui(frame)
+                TEXT_CACHE.end_frame()
                 
-                # Show frame
-                cv2.imshow(window_name, frame)
-                
-                # Keyboard input
-                key = cv2.waitKey(1) & 0xFF
+                # Show frame + keyboard input
+                key = display.show(frame) & 0xFF
+                frame_timer.tick()
                 if key == ord('q'):
                     print("\n[*] Goodbye!\n")
                     break
@@ -693,6 +842,13 @@ def main():
                     drawer.canvas = np.zeros_like(frame)
                     drawer.points.clear()
                     print("\n[*] Canvas cleared!\n")
+                elif key == ord('w'):
+                    drawer.toggle_word_mode()
+                elif key == 8 and drawer.mode == "word":  # Backspace
+                    drawer.writer.undo()
+                    drawer.canvas[:] = 0
+                elif key == 13 and drawer.mode == "word":  # Enter
+                    drawer.update_word_mode(finish_word=True)
     
     except KeyboardInterrupt:
         print("\n[*] Interrupted by user")
@@ -702,6 +858,17 @@ def main():
         traceback.print_exc()
     finally:
         print("[*] Cleaning up...")
+        if recorder:
+            recorder.close()
+        recognizer.shutdown()
+        frame_timer.report()
+        drawer.ui_layer.report()
+        TEXT_CACHE.report(frame_timer)
+        display.report()
+        display.close()
+        recognizer.report()
+        if drawer.writer:
+            drawer.writer.recognizer.stats.report()
         cap.release()
         cv2.destroyAllWindows()
         print("[*] Application closed")
@@ -1,10 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from PIL import Image, ImageTk
-import json
-import shutil
+import threading
 from pathlib import Path
 import sys
+import time
+
+from asset_pipeline import import_image, run_pool, make_question, answer_from_filename, report_import
+from asset_store import disk_usage
+from question_bank import QuestionBank
+from thumbnails import ThumbnailCache, bank_images
 
 class GuessEditor:
     def __init__(self, root):
@@ -13,17 +18,21 @@ class GuessEditor:
         self.root.geometry("1000x750")
         self.root.resizable(True, True)
         
-        # Data
-        self.data = []
-        self.current_index = -1
+        # Data (bank soal SQLite, listbox hanya memegang id baris)
+        self.bank = None
+        self.row_ids = []
+        self.current_id = None
         
         # Image preview
         self.blurred_preview = None
         self.original_preview = None
         
+        # Derivative (blur levels, display-size) dari asset pipeline untuk soal yang sedang diedit
+        self.current_assets = None
+        self.bulk_progress = None
+        
         # Paths
         self.base_path = Path(__file__).parent
-        self.json_path = self.base_path / "guess_data.json"
         self.assets_path = self.base_path / "assets" / "guess_game"
         
         # Create assets folders if not exist
@@ -33,6 +42,11 @@ class GuessEditor:
         # Load data
         self.load_data()
         
+        # Thumbnail preview (on-disk, dibuat di background untuk semua gambar di bank)
+        self.thumbnails = ThumbnailCache()
+        if self.bank is not None:
+            self.thumbnails.prefetch(bank_images(self.bank, self.assets_path))
+        
         # Build UI
         self.build_ui()
         
@@ -49,31 +63,25 @@ class GuessEditor:
         style.map('TButton', background=[('active', '#8E44AD')])
         
     def load_data(self):
-        """Load game data"""
+        """Buka bank soal (migrasi sekali dari JSON jika questions.db belum ada)"""
         try:
-            if self.json_path.exists():
-                with open(self.json_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
-                print(f"[OK] Loaded {len(self.data)} questions from {self.json_path}")
-            else:
-                self.data = []
-                self.save_data()
-                print(f"[OK] Created new data file: {self.json_path}")
+            self.bank = QuestionBank()
+            print(f"[OK] Loaded {self.bank.count_guess()} questions from {self.bank.path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {e}")
-            self.data = []
     
-    def save_data(self):
-        """Save game data"""
+    def commit_edit(self, edit, *args):
+        """Jalankan satu edit (satu transaksi di bank). Return hasilnya, atau None jika gagal"""
         try:
-            with open(self.json_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            start = time.perf_counter()
+            result = edit(*args)
+            save_ms = (time.perf_counter() - start) * 1000
             messagebox.showinfo("Success", "✅ Data saved successfully!")
-            print(f"[OK] Data saved to {self.json_path}")
-            return True
+            print(f"[OK] Data saved to {self.bank.path} ({save_ms:.1f} ms)")
+            return True if result is None else result
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {e}")
-            return False
+            return None
     
     def build_ui(self):
         """Build user interface"""
@@ -137,6 +145,10 @@ class GuessEditor:
         tk.Button(btn_frame, text="🔄 Refresh List", command=self.load_questions_list,
                  bg="#95A5A6", fg="white", font=("Arial", 10, "bold"),
                  relief=tk.FLAT, cursor="hand2").pack(fill=tk.X, pady=2)
+        self.bulk_button = tk.Button(btn_frame, text="📥 Bulk Import Images", command=self.bulk_import,
+                 bg="#2980B9", fg="white", font=("Arial", 10, "bold"),
+                 relief=tk.FLAT, cursor="hand2")
+        self.bulk_button.pack(fill=tk.X, pady=2)
         
         # Right panel - Editor
         right_panel = tk.Frame(main_container, bg="white")
@@ -191,9 +203,8 @@ class GuessEditor:
                                       relief=tk.SOLID, bd=1, state="readonly")
         self.blurred_entry.pack(pady=5, ipady=3)
         
-        tk.Button(blurred_col, text="📁 Browse Blurred Image", 
-                 command=self.browse_blurred, bg="#E67E22", fg="white",
-                 font=("Arial", 9, "bold"), relief=tk.FLAT, cursor="hand2").pack(pady=5)
+        tk.Label(blurred_col, text="Generated automatically from the original", 
+                bg="#F8F9F9", fg="gray", font=("Arial", 9, "italic")).pack(pady=5)
         
         # Original Image column
         original_col = tk.Frame(images_frame, bg="#F8F9F9")
@@ -271,12 +282,15 @@ class GuessEditor:
         """Load questions list"""
         self.questions_listbox.delete(0, tk.END)
         
-        for i, q in enumerate(self.data):
-            correct = q.get("correct_answer", "Unknown")
+        # Hanya id + jawaban, isi lengkap soal dibaca saat dipilih
+        rows = self.bank.list_guess()
+        self.row_ids = [question_id for question_id, _ in rows]
+        
+        for i, (_, correct) in enumerate(rows):
             self.questions_listbox.insert(tk.END, f"{i+1}. {correct}")
         
         # Update count
-        self.count_label.config(text=f"Total: {len(self.data)} questions")
+        self.count_label.config(text=f"Total: {len(rows)} questions")
     
     def on_question_select(self, event):
         """Handle question selection"""
@@ -284,8 +298,12 @@ class GuessEditor:
         if not selection:
             return
         
-        self.current_index = selection[0]
-        question = self.data[self.current_index]
+        self.current_id = self.row_ids[selection[0]]
+        question = self.bank.get_guess(self.current_id)
+        if question is None:
+            self.load_questions_list()
+            return
+        self.current_assets = question.get("assets")
         
         # Fill form
         self.blurred_entry.config(state="normal")
@@ -319,9 +337,9 @@ class GuessEditor:
         try:
             img_path = self.assets_path / img_type / filename
             if img_path.exists():
-                img = Image.open(img_path)
-                img.thumbnail((200, 150))
-                photo = ImageTk.PhotoImage(img)
+                # Thumbnail dari cache (JPEG kecil), bukan decode gambar full-size
+                with Image.open(self.thumbnails.get(img_path)) as img:
+                    photo = ImageTk.PhotoImage(img)
                 
                 if img_type == "blurred":
                     self.blurred_preview = photo
@@ -334,7 +352,8 @@ class GuessEditor:
     
     def new_question(self):
         """Create new question"""
-        self.current_index = -1
+        self.current_id = None
+        self.current_assets = None
         
         self.blurred_entry.config(state="normal")
         self.blurred_entry.delete(0, tk.END)
@@ -374,94 +393,138 @@ class GuessEditor:
             "options": options,
             "correct_answer": correct
         }
+        if self.current_assets:
+            question_data["assets"] = self.current_assets
         
-        if self.current_index >= 0:
-            # Update
-            self.data[self.current_index] = question_data
+        if self.current_id is not None:
+            # Update (satu baris)
+            saved = self.commit_edit(self.bank.update_guess, self.current_id, question_data)
             action = "updated"
         else:
             # Add new
-            self.data.append(question_data)
+            saved = self.commit_edit(self.bank.add_guess, question_data)
             action = "added"
         
-        if self.save_data():
+        if saved:
             self.load_questions_list()
             self.new_question()
             print(f"[OK] Question {action} successfully")
     
     def delete_question(self):
         """Delete question"""
-        if self.current_index < 0:
+        if self.current_id is None:
             messagebox.showwarning("Warning", "⚠️ Please select a question to delete!")
             return
         
         if messagebox.askyesno("Confirm", "🗑️ Are you sure you want to delete this question?"):
-            del self.data[self.current_index]
-            
-            if self.save_data():
+            if self.commit_edit(self.bank.delete_guess, self.current_id):
                 self.load_questions_list()
                 self.new_question()
                 print("[OK] Question deleted")
     
-    def browse_blurred(self):
-        """Browse and copy blurred image"""
+    def preview_when_ready(self, previews):
+        """Preview gambar yang baru di-import: thumbnail dibuat oleh prefetch (bukan di
+        thread Tk), lalu ditampilkan jika gambar itu masih dipilih. previews: [(filename, img_type)]"""
+        entries = {"original": self.original_entry, "blurred": self.blurred_entry}
+
+        def show():
+            for filename, img_type in previews:
+                if entries[img_type].get() == filename:
+                    self.load_image_preview(filename, img_type)
+
+        self.thumbnails.prefetch([self.assets_path / img_type / filename for filename, img_type in previews],
+                                 done=lambda: self.root.after(0, show))
+    
+    def browse_original(self):
+        """Browse original image, copy ke assets dan buat blur levels + derivative display-size"""
         filename = filedialog.askopenfilename(
-            title="Select Blurred Image",
+            title="Select Original Image",
             filetypes=[("Image files", "*.png *.jpg *.jpeg *.bmp"), ("All files", "*.*")]
         )
         
         if filename:
-            src = Path(filename)
-            # Create unique filename
-            import time
-            timestamp = int(time.time())
-            dst_name = f"blurred_{timestamp}_{src.name}"
-            dst = self.assets_path / "blurred" / dst_name
-            
             try:
-                shutil.copy(src, dst)
-                self.blurred_entry.config(state="normal")
-                self.blurred_entry.delete(0, tk.END)
-                self.blurred_entry.insert(0, dst_name)
-                self.blurred_entry.config(state="readonly")
-                
-                # Load preview
-                self.load_image_preview(dst_name, "blurred")
-                
-                messagebox.showinfo("Success", f"✅ Image copied to:\n{dst}")
-                print(f"[OK] Blurred image copied: {dst_name}")
+                imported = import_image(filename, self.assets_path)
             except Exception as e:
-                messagebox.showerror("Error", f"❌ Failed to copy image: {e}")
+                messagebox.showerror("Error", f"❌ Failed to import image: {e}")
+                return
+            
+            self.current_assets = imported["assets"]
+            for entry, value in ((self.original_entry, imported["original_image"]),
+                                 (self.blurred_entry, imported["blurred_image"])):
+                entry.config(state="normal")
+                entry.delete(0, tk.END)
+                entry.insert(0, value)
+                entry.config(state="readonly")
+            
+            # Preview muncul setelah thumbnail-nya dibuat di background
+            self.preview_when_ready([(imported["original_image"], "original"),
+                                     (imported["blurred_image"], "blurred")])
+            
+            stored = "already in store" if imported["reused"] else \
+                f"{len(imported['assets']['blur_levels'])} blur levels"
+            print(f"[OK] Original image imported: {imported['original_image']} "
+                  f"({stored}, {imported['seconds'] * 1000:.0f} ms)")
     
-    def browse_original(self):
-        """Browse and copy original image"""
-        filename = filedialog.askopenfilename(
-            title="Select Original Image",
+    def bulk_import(self):
+        """Import banyak gambar sekaligus (process pool), satu soal baru per gambar"""
+        filenames = filedialog.askopenfilenames(
+            title="Select Original Images",
             filetypes=[("Image files", "*.png *.jpg *.jpeg *.bmp"), ("All files", "*.*")]
         )
+        if not filenames or self.bulk_progress is not None:
+            return
         
-        if filename:
-            src = Path(filename)
-            # Create unique filename
-            import time
-            timestamp = int(time.time())
-            dst_name = f"original_{timestamp}_{src.name}"
-            dst = self.assets_path / "original" / dst_name
-            
-            try:
-                shutil.copy(src, dst)
-                self.original_entry.config(state="normal")
-                self.original_entry.delete(0, tk.END)
-                self.original_entry.insert(0, dst_name)
-                self.original_entry.config(state="readonly")
-                
-                # Load preview
-                self.load_image_preview(dst_name, "original")
-                
-                messagebox.showinfo("Success", f"✅ Image copied to:\n{dst}")
-                print(f"[OK] Original image copied: {dst_name}")
-            except Exception as e:
-                messagebox.showerror("Error", f"❌ Failed to copy image: {e}")
+        self.bulk_progress = (0, len(filenames))
+        self.bulk_button.config(state="disabled")
+        usage_before = disk_usage(self.assets_path)
+        start = time.perf_counter()
+        
+        def progress(done, total):
+            self.bulk_progress = (done, total)
+        
+        def worker():
+            # Pool dijalankan dari thread terpisah supaya window Tk tetap responsif
+            results = run_pool(import_image, list(filenames), progress=progress)
+            seconds = time.perf_counter() - start
+            self.root.after(0, lambda: self.finish_bulk_import(filenames, results, seconds, usage_before))
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.poll_bulk_import()
+    
+    def poll_bulk_import(self):
+        if self.bulk_progress is None:
+            return
+        done, total = self.bulk_progress
+        self.bulk_button.config(text=f"⏳ Importing {done}/{total}...")
+        self.root.after(100, self.poll_bulk_import)
+    
+    def finish_bulk_import(self, filenames, results, seconds, usage_before):
+        self.bulk_progress = None
+        self.bulk_button.config(state="normal", text="📥 Bulk Import Images")
+        report_import(results, seconds, usage_before, self.assets_path)
+        
+        pool = self.bank.guess_answers() + [answer_from_filename(f) for f in filenames]
+        failed = []
+        questions = []
+        for filename, result in zip(filenames, results):
+            if isinstance(result, Exception):
+                failed.append(f"{Path(filename).name}: {result}")
+                continue
+            questions.append(make_question(result, answer_from_filename(filename), pool))
+        
+        # Thumbnail soal baru dibuat di background, siap saat soal dipilih
+        self.thumbnails.prefetch([self.assets_path / img_type / q[f"{img_type}_image"]
+                                  for q in questions for img_type in ("blurred", "original")])
+        
+        imported = len(questions)
+        print(f"[OK] Bulk import: {imported}/{len(filenames)} images")
+        if imported:
+            # Semua soal baru dalam satu transaksi
+            self.commit_edit(self.bank.add_guesses, questions)
+            self.load_questions_list()
+        if failed:
+            messagebox.showwarning("Warning", "⚠️ Some images failed:\n" + "\n".join(failed[:10]))
 
 def main():
     print(f"\n{'='*60}")
@@ -473,11 +536,17 @@ def main():
     
     print("[OK] Editor window opened")
     print("[*] Edit your questions and click Save")
-    print("[*] Remember to reload the game after editing (press 'r')")
+    print("[*] Running games pick up saved edits automatically")
     print(f"{'='*60}\n")
     
     root.mainloop()
     
+    if app.bank is not None:
+        # Isi WAL (save selama sesi) dipindah ke questions.db saat editor ditutup
+        app.bank.checkpoint()
+        app.bank.close()
+    app.thumbnails.report()
+    app.thumbnails.close()
     print("\n[*] Editor closed")
 
 if __name__ == "__main__":
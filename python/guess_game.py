@@ -1,120 +1,200 @@
 import cv2
-import mediapipe as mp
 import numpy as np
-import math
-import json
 import random
+from collections import deque
 from pathlib import Path
 import sys
 
+from engine import Game, Widget, parse_game_args, run_game
+from engine.image_cache import LOADING, READY, ImageCache
+from engine.ui_layer import UILayer
+from engine.layout import LAYOUT, REF_WIDTH, REF_HEIGHT
+from engine.data_watcher import DataWatcher
+from asset_pipeline import ASSET_DIR, QUIZ_IMAGE_BOX, RESULT_IMAGE_BOX
+from question_bank import DB_PATH, QuestionBank
+from question_sampler import SAMPLER_PATH, QuestionSampler
+
+PREFETCH_AHEAD = 3
+
+# Progressive reveal: gambar makin jelas tiap REVEAL_STEP_SECONDS atau setelah tebakan salah.
+# Poin untuk jawaban benar di level blur ke-i (semakin awal semakin besar)
+REVEAL_STEP_SECONDS = 5.0
+REVEAL_POINTS = [4, 3, 2, 1]
+
+
+def reveal_images(question):
+    """Path blur levels dari asset pipeline (paling blur dulu), atau None untuk soal lama"""
+    assets = question.get("assets")
+    if assets and assets.get("blur_levels"):
+        return [ASSET_DIR / name for name in assets["blur_levels"]]
+    return None
+
+
+def blur_chain(img, levels):
+    """Blur levels dari gambar tajam lewat rantai pyrDown -> pyrUp (untuk soal tanpa pyramid)"""
+    h, w = img.shape[:2]
+    chain = []
+    for depth in range(levels + 1, 1, -1):
+        small = img
+        for _ in range(depth):
+            small = cv2.pyrDown(small)
+        chain.append(cv2.resize(small, (w, h), interpolation=cv2.INTER_LINEAR))
+    return chain
+
+
+def question_image(question, kind):
+    """Path gambar soal: derivative dari asset pipeline jika ada, kalau tidak file lama"""
+    assets = question.get("assets")
+    if kind == "quiz":
+        if assets and assets.get("blur_levels"):
+            return ASSET_DIR / assets["blur_levels"][0]
+        return ASSET_DIR / "blurred" / question["blurred_image"]
+    if assets and assets.get("result"):
+        return ASSET_DIR / assets["result"]
+    return ASSET_DIR / "original" / question["original_image"]
+
 camera_index = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 0
 print(f"[INFO] Kamera index: {camera_index}")
 
-# Initialize MediaPipe
-mp_hands = mp.solutions.hands
-mp_draw = mp.solutions.drawing_utils
-
-class Button:
+class Button(Widget):
     """Class untuk button yang bisa diklik"""
-    def __init__(self, x, y, width, height, text, id=None):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.text = text
-        self.id = id
-        self.hovered = False
-        
-    def contains_point(self, x, y):
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
-    
     def draw(self, frame, color=None):
         if color is None:
             color = (120, 180, 255) if self.hovered else (60, 60, 60)
         
         # Background with gradient effect
         overlay = frame.copy()
-        cv2.rectangle(overlay, (self.x, self.y), 
+        LAYOUT.rectangle(overlay, (self.x, self.y), 
                      (self.x + self.width, self.y + self.height), 
                      color, -1)
         cv2.addWeighted(overlay, 0.9, frame, 0.1, 0, frame)
         
         # Outer glow when hovered
         if self.hovered:
-            cv2.rectangle(frame, (self.x-2, self.y-2), 
+            LAYOUT.rectangle(frame, (self.x-2, self.y-2), 
                          (self.x + self.width+2, self.y + self.height+2), 
                          (150, 200, 255), 3, cv2.LINE_AA)
         
         # Border
         border_color = (200, 220, 255) if self.hovered else (100, 100, 100)
-        cv2.rectangle(frame, (self.x, self.y), 
+        LAYOUT.rectangle(frame, (self.x, self.y), 
                      (self.x + self.width, self.y + self.height), 
                      border_color, 2, cv2.LINE_AA)
         
-        # Text centered dengan font yang lebih baik
-        font = cv2.FONT_HERSHEY_DUPLEX
-        font_scale = 0.85
-        thickness = 2
-        text_size = cv2.getTextSize(self.text, font, font_scale, thickness)[0]
-        text_x = self.x + (self.width - text_size[0]) // 2
-        text_y = self.y + (self.height + text_size[1]) // 2
-        
-        # Shadow
-        cv2.putText(frame, self.text, (text_x + 2, text_y + 2), 
-                   font, font_scale, (0, 0, 0), thickness, cv2.LINE_AA)
-        # Main text
+        # Text centered dengan font yang lebih baik (text + shadow, sprite di-cache)
         text_color = (255, 255, 255) if self.hovered else (220, 220, 220)
-        cv2.putText(frame, self.text, (text_x, text_y), 
-                   font, font_scale, text_color, thickness, cv2.LINE_AA)
+        self.draw_label(frame, cv2.FONT_HERSHEY_DUPLEX, 0.85, text_color, 2)
 
-class GuessGame:
-    def __init__(self):
-        self.state = "MENU"  # MENU, QUIZ, RESULT
-        self.game_data = []
+class GuessGame(Game):
+    # Draw hand landmarks with subtle style
+    hand_style = dict(point_color=(100, 255, 200), line_color=(100, 200, 255), thickness=2, radius=2)
+    
+    def __init__(self, sampler_path=SAMPLER_PATH, bank_path=DB_PATH):
+        # State: MENU, QUIZ, RESULT - hanya berubah lewat event (lihat engine/state_machine.py)
+        super().__init__()
+        self.bank_path = bank_path  # bank soal lain mis. untuk replay regression test
+        self.bank = None
+        self.question_ids = []
+        # Soal tidak diulang sampai semua soal sudah keluar
+        self.sampler = QuestionSampler(sampler_path)
         self.current_question = None
         self.selected_answer = None
-        self.buttons = []
         self.score = 0
         self.total_questions = 0
         
         # Shuffled options for current question
         self.shuffled_options = []
         
-        # Hand tracking
-        self.finger_pos = None
-        self.is_pinching = False
-        self.last_pinch = False
-        self.pinch_cooldown = 0
+        # Gambar di-decode + resize sekali, soal berikutnya di-prefetch di background
+        self.images = ImageCache(capacity=48)
+        self.upcoming = deque()
+        
+        # Elemen statis menu dirender sekali ke retained UI layer
+        self.menu_layer = UILayer("guess menu")
+        
+        # Progressive reveal mode
+        self.reveal_mode = False
+        self.reveal_level = 0
+        self.reveal_started = 0.0
+        self.reveal_frames = []  # gambar per level (sudah display-size), dipilih per frame
+        self.reveal_ready = False  # semua level sudah ada di memori (lihat load_reveal_frames)
+        self.reveal_chains = {}  # cache blur chain untuk soal tanpa pyramid
+        self.wrong_options = set()
+        self.last_points = 0
+        self.reveal_remaining = 0.0
+        self.result = None  # dihitung sekali saat masuk RESULT
         
         # Load game data
         self.load_game_data()
+        self.fsm.transition("MENU")
         
     def load_game_data(self):
-        """Load game data from JSON"""
+        """Buka bank soal SQLite: hanya daftar id yang dimuat, isi soal dibaca per baris"""
         try:
-            json_path = Path(__file__).parent / "guess_data.json"
-            
-            if not json_path.exists():
-                print("[!] guess_data.json not found!")
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=2, ensure_ascii=False)
-                print("[OK] Created empty guess_data.json")
-                self.game_data = []
-                return
+            self.bank = QuestionBank(self.bank_path)
+            self.question_ids = self.bank.guess_ids()
             
-            with open(json_path, 'r', encoding='utf-8') as f:
-                self.game_data = json.load(f)
+            print(f"[OK] Loaded {len(self.question_ids)} questions")
+            self.fill_upcoming()
             
-            print(f"[OK] Loaded {len(self.game_data)} questions")
+            # Save dari editor dideteksi dan di-parse di background (hot reload)
+            self.watcher = DataWatcher(self.bank.files(), self.load_question_ids, "guess data")
             
         except Exception as e:
             print(f"[X] Error loading game data: {e}")
-            self.game_data = []
+            self.question_ids = []
+    
+    def load_question_ids(self):
+        """Dipanggil di thread watcher, dengan koneksi SQLite sendiri"""
+        bank = QuestionBank(self.bank.path)
+        try:
+            return bank.guess_ids()
+        finally:
+            bank.close()
+    
+    def apply_data(self, question_ids):
+        """Tukar daftar id sekaligus; soal yang sedang dimainkan tidak terganggu"""
+        self.question_ids = question_ids
+        print(f"[OK] Guess data reloaded: {len(question_ids)} questions")
+        # Soal antrian bisa sudah diedit: baca ulang (belum keluar dari deck), cache file dicek ulang
+        self.upcoming.clear()
+        self.images.invalidate()
+        self.fill_upcoming()
+    
+    def fill_upcoming(self):
+        """Lihat beberapa soal berikutnya di deck (peek: belum dihitung keluar) dan
+        prefetch gambarnya. Soal baru diambil dari deck di enter_quiz"""
+        known = {question["id"]: question for question in self.upcoming}
+        upcoming = deque()
+        new = []
+        for question_id in self.sampler.peek("guess", self.question_ids, PREFETCH_AHEAD):
+            question = known.get(question_id)
+            if question is None:
+                question = self.bank.get_guess(question_id)
+                if question is None:
+                    # Soal dihapus editor sebelum watcher sempat reload: daftar id baru
+                    # dibaca di thread watcher (apply_data mengisi antrian lagi)
+                    self.reload()
+                    break
+                new.append(question)
+            upcoming.append(question)
+        self.upcoming = upcoming
+        self.images.prefetch(
+            [(question_image(q, "quiz"), LAYOUT.box(QUIZ_IMAGE_BOX)) for q in new] +
+            [(question_image(q, "result"), LAYOUT.box(RESULT_IMAGE_BOX)) for q in new] +
+            [(path, LAYOUT.box(QUIZ_IMAGE_BOX)) for q in new for path in (reveal_images(q) or [])[1:]]
+        )
     
     def setup_menu(self):
+        """Kembali ke main menu"""
+        self.fsm.transition("MENU")
+    
+    def start_game(self):
+        """Mulai soal berikutnya"""
+        self.fsm.transition("QUIZ")
+    
+    def enter_menu(self):
         """Setup main menu"""
-        self.state = "MENU"
         self.buttons = []
         
         # Reset score when going back to menu
@@ -124,19 +204,33 @@ class GuessGame:
         # Start button (centered, larger)
         self.buttons.append(Button(710, 450, 500, 100, "START GAME", "start"))
         
+        # Progressive reveal mode (gambar makin jelas, jawab cepat = poin lebih banyak)
+        self.buttons.append(Button(710, 580, 500, 100, "REVEAL MODE", "reveal"))
+        
         # Edit button (centered, below start)
-        self.buttons.append(Button(710, 580, 500, 100, "EDIT QUESTIONS", "edit"))
+        self.buttons.append(Button(710, 710, 500, 100, "EDIT QUESTIONS", "edit"))
     
-    def start_game(self):
+    def enter_quiz(self):
         """Start the game"""
-        if not self.game_data:
+        if not self.question_ids:
             print("[!] No questions available!")
-            return
+            return "MENU"
+        
+        self.fill_upcoming()
+        if not self.upcoming:
+            print("[!] Questions changed, waiting for reload")
+            return "MENU"
         
-        self.state = "QUIZ"
         self.total_questions += 1
-        self.current_question = random.choice(self.game_data)
+        # Baru sekarang soal dihitung keluar dari deck (sama dengan hasil peek pertama)
+        self.sampler.draw("guess", self.question_ids)
+        self.current_question = self.upcoming.popleft()
+        self.fill_upcoming()
         self.selected_answer = None
+        self.wrong_options = set()
+        self.last_points = 0
+        if self.reveal_mode:
+            self.prepare_reveal()
         self.buttons = []
         
         # SHUFFLE OPTIONS
@@ -154,7 +248,7 @@ class GuessGame:
         # Calculate center position
         grid_width = button_width * 2 + spacing
         grid_height = button_height * 2 + spacing
-        start_x = (1920 - grid_width) // 2
+        start_x = (REF_WIDTH - grid_width) // 2
         start_y = 720
         
         for i, option in enumerate(self.shuffled_options):
@@ -165,136 +259,221 @@ class GuessGame:
             
             btn = Button(x, y, button_width, button_height, option, f"option_{i}")
             self.buttons.append(btn)
+        
+        # Submit button (aktif jika ada jawaban terpilih)
+        self.submit_btn = Button(710, 960, 500, 80, "SUBMIT ANSWER", "submit")
+    
+    def clickable_buttons(self):
+        """Semua button yang bisa di-hover/klik di state sekarang"""
+        if self.state == "QUIZ" and self.selected_answer:
+            return self.buttons + [self.submit_btn]
+        return self.buttons
+    
+    def prepare_reveal(self):
+        """Siapkan semua level blur soal ini sekali, ganti level = pilih gambar lain (blit saja)"""
+        self.reveal_level = 0
+        self.reveal_started = self.fsm.entered_at
+        self.reveal_frames = []
+        self.reveal_ready = False
+        self.load_reveal_frames()
+    
+    def load_reveal_frames(self):
+        """Ambil semua level dari image cache. Selama ada level yang masih dimuat worker
+        prefetch (soal pertama, atau prefetch belum selesai), dicoba lagi di tick berikutnya;
+        hanya file yang memang tidak ada yang dilewati"""
+        box = LAYOUT.box(QUIZ_IMAGE_BOX)
+        paths = reveal_images(self.current_question)
+        if paths:
+            frames = [self.images.lookup(path, box) for path in paths]
+            if any(state == LOADING for _, state in frames):
+                return
+            self.reveal_frames = [frame for frame, state in frames if state == READY]
+            self.reveal_ready = True
+            return
+        
+        # Soal lama tanpa pyramid: buat chain dari original, simpan di cache
+        key = (self.current_question["original_image"], box)
+        if key not in self.reveal_chains:
+            sharp, state = self.images.lookup(question_image(self.current_question, "result"), box)
+            if state == LOADING:
+                return
+            if len(self.reveal_chains) >= 16:
+                self.reveal_chains.pop(next(iter(self.reveal_chains)))
+            self.reveal_chains[key] = blur_chain(sharp, len(REVEAL_POINTS)) if state == READY else []
+        self.reveal_frames = self.reveal_chains[key]
+        self.reveal_ready = True
+    
+    def update_reveal(self, now):
+        """Naikkan level reveal sesuai waktu"""
+        if not self.reveal_ready:
+            self.load_reveal_frames()
+        if not self.reveal_frames:
+            return
+        by_time = int((now - self.reveal_started) / REVEAL_STEP_SECONDS)
+        level = min(max(self.reveal_level, by_time), len(self.reveal_frames) - 1)
+        if level != self.reveal_level:
+            self.reveal_level = level
+            print(f"[*] Reveal level {level + 1}/{len(self.reveal_frames)}")
+        self.reveal_remaining = max(0.0, (self.reveal_level + 1) * REVEAL_STEP_SECONDS -
+                                    (now - self.reveal_started))
+    
+    def reveal_next(self):
+        """Tebakan salah: tampilkan level berikutnya dan mulai hitung waktu dari level itu"""
+        self.reveal_level = min(self.reveal_level + 1, len(self.reveal_frames) - 1)
+        self.reveal_started = self.clock() - self.reveal_level * REVEAL_STEP_SECONDS
+    
+    def reveal_points(self):
+        return REVEAL_POINTS[min(self.reveal_level, len(REVEAL_POINTS) - 1)]
+    
+    def draw_menu_button(self, frame, btn, hovered):
+        if btn.id == "edit":
+            btn.draw(frame, (180, 120, 255) if hovered else (120, 80, 200))
+        elif btn.id == "reveal":
+            btn.draw(frame, (255, 200, 120) if hovered else (200, 150, 70))
+        else:
+            btn.draw(frame, (100, 220, 150) if hovered else (60, 150, 100))
     
     def draw_menu(self, frame):
-        """Draw main menu"""
-        h, w = frame.shape[:2]
+        """Draw main menu: elemen statis dari UI layer, tombol yang di-hover digambar langsung"""
+        hovered = self.hovered_button()
+        self.menu_layer.draw(frame, hovered.id if hovered else None,
+                             lambda canvas: self.draw_menu_static(canvas, hovered))
+        if hovered:
+            self.draw_menu_button(frame, hovered, True)
+    
+    def draw_menu_static(self, frame, hovered):
+        """Elemen statis main menu"""
+        h, w = REF_HEIGHT, REF_WIDTH
         
         # Modern gradient background (subtle)
         overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (w, 400), (20, 20, 20), -1)
+        LAYOUT.rectangle(overlay, (0, 0), (w, 400), (20, 20, 20), -1)
         cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
         
         # Title with better font
         title_font = cv2.FONT_HERSHEY_TRIPLEX
-        cv2.putText(frame, "GUESS THE PICTURE", (520, 200), 
-                   title_font, 2.5, (100, 255, 200), 5, cv2.LINE_AA)
-        cv2.putText(frame, "GUESS THE PICTURE", (518, 198), 
-                   title_font, 2.5, (50, 200, 150), 4, cv2.LINE_AA)
+        LAYOUT.text(frame, "GUESS THE PICTURE", (518, 198), title_font, 2.5, (50, 200, 150), 4,
+                  shadow_offset=2, shadow_thickness=5, shadow_color=(100, 255, 200))
         
         # Subtitle
         subtitle_font = cv2.FONT_HERSHEY_DUPLEX
-        cv2.putText(frame, "Can you guess what's behind the blur?", (560, 280), 
-                   subtitle_font, 1.1, (200, 220, 240), 2, cv2.LINE_AA)
+        LAYOUT.text(frame, "Can you guess what's behind the blur?", (560, 280), 
+                 subtitle_font, 1.1, (200, 220, 240), 2)
         
-        # Draw buttons
+        # Draw buttons (tombol yang di-hover digambar terpisah)
         for btn in self.buttons:
-            if btn.id == "edit":
-                btn.draw(frame, (180, 120, 255) if btn.hovered else (120, 80, 200))
-            else:
-                btn.draw(frame, (100, 220, 150) if btn.hovered else (60, 150, 100))
+            if btn is not hovered:
+                self.draw_menu_button(frame, btn, False)
         
         # Instructions at bottom
         info_font = cv2.FONT_HERSHEY_DUPLEX
-        cv2.putText(frame, "Point and PINCH to select | Press 'Q' to quit", 
-                   (580, h - 40), info_font, 0.8, (200, 200, 200), 2, cv2.LINE_AA)
+        LAYOUT.text(frame, "Point and PINCH to select | Press 'Q' to quit", 
+                 (580, h - 40), info_font, 0.8, (200, 200, 200), 2)
     
     def draw_quiz(self, frame):
         """Draw quiz interface"""
-        h, w = frame.shape[:2]
+        h, w = REF_HEIGHT, REF_WIDTH
+        LAYOUT.fit(frame)
         
         # Top bar with gradient
         overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (w, 100), (30, 30, 30), -1)
+        LAYOUT.rectangle(overlay, (0, 0), (w, 100), (30, 30, 30), -1)
         cv2.addWeighted(overlay, 0.4, frame, 0.6, 0, frame)
         
         # Load and display blurred image
         try:
-            img_path = Path(__file__).parent / "assets" / "guess_game" / "blurred" / self.current_question["blurred_image"]
-            
-            if img_path.exists():
-                img = cv2.imread(str(img_path))
-                if img is not None:
-                    # Resize to fit (larger for 1920x1080)
-                    img_h, img_w = img.shape[:2]
-                    max_width = 800
-                    max_height = 550
-                    
-                    scale = min(max_width / img_w, max_height / img_h)
-                    new_w = int(img_w * scale)
-                    new_h = int(img_h * scale)
-                    
-                    img_resized = cv2.resize(img, (new_w, new_h))
-                    
-                    # Center position
-                    x_offset = (1920 - new_w) // 2
-                    y_offset = 120
-                    
-                    # Add shadow effect
-                    shadow_offset = 8
-                    cv2.rectangle(frame, 
-                                (x_offset + shadow_offset, y_offset + shadow_offset), 
-                                (x_offset + new_w + shadow_offset, y_offset + new_h + shadow_offset), 
-                                (0, 0, 0), -1)
-                    
-                    # Place image
-                    frame[y_offset:y_offset+new_h, x_offset:x_offset+new_w] = img_resized
-                    
-                    # Modern border
-                    cv2.rectangle(frame, (x_offset-4, y_offset-4), 
-                                (x_offset+new_w+4, y_offset+new_h+4), 
-                                (100, 255, 200), 4, cv2.LINE_AA)
+            if self.reveal_mode and self.reveal_frames:
+                # Semua level sudah ada di memori, ganti level hanya memilih array lain
+                img_resized, state = self.reveal_frames[self.reveal_level], READY
+            else:
+                img_path = question_image(self.current_question, "quiz")
+                
+                # Sudah di-decode dan di-resize (fit 800x550 x scale layout) oleh cache
+                img_resized, state = self.images.lookup(img_path, LAYOUT.box(QUIZ_IMAGE_BOX))
+            if img_resized is not None:
+                new_w, new_h = LAYOUT.design_size(img_resized)
+                
+                # Center position
+                x_offset = (REF_WIDTH - new_w) // 2
+                y_offset = 120
+                
+                # Add shadow effect
+                shadow_offset = 8
+                LAYOUT.rectangle(frame, 
+                            (x_offset + shadow_offset, y_offset + shadow_offset), 
+                            (x_offset + new_w + shadow_offset, y_offset + new_h + shadow_offset), 
+                            (0, 0, 0), -1)
+                
+                # Place image
+                LAYOUT.blit(frame, img_resized, x_offset, y_offset)
+                
+                # Modern border
+                LAYOUT.rectangle(frame, (x_offset-4, y_offset-4), 
+                            (x_offset+new_w+4, y_offset+new_h+4), 
+                            (100, 255, 200), 4, cv2.LINE_AA)
+            elif state == LOADING:
+                # Masih di-decode worker prefetch (render thread tidak menunggu)
+                LAYOUT.text(frame, "LOADING...", (800, 400), 
+                         cv2.FONT_HERSHEY_DUPLEX, 1.5, (200, 200, 200), 3)
             else:
                 # Placeholder if image not found
-                cv2.putText(frame, "IMAGE NOT FOUND", (720, 400), 
-                           cv2.FONT_HERSHEY_DUPLEX, 1.5, (100, 100, 255), 3, cv2.LINE_AA)
+                LAYOUT.text(frame, "IMAGE NOT FOUND", (720, 400), 
+                         cv2.FONT_HERSHEY_DUPLEX, 1.5, (100, 100, 255), 3)
         
         except Exception as e:
             print(f"[X] Error loading image: {e}")
-            cv2.putText(frame, "ERROR LOADING IMAGE", (680, 400), 
-                       cv2.FONT_HERSHEY_DUPLEX, 1.5, (100, 100, 255), 3, cv2.LINE_AA)
+            LAYOUT.text(frame, "ERROR LOADING IMAGE", (680, 400), 
+                     cv2.FONT_HERSHEY_DUPLEX, 1.5, (100, 100, 255), 3)
         
         # Question text
         question_font = cv2.FONT_HERSHEY_TRIPLEX
-        cv2.putText(frame, "What is this?", (800, 60), 
-                   question_font, 1.3, (255, 255, 255), 3, cv2.LINE_AA)
+        LAYOUT.text(frame, "What is this?", (800, 60), 
+                 question_font, 1.3, (255, 255, 255), 3)
         
         # Score display (top left)
         score_font = cv2.FONT_HERSHEY_DUPLEX
-        cv2.putText(frame, f"Score: {self.score}/{self.total_questions}", (40, 60), 
-                   score_font, 1.1, (100, 255, 200), 3, cv2.LINE_AA)
+        if self.reveal_mode:
+            LAYOUT.text(frame, f"Points: {self.score}", (40, 60), 
+                     score_font, 1.1, (100, 255, 200), 3)
+            # Level reveal + poin yang masih bisa didapat
+            if self.reveal_frames:
+                reveal_text = f"Reveal {self.reveal_level + 1}/{len(self.reveal_frames)} - worth {self.reveal_points()} pts"
+                if self.reveal_level < len(self.reveal_frames) - 1:
+                    reveal_text += f" ({self.reveal_remaining:.0f}s)"
+                LAYOUT.text(frame, reveal_text, (1300, 60), 
+                         score_font, 0.9, (255, 220, 150), 2)
+        else:
+            LAYOUT.text(frame, f"Score: {self.score}/{self.total_questions}", (40, 60), 
+                     score_font, 1.1, (100, 255, 200), 3)
         
         # Draw option buttons
         for btn in self.buttons:
+            # Tebakan salah di reveal mode tidak bisa dipilih lagi
+            if btn.id in self.wrong_options:
+                btn.draw(frame, (40, 40, 90))
             # Highlight selected
-            if self.selected_answer == btn.id:
+            elif self.selected_answer == btn.id:
                 btn.draw(frame, (255, 200, 100) if btn.hovered else (220, 160, 60))
             else:
                 btn.draw(frame)
         
         # Submit button (if answer selected)
         if self.selected_answer:
-            submit_btn = Button(710, 960, 500, 80, "SUBMIT ANSWER", "submit")
-            submit_btn.hovered = (self.finger_pos and 
-                                submit_btn.contains_point(self.finger_pos[0], self.finger_pos[1]))
-            submit_btn.draw(frame, (100, 220, 100) if submit_btn.hovered else (60, 170, 60))
-            
-            if submit_btn.hovered and self.is_pinching and not self.last_pinch:
-                self.check_answer()
+            self.submit_btn.draw(frame, (100, 220, 100) if self.submit_btn.hovered else (60, 170, 60))
         
         # Instructions
-        cv2.putText(frame, "Select an answer and SUBMIT", 
-                   (690, h - 30), cv2.FONT_HERSHEY_DUPLEX, 0.8, (200, 200, 200), 2, cv2.LINE_AA)
+        LAYOUT.text(frame, "Select an answer and SUBMIT", 
+                 (690, h - 30), cv2.FONT_HERSHEY_DUPLEX, 0.8, (200, 200, 200), 2)
     
     def draw_result(self, frame):
         """Draw result screen"""
-        h, w = frame.shape[:2]
+        h, w = REF_HEIGHT, REF_WIDTH
+        LAYOUT.fit(frame)
         
-        # Check if answer is correct
-        selected_idx = int(self.selected_answer.split("_")[1])
-        selected_option = self.shuffled_options[selected_idx]
-        correct_answer = self.current_question["correct_answer"]
-        is_correct = selected_option == correct_answer
+        # Hasil sudah dihitung sekali di enter_result
+        selected_option = self.result["selected"]
+        correct_answer = self.result["correct_answer"]
+        is_correct = self.result["correct"]
         
         # Result text with better font
         result_text = "CORRECT!" if is_correct else "WRONG!"
@@ -302,104 +481,110 @@ class GuessGame:
         result_font = cv2.FONT_HERSHEY_TRIPLEX
         
         # Large result text
-        cv2.putText(frame, result_text, (720, 110), 
-                   result_font, 3.0, result_color, 6, cv2.LINE_AA)
+        LAYOUT.text(frame, result_text, (720, 110), 
+                 result_font, 3.0, result_color, 6)
         
         # Load and display ORIGINAL (unblurred) image
         try:
-            img_path = Path(__file__).parent / "assets" / "guess_game" / "original" / self.current_question["original_image"]
+            img_path = question_image(self.current_question, "result")
             
-            if img_path.exists():
-                img = cv2.imread(str(img_path))
-                if img is not None:
-                    # Resize (larger)
-                    img_h, img_w = img.shape[:2]
-                    max_width = 900
-                    max_height = 600
-                    
-                    scale = min(max_width / img_w, max_height / img_h)
-                    new_w = int(img_w * scale)
-                    new_h = int(img_h * scale)
-                    
-                    img_resized = cv2.resize(img, (new_w, new_h))
-                    
-                    # Center position
-                    x_offset = (1920 - new_w) // 2
-                    y_offset = 180
-                    
-                    # Shadow
-                    shadow_offset = 10
-                    cv2.rectangle(frame, 
-                                (x_offset + shadow_offset, y_offset + shadow_offset), 
-                                (x_offset + new_w + shadow_offset, y_offset + new_h + shadow_offset), 
-                                (0, 0, 0), -1)
-                    
-                    # Place image
-                    frame[y_offset:y_offset+new_h, x_offset:x_offset+new_w] = img_resized
-                    
-                    # Border
-                    border_color = (100, 255, 150) if is_correct else (100, 120, 255)
-                    cv2.rectangle(frame, (x_offset-5, y_offset-5), 
-                                (x_offset+new_w+5, y_offset+new_h+5), 
-                                border_color, 5, cv2.LINE_AA)
-                    
-                    # Label
-                    label_font = cv2.FONT_HERSHEY_TRIPLEX
-                    cv2.putText(frame, "THE TRUTH REVEALED!", (640, 155), 
-                               label_font, 1.2, (255, 255, 150), 3, cv2.LINE_AA)
+            # Sudah di-decode dan di-resize (fit 900x600 x scale layout) oleh cache / prefetch
+            img_resized = self.images.get(img_path, LAYOUT.box(RESULT_IMAGE_BOX))
+            if img_resized is not None:
+                new_w, new_h = LAYOUT.design_size(img_resized)
+                
+                # Center position
+                x_offset = (REF_WIDTH - new_w) // 2
+                y_offset = 180
+                
+                # Shadow
+                shadow_offset = 10
+                LAYOUT.rectangle(frame, 
+                            (x_offset + shadow_offset, y_offset + shadow_offset), 
+                            (x_offset + new_w + shadow_offset, y_offset + new_h + shadow_offset), 
+                            (0, 0, 0), -1)
+                
+                # Place image
+                LAYOUT.blit(frame, img_resized, x_offset, y_offset)
+                
+                # Border
+                border_color = (100, 255, 150) if is_correct else (100, 120, 255)
+                LAYOUT.rectangle(frame, (x_offset-5, y_offset-5), 
+                            (x_offset+new_w+5, y_offset+new_h+5), 
+                            border_color, 5, cv2.LINE_AA)
+                
+                # Label
+                label_font = cv2.FONT_HERSHEY_TRIPLEX
+                LAYOUT.text(frame, "THE TRUTH REVEALED!", (640, 155), 
+                         label_font, 1.2, (255, 255, 150), 3)
         
         except Exception as e:
             print(f"[X] Error loading result image: {e}")
         
         # Answer info with better layout
         info_font = cv2.FONT_HERSHEY_DUPLEX
-        cv2.putText(frame, f"Your Answer: {selected_option}", (460, 830), 
-                   info_font, 1.0, (255, 255, 150), 2, cv2.LINE_AA)
-        cv2.putText(frame, f"Correct Answer: {correct_answer}", (460, 870), 
-                   info_font, 1.0, (150, 255, 150), 2, cv2.LINE_AA)
+        if self.reveal_mode:
+            LAYOUT.text(frame, f"+{self.last_points} points", (1200, 850), 
+                     info_font, 1.2, (100, 255, 255), 2)
+        LAYOUT.text(frame, f"Your Answer: {selected_option}", (460, 830), 
+                 info_font, 1.0, (255, 255, 150), 2)
+        LAYOUT.text(frame, f"Correct Answer: {correct_answer}", (460, 870), 
+                 info_font, 1.0, (150, 255, 150), 2)
         
         # Score (top left)
-        cv2.putText(frame, f"Score: {self.score}/{self.total_questions}", (40, 60), 
-                   cv2.FONT_HERSHEY_DUPLEX, 1.1, (100, 255, 255), 3, cv2.LINE_AA)
-        
-        # Buttons
-        button_y = 930
-        button_width = 320
-        button_height = 80
-        button_spacing = 50
-        
-        total_width = button_width * 2 + button_spacing
-        start_x = (1920 - total_width) // 2
-        
-        next_btn = Button(start_x, button_y, button_width, button_height, "NEXT QUESTION", "next")
-        menu_btn = Button(start_x + button_width + button_spacing, button_y, 
-                         button_width, button_height, "MAIN MENU", "menu")
+        score_text = f"Points: {self.score}" if self.reveal_mode else f"Score: {self.score}/{self.total_questions}"
+        LAYOUT.text(frame, score_text, (40, 60), 
+                 cv2.FONT_HERSHEY_DUPLEX, 1.1, (100, 255, 255), 3)
         
-        for btn in [next_btn, menu_btn]:
-            btn.hovered = (self.finger_pos and 
-                          btn.contains_point(self.finger_pos[0], self.finger_pos[1]))
-            
+        # Buttons (dibuat di enter_result)
+        for btn in self.buttons:
             if btn.id == "next":
                 btn.draw(frame, (100, 220, 150) if btn.hovered else (60, 170, 100))
             else:
                 btn.draw(frame, (220, 150, 100) if btn.hovered else (170, 100, 60))
-            
-            if btn.hovered and self.is_pinching and not self.last_pinch:
-                if btn.id == "next":
-                    self.start_game()
-                elif btn.id == "menu":
-                    self.setup_menu()
     
-    def check_answer(self):
-        """Check answer and move to result"""
+    def selected_option(self):
         selected_idx = int(self.selected_answer.split("_")[1])
-        selected_option = self.shuffled_options[selected_idx]
+        return self.shuffled_options[selected_idx]
+    
+    def check_answer(self):
+        """Submit: return state tujuan (RESULT), atau None jika reveal mode lanjut ke level berikutnya"""
+        selected_option = self.selected_option()
+        if selected_option != self.current_question["correct_answer"] and \
+                self.reveal_mode and self.reveal_level < len(self.reveal_frames) - 1:
+            # Salah tapi masih ada level: gambar makin jelas, opsi ini dicoret
+            print(f"[*] Wrong guess: {selected_option}, revealing more")
+            self.wrong_options.add(self.selected_answer)
+            self.selected_answer = None
+            self.reveal_next()
+            return None
+        return "RESULT"
+    
+    def enter_result(self):
+        """Hitung hasil + skor SEKALI; draw_result hanya membaca self.result"""
+        selected_option = self.selected_option()
         correct_answer = self.current_question["correct_answer"]
+        is_correct = selected_option == correct_answer
+        self.last_points = 0
+        if is_correct:
+            self.last_points = self.reveal_points() if self.reveal_mode else 1
+            self.score += self.last_points
+        self.result = {"selected": selected_option, "correct_answer": correct_answer, "correct": is_correct}
+        
+        # Buttons
+        button_y = 930
+        button_width = 320
+        button_height = 80
+        button_spacing = 50
         
-        if selected_option == correct_answer:
-            self.score += 1
+        total_width = button_width * 2 + button_spacing
+        start_x = (REF_WIDTH - total_width) // 2
         
-        self.state = "RESULT"
+        self.buttons = [
+            Button(start_x, button_y, button_width, button_height, "NEXT QUESTION", "next"),
+            Button(start_x + button_width + button_spacing, button_y, 
+                   button_width, button_height, "MAIN MENU", "menu"),
+        ]
     
     def open_editor(self):
         """Open question editor"""
@@ -417,164 +602,94 @@ class GuessGame:
             subprocess.Popen([sys.executable, str(editor_path)])
             print("[OK] Opening Guess Game Editor...")
             print("[*] Edit your questions in the editor window")
-            print("[*] Press 'r' in this window to reload after editing")
+            print("[*] Saved edits are picked up automatically by the game")
         
         except Exception as e:
             print(f"[X] Error opening editor: {e}")
             import traceback
             traceback.print_exc()
     
-    def update(self, frame):
-        """Main update loop"""
-        if self.finger_pos:
-            x, y = self.finger_pos
-            
-            for btn in self.buttons:
-                btn.hovered = btn.contains_point(x, y)
-                
-                if btn.hovered and self.is_pinching and not self.last_pinch and self.pinch_cooldown <= 0:
-                    self.handle_button_click(btn)
-                    self.pinch_cooldown = 15
-        
-        if self.pinch_cooldown > 0:
-            self.pinch_cooldown -= 1
-        
-        # Draw based on state
-        if self.state == "MENU":
-            self.draw_menu(frame)
-        elif self.state == "QUIZ":
-            self.draw_quiz(frame)
-        elif self.state == "RESULT":
-            self.draw_result(frame)
-        
-        # Draw finger pointer (improved design)
+    def draw_pointer(self, frame):
+        """Draw finger pointer (improved design)"""
         if self.finger_pos:
             x, y = self.finger_pos
             if self.is_pinching:
                 # Pinching - yellow glow
-                cv2.circle(frame, (x, y), 20, (0, 255, 255), 2, cv2.LINE_AA)
-                cv2.circle(frame, (x, y), 14, (0, 255, 255), -1, cv2.LINE_AA)
-                cv2.circle(frame, (x, y), 8, (255, 255, 255), -1, cv2.LINE_AA)
+                LAYOUT.circle(frame, (x, y), 20, (0, 255, 255), 2, cv2.LINE_AA)
+                LAYOUT.circle(frame, (x, y), 14, (0, 255, 255), -1, cv2.LINE_AA)
+                LAYOUT.circle(frame, (x, y), 8, (255, 255, 255), -1, cv2.LINE_AA)
             else:
                 # Normal - cyan/blue
-                cv2.circle(frame, (x, y), 16, (255, 150, 100), 2, cv2.LINE_AA)
-                cv2.circle(frame, (x, y), 10, (255, 150, 100), -1, cv2.LINE_AA)
-    
-    def handle_button_click(self, btn):
-        """Handle button clicks"""
-        if self.state == "MENU":
-            if btn.id == "start":
-                self.start_game()
-            elif btn.id == "edit":
-                self.open_editor()
-        
-        elif self.state == "QUIZ":
-            if btn.id.startswith("option_"):
-                self.selected_answer = btn.id
+                LAYOUT.circle(frame, (x, y), 16, (255, 150, 100), 2, cv2.LINE_AA)
+                LAYOUT.circle(frame, (x, y), 10, (255, 150, 100), -1, cv2.LINE_AA)
+    
+    def draw_overlay(self, frame):
+        """Status bar at top right"""
+        LAYOUT.text(frame, "Press 'Q' to Quit | 'R' to Reload", (1480, 35), 
+                 cv2.FONT_HERSHEY_DUPLEX, 0.7, (150, 150, 150), 2)
+    
+    def reload(self):
+        """Tombol 'r': paksa reload di background (biasanya sudah otomatis lewat watcher)"""
+        if self.watcher is not None:
+            self.watcher.request()
+    
+    def report(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher.report()
+        self.sampler.save()
+        self.sampler.report()
+        self.images.shutdown()
+        self.images.report()
+        self.menu_layer.report()
+    
+    # --- Event handlers (return state tujuan, atau None = tetap) ---
+    def on_menu_click(self, btn):
+        if btn.id == "start":
+            self.reveal_mode = False
+            return "QUIZ"
+        if btn.id == "reveal":
+            self.reveal_mode = True
+            return "QUIZ"
+        if btn.id == "edit":
+            self.open_editor()
+        return None
+    
+    def on_quiz_click(self, btn):
+        if btn.id == "submit" and self.selected_answer:
+            return self.check_answer()
+        if btn.id.startswith("option_") and btn.id not in self.wrong_options:
+            self.selected_answer = btn.id
+        return None
+    
+    def on_quiz_tick(self, now):
+        if self.reveal_mode:
+            self.update_reveal(now)
+        return None
+    
+    def on_result_click(self, btn):
+        if btn.id == "next":
+            return "QUIZ"
+        if btn.id == "menu":
+            return "MENU"
+        return None
 
 def main():
     print("\n" + "=" * 70)
     print("[*] GUESS THE PICTURE - Starting Application")
     print("=" * 70)
     
-    cap = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)
-    
-    if not cap.isOpened():
-        print("[X] ERROR: Cannot access camera!")
-        return
-    
-    print("[OK] Camera accessed successfully!")
-    
-    # Set resolusi 1920x1080
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-    cap.set(cv2.CAP_PROP_FPS, 30)
+    # --replay memutar rekaman landmark, tanpa kamera dan tanpa MediaPipe
+    # --resolution 1280x720: capture + proses lebih kecil, window tetap 1920x1080
+    args = parse_game_args()
     
+    # Prefetch gambar pertama langsung di ukuran tampilan resolusi capture
+    LAYOUT.resize(*args.resolution)
     game = GuessGame()
-    game.setup_menu()
     print("[OK] Game initialized!")
-    print("\n[*] Starting main loop...")
-    print("[*] Press 'r' to reload game data after editing")
-    print("[*] Resolution: 1920x1080 (Full Screen Window Mode)")
-    print("=" * 70 + "\n")
     
-    try:
-        with mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        ) as hands:
-            
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                frame = cv2.flip(frame, 1)
-                h, w, c = frame.shape
-                
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = hands.process(rgb_frame)
-                
-                game.finger_pos = None
-                game.last_pinch = game.is_pinching
-                game.is_pinching = False
-                
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
-                    
-                    index_tip = hand_landmarks.landmark[8]
-                    thumb_tip = hand_landmarks.landmark[4]
-                    
-                    index_x = int(index_tip.x * w)
-                    index_y = int(index_tip.y * h)
-                    thumb_x = int(thumb_tip.x * w)
-                    thumb_y = int(thumb_tip.y * h)
-                    
-                    game.finger_pos = (index_x, index_y)
-                    
-                    distance = math.sqrt((index_x - thumb_x)**2 + (index_y - thumb_y)**2)
-                    game.is_pinching = distance < 40
-                    
-                    # Draw hand landmarks with subtle style
-                    mp_draw.draw_landmarks(
-                        frame, hand_landmarks, mp_hands.HAND_CONNECTIONS,
-                        mp_draw.DrawingSpec(color=(100, 255, 200), thickness=2, circle_radius=2),
-                        mp_draw.DrawingSpec(color=(100, 200, 255), thickness=2)
-                    )
-                
-                game.update(frame)
-                
-                # Status bar at top right
-                cv2.putText(frame, "Press 'Q' to Quit | 'R' to Reload", (1480, 35), 
-                           cv2.FONT_HERSHEY_DUPLEX, 0.7, (150, 150, 150), 2, cv2.LINE_AA)
-                
-                # Window mode biasa dengan ukuran 1920x1080
-                cv2.namedWindow("Guess The Picture", cv2.WINDOW_NORMAL)
-                cv2.resizeWindow("Guess The Picture", 1920, 1080)
-                cv2.imshow("Guess The Picture", frame)
-                
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q') or key == ord('Q'):
-                    print("\n[*] Goodbye!\n")
-                    break
-                elif key == ord('r') or key == ord('R'):
-                    print("\n[*] Reloading game data...")
-                    game.load_game_data()
-                    game.setup_menu()
-                    print("[OK] Data reloaded!\n")
-    
-    except KeyboardInterrupt:
-        print("\n[*] Interrupted by user")
-    except Exception as e:
-        print(f"\n[X] ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-    finally:
-        print("[*] Cleaning up...")
-        cap.release()
-        cv2.destroyAllWindows()
-        print("[*] Application closed")
+    # Kamera, hand tracking, fixed-timestep loop dan window dari engine
+    run_game(game, "Guess The Picture", args, camera_index=camera_index, camera_api=cv2.CAP_DSHOW)
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,319 @@
+"""
+Air-writing: pengenalan huruf (a-z, A-Z) dari stroke EmojiDrawer dan penyusunan
+huruf menjadi kata yang dicek ke vocabulary bank soal (questions.db).
+
+Recognizer berupa template matcher point-cloud (murni NumPy, tanpa model):
+- Template dibuat sekali saat start dari font Hershey OpenCV (stroke font),
+  beberapa gaya per huruf, masing-masing disimpan sebagai NUM_POINTS titik
+  ternormalisasi dalam satu array (K, N, 2).
+- Stroke dari tangan dirasterisasi ke kotak kecil lalu dijadikan point cloud
+  yang sama, sehingga urutan dan arah stroke tidak berpengaruh.
+- Jarak = chamfer distance dua arah, dihitung untuk semua template sekaligus.
+  Template diindeks per aspect ratio, jadi hanya kandidat dengan bentuk kotak
+  yang mirip yang dibandingkan.
+
+Target latency < 5 ms per huruf di CPU. Cek dengan:
+    python letter_recognizer.py --samples 20
+"""
+
+import argparse
+import string
+import time
+
+import cv2
+import numpy as np
+
+from engine.perf_stats import TimingStats
+from question_bank import DB_PATH, QuestionBank
+
+NUM_POINTS = 48
+RASTER_SIZE = 48
+MAX_QUERY_POINTS = 160
+LETTERS = string.ascii_lowercase + string.ascii_uppercase
+TEMPLATE_FONTS = [
+    cv2.FONT_HERSHEY_SIMPLEX,
+    cv2.FONT_HERSHEY_SIMPLEX | cv2.FONT_ITALIC,
+    cv2.FONT_HERSHEY_COMPLEX,
+    cv2.FONT_HERSHEY_SCRIPT_SIMPLEX,
+]
+
+# Template dengan log(aspect ratio) yang beda lebih dari ini tidak dibandingkan
+ASPECT_TOLERANCE = 0.9
+# Rata-rata jarak per huruf maksimum agar sebuah kata dianggap cocok (satuan: sisi kotak raster)
+WORD_MAX_DISTANCE = 0.04
+
+
+def _fit_mask(mask, size=RASTER_SIZE):
+    """Crop mask ke bounding box lalu skala (aspect ratio tetap) ke tengah kotak size x size"""
+    ys, xs = np.nonzero(mask)
+    if len(xs) == 0:
+        return None, 0.0
+    crop = mask[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+    h, w = crop.shape
+    scale = (size - 4) / max(w, h)
+    new_w, new_h = max(1, int(round(w * scale))), max(1, int(round(h * scale)))
+    resized = cv2.resize(crop, (new_w, new_h), interpolation=cv2.INTER_AREA)
+    fitted = np.zeros((size, size), dtype=np.uint8)
+    x0, y0 = (size - new_w) // 2, (size - new_h) // 2
+    fitted[y0:y0 + new_h, x0:x0 + new_w] = np.where(resized > 64, 255, 0)
+    return fitted, float(np.log(w / h))
+
+
+def _skeleton(mask):
+    """Morphological skeleton (hanya modul inti OpenCV, tanpa ximgproc)"""
+    kernel = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
+    skeleton = np.zeros_like(mask)
+    while cv2.countNonZero(mask):
+        eroded = cv2.erode(mask, kernel)
+        skeleton |= cv2.subtract(mask, cv2.dilate(eroded, kernel))
+        mask = eroded
+    return skeleton
+
+
+def _glyph_mask(char, font):
+    """Huruf dari font Hershey sebagai garis tipis (ketebalan putText ikut membesar dengan scale)"""
+    scale = 2.0
+    (tw, th), baseline = cv2.getTextSize(char, font, scale, 1)
+    pad = 10
+    mask = np.zeros((th + baseline + pad * 2, tw + pad * 2), dtype=np.uint8)
+    cv2.putText(mask, char, (pad, pad + th), font, scale, 255, 1, cv2.LINE_8)
+    return _skeleton(mask)
+
+
+def rasterize_strokes(strokes, size=RASTER_SIZE):
+    """Gambar stroke (list of list (x, y) pixel) ke kotak size x size, aspect ratio dipertahankan"""
+    arrays = [np.asarray(s, dtype=np.float32).reshape(-1, 2) for s in strokes if len(s)]
+    if not arrays:
+        return None, 0.0
+    all_pts = np.concatenate(arrays)
+    lo = all_pts.min(axis=0)
+    w, h = np.maximum(all_pts.max(axis=0) - lo, 1.0)
+    scale = (size - 4) / max(w, h)
+    offset = (np.array([size, size]) - np.array([w, h]) * scale) / 2
+    polylines = [np.round((a - lo) * scale + offset).astype(np.int32).reshape(-1, 1, 2) for a in arrays]
+    mask = np.zeros((size, size), dtype=np.uint8)
+    cv2.polylines(mask, [p for p in polylines if len(p) > 1], False, 255, 1, cv2.LINE_8)
+    for p in polylines:
+        if len(p) == 1:
+            # Titik (misalnya titik huruf i/j), polylines tidak menggambar apa-apa
+            cv2.circle(mask, tuple(int(v) for v in p[0, 0]), 1, 255, -1)
+    return mask, float(np.log(w / h))
+
+
+def _distance_map(mask):
+    """Jarak setiap pixel ke garis terdekat, dinormalisasi ke sisi kotak"""
+    return cv2.distanceTransform(255 - mask, cv2.DIST_L2, 3) / mask.shape[0]
+
+
+class LetterRecognizer:
+    """Chamfer template matcher huruf. recognize(strokes) -> (huruf, jarak, skor per huruf)"""
+    def __init__(self, num_points=NUM_POINTS, fonts=TEMPLATE_FONTS):
+        rng = np.random.default_rng(0)
+        maps, points, labels, aspects = [], [], [], []
+        for font in fonts:
+            for char in LETTERS:
+                fitted, aspect = _fit_mask(_glyph_mask(char, font))
+                ys, xs = np.nonzero(fitted)
+                pick = rng.choice(len(xs), num_points, replace=len(xs) < num_points)
+                maps.append(_distance_map(fitted))
+                points.append(ys[pick] * RASTER_SIZE + xs[pick])
+                labels.append(char)
+                aspects.append(aspect)
+        # Semua template dalam satu array supaya matching cukup beberapa operasi NumPy
+        self.distance_maps = np.stack(maps).reshape(len(maps), -1)  # (K, S*S)
+        self.points = np.stack(points)  # (K, N) index pixel flat
+        self.labels = np.array(labels)
+        self.aspects = np.array(aspects, dtype=np.float32)
+        # Index huruf -> kolom a..z (huruf besar/kecil dianggap sama untuk vocabulary)
+        self.letter_index = np.array([string.ascii_lowercase.index(c.lower()) for c in labels])
+        self.stats = TimingStats("Letter recognition")
+        self.last_latency = 0.0
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _distances(self, strokes):
+        """Chamfer distance dua arah ke setiap template (inf jika tidak lolos index aspect ratio)"""
+        distances = np.full(len(self.labels), np.inf, dtype=np.float32)
+        mask, aspect = rasterize_strokes(strokes)
+        if mask is None:
+            return distances
+        query = np.flatnonzero(mask)
+        if len(query) > MAX_QUERY_POINTS:
+            query = query[np.linspace(0, len(query) - 1, MAX_QUERY_POINTS).astype(np.int32)]
+        candidates = np.flatnonzero(np.abs(self.aspects - aspect) < ASPECT_TOLERANCE)
+        if len(candidates) == 0:
+            candidates = np.arange(len(self.labels))
+        query_map = _distance_map(mask).ravel()
+        forward = self.distance_maps[candidates][:, query].mean(axis=1)
+        backward = query_map[self.points[candidates]].mean(axis=1)
+        distances[candidates] = (forward + backward) / 2
+        return distances
+
+    def recognize(self, strokes):
+        """Return (huruf terbaik, jarak, skor terbaik per huruf a..z)"""
+        start = time.perf_counter()
+        distances = self._distances(strokes)
+        best = int(np.argmin(distances))
+        scores = np.full(26, np.inf, dtype=np.float32)
+        np.minimum.at(scores, self.letter_index, distances)
+        self.last_latency = time.perf_counter() - start
+        self.stats.add(self.last_latency)
+        return str(self.labels[best]), float(distances[best]), scores
+
+
+def load_vocabulary(path=DB_PATH):
+    """Semua kata (huruf saja, lowercase) dari correct_answer soal kalimat di bank soal"""
+    try:
+        bank = QuestionBank(path)
+        answers = list(bank.sentence_answers())
+        bank.close()
+    except Exception as e:
+        print(f"[!] Cannot load vocabulary from {path}: {e}")
+        return []
+    words = set()
+    for answer in answers:
+        for word in answer:
+            letters = "".join(c for c in word.lower() if c in string.ascii_lowercase)
+            if letters:
+                words.add(letters)
+    return sorted(words)
+
+
+class WordMatcher:
+    """Cocokkan deretan skor huruf ke vocabulary, diindeks per panjang kata"""
+    def __init__(self, vocabulary):
+        self.by_length = {}
+        for word in vocabulary:
+            self.by_length.setdefault(len(word), []).append(word)
+        self.index = {
+            length: (words, np.array([[ord(c) - ord("a") for c in w] for w in words]))
+            for length, words in self.by_length.items()
+        }
+
+    def match(self, letter_scores):
+        """letter_scores: list array(26) per huruf. Return (kata, rata-rata jarak) atau (None, inf)"""
+        entry = self.index.get(len(letter_scores))
+        if entry is None:
+            return None, float("inf")
+        words, chars = entry
+        scores = np.stack(letter_scores)  # (L, 26)
+        per_word = scores[np.arange(len(letter_scores)), chars].mean(axis=1)
+        best = int(np.argmin(per_word))
+        return words[best], float(per_word[best])
+
+
+class AirWriter:
+    """Kumpulkan stroke -> huruf -> kata.
+
+    Satu huruf boleh terdiri dari beberapa stroke (misalnya t, i, E). Huruf
+    dianggap selesai setelah letter_pause frame tanpa menggambar, kata selesai
+    setelah word_pause frame (berbasis frame supaya replay tetap deterministik).
+    """
+    def __init__(self, vocabulary=None, letter_pause=20, word_pause=60):
+        self.recognizer = LetterRecognizer()
+        self.vocabulary = vocabulary if vocabulary is not None else load_vocabulary()
+        self.matcher = WordMatcher(self.vocabulary)
+        self.letter_pause = letter_pause
+        self.word_pause = word_pause
+        self.strokes = []
+        self.letters = []  # list of (huruf, skor per huruf)
+        self.idle_frames = 0
+        self.last_word = None  # (tulisan, kata vocabulary atau None)
+
+    def add_stroke(self, points):
+        if points:
+            self.strokes.append(list(points))
+            self.idle_frames = 0
+
+    def text(self):
+        return "".join(letter for letter, _ in self.letters)
+
+    def finish_letter(self):
+        if not self.strokes:
+            return None
+        letter, distance, scores = self.recognizer.recognize(self.strokes)
+        self.strokes = []
+        self.letters.append((letter, scores))
+        return letter
+
+    def finish_word(self):
+        self.finish_letter()
+        if not self.letters:
+            return None
+        written = self.text()
+        word, distance = self.matcher.match([scores for _, scores in self.letters])
+        self.last_word = (written, word if distance <= WORD_MAX_DISTANCE else None)
+        self.letters = []
+        return self.last_word
+
+    def undo(self):
+        """Hapus stroke yang belum jadi huruf, atau huruf terakhir"""
+        if self.strokes:
+            self.strokes = []
+        elif self.letters:
+            self.letters.pop()
+
+    def update(self, drawing):
+        """Panggil sekali per frame. Return "letter", "word" atau None"""
+        if drawing:
+            self.idle_frames = 0
+            return None
+        self.idle_frames += 1
+        if self.strokes and self.idle_frames >= self.letter_pause:
+            self.finish_letter()
+            return "letter"
+        if self.letters and self.idle_frames >= self.word_pause:
+            self.finish_word()
+            return "word"
+        return None
+
+
+def _synthetic_strokes(char, font, rng):
+    """Huruf dari font lain + rotasi/skala/jitter sebagai polyline (untuk benchmark)"""
+    mask = _glyph_mask(char, font)
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+    angle = np.radians(rng.uniform(-10, 10))
+    rot = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]], dtype=np.float32)
+    scale = rng.uniform(3.0, 6.0)
+    strokes = []
+    for contour in contours:
+        pts = contour.reshape(-1, 2).astype(np.float32) @ rot.T * scale
+        pts += rng.normal(0, 3.0, pts.shape)
+        strokes.append([tuple(p) for p in pts + 300])
+    return strokes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Letter recognizer accuracy/latency benchmark")
+    parser.add_argument("--samples", type=int, default=10, help="Sample per huruf")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    recognizer = LetterRecognizer()
+    print(f"[OK] {len(recognizer)} templates built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rng = np.random.default_rng(args.seed)
+    # Font DUPLEX tidak dipakai sebagai template -> uji generalisasi
+    correct = total = 0
+    for char in LETTERS:
+        for _ in range(args.samples):
+            letter, _, _ = recognizer.recognize(_synthetic_strokes(char, cv2.FONT_HERSHEY_DUPLEX, rng))
+            correct += letter.lower() == char.lower()
+            total += 1
+    print(f"[STATS] Letter accuracy (case-insensitive): {correct / total * 100:.1f}% ({correct}/{total})")
+
+    vocabulary = load_vocabulary()
+    matcher = WordMatcher(vocabulary)
+    matched = 0
+    for word in vocabulary:
+        scores = [recognizer.recognize(_synthetic_strokes(c, cv2.FONT_HERSHEY_DUPLEX, rng))[2] for c in word]
+        found, distance = matcher.match(scores)
+        matched += found == word and distance <= WORD_MAX_DISTANCE
+    print(f"[STATS] Vocabulary words recognized: {matched}/{len(vocabulary)}")
+    recognizer.stats.report()
+
+
+if __name__ == "__main__":
+    main()
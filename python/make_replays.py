@@ -0,0 +1,220 @@
+"""
+Buat ulang rekaman regression suite (replays/*.hlr + replays/expected.json).
+
+Setiap rekaman adalah gerakan tangan sintetis (cursor telunjuk + pinch) yang memainkan
+satu skenario sampai selesai:
+- quiz_present_easy: Present/easy, susun kalimat dengan benar, SUBMIT -> RESULT skor 1
+- guess_correct: START, pilih jawaban benar, SUBMIT -> RESULT skor 1
+- draw_star: gambar bintang di udara -> emoji star terdeteksi
+- draw_word_rice: mode menulis kata, tulis r-i-c-e -> kata "rice"
+
+Game quiz/guess dijalankan bersamaan saat merekam (seed dan bank soal sama dengan replay),
+sehingga posisi tombol berikutnya selalu sesuai layar saat itu. Hasil yang diharapkan
+diambil dari replay_games.py atas rekaman yang baru dibuat, dan dicek terhadap hasil
+yang dimaksud skenario sebelum expected.json ditulis.
+
+Jalankan ulang jika quiz_data.json / guess_data.json atau tata letak game berubah:
+    python make_replays.py
+    python replay_games.py all
+"""
+
+import json
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+import letter_recognizer
+from engine import GameLoop
+from engine.hand_recording import HandRecorder
+from engine.hand_tracking import INDEX_TIP, THUMB_TIP, Landmark, TrackedHand
+from question_bank import QuestionBank
+from replay_games import REPLAY_DIR, SUITE_PATH
+from shape_corpus import generate_stroke
+
+WIDTH, HEIGHT = 1920, 1080
+FRAME_MS = 33
+FRAME = np.zeros((HEIGHT, WIDTH, 3), np.uint8)
+
+
+def hand(x, y, pinch):
+    """Tangan sintetis: telunjuk di (x, y) pixel, ibu jari menempel (pinch) atau terbuka"""
+    landmark = [Landmark(x / WIDTH, (y + 100) / HEIGHT, 0.0)] * 21
+    landmark[INDEX_TIP] = Landmark(x / WIDTH, y / HEIGHT, 0.0)
+    landmark[THUMB_TIP] = Landmark((x + (5 if pinch else 100)) / WIDTH, y / HEIGHT, 0.0)
+    return TrackedHand(landmark, "Right", 0.9)
+
+
+class Script:
+    """Tulis frame ke rekaman; jika ada loop, game yang sama ikut dijalankan"""
+    def __init__(self, path, loop=None):
+        self.recorder = HandRecorder(path)
+        self.loop = loop
+        self.timestamp_ms = 0
+        self.pos = (WIDTH // 2, HEIGHT - 100)
+
+    def frame(self, hands):
+        self.recorder.write(hands, FRAME, self.timestamp_ms)
+        if self.loop is not None:
+            self.loop.frame_hands(FRAME.copy(), hands, self.timestamp_ms / 1000.0)
+        self.timestamp_ms += FRAME_MS
+
+    def move(self, target, frames=8):
+        """Geser cursor (tangan terbuka) ke target"""
+        (x0, y0), (x1, y1) = self.pos, target
+        for k in range(1, frames + 1):
+            self.frame([hand(x0 + (x1 - x0) * k / frames, y0 + (y1 - y0) * k / frames, False)])
+        self.pos = target
+
+    def click(self, widget):
+        """Arahkan ke tengah widget, pinch sekali lalu lepas"""
+        target = (widget.x + widget.width // 2, widget.y + widget.height // 2)
+        self.move(target)
+        for _ in range(3):
+            self.frame([hand(*target, False)])
+        self.frame([hand(*target, True)])
+        for _ in range(16):
+            self.frame([hand(*target, False)])
+
+    def stroke(self, points, frames_per_point=1):
+        """Gambar di udara: pinch mengikuti points, lalu lepas"""
+        self.move(tuple(points[0]))
+        for _ in range(3):
+            self.frame([hand(*points[0], False)])
+        for x, y in points:
+            for _ in range(frames_per_point):
+                self.frame([hand(x, y, True)])
+        for _ in range(2):
+            self.frame([hand(*points[-1], False)])
+        self.pos = tuple(points[-1])
+
+    def idle(self, frames, visible=True):
+        for _ in range(frames):
+            self.frame([hand(*self.pos, False)] if visible else [])
+
+    def close(self):
+        self.recorder.close()
+
+
+def find(game, predicate):
+    return next(btn for btn in game.clickable_buttons() if predicate(btn))
+
+
+def record_quiz(path, db):
+    from quiz_game import QuizGame
+
+    # Sama dengan run_quiz di replay_games.py (seed 0, tanpa posisi sampler)
+    random.seed(0)
+    game = QuizGame(sampler_path=None, bank_path=db)
+    script = Script(path, GameLoop(game))
+    game.setup_menu()
+    game.current_category = "Present"
+    game.setup_difficulty()
+    game.current_difficulty = "easy"
+    game.start_quiz()
+    script.idle(10)
+    for word in game.current_question["correct_answer"]:
+        script.click(find(game, lambda b: b.id.startswith("word_") and b.text == word and not b.selected))
+    script.click(find(game, lambda b: b.id == "submit"))
+    script.idle(30)
+    script.close()
+    return ["quiz", "--category", "Present", "--difficulty", "easy"], {"state": "RESULT", "score": "1"}
+
+
+def record_guess(path, db):
+    from guess_game import GuessGame
+
+    random.seed(0)
+    game = GuessGame(sampler_path=None, bank_path=db)
+    script = Script(path, GameLoop(game))
+    game.setup_menu()
+    script.idle(10)
+    script.click(find(game, lambda b: b.id == "start"))
+    script.click(find(game, lambda b: b.text == game.current_question["correct_answer"]))
+    script.click(find(game, lambda b: b.id == "submit"))
+    script.idle(30)
+    script.close()
+    game.images.shutdown()
+    return ["guess"], {"state": "RESULT", "score": "1"}
+
+
+def record_star(path, db):
+    script = Script(path)
+    script.idle(10)
+    points = generate_stroke("star", seed=1)[::3].round().astype(int).tolist()
+    script.stroke(points)
+    script.idle(20)
+    script.close()
+    return ["draw"], {"detections": "star"}
+
+
+def record_word(path, db):
+    script = Script(path)
+    rng = np.random.default_rng(3)
+    for char in "rice":
+        # Huruf di kotak 400 px di tengah layar, satu stroke per goresan font
+        strokes = letter_recognizer._synthetic_strokes(char, cv2.FONT_HERSHEY_DUPLEX, rng)
+        points = np.concatenate([np.array(s) for s in strokes])
+        low, scale = points.min(0), 400 / (points.max(0) - points.min(0)).max()
+        for s in strokes:
+            s = ((np.array(s) - low) * scale + (760, 340)).round().astype(int)
+            script.stroke(s[::4].tolist())
+        # Jeda antar huruf (tangan terbuka di luar huruf)
+        script.move((700, 300), frames=3)
+        script.idle(25)
+    script.idle(70)
+    script.close()
+    return ["draw", "--word-mode"], {"words": "rice"}
+
+
+SCENARIOS = {
+    "quiz_present_easy.hlr": record_quiz,
+    "guess_correct.hlr": record_guess,
+    "draw_star.hlr": record_star,
+    "draw_word_rice.hlr": record_word,
+}
+
+
+def replay_result(game_args, recording, db):
+    """Hasil [RESULT] replay_games.py untuk rekaman (key -> string)"""
+    cmd = [sys.executable, "replay_games.py", game_args[0], str(recording), *game_args[1:], "--db", str(db)]
+    proc = subprocess.run(cmd, cwd=Path(__file__).parent, capture_output=True, text=True, check=True)
+    result = {}
+    for line in proc.stdout.splitlines():
+        if line.startswith("[RESULT] "):
+            key, _, value = line[len("[RESULT] "):].partition(": ")
+            result[key] = value
+    return result
+
+
+def main():
+    REPLAY_DIR.mkdir(exist_ok=True)
+    cases = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Bank soal baru dari JSON di repo, sama seperti replay_games.py all
+        db = Path(tmp) / "questions.db"
+        QuestionBank(db).close()
+        for name, record in SCENARIOS.items():
+            path = REPLAY_DIR / name
+            args, intended = record(path, db)
+            result = replay_result(args, path, db)
+            mismatch = {key: result.get(key) for key, value in intended.items() if result.get(key) != value}
+            if mismatch:
+                raise SystemExit(f"[X] {name}: replay gives {mismatch}, expected {intended}")
+            expect = []
+            for key, value in intended.items():
+                expect += [f"--expect-{key}", value]
+            cases.append({"game": args[0], "recording": name, "args": args[1:] + expect})
+            print(f"[OK] {name}: {path.stat().st_size / 1024:.1f} KB, {intended}")
+    with open(SUITE_PATH, "w", encoding="utf-8") as f:
+        json.dump(cases, f, indent=2)
+        f.write("\n")
+    print(f"[OK] Suite written: {SUITE_PATH} ({len(cases)} recordings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Bank soal SQLite untuk QuizGame (susun kalimat) dan GuessGame (tebak gambar).
+
+Dulu kedua game me-load seluruh quiz_data.json / guess_data.json ke memori dan
+editor menulis ulang seluruh file (indent=2) setiap save. Sekarang:
+- satu soal = satu baris di questions.db, dengan index (category, difficulty)
+- game hanya memuat daftar id (array ringkas) per category/difficulty, isi soal
+  dibaca per baris saat dipakai (lazy)
+- editor mengubah satu baris per save, dalam satu transaksi
+- mode WAL: save = append ke questions.db-wal (file DB tidak ditulis ulang), isinya
+  dipindah ke DB secara berkala (checkpoint). Crash di tengah save tidak merusak DB
+  yang sedang dibaca game, dan game yang membaca tidak memblokir editor
+- migrasi sekali dari file JSON lama: otomatis saat questions.db belum ada, atau
+  manual dengan --migrate. --export menulis balik ke JSON (untuk dibagikan / git)
+
+Field list (words, correct_answer, options) dan assets guess disimpan sebagai kolom JSON.
+Export JSON ditulis ke file sementara lalu di-rename (atomic), jadi file JSON tidak
+pernah setengah jadi.
+
+Contoh:
+    bank = QuestionBank()
+    ids = bank.sentence_ids("Present", "easy")
+    question = bank.get_sentence(random.choice(ids))
+
+    python question_bank.py --migrate     # ganti isi DB dengan isi file JSON
+    python question_bank.py --export      # tulis isi DB ke file JSON
+    python question_bank.py --checkpoint  # pindahkan isi WAL ke DB sekarang
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+DB_PATH = BASE_DIR / "questions.db"
+QUIZ_JSON_PATH = BASE_DIR / "quiz_data.json"
+GUESS_JSON_PATH = BASE_DIR / "guess_data.json"
+
+DEFAULT_CATEGORIES = ["Present", "Past", "Future", "Past Future"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+# Checkpoint WAL -> DB otomatis setiap WAL_AUTOCHECKPOINT halaman (4 KB) di WAL
+WAL_AUTOCHECKPOINT = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sentence_categories (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sentence_questions (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    question TEXT NOT NULL,
+    words TEXT NOT NULL,
+    correct_answer TEXT NOT NULL,
+    timer INTEGER NOT NULL DEFAULT 30
+);
+CREATE INDEX IF NOT EXISTS idx_sentence_category_difficulty
+    ON sentence_questions (category, difficulty);
+CREATE TABLE IF NOT EXISTS guess_questions (
+    id INTEGER PRIMARY KEY,
+    blurred_image TEXT NOT NULL,
+    original_image TEXT NOT NULL,
+    options TEXT NOT NULL,
+    correct_answer TEXT NOT NULL,
+    assets TEXT
+);
+"""
+
+
+def _sentence_row(category, difficulty, question):
+    return (category, difficulty, question["question"],
+            json.dumps(question["words"], ensure_ascii=False),
+            json.dumps(question["correct_answer"], ensure_ascii=False),
+            int(question.get("timer", 30)))
+
+
+def _guess_row(question):
+    assets = question.get("assets")
+    return (question["blurred_image"], question["original_image"],
+            json.dumps(question["options"], ensure_ascii=False), question["correct_answer"],
+            json.dumps(assets, ensure_ascii=False) if assets else None)
+
+
+def _write_json_atomic(path, data):
+    """Tulis ke file sementara di folder yang sama, fsync, lalu os.replace: pembaca
+    selalu melihat file lama atau file baru yang lengkap"""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class QuestionBank:
+    def __init__(self, path=DB_PATH, quiz_json=QUIZ_JSON_PATH, guess_json=GUESS_JSON_PATH):
+        self.path = Path(path)
+        created = not self.path.exists()
+        self.conn = sqlite3.connect(str(self.path))
+        # synchronous=NORMAL aman di mode WAL: crash tidak merusak DB (paling buruk commit
+        # terakhir hilang saat listrik mati), fsync hanya saat checkpoint
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT}")
+        self.conn.executescript(SCHEMA)
+        if created:
+            # Migrasi sekali dari file JSON lama (kalau ada)
+            self.migrate_json(quiz_json, guess_json)
+
+    def close(self):
+        self.conn.close()
+
+    def checkpoint(self):
+        """Pindahkan seluruh isi WAL ke DB lalu kosongkan WAL. Return jumlah halaman WAL
+        yang belum bisa dipindah (> 0 jika ada pembaca yang masih memakai snapshot lama)"""
+        _, wal_pages, moved = self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        return max(wal_pages - moved, 0)
+
+    def files(self):
+        """File yang berubah saat ada commit (untuk DataWatcher): DB + WAL jika ada"""
+        return [self.path, self.path.with_name(self.path.name + "-wal")]
+
+    # --- Soal kalimat (QuizGame) ---
+    def categories(self):
+        rows = self.conn.execute("SELECT name FROM sentence_categories ORDER BY position")
+        return [name for (name,) in rows]
+
+    def sentence_ids(self, category, difficulty):
+        """Id soal untuk category/difficulty (array int64, lewat index, tanpa isi soal)"""
+        rows = self.conn.execute(
+            "SELECT id FROM sentence_questions WHERE category = ? AND difficulty = ? ORDER BY id",
+            (category, difficulty))
+        return array("q", (question_id for (question_id,) in rows))
+
+    def sentence_index(self):
+        """Semua daftar id: {(category, difficulty): array id}"""
+        return {(category, difficulty): self.sentence_ids(category, difficulty)
+                for category in self.categories() for difficulty in DIFFICULTIES}
+
+    def count_sentences(self):
+        return self.conn.execute("SELECT COUNT(*) FROM sentence_questions").fetchone()[0]
+
+    def get_sentence(self, question_id):
+        """Satu soal sebagai dict (format sama dengan quiz_data.json + id), atau None"""
+        row = self.conn.execute(
+            "SELECT id, category, difficulty, question, words, correct_answer, timer "
+            "FROM sentence_questions WHERE id = ?", (question_id,)).fetchone()
+        if row is None:
+            return None
+        return {"id": row[0], "category": row[1], "difficulty": row[2], "question": row[3],
+                "words": json.loads(row[4]), "correct_answer": json.loads(row[5]), "timer": row[6]}
+
+    def sentence_answers(self):
+        """correct_answer (list kata) semua soal kalimat, mis. untuk vocabulary air-writing"""
+        for (answer,) in self.conn.execute("SELECT correct_answer FROM sentence_questions"):
+            yield json.loads(answer)
+
+    def list_sentences(self, category, difficulty):
+        """Untuk daftar di editor: [(id, teks soal)] tanpa parse kolom JSON"""
+        return self.conn.execute(
+            "SELECT id, question FROM sentence_questions WHERE category = ? AND difficulty = ? "
+            "ORDER BY id", (category, difficulty)).fetchall()
+
+    def add_sentence(self, category, difficulty, question):
+        with self.conn:
+            self._ensure_category(category)
+            cursor = self.conn.execute(
+                "INSERT INTO sentence_questions (category, difficulty, question, words, "
+                "correct_answer, timer) VALUES (?, ?, ?, ?, ?, ?)",
+                _sentence_row(category, difficulty, question))
+        return cursor.lastrowid
+
+    def update_sentence(self, question_id, question):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE sentence_questions SET question = ?, words = ?, correct_answer = ?, "
+                "timer = ? WHERE id = ?",
+                _sentence_row(None, None, question)[2:] + (question_id,))
+
+    def delete_sentence(self, question_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM sentence_questions WHERE id = ?", (question_id,))
+
+    def _ensure_category(self, category):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO sentence_categories (name, position) "
+            "VALUES (?, (SELECT COUNT(*) FROM sentence_categories))", (category,))
+
+    # --- Soal tebak gambar (GuessGame) ---
+    def guess_ids(self):
+        rows = self.conn.execute("SELECT id FROM guess_questions ORDER BY id")
+        return array("q", (question_id for (question_id,) in rows))
+
+    def count_guess(self):
+        return self.conn.execute("SELECT COUNT(*) FROM guess_questions").fetchone()[0]
+
+    def get_guess(self, question_id):
+        """Satu soal sebagai dict (format sama dengan guess_data.json + id), atau None"""
+        row = self.conn.execute(
+            "SELECT id, blurred_image, original_image, options, correct_answer, assets "
+            "FROM guess_questions WHERE id = ?", (question_id,)).fetchone()
+        if row is None:
+            return None
+        question = {"id": row[0], "blurred_image": row[1], "original_image": row[2],
+                    "options": json.loads(row[3]), "correct_answer": row[4]}
+        if row[5]:
+            question["assets"] = json.loads(row[5])
+        return question
+
+    def list_guess(self):
+        """Untuk daftar di editor: [(id, jawaban benar)]"""
+        return self.conn.execute(
+            "SELECT id, correct_answer FROM guess_questions ORDER BY id").fetchall()
+
+    def guess_answers(self):
+        """Semua jawaban benar (pool pengecoh untuk soal baru)"""
+        return [answer for (answer,) in self.conn.execute("SELECT correct_answer FROM guess_questions")]
+
+    def add_guess(self, question):
+        return self.add_guesses([question])[0]
+
+    def add_guesses(self, questions):
+        """Tambah banyak soal dalam satu transaksi (bulk import). Return list id"""
+        ids = []
+        with self.conn:
+            for question in questions:
+                cursor = self.conn.execute(
+                    "INSERT INTO guess_questions (blurred_image, original_image, options, "
+                    "correct_answer, assets) VALUES (?, ?, ?, ?, ?)", _guess_row(question))
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def update_guess(self, question_id, question):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE guess_questions SET blurred_image = ?, original_image = ?, options = ?, "
+                "correct_answer = ?, assets = ? WHERE id = ?", _guess_row(question) + (question_id,))
+
+    def delete_guess(self, question_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM guess_questions WHERE id = ?", (question_id,))
+
+    # --- Migrasi / export JSON ---
+    def migrate_json(self, quiz_json=QUIZ_JSON_PATH, guess_json=GUESS_JSON_PATH):
+        """Ganti isi DB dengan isi file JSON (satu transaksi). File yang tidak ada dilewati"""
+        start = time.perf_counter()
+        quiz_data = None
+        guess_data = None
+        if Path(quiz_json).exists():
+            with open(quiz_json, "r", encoding="utf-8") as f:
+                quiz_data = json.load(f)
+        if Path(guess_json).exists():
+            with open(guess_json, "r", encoding="utf-8") as f:
+                guess_data = json.load(f)
+
+        with self.conn:
+            if quiz_data is not None or not self.categories():
+                self.conn.execute("DELETE FROM sentence_questions")
+                self.conn.execute("DELETE FROM sentence_categories")
+                for category in (quiz_data or {name: {} for name in DEFAULT_CATEGORIES}):
+                    self._ensure_category(category)
+                self.conn.executemany(
+                    "INSERT INTO sentence_questions (category, difficulty, question, words, "
+                    "correct_answer, timer) VALUES (?, ?, ?, ?, ?, ?)",
+                    (_sentence_row(category, difficulty, question)
+                     for category, levels in (quiz_data or {}).items()
+                     for difficulty, questions in levels.items()
+                     for question in questions))
+            if guess_data is not None:
+                self.conn.execute("DELETE FROM guess_questions")
+                self.conn.executemany(
+                    "INSERT INTO guess_questions (blurred_image, original_image, options, "
+                    "correct_answer, assets) VALUES (?, ?, ?, ?, ?)",
+                    (_guess_row(question) for question in guess_data))
+
+        print(f"[OK] Migrated JSON -> {self.path.name}: {self.count_sentences()} sentence, "
+              f"{self.count_guess()} guess questions ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    def export_json(self, quiz_json=QUIZ_JSON_PATH, guess_json=GUESS_JSON_PATH):
+        """Tulis isi DB ke file JSON (format lama, tanpa id)"""
+        quiz_data = {category: {difficulty: [] for difficulty in DIFFICULTIES}
+                     for category in self.categories()}
+        for (question_id,) in self.conn.execute("SELECT id FROM sentence_questions ORDER BY id"):
+            question = self.get_sentence(question_id)
+            levels = quiz_data.setdefault(question.pop("category"), {})
+            levels.setdefault(question.pop("difficulty"), []).append(question)
+            del question["id"]
+        guess_data = []
+        for question_id in self.guess_ids():
+            question = self.get_guess(question_id)
+            del question["id"]
+            guess_data.append(question)
+
+        _write_json_atomic(quiz_json, quiz_data)
+        _write_json_atomic(guess_json, guess_data)
+        print(f"[OK] Exported {self.count_sentences()} sentence + {len(guess_data)} guess "
+              f"questions to {Path(quiz_json).name}, {Path(guess_json).name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite question bank for quiz and guess games")
+    parser.add_argument("--db", default=str(DB_PATH))
+    parser.add_argument("--migrate", action="store_true", help="Ganti isi DB dengan isi file JSON")
+    parser.add_argument("--export", action="store_true", help="Tulis isi DB ke file JSON")
+    parser.add_argument("--checkpoint", action="store_true", help="Pindahkan isi WAL ke DB sekarang")
+    args = parser.parse_args()
+
+    bank = QuestionBank(args.db)
+    if args.migrate:
+        bank.migrate_json()
+    if args.export:
+        bank.export_json()
+    if args.checkpoint:
+        left = bank.checkpoint()
+        print(f"[OK] Checkpoint {bank.path.name}" if left == 0 else
+              f"[!] Checkpoint incomplete: {left} WAL pages still in use by a reader")
+    print(f"[STATS] {bank.path.name}: {bank.count_sentences()} sentence questions in "
+          f"{len(bank.categories())} categories, {bank.count_guess()} guess questions")
+    bank.close()
+
+
+if __name__ == "__main__":
+    main()
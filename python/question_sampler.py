@@ -0,0 +1,173 @@
+"""
+Pemilih soal tanpa pengulangan (per category/difficulty untuk QuizGame, satu deck
+untuk GuessGame).
+
+Setiap deck = array int64 berisi id soal + cursor (Fisher-Yates bertahap):
+- draw(): pilih j acak di [cursor, n), tukar ke posisi cursor, cursor += 1 -> O(1),
+  tanpa shuffle seluruh deck di awal (tidak ada frame yang tersendat di 100k soal)
+- peek(k): pilih k soal berikutnya dengan cara yang sama tapi cursor tidak maju (mis.
+  untuk prefetch gambar); draw berikutnya mengeluarkan soal-soal itu sesuai urutan.
+  Soal yang hanya di-peek belum dihitung keluar (save / hot reload tidak melewatinya)
+- deck[:cursor] = sudah keluar di ronde ini, deck[cursor:] = belum (urutannya tidak
+  penting karena j selalu acak). Setelah semua keluar, ronde baru dimulai dan soal
+  terakhir ronde lalu tidak boleh langsung keluar lagi
+- memori O(n): 8 byte per soal
+- daftar id berubah (edit / hot reload): deck disinkronkan saat draw berikutnya,
+  soal yang sudah keluar tetap dianggap sudah keluar, soal baru masuk ke sisa deck
+- posisi disimpan ke sampler_state.npz saat game keluar (tulis ke file sementara
+  lalu os.replace) dan dilanjutkan di sesi berikutnya
+
+Contoh:
+    sampler = QuestionSampler()
+    question_id = sampler.draw("sentence/Present/easy", bank.sentence_ids("Present", "easy"))
+    sampler.save()
+"""
+
+import os
+import random
+from pathlib import Path
+
+import numpy as np
+
+SAMPLER_PATH = Path(__file__).parent / "sampler_state.npz"
+
+
+class Deck:
+    def __init__(self, ids, cursor=0, last=-1, rounds=0):
+        self.ids = ids
+        self.cursor = cursor
+        self.last = last  # id terakhir yang keluar (-1 = belum ada)
+        self.rounds = rounds
+        self.picked = 0  # ids[cursor:cursor + picked] sudah dipilih acak oleh peek()
+        self.source = None  # daftar id yang terakhir disinkronkan (cek identitas, murah)
+
+    def sync(self, source):
+        """Samakan isi deck dengan daftar id terbaru, posisi ronde dipertahankan"""
+        current = np.asarray(source, dtype=np.int64)
+        drawn, remaining = self.ids[:self.cursor], self.ids[self.cursor:]
+        drawn = drawn[np.isin(drawn, current)]
+        remaining = remaining[np.isin(remaining, current)]
+        added = current[~np.isin(current, self.ids)]
+        self.ids = np.concatenate([drawn, remaining, added])
+        self.cursor = len(drawn)
+        self.picked = 0
+        self.source = source
+
+    def _pick(self, i):
+        """Tukar soal acak dari sisa deck ke posisi i"""
+        n = len(self.ids)
+        j = random.randrange(i, n)
+        if i == 0 and n > 1 and self.ids[j] == self.last:
+            # Awal ronde: soal terakhir ronde lalu tidak langsung diulang
+            j = (j + 1 + random.randrange(n - 1)) % n
+        ids = self.ids
+        ids[i], ids[j] = ids[j], ids[i]
+
+    def _start_round(self):
+        if self.cursor >= len(self.ids):
+            self.cursor = 0
+            self.picked = 0
+            self.rounds += 1
+
+    def draw(self):
+        n = len(self.ids)
+        if n == 0:
+            return None
+        self._start_round()
+        i = self.cursor
+        if self.picked:
+            self.picked -= 1
+        else:
+            self._pick(i)
+        self.cursor = i + 1
+        self.last = int(self.ids[i])
+        return self.last
+
+    def peek(self, count):
+        """Maksimal count id yang akan keluar berikutnya (urutan draw), tanpa mengambilnya.
+        Tidak melewati akhir ronde"""
+        if len(self.ids) == 0:
+            return []
+        self._start_round()
+        end = min(self.cursor + count, len(self.ids))
+        for i in range(self.cursor + self.picked, end):
+            self._pick(i)
+        self.picked = max(self.picked, end - self.cursor)
+        return self.ids[self.cursor:end].tolist()
+
+    def take(self, question_id):
+        """Keluarkan soal tertentu dari sisa deck (bukan yang acak). Return False jika
+        soal itu sudah keluar di ronde ini atau tidak ada di deck"""
+        rest = np.flatnonzero(self.ids[self.cursor:] == question_id)
+        if len(rest) == 0:
+            return False
+        i, k = self.cursor, self.cursor + int(rest[0])
+        ids = self.ids
+        ids[i], ids[k] = ids[k], ids[i]
+        # Urutan hasil peek hanya tetap jika yang diambil memang soal berikutnya
+        self.picked = self.picked - 1 if k == i and self.picked else 0
+        self.cursor = i + 1
+        self.last = int(question_id)
+        return True
+
+
+class QuestionSampler:
+    def __init__(self, path=SAMPLER_PATH):
+        # path None = tanpa persistensi (mis. replay yang harus deterministik)
+        self.path = Path(path) if path is not None else None
+        self.decks = {}
+        self.load()
+
+    def _deck(self, key, ids):
+        deck = self.decks.get(key)
+        if deck is None:
+            deck = self.decks[key] = Deck(np.asarray(ids, dtype=np.int64).copy())
+            deck.source = ids
+        elif deck.source is not ids:
+            deck.sync(ids)
+        return deck
+
+    def draw(self, key, ids):
+        """Id soal berikutnya dari deck key (ids = daftar id terbaru), atau None jika kosong"""
+        return self._deck(key, ids).draw()
+
+    def peek(self, key, ids, count):
+        """Maksimal count id berikutnya dari deck key tanpa mengambilnya (lihat Deck.peek)"""
+        return self._deck(key, ids).peek(count)
+
+    def load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with np.load(self.path) as data:
+                for name in data.files:
+                    if not name.endswith(":ids"):
+                        continue
+                    key = name[:-len(":ids")]
+                    cursor, last, rounds = (int(v) for v in data[f"{key}:state"])
+                    self.decks[key] = Deck(data[name].astype(np.int64), cursor, last, rounds)
+            print(f"[OK] Question sampler: resumed {len(self.decks)} decks")
+        except Exception as e:
+            print(f"[!] Cannot load sampler state ({e}), starting fresh decks")
+            self.decks = {}
+
+    def save(self):
+        """Simpan posisi semua deck (atomic: file sementara + os.replace)"""
+        if self.path is None or not self.decks:
+            return
+        arrays = {}
+        for key, deck in self.decks.items():
+            arrays[f"{key}:ids"] = deck.ids
+            arrays[f"{key}:state"] = np.array([deck.cursor, deck.last, deck.rounds], dtype=np.int64)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[X] Cannot save sampler state: {e}")
+
+    def report(self):
+        for key, deck in self.decks.items():
+            print(f"[STATS] Sampler {key}: {deck.cursor}/{len(deck.ids)} seen this round, "
+                  f"round {deck.rounds + 1}")
@@ -1,10 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from PIL import Image, ImageTk
-import json
-import shutil
 from pathlib import Path
 import sys
+import time
+
+from asset_store import store_file
+from question_bank import QuestionBank
+from thumbnails import ThumbnailCache, bank_images
 
 class QuizEditor:
     def __init__(self, root, mode="sentence"):
@@ -14,11 +17,12 @@ class QuizEditor:
         self.root.geometry("1000x750")
         self.root.resizable(True, True)
         
-        # Data
-        self.data = {}
+        # Data (bank soal SQLite, listbox hanya memegang id baris)
+        self.bank = None
+        self.row_ids = []
         self.current_category = None
         self.current_difficulty = None
-        self.current_index = -1
+        self.current_id = None
         
         # Image preview
         self.blurred_preview = None
@@ -26,7 +30,6 @@ class QuizEditor:
         
         # Paths
         self.base_path = Path(__file__).parent
-        self.json_path = self.base_path / ("quiz_data.json" if mode == "sentence" else "guess_data.json")
         self.assets_path = self.base_path / "assets" / "guess_game"
         
         # Create assets folders if not exist
@@ -37,6 +40,13 @@ class QuizEditor:
         # Load data
         self.load_data()
         
+        # Thumbnail preview (on-disk, dibuat di background untuk semua gambar di bank)
+        self.thumbnails = None
+        if mode == "guess":
+            self.thumbnails = ThumbnailCache()
+            if self.bank is not None:
+                self.thumbnails.prefetch(bank_images(self.bank, self.assets_path))
+        
         # Build UI
         self.build_ui()
         
@@ -54,39 +64,25 @@ class QuizEditor:
         style.map('TButton', background=[('active', '#2980B9')])
         
     def load_data(self):
-        """Load quiz data"""
+        """Buka bank soal (migrasi sekali dari JSON jika questions.db belum ada)"""
         try:
-            if self.json_path.exists():
-                with open(self.json_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
-                print(f"[OK] Loaded data from {self.json_path}")
-            else:
-                if self.mode == "sentence":
-                    self.data = {
-                        "Present": {"easy": [], "medium": [], "hard": []},
-                        "Past": {"easy": [], "medium": [], "hard": []},
-                        "Future": {"easy": [], "medium": [], "hard": []},
-                        "Past Future": {"easy": [], "medium": [], "hard": []}
-                    }
-                else:  # guess
-                    self.data = []
-                self.save_data()
-                print(f"[OK] Created new data file: {self.json_path}")
+            self.bank = QuestionBank()
+            print(f"[OK] Loaded data from {self.bank.path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {e}")
-            self.data = {} if self.mode == "sentence" else []
     
-    def save_data(self):
-        """Save quiz data"""
+    def commit_edit(self, edit, *args):
+        """Jalankan satu edit baris (satu transaksi di bank). Return hasilnya, atau None jika gagal"""
         try:
-            with open(self.json_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            start = time.perf_counter()
+            result = edit(*args)
+            save_ms = (time.perf_counter() - start) * 1000
             messagebox.showinfo("Success", "✅ Data saved successfully!")
-            print(f"[OK] Data saved to {self.json_path}")
-            return True
+            print(f"[OK] Data saved to {self.bank.path} ({save_ms:.1f} ms)")
+            return True if result is None else result
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {e}")
-            return False
+            return None
     
     def build_ui(self):
         """Build user interface"""
@@ -471,26 +467,29 @@ class QuizEditor:
         category = self.category_var.get()
         difficulty = self.difficulty_var.get()
         
-        questions = self.data.get(category, {}).get(difficulty, [])
+        # Hanya id + teks soal (tanpa parse words/answer), isi lengkap dibaca saat dipilih
+        rows = self.bank.list_sentences(category, difficulty)
+        self.row_ids = [question_id for question_id, _ in rows]
         
-        for i, q in enumerate(questions):
-            question_text = q.get("question", "No question")
+        for i, (_, question_text) in enumerate(rows):
             display_text = f"{i+1}. {question_text[:45]}..."
             self.questions_listbox.insert(tk.END, display_text)
         
         # Update count
-        self.count_label.config(text=f"Total: {len(questions)} questions")
+        self.count_label.config(text=f"Total: {len(rows)} questions")
     
     def load_guess_list(self):
         """Load questions list for guess game"""
         self.questions_listbox.delete(0, tk.END)
         
-        for i, q in enumerate(self.data):
-            correct = q.get("correct_answer", "Unknown")
+        rows = self.bank.list_guess()
+        self.row_ids = [question_id for question_id, _ in rows]
+        
+        for i, (_, correct) in enumerate(rows):
             self.questions_listbox.insert(tk.END, f"{i+1}. {correct}")
         
         # Update count
-        self.count_label.config(text=f"Total: {len(self.data)} questions")
+        self.count_label.config(text=f"Total: {len(rows)} questions")
     
     def on_question_select(self, event):
         """Handle question selection in sentence quiz"""
@@ -498,11 +497,11 @@ class QuizEditor:
         if not selection:
             return
         
-        self.current_index = selection[0]
-        
-        category = self.category_var.get()
-        difficulty = self.difficulty_var.get()
-        question = self.data[category][difficulty][self.current_index]
+        self.current_id = self.row_ids[selection[0]]
+        question = self.bank.get_sentence(self.current_id)
+        if question is None:
+            self.load_questions_list()
+            return
         
         # Fill form
         self.question_entry.delete(0, tk.END)
@@ -523,8 +522,11 @@ class QuizEditor:
         if not selection:
             return
         
-        self.current_index = selection[0]
-        question = self.data[self.current_index]
+        self.current_id = self.row_ids[selection[0]]
+        question = self.bank.get_guess(self.current_id)
+        if question is None:
+            self.load_guess_list()
+            return
         
         # Fill form
         self.blurred_entry.config(state="normal")
@@ -558,9 +560,9 @@ class QuizEditor:
         try:
             img_path = self.assets_path / img_type / filename
             if img_path.exists():
-                img = Image.open(img_path)
-                img.thumbnail((200, 150))
-                photo = ImageTk.PhotoImage(img)
+                # Thumbnail dari cache (JPEG kecil), bukan decode gambar full-size
+                with Image.open(self.thumbnails.get(img_path)) as img:
+                    photo = ImageTk.PhotoImage(img)
                 
                 if img_type == "blurred":
                     self.blurred_preview = photo
@@ -573,7 +575,7 @@ class QuizEditor:
     
     def new_question(self):
         """Create new question for sentence quiz"""
-        self.current_index = -1
+        self.current_id = None
         self.question_entry.delete(0, tk.END)
         self.words_entry.delete(0, tk.END)
         self.answer_entry.delete(0, tk.END)
@@ -583,7 +585,7 @@ class QuizEditor:
     
     def new_guess_question(self):
         """Create new question for guess game"""
-        self.current_index = -1
+        self.current_id = None
         
         self.blurred_entry.config(state="normal")
         self.blurred_entry.delete(0, tk.END)
@@ -645,16 +647,16 @@ class QuizEditor:
         category = self.category_var.get()
         difficulty = self.difficulty_var.get()
         
-        if self.current_index >= 0:
-            # Update existing
-            self.data[category][difficulty][self.current_index] = question_data
+        if self.current_id is not None:
+            # Update existing (satu baris)
+            saved = self.commit_edit(self.bank.update_sentence, self.current_id, question_data)
             action = "updated"
         else:
             # Add new
-            self.data[category][difficulty].append(question_data)
+            saved = self.commit_edit(self.bank.add_sentence, category, difficulty, question_data)
             action = "added"
         
-        if self.save_data():
+        if saved:
             self.load_questions_list()
             self.new_question()
             print(f"[OK] Question {action} successfully")
@@ -682,50 +684,60 @@ class QuizEditor:
             "correct_answer": correct
         }
         
-        if self.current_index >= 0:
-            # Update
-            self.data[self.current_index] = question_data
+        if self.current_id is not None:
+            # Update (derivative dari asset pipeline tetap dipakai selama original tidak diganti)
+            previous = self.bank.get_guess(self.current_id) or {}
+            if previous.get("assets") and previous.get("original_image") == original:
+                question_data["assets"] = previous["assets"]
+            saved = self.commit_edit(self.bank.update_guess, self.current_id, question_data)
             action = "updated"
         else:
             # Add new
-            self.data.append(question_data)
+            saved = self.commit_edit(self.bank.add_guess, question_data)
             action = "added"
         
-        if self.save_data():
+        if saved:
             self.load_guess_list()
             self.new_guess_question()
             print(f"[OK] Question {action} successfully")
     
     def delete_question(self):
         """Delete question from sentence quiz"""
-        if self.current_index < 0:
+        if self.current_id is None:
             messagebox.showwarning("Warning", "⚠️ Please select a question to delete!")
             return
         
         if messagebox.askyesno("Confirm", "🗑️ Are you sure you want to delete this question?"):
-            category = self.category_var.get()
-            difficulty = self.difficulty_var.get()
-            del self.data[category][difficulty][self.current_index]
-            
-            if self.save_data():
+            if self.commit_edit(self.bank.delete_sentence, self.current_id):
                 self.load_questions_list()
                 self.new_question()
                 print("[OK] Question deleted")
     
     def delete_guess_question(self):
         """Delete question from guess game"""
-        if self.current_index < 0:
+        if self.current_id is None:
             messagebox.showwarning("Warning", "⚠️ Please select a question to delete!")
             return
         
         if messagebox.askyesno("Confirm", "🗑️ Are you sure you want to delete this question?"):
-            del self.data[self.current_index]
-            
-            if self.save_data():
+            if self.commit_edit(self.bank.delete_guess, self.current_id):
                 self.load_guess_list()
                 self.new_guess_question()
                 print("[OK] Question deleted")
     
+    def preview_when_ready(self, previews):
+        """Preview gambar yang baru di-import: thumbnail dibuat oleh prefetch (bukan di
+        thread Tk), lalu ditampilkan jika gambar itu masih dipilih. previews: [(filename, img_type)]"""
+        entries = {"original": self.original_entry, "blurred": self.blurred_entry}
+
+        def show():
+            for filename, img_type in previews:
+                if entries[img_type].get() == filename:
+                    self.load_image_preview(filename, img_type)
+
+        self.thumbnails.prefetch([self.assets_path / img_type / filename for filename, img_type in previews],
+                                 done=lambda: self.root.after(0, show))
+    
     def browse_blurred(self):
         """Browse and copy blurred image"""
         filename = filedialog.askopenfilename(
@@ -734,22 +746,17 @@ class QuizEditor:
         )
         
         if filename:
-            src = Path(filename)
-            # Create unique filename
-            import time
-            timestamp = int(time.time())
-            dst_name = f"blurred_{timestamp}_{src.name}"
-            dst = self.assets_path / "blurred" / dst_name
-            
             try:
-                shutil.copy(src, dst)
+                # Nama file = hash isi: gambar yang sama tidak disalin dua kali
+                dst_name, _ = store_file(filename, "blurred", self.assets_path)
+                dst = self.assets_path / "blurred" / dst_name
                 self.blurred_entry.config(state="normal")
                 self.blurred_entry.delete(0, tk.END)
                 self.blurred_entry.insert(0, dst_name)
                 self.blurred_entry.config(state="readonly")
                 
-                # Load preview
-                self.load_image_preview(dst_name, "blurred")
+                # Preview muncul setelah thumbnail-nya dibuat di background
+                self.preview_when_ready([(dst_name, "blurred")])
                 
                 messagebox.showinfo("Success", f"✅ Image copied to:\n{dst}")
                 print(f"[OK] Blurred image copied: {dst_name}")
@@ -764,22 +771,17 @@ class QuizEditor:
         )
         
         if filename:
-            src = Path(filename)
-            # Create unique filename
-            import time
-            timestamp = int(time.time())
-            dst_name = f"original_{timestamp}_{src.name}"
-            dst = self.assets_path / "original" / dst_name
-            
             try:
-                shutil.copy(src, dst)
+                # Nama file = hash isi: gambar yang sama tidak disalin dua kali
+                dst_name, _ = store_file(filename, "original", self.assets_path)
+                dst = self.assets_path / "original" / dst_name
                 self.original_entry.config(state="normal")
                 self.original_entry.delete(0, tk.END)
                 self.original_entry.insert(0, dst_name)
                 self.original_entry.config(state="readonly")
                 
-                # Load preview
-                self.load_image_preview(dst_name, "original")
+                # Preview muncul setelah thumbnail-nya dibuat di background
+                self.preview_when_ready([(dst_name, "original")])
                 
                 messagebox.showinfo("Success", f"✅ Image copied to:\n{dst}")
                 print(f"[OK] Original image copied: {dst_name}")
@@ -802,11 +804,18 @@ def main():
     
     print("[OK] Editor window opened")
     print("[*] Edit your questions and click Save")
-    print("[*] Remember to reload the game after editing (press 'r')")
+    print("[*] Running games pick up saved edits automatically")
     print(f"{'='*60}\n")
     
     root.mainloop()
     
+    if app.bank is not None:
+        # Isi WAL (save selama sesi) dipindah ke questions.db saat editor ditutup
+        app.bank.checkpoint()
+        app.bank.close()
+    if app.thumbnails is not None:
+        app.thumbnails.report()
+        app.thumbnails.close()
     print("\n[*] Editor closed")
 
 if __name__ == "__main__":
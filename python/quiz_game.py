@@ -1,18 +1,22 @@
+import argparse
 import cv2
-import mediapipe as mp
-import numpy as np
 import math
-import json
+import numpy as np
 import random
-import time
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict
 
-# Initialize MediaPipe
-mp_hands = mp.solutions.hands
-mp_draw = mp.solutions.drawing_utils
+from engine import Game, Widget, parse_game_args, run_game
+from engine.animation import Motion, Slide
+from engine.sprites import SpriteCache
+from engine.ui_layer import UILayer, WidgetLayer
+from engine.layout import LAYOUT, REF_WIDTH, REF_HEIGHT
+from engine.data_watcher import DataWatcher
+from question_bank import DB_PATH, QuestionBank
+from question_sampler import SAMPLER_PATH, QuestionSampler
+from spaced_repetition import ReviewScheduler
 
 @dataclass
 class QuizQuestion:
@@ -23,23 +27,49 @@ class QuizQuestion:
     category: str
     difficulty: str
 
-class Button:
+# Warna penanda pemain di mode dua pemain (cursor, label, strip di word card)
+PLAYER_COLORS = [(255, 180, 80), (80, 160, 255)]
+
+# Drag-and-drop word card: pinch yang dilepas sebelum cursor bergerak TAP_DISTANCE = klik biasa
+TAP_DISTANCE = 40
+# Card yang sedang diangkat tampil sedikit lebih besar
+LIFT_SCALE = 1.1
+# Card dijatuhkan ke baris jawaban jika pusatnya kurang dari ini di atas/bawah baris
+DROP_MARGIN = 40
+
+@dataclass
+class CardDrag:
+    """Card yang sedang di-drag satu pemain (dari word card atau dari baris jawabannya)"""
+    word: int  # index di available_words
+    button: Widget  # word card asal, atau answer card yang diangkat dari baris
+    source: str  # "word" / "answer"
+    grab: tuple  # offset cursor -> pojok kiri atas card
+    start: tuple  # posisi cursor saat pinch dimulai
+    origin: int = None  # posisi asal di baris jawaban (source "answer")
+    gap: int = None  # posisi sisip di baris jawaban, None = cursor di luar baris
+    pos: tuple = None  # posisi cursor terakhir
+
+@dataclass
+class QuizPlayer:
+    """Jawaban dan skor satu pemain (mode dua pemain: masing-masing cursor, jawaban dan skor sendiri)"""
+    index: int
+    color: tuple
+    picked: List[int] = field(default_factory=list)  # index word button, urut sesuai jawaban
+    answer_buttons: list = field(default_factory=list)
+    clear_btn: Widget = None
+    submit_btn: Widget = None
+    score: int = 0
+    submitted: bool = False  # sudah SUBMIT soal sekarang (salah = tidak bisa menjawab lagi)
+    correct: bool = False
+    result: dict = None
+    drag: CardDrag = None
+
+    @property
+    def name(self):
+        return f"P{self.index + 1}"
+
+class Button(Widget):
     """Class untuk button/word card yang bisa diklik - MODERN STYLE"""
-    def __init__(self, x, y, width, height, text, id=None):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.text = text
-        self.id = id
-        self.hovered = False
-        self.selected = False
-        
-    def contains_point(self, x, y):
-        """Check if point is inside button"""
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
-    
     def draw(self, frame, color=None):
         """Draw button with modern style"""
         if color is None:
@@ -52,13 +82,13 @@ class Button:
         
         # Shadow effect
         shadow_offset = 4
-        cv2.rectangle(frame, 
+        LAYOUT.rectangle(frame, 
                      (self.x + shadow_offset, self.y + shadow_offset), 
                      (self.x + self.width + shadow_offset, self.y + self.height + shadow_offset), 
                      (20, 20, 20), -1)
         
         # Draw button background with rounded effect
-        cv2.rectangle(frame, (self.x, self.y), 
+        LAYOUT.rectangle(frame, (self.x, self.y), 
                       (self.x + self.width, self.y + self.height), 
                       color, -1)
         
@@ -73,82 +103,111 @@ class Button:
             border_color = (100, 100, 100)
             thickness = 2
             
-        cv2.rectangle(frame, (self.x, self.y), 
+        LAYOUT.rectangle(frame, (self.x, self.y), 
                       (self.x + self.width, self.y + self.height), 
                       border_color, thickness)
         
-        # Draw text centered - modern font
-        font = cv2.FONT_HERSHEY_DUPLEX
-        font_scale = 0.8
-        thickness = 2
-        text_size = cv2.getTextSize(self.text, font, font_scale, thickness)[0]
-        text_x = self.x + (self.width - text_size[0]) // 2
-        text_y = self.y + (self.height + text_size[1]) // 2
-        
-        # Text shadow
-        cv2.putText(frame, self.text, (text_x + 2, text_y + 2), 
-                    font, font_scale, (0, 0, 0), thickness, cv2.LINE_AA)
-        # Main text
-        cv2.putText(frame, self.text, (text_x, text_y), 
-                    font, font_scale, (255, 255, 255), thickness, cv2.LINE_AA)
+        # Draw text centered - modern font (text + shadow, sprite di-cache)
+        self.draw_label(frame, cv2.FONT_HERSHEY_DUPLEX, 0.8, (255, 255, 255), 2)
 
-class QuizGame:
-    def __init__(self):
-        self.state = "MENU"  # MENU, DIFFICULTY, QUIZ, RESULT
-        self.quiz_data = {}
+class QuizGame(Game):
+    # Draw hand landmarks (minimal, subtle)
+    hand_style = dict(point_color=(100, 255, 150), line_color=(80, 200, 255), thickness=1, radius=2)
+    
+    def __init__(self, sampler_path=SAMPLER_PATH, learner=None, players=1, bank_path=DB_PATH):
+        # State: MENU, DIFFICULTY, QUIZ, RESULT - hanya berubah lewat event (lihat engine/state_machine.py)
+        # players=2: dua tangan di satu kamera berlomba menjawab soal yang sama
+        super().__init__(players)
+        self.bank_path = bank_path  # bank soal lain mis. untuk replay regression test
+        self.bank = None
+        self.question_ids = {}
+        # Soal tidak diulang sampai semua soal category/difficulty sudah keluar
+        self.sampler = QuestionSampler(sampler_path)
+        # --learner NAME: soal dipilih spaced repetition (SM-2), progres disimpan per learner
+        self.scheduler = None
+        self.learner = None
+        if learner and players > 1:
+            print("[!] --learner is ignored in two-player mode")
+        elif learner:
+            self.scheduler = ReviewScheduler()
+            self.learner = self.scheduler.learner(learner)
+            print(f"[OK] Learner {learner}: {len(self.learner.reviews)} items scheduled, "
+                  f"{self.scheduler.due_count(self.learner)} due now")
         self.current_category = None
         self.current_difficulty = None
         self.current_question = None
         self.available_words = []
-        self.answer_sequence = []
-        self.buttons = []
-        self.answer_buttons = []
-        self.score = 0
+        self.players = [QuizPlayer(i, PLAYER_COLORS[i % len(PLAYER_COLORS)]) for i in range(players)]
         self.total_questions = 0
         self.start_time = 0
         self.time_limit = 0
-        
-        # Hand tracking
-        self.finger_pos = None
-        self.is_pinching = False
-        self.last_pinch = False
-        self.pinch_cooldown = 0
+        self.remaining = 0
+        self.result = None  # dihitung sekali saat masuk RESULT
+        self.winner = None  # dua pemain: QuizPlayer yang pertama menjawab benar
         
         # Modern font
         self.font = cv2.FONT_HERSHEY_DUPLEX
         
+        # Retained UI layer untuk layar yang hampir statis
+        self.menu_layer = UILayer("quiz menu")
+        self.difficulty_layer = UILayer("quiz difficulty")
+        # Layar soal: satu overlay untuk semua pemain (soal, label, skor), dibangun ulang
+        # hanya saat soal atau skor pemain berubah (key = id soal + skor)
+        self.quiz_layer = UILayer("quiz question")
+        # Word card: dibangun sekali per soal, card yang hover/pilihannya berubah digambar ulang
+        self.cards_layer = WidgetLayer("quiz cards")
+        # Card yang bergerak (drag, reflow baris jawaban, kembali ke tempatnya): sprite + posisi
+        self.card_sprites = SpriteCache("quiz cards")
+        self.motion = Motion()
+        self.flying = []  # (card, Slide): card yang dilepas meluncur kembali ke word card-nya
+        
         # Load quiz data
         self.load_quiz_data()
+        self.fsm.transition("MENU")
         
     def load_quiz_data(self):
-        """Load quiz data from JSON file"""
+        """Buka bank soal SQLite dan muat daftar id (isi soal dibaca per baris saat dipakai)"""
         try:
-            json_path = Path(__file__).parent / "quiz_data.json"
-            
-            if not json_path.exists():
-                print("[!] quiz_data.json not found!")
-                print("[!] Please create quiz_data.json file")
-                # Create empty structure
-                self.quiz_data = {
-                    "Present": {"easy": [], "medium": [], "hard": []},
-                    "Past": {"easy": [], "medium": [], "hard": []},
-                    "Future": {"easy": [], "medium": [], "hard": []},
-                    "Past Future": {"easy": [], "medium": [], "hard": []}
-                }
-                # Save it
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.quiz_data, f, indent=2, ensure_ascii=False)
-                print("[OK] Created empty quiz_data.json")
-                return
+            self.bank = QuestionBank(self.bank_path)
+            self.question_ids = self.bank.sentence_index()
+            print(f"[OK] Question bank: {self.bank.count_sentences()} questions, "
+                  f"{len(self.bank.categories())} categories")
             
-            with open(json_path, 'r', encoding='utf-8') as f:
-                self.quiz_data = json.load(f)
-            
-            print(f"[OK] Loaded quiz data: {len(self.quiz_data)} categories")
+            # Save dari editor dideteksi dan di-parse di background (hot reload)
+            self.watcher = DataWatcher(self.bank.files(), self.load_question_index, "quiz data")
             
         except Exception as e:
             print(f"[X] Error loading quiz data: {e}")
-            self.quiz_data = {}
+    
+    def load_question_index(self):
+        """Dipanggil di thread watcher, dengan koneksi SQLite sendiri"""
+        bank = QuestionBank(self.bank.path)
+        try:
+            return bank.sentence_index()
+        finally:
+            bank.close()
+    
+    def apply_data(self, question_ids):
+        """Tukar daftar id sekaligus; soal yang sedang dimainkan tidak terganggu"""
+        self.question_ids = question_ids
+        print(f"[OK] Quiz data reloaded: {sum(len(ids) for ids in question_ids.values())} questions")
+    
+    @property
+    def score(self):
+        """Skor pemain pertama (satu-satunya pemain di mode biasa)"""
+        return self.players[0].score
+    
+    @property
+    def answer_sequence(self):
+        """Jawaban pemain pertama"""
+        return self.answer_words(self.players[0])
+    
+    def answer_words(self, player):
+        return [self.available_words[i] for i in player.picked]
+    
+    def get_question_ids(self, category, difficulty):
+        """Id soal (array ringkas) untuk category/difficulty"""
+        return self.question_ids.get((category, difficulty), [])
     
     def open_quiz_editor(self):
         """Open quiz editor GUI"""
@@ -167,7 +226,7 @@ class QuizGame:
             subprocess.Popen([sys.executable, str(editor_path), "sentence"])
             print("[OK] Opening Sentence Quiz Editor...")
             print("[*] Edit your questions in the editor window")
-            print("[*] Press 'r' in this window to reload after editing")
+            print("[*] Saved edits are picked up automatically by the game")
         
         except Exception as e:
             print(f"[X] Error opening editor: {e}")
@@ -176,15 +235,28 @@ class QuizGame:
     
     def draw_text_shadow(self, frame, text, pos, font, scale, color, thickness):
         """Draw text with shadow for better visibility"""
-        x, y = pos
-        # Shadow
-        cv2.putText(frame, text, (x+3, y+3), font, scale, (0, 0, 0), thickness+1, cv2.LINE_AA)
-        # Main text
-        cv2.putText(frame, text, (x, y), font, scale, color, thickness, cv2.LINE_AA)
+        # Shadow +3px, lebih tebal 1; dirender sekali ke sprite oleh TEXT_CACHE
+        LAYOUT.text(frame, text, pos, font, scale, color, thickness,
+                    shadow_offset=3, shadow_thickness=thickness + 1)
     
     def setup_menu(self):
+        """Kembali ke main menu"""
+        self.fsm.transition("MENU")
+    
+    def setup_difficulty(self):
+        """Ke pilihan difficulty untuk self.current_category"""
+        self.fsm.transition("DIFFICULTY")
+    
+    def start_quiz(self):
+        """Mulai soal baru dengan category dan difficulty yang dipilih"""
+        self.fsm.transition("QUIZ")
+    
+    def finish_quiz(self):
+        """Selesaikan soal sekarang (hasil dihitung sekali di enter_result)"""
+        self.fsm.transition("RESULT")
+    
+    def enter_menu(self):
         """Setup main menu buttons"""
-        self.state = "MENU"
         self.buttons = []
         
         categories = ["Present", "Past", "Future", "Past Future"]
@@ -204,9 +276,8 @@ class QuizGame:
         edit_x = 960 - edit_btn_width // 2
         self.buttons.append(Button(edit_x, 880, edit_btn_width, 70, "EDIT QUESTIONS", "edit_quiz"))
     
-    def setup_difficulty(self):
+    def enter_difficulty(self):
         """Setup difficulty selection"""
-        self.state = "DIFFICULTY"
         self.buttons = []
         
         difficulties = ["Easy", "Medium", "Hard"]
@@ -226,23 +297,36 @@ class QuizGame:
         back_x = 960 - 80
         self.buttons.append(Button(back_x, 880, 160, 60, "Back", "back"))
     
-    def start_quiz(self):
+    def enter_quiz(self):
         """Start quiz with selected category and difficulty"""
-        self.state = "QUIZ"
         self.buttons = []
-        self.answer_buttons = []
-        self.answer_sequence = []
+        for player in self.players:
+            player.picked = []
+            player.answer_buttons = []
+            player.submitted = False
+            player.correct = False
+            player.drag = None
+        self.motion.clear()
+        self.flying = []
         
         # Get questions
-        questions = self.quiz_data.get(self.current_category, {}).get(self.current_difficulty, [])
+        question_ids = self.get_question_ids(self.current_category, self.current_difficulty)
         
-        if not questions:
+        if not question_ids:
             print(f"[!] No questions for {self.current_category} - {self.current_difficulty}")
-            self.setup_difficulty()
-            return
+            return "DIFFICULTY"
         
-        # Select random question
-        question_data = random.choice(questions)
+        # Soal jatuh tempo / soal baru untuk learner, atau soal berikutnya dari deck tanpa pengulangan
+        if self.learner is not None:
+            question_id = self.scheduler.next_question(self.learner, self.deck_key(), question_ids)
+        else:
+            question_id = self.sampler.draw(f"sentence/{self.deck_key()}", question_ids)
+        question_data = self.bank.get_sentence(question_id)
+        if question_data is None:
+            # Soal dihapus editor sebelum watcher sempat reload
+            self.watcher.request()
+            print("[!] Question was deleted, reloading list")
+            return "DIFFICULTY"
         
         # Setup question
         self.current_question = question_data
@@ -251,13 +335,15 @@ class QuizGame:
         
         # Timer
         self.time_limit = question_data.get("timer", 30)
-        self.start_time = time.time()
+        self.start_time = self.fsm.entered_at
+        self.remaining = self.time_limit
         
         # Create word buttons
         self.create_word_buttons()
         
         # Create answer area buttons
         self.create_answer_area()
+        self.create_action_buttons()
     
     def create_word_buttons(self):
         """Create buttons for available words - CENTERED, RAISED POSITION"""
@@ -282,7 +368,7 @@ class QuizGame:
             
             # Calculate starting x for centering this row
             total_width = words_in_row * button_width + (words_in_row - 1) * spacing_x
-            start_x = (1920 - total_width) // 2
+            start_x = (REF_WIDTH - total_width) // 2
             
             x = start_x + col * (button_width + spacing_x)
             y = start_y + row * (button_height + spacing_y)
@@ -294,40 +380,244 @@ class QuizGame:
         """Create answer area for selected words"""
         pass
     
-    def update_answer_display(self):
-        """Update answer buttons based on current sequence"""
-        self.answer_buttons = []
+    def create_action_buttons(self):
+        """CLEAR dan SUBMIT per pemain - RAISED POSITION (SUBMIT aktif jika jawaban tidak kosong).
+        Satu pemain: di tengah; dua pemain: pemain 1 di kiri, pemain 2 di kanan"""
+        button_y = 880  # Raised from 980
+        button_height = 60
+        button_spacing = 35
+        clear_width = 160
+        submit_width = 180
+        total_buttons_width = clear_width + button_spacing + submit_width
         
+        for player in self.players:
+            if len(self.players) == 1:
+                start_x = (REF_WIDTH - total_buttons_width) // 2
+            elif player.index == 0:
+                start_x = 150
+            else:
+                start_x = REF_WIDTH - 150 - total_buttons_width
+            player.clear_btn = Button(start_x, button_y, clear_width, button_height, "CLEAR", "clear")
+            player.submit_btn = Button(start_x + clear_width + button_spacing, button_y, 
+                                       submit_width, button_height, "SUBMIT", "submit")
+    
+    def clickable_buttons(self, player=0):
+        """Semua button yang bisa di-hover/klik pemain di state sekarang (word card dipakai bersama)"""
+        if self.state == "QUIZ":
+            player = self.players[player]
+            if player.submitted:
+                return []
+            actions = [player.clear_btn, player.submit_btn] if player.picked else [player.clear_btn]
+            return self.buttons + player.answer_buttons + actions
+        return self.buttons
+    
+    def answer_row_y(self, player):
+        """Baris jawaban: satu pemain di y=320, dua pemain bertumpuk"""
+        return 320 if len(self.players) == 1 else 270 + 150 * player.index
+    
+    def answer_slots(self, player, count):
+        """Posisi x card di baris jawaban untuk count card (di tengah layar)"""
         button_width = 140
-        button_height = 70
         spacing = 15
-        start_y = 320  # Raised position
-        
-        if not self.answer_sequence:
+        total_width = count * button_width + (count - 1) * spacing
+        start_x = (REF_WIDTH - total_width) // 2
+        return [start_x + i * (button_width + spacing) for i in range(count)]
+    
+    def update_answer_display(self, player):
+        """Atur ulang posisi answer card (objek Button tetap, hanya x/y yang berubah).
+
+        Card yang pindah meluncur ke tempat barunya; saat card di-drag di atas baris,
+        ada celah di posisi sisipnya.
+        """
+        gap = player.drag.gap if player.drag is not None else None
+        count = len(player.answer_buttons) + (gap is not None)
+        slots = self.answer_slots(player, count)
+        if gap is not None:
+            del slots[gap]
+        now = self.clock()
+        for i, (btn, x) in enumerate(zip(player.answer_buttons, slots)):
+            btn.id = f"answer_{i}"
+            self.motion.move(btn, x, self.answer_row_y(player), now)
+        self.invalidate_layout()
+    
+    def insert_answer(self, player, word, position, start):
+        """Sisipkan kata ke jawaban; card baru meluncur dari start (pojok kiri atas)"""
+        btn = Button(start[0], start[1], 140, 70, self.available_words[word], "answer")
+        player.picked.insert(position, word)
+        player.answer_buttons.insert(position, btn)
+        self.update_answer_display(player)
+    
+    def return_card(self, card, word, start):
+        """Card yang dilepas meluncur dari start kembali ke word card asalnya (index word,
+        bukan teksnya: kata yang sama bisa muncul di lebih dari satu word card)"""
+        home = self.buttons[word]
+        self.flying.append((card, Slide(start, (home.x, home.y), self.clock())))
+    
+    def remove_answer(self, player, position):
+        """Buang kata dari jawaban, card-nya kembali ke word card"""
+        word = player.picked.pop(position)
+        btn = player.answer_buttons.pop(position)
+        self.return_card(btn, word, self.motion.position(btn, self.clock()))
+        self.update_answer_display(player)
+    
+    def start_drag(self, player, btn, source):
+        """Pinch di word card / answer card: card diangkat dan mengikuti cursor"""
+        pos = self.hands[player.index].pos or (btn.x + btn.width // 2, btn.y + btn.height // 2)
+        x, y = self.motion.position(btn, self.clock())
+        if source == "word":
+            word = int(btn.id.split("_")[1])
+            player.drag = CardDrag(word, btn, source, (x - pos[0], y - pos[1]), pos, pos=pos)
             return
+        # Answer card keluar dari baris; celah tetap di tempatnya sampai cursor bergerak
+        origin = player.answer_buttons.index(btn)
+        player.answer_buttons.pop(origin)
+        word = player.picked.pop(origin)
+        player.drag = CardDrag(word, btn, source, (x - pos[0], y - pos[1]), pos,
+                               origin=origin, gap=origin, pos=pos)
+        self.update_answer_display(player)
+    
+    def drag_card_pos(self, drag):
+        """Pojok kiri atas card yang sedang di-drag (koordinat desain)"""
+        return drag.pos[0] + drag.grab[0], drag.pos[1] + drag.grab[1]
+    
+    def drop_index(self, player, drag):
+        """Posisi sisip di baris jawaban untuk card yang di-drag, atau None jika di luar baris"""
+        x, y = self.drag_card_pos(drag)
+        center_x = x + drag.button.width / 2
+        center_y = y + drag.button.height / 2
+        if abs(center_y - (self.answer_row_y(player) + 35)) > 35 + DROP_MARGIN:
+            return None
+        slots = self.answer_slots(player, len(player.answer_buttons))
+        return sum(1 for slot in slots if slot + 70 < center_x)
+    
+    def update_drags(self):
+        """Satu step drag-and-drop: ikuti cursor selama pinch ditahan, jatuhkan saat dilepas"""
+        for player in self.players:
+            drag = player.drag
+            if drag is None:
+                continue
+            hand = self.hands[player.index]
+            if hand.pos is None:
+                # Tangan hilang: batalkan, card kembali ke tempat asalnya
+                self.drop(player, cancel=True)
+            elif hand.pinching:
+                drag.pos = hand.pos
+                gap = self.drop_index(player, drag)
+                if gap != drag.gap:
+                    drag.gap = gap
+                    self.update_answer_display(player)
+            else:
+                self.drop(player)
+    
+    def drop(self, player, cancel=False):
+        """Lepas card: tap = klik lama (tambah kata / buang kata), di atas baris = sisipkan,
+        di luar baris = card kembali (answer card: kata dibuang)"""
+        drag = player.drag
+        picked = set(player.picked) | ({drag.word} if drag.source == "answer" else set())
+        start = self.drag_card_pos(drag)
+        moved = math.hypot(drag.pos[0] - drag.start[0], drag.pos[1] - drag.start[1])
+        player.drag = None
+        if cancel:
+            if drag.source == "answer":
+                self.insert_answer(player, drag.word, drag.origin, start)
+            else:
+                self.return_card(drag.button, drag.word, start)
+        elif moved < TAP_DISTANCE:
+            if drag.source == "word" and drag.word not in player.picked:
+                # Tap word card: kata ditambahkan di akhir, card meluncur dari word card
+                self.insert_answer(player, drag.word, len(player.picked), (drag.button.x, drag.button.y))
+            elif drag.source == "answer":
+                self.return_card(drag.button, drag.word, start)
+                self.update_answer_display(player)
+        elif drag.gap is not None and drag.word not in player.picked:
+            self.insert_answer(player, drag.word, drag.gap, start)
+        else:
+            self.return_card(drag.button, drag.word, start)
+            self.update_answer_display(player)
+        self.picked_changed(player, picked)
+    
+    def picked_changed(self, player, before):
+        """Jawaban pemain berubah: warna / strip word card yang terkait digambar ulang"""
+        self.sync_word_selection()
+        self.mark_dirty(self.buttons[i] for i in before.symmetric_difference(player.picked))
+        self.invalidate_layout()
+    
+    def sync_word_selection(self):
+        """Satu pemain: word card yang sudah dipakai tampil hijau (dua pemain: strip warna pemain)"""
+        if len(self.players) == 1:
+            picked = set(self.players[0].picked)
+            for i, btn in enumerate(self.buttons):
+                btn.selected = i in picked
+    
+    def deck_key(self):
+        return f"{self.current_category}/{self.current_difficulty}"
+    
+    def answer_quality(self, is_correct):
+        """Kualitas jawaban SM-2 (0..5): benar + cepat = 5, salah = 1, waktu habis tanpa jawaban = 0"""
+        if not is_correct:
+            return 1 if self.players[0].picked else 0
+        used = (self.fsm.entered_at - self.start_time) / max(1, self.time_limit)
+        return 5 if used <= 1 / 3 else 4 if used <= 2 / 3 else 3
+    
+    def check_answer(self, player):
+        """Check if answer is correct (tanpa efek samping, skor diubah di enter_result)"""
+        return self.answer_words(player) == self.current_question["correct_answer"]
+    
+    def enter_result(self):
+        """Hitung hasil SEKALI saat soal selesai; draw_result hanya membaca self.result.
+
+        Dua pemain: pemain pertama yang SUBMIT jawaban benar menang; jika tidak ada
+        (semua salah / waktu habis), jawaban yang sedang disusun ikut dinilai.
+        """
+        self.winner = next((p for p in self.players if p.submitted and p.correct), None)
+        for player in self.players:
+            if self.winner is None and not player.submitted:
+                player.correct = self.check_answer(player)
+            is_correct = player.correct and (self.winner is None or player is self.winner)
+            if is_correct:
+                player.score += 1
+            player.result = {"correct": is_correct, "your_answer": " ".join(self.answer_words(player))}
+        is_correct = self.players[0].result["correct"]
+        self.result = dict(self.players[0].result,
+                           correct_answer=" ".join(self.current_question["correct_answer"]))
+        if self.learner is not None:
+            quality = self.answer_quality(is_correct)
+            due = self.scheduler.record(self.learner, self.deck_key(), self.current_question["id"], quality)
+            print(f"[*] Quality {quality}, next review in {(due - self.scheduler.clock()) / 3600:.1f} h")
+        
+        # Buttons - CENTERED
+        button_y = 850
+        button_width = 220
+        button_height = 80
+        button_spacing = 40
         
-        # Calculate total width and center
-        total_width = len(self.answer_sequence) * button_width + (len(self.answer_sequence) - 1) * spacing
-        start_x = (1920 - total_width) // 2
+        total_width = button_width * 2 + button_spacing
+        start_x = (REF_WIDTH - total_width) // 2
         
-        for i, word in enumerate(self.answer_sequence):
-            x = start_x + i * (button_width + spacing)
-            btn = Button(x, start_y, button_width, button_height, word, f"answer_{i}")
-            self.answer_buttons.append(btn)
+        self.buttons = [
+            Button(start_x, button_y, button_width, button_height, "NEXT", "next"),
+            Button(start_x + button_width + button_spacing, button_y, 
+                   button_width, button_height, "MENU", "menu"),
+        ]
     
-    def check_answer(self):
-        """Check if answer is correct"""
-        correct = self.current_question["correct_answer"]
-        user_answer = self.answer_sequence
-        
-        if user_answer == correct:
-            self.score += 1
-            return True
-        return False
+    def draw_menu_button(self, frame, btn, hovered):
+        if btn.id == "edit_quiz":
+            # Special color for edit button
+            btn.draw(frame, (150, 100, 255) if hovered else (100, 70, 180))
+        else:
+            btn.draw(frame)
     
     def draw_menu(self, frame):
-        """Draw main menu - MODERN STYLE"""
-        h, w = frame.shape[:2]
+        """Draw main menu - bagian statis dari UI layer, tombol yang di-hover digambar langsung"""
+        hovered = self.hovered_buttons()
+        self.menu_layer.draw(frame, tuple(btn.id for btn in hovered),
+                             lambda canvas: self.draw_menu_static(canvas, hovered))
+        for btn in hovered:
+            self.draw_menu_button(frame, btn, True)
+    
+    def draw_menu_static(self, frame, hovered):
+        """Elemen statis main menu - MODERN STYLE"""
+        h, w = REF_HEIGHT, REF_WIDTH
         
         # Title - modern
         title = "ENGLISH SENTENCE QUIZ"
@@ -339,21 +629,36 @@ class QuizGame:
         self.draw_text_shadow(frame, subtitle, (960 - 200, 230), 
                              self.font, 1.0, (200, 200, 200), 2)
         
-        # Draw buttons
+        # Draw buttons (tombol yang di-hover digambar terpisah)
         for btn in self.buttons:
-            if btn.id == "edit_quiz":
-                # Special color for edit button
-                btn.draw(frame, (150, 100, 255) if btn.hovered else (100, 70, 180))
-            else:
-                btn.draw(frame)
+            if btn not in hovered:
+                self.draw_menu_button(frame, btn, False)
         
         # Instructions
         self.draw_text_shadow(frame, "Point and PINCH fingers to select", 
                              (50, h - 40), self.font, 0.8, (255, 255, 255), 2)
     
+    def draw_difficulty_button(self, frame, btn, hovered):
+        if btn.id == "easy":
+            btn.draw(frame, (100, 200, 100) if hovered else (70, 150, 70))
+        elif btn.id == "medium":
+            btn.draw(frame, (255, 200, 80) if hovered else (200, 150, 60))
+        elif btn.id == "hard":
+            btn.draw(frame, (255, 120, 120) if hovered else (200, 80, 80))
+        else:
+            btn.draw(frame)
+    
     def draw_difficulty(self, frame):
-        """Draw difficulty selection - MODERN STYLE"""
-        h, w = frame.shape[:2]
+        """Draw difficulty selection - bagian statis dari UI layer"""
+        hovered = self.hovered_buttons()
+        self.difficulty_layer.draw(frame, (self.current_category, tuple(btn.id for btn in hovered)),
+                                   lambda canvas: self.draw_difficulty_static(canvas, hovered))
+        for btn in hovered:
+            self.draw_difficulty_button(frame, btn, True)
+    
+    def draw_difficulty_static(self, frame, hovered):
+        """Elemen statis difficulty selection - MODERN STYLE"""
+        h, w = REF_HEIGHT, REF_WIDTH
         
         # Title
         title = f"Category: {self.current_category}"
@@ -365,16 +670,10 @@ class QuizGame:
         self.draw_text_shadow(frame, subtitle, (960 - 180, 280), 
                              self.font, 1.1, (200, 200, 200), 2)
         
-        # Draw buttons
+        # Draw buttons (tombol yang di-hover digambar terpisah)
         for btn in self.buttons:
-            if btn.id == "easy":
-                btn.draw(frame, (100, 200, 100) if btn.hovered else (70, 150, 70))
-            elif btn.id == "medium":
-                btn.draw(frame, (255, 200, 80) if btn.hovered else (200, 150, 60))
-            elif btn.id == "hard":
-                btn.draw(frame, (255, 120, 120) if btn.hovered else (200, 80, 80))
-            else:
-                btn.draw(frame)
+            if btn not in hovered:
+                self.draw_difficulty_button(frame, btn, False)
         
         # Info text - modern layout
         info_lines = [
@@ -388,31 +687,36 @@ class QuizGame:
                                  self.font, 0.7, (180, 180, 180), 1)
     
     def draw_quiz(self, frame):
-        """Draw quiz interface - MODERN & MINIMALIST"""
-        h, w = frame.shape[:2]
+        """Draw quiz interface - MODERN & MINIMALIST.
+
+        Teks statis (soal, label, skor) dari satu UI layer untuk semua pemain, dibangun
+        sekali per soal; word card dari widget layer (hanya card dirty yang digambar ulang);
+        jawaban, tombol dan timer digambar langsung.
+        """
+        key = (self.current_question["id"], tuple(p.score for p in self.players))
+        self.quiz_layer.draw(frame, key, self.draw_quiz_static)
         
-        # Timer - top right, modern
-        elapsed = time.time() - self.start_time
-        remaining = max(0, self.time_limit - int(elapsed))
+        # Timer - top right, modern (self.remaining diupdate oleh event "tick")
+        remaining = self.remaining
         
         timer_color = (100, 255, 100) if remaining > 10 else (255, 200, 100) if remaining > 5 else (255, 100, 100)
         
         # Timer background box
         timer_text = f"{remaining}s"
-        timer_size = cv2.getTextSize(timer_text, self.font, 1.5, 3)[0]
+        timer_size = LAYOUT.text_size(timer_text, self.font, 1.5, 3)[0]
         timer_box_x = 1750
         timer_box_y = 40
         timer_box_w = 140
         timer_box_h = 80
         
         # Draw timer box with shadow
-        cv2.rectangle(frame, (timer_box_x + 4, timer_box_y + 4), 
+        LAYOUT.rectangle(frame, (timer_box_x + 4, timer_box_y + 4), 
                      (timer_box_x + timer_box_w + 4, timer_box_y + timer_box_h + 4), 
                      (20, 20, 20), -1)
-        cv2.rectangle(frame, (timer_box_x, timer_box_y), 
+        LAYOUT.rectangle(frame, (timer_box_x, timer_box_y), 
                      (timer_box_x + timer_box_w, timer_box_y + timer_box_h), 
                      (50, 50, 50), -1)
-        cv2.rectangle(frame, (timer_box_x, timer_box_y), 
+        LAYOUT.rectangle(frame, (timer_box_x, timer_box_y), 
                      (timer_box_x + timer_box_w, timer_box_y + timer_box_h), 
                      timer_color, 3)
         
@@ -421,6 +725,58 @@ class QuizGame:
                               timer_box_y + (timer_box_h + timer_size[1]) // 2), 
                              self.font, 1.5, timer_color, 3)
         
+        now = self.clock()
+        for player in self.players:
+            row_y = self.answer_row_y(player)
+            
+            # Draw answer buttons (sprite di posisi animasinya)
+            for btn in player.answer_buttons:
+                self.draw_card(frame, btn, *self.motion.position(btn, now))
+            
+            if player.submitted:
+                self.draw_text_shadow(frame, "WRONG - wait for the other player", (960 - 280, row_y + 45),
+                                     self.font, 0.8, (255, 120, 120), 2)
+            elif not player.picked and player.drag is None:
+                # If no answer yet, show placeholder
+                placeholder = "Click words below to build sentence..."
+                self.draw_text_shadow(frame, placeholder, (960 - 280, row_y + 40), 
+                                     self.font, 0.7, (120, 120, 120), 1)
+            
+            self.draw_action_buttons(frame, player)
+        
+        # Draw word buttons
+        self.cards_layer.draw(frame, self.buttons, self.draw_word_button, dirty=self.dirty)
+        
+        # Card yang kembali ke word card-nya, lalu card yang sedang di-drag (paling atas)
+        for card, slide in self.flying:
+            self.draw_card(frame, card, *slide.position(now))
+        for player in self.players:
+            if player.drag is not None:
+                x, y = self.drag_card_pos(player.drag)
+                btn = player.drag.button
+                sprite = self.card_sprites.get(frame, btn, (btn.text, "lifted"), self.draw_lifted_card, LIFT_SCALE)
+                self.card_sprites.blit_centered(frame, sprite, x + btn.width / 2, y + btn.height / 2)
+    
+    def draw_card(self, frame, btn, x, y):
+        """Card dari sprite cache di (x, y): tidak digambar ulang walaupun bergerak"""
+        sprite = self.card_sprites.get(frame, btn, (btn.text, btn.hovered, btn.selected), self.draw_plain_card)
+        self.card_sprites.blit(frame, sprite, x, y)
+    
+    @staticmethod
+    def draw_plain_card(frame, btn):
+        btn.draw(frame)
+    
+    @staticmethod
+    def draw_lifted_card(frame, btn):
+        """Tampilan card yang sedang diangkat (btn = salinan milik SpriteCache)"""
+        btn.hovered, btn.selected = True, False
+        btn.draw(frame)
+    
+    def draw_quiz_static(self, frame):
+        """Teks layar soal yang tetap sampai soal berikutnya"""
+        h, w = REF_HEIGHT, REF_WIDTH
+        two_players = len(self.players) > 1
+        
         # Question - top, modern
         question_text = self.current_question["question"]
         self.draw_text_shadow(frame, f"Q: {question_text}", (50, 80), 
@@ -430,77 +786,65 @@ class QuizGame:
         self.draw_text_shadow(frame, f"{self.current_category} - {self.current_difficulty.title()}", 
                              (50, 130), self.font, 0.7, (150, 150, 150), 1)
         
-        # Answer area label
-        self.draw_text_shadow(frame, "Your Answer:", (50, 250), 
-                             self.font, 0.9, (100, 200, 255), 2)
-        
-        # Draw answer buttons
-        for btn in self.answer_buttons:
-            btn.draw(frame)
-        
-        # If no answer yet, show placeholder
-        if not self.answer_sequence:
-            placeholder = "Click words below to build sentence..."
-            self.draw_text_shadow(frame, placeholder, (960 - 280, 360), 
-                                 self.font, 0.7, (120, 120, 120), 1)
+        if two_players:
+            # Skor sementara di tengah atas, label pemain di kiri baris jawabannya
+            scores = "  :  ".join(f"{p.name} {p.score}" for p in self.players)
+            self.draw_text_shadow(frame, scores, (960 - 120, 200), self.font, 1.0, (255, 255, 255), 2)
+            for player in self.players:
+                self.draw_text_shadow(frame, player.name, (50, self.answer_row_y(player) + 50),
+                                     self.font, 1.2, player.color, 3)
+        else:
+            # Answer area label
+            self.draw_text_shadow(frame, "Your Answer:", (50, 250), 
+                                 self.font, 0.9, (100, 200, 255), 2)
         
         # Available words label
         self.draw_text_shadow(frame, "Available Words (click to add):", (50, 560), 
                              self.font, 0.9, (200, 200, 200), 2)
         
-        # Draw word buttons
-        for btn in self.buttons:
-            btn.draw(frame)
-        
-        # Submit and Clear buttons - RAISED POSITION, centered
-        button_y = 880  # Raised from 980
-        button_height = 60
-        button_spacing = 35
-        
-        # Clear button (left)
-        clear_width = 160
-        submit_width = 180
-        total_buttons_width = clear_width + button_spacing + submit_width
-        start_x = (1920 - total_buttons_width) // 2
-        
-        clear_btn = Button(start_x, button_y, clear_width, button_height, "CLEAR", "clear")
-        clear_btn.hovered = (self.finger_pos and 
-                            clear_btn.contains_point(self.finger_pos[0], self.finger_pos[1]))
-        clear_btn.draw(frame, (255, 120, 120) if clear_btn.hovered else (180, 80, 80))
-        
-        if clear_btn.hovered and self.is_pinching and not self.last_pinch:
-            self.answer_sequence = []
-            self.update_answer_display()
-            # Restore all words
-            for btn in self.buttons:
-                btn.selected = False
-        
-        # Submit button (right) - only if answer has words
-        if self.answer_sequence:
-            submit_btn = Button(start_x + clear_width + button_spacing, button_y, 
-                              submit_width, button_height, "SUBMIT", "submit")
-            submit_btn.hovered = (self.finger_pos and 
-                                 submit_btn.contains_point(self.finger_pos[0], self.finger_pos[1]))
-            submit_btn.draw(frame, (120, 255, 120) if submit_btn.hovered else (80, 180, 80))
-            
-            # Check if submit clicked
-            if submit_btn.hovered and self.is_pinching and not self.last_pinch:
-                self.finish_quiz()
-        
-        # Time up check
-        if remaining <= 0:
-            self.finish_quiz()
-        
         # Instructions - bottom
-        self.draw_text_shadow(frame, "Pinch to select | Click answer to remove | SUBMIT when done", 
-                             (50, h - 40), self.font, 0.7, (255, 255, 255), 1)
+        if two_players:
+            instructions = "First correct SUBMIT wins | Wrong SUBMIT = out for this question"
+        else:
+            instructions = "Pinch to select | Click answer to remove | SUBMIT when done"
+        self.draw_text_shadow(frame, instructions, (50, h - 40), self.font, 0.7, (255, 255, 255), 1)
+    
+    def draw_word_button(self, frame, btn):
+        """Word card; dua pemain: strip warna di bawah untuk setiap pemain yang sudah memakainya"""
+        btn.draw(frame)
+        if len(self.players) == 1:
+            return
+        index = int(btn.id.split("_")[1])
+        strip_w = (btn.width - 20) // len(self.players)
+        for player in self.players:
+            if index in player.picked:
+                x = btn.x + 10 + player.index * strip_w
+                LAYOUT.rectangle(frame, (x, btn.y + btn.height - 14), 
+                                 (x + strip_w - 4, btn.y + btn.height - 6), player.color, -1)
+    
+    def draw_action_buttons(self, frame, player):
+        """CLEAR (kiri) dan SUBMIT (kanan, hanya jika jawaban tidak kosong) milik pemain"""
+        if player.submitted:
+            return
+        player.clear_btn.draw(frame, (255, 120, 120) if player.clear_btn.hovered else (180, 80, 80))
+        if player.picked:
+            player.submit_btn.draw(frame, (120, 255, 120) if player.submit_btn.hovered else (80, 180, 80))
+        if len(self.players) > 1:
+            # Garis warna pemain di bawah tombolnya
+            x0 = player.clear_btn.x
+            x1 = player.submit_btn.x + player.submit_btn.width
+            y = player.clear_btn.y + player.clear_btn.height + 12
+            LAYOUT.rectangle(frame, (x0, y), (x1, y + 6), player.color, -1)
     
     def draw_result(self, frame):
         """Draw result screen - MODERN"""
-        h, w = frame.shape[:2]
+        if len(self.players) > 1:
+            self.draw_result_players(frame)
+            return
+        h, w = REF_HEIGHT, REF_WIDTH
         
-        # Result
-        is_correct = self.check_answer()
+        # Result (dihitung sekali di enter_result)
+        is_correct = self.result["correct"]
         result_text = "CORRECT!" if is_correct else "WRONG!"
         result_color = (120, 255, 120) if is_correct else (255, 120, 120)
         
@@ -512,240 +856,190 @@ class QuizGame:
                              (150, 350), self.font, 0.9, (255, 255, 255), 2)
         
         # Your answer
-        your_answer = " ".join(self.answer_sequence)
+        your_answer = self.result["your_answer"]
         self.draw_text_shadow(frame, f"Your Answer:", (150, 470), 
                              self.font, 0.8, (200, 200, 200), 1)
         self.draw_text_shadow(frame, your_answer if your_answer else "(empty)", 
                              (150, 530), self.font, 1.1, (255, 255, 150), 2)
         
         # Correct answer
-        correct_answer = " ".join(self.current_question["correct_answer"])
+        correct_answer = self.result["correct_answer"]
         self.draw_text_shadow(frame, f"Correct Answer:", (150, 650), 
                              self.font, 0.8, (200, 200, 200), 1)
         self.draw_text_shadow(frame, correct_answer, 
                              (150, 710), self.font, 1.1, (120, 255, 120), 2)
         
-        # Buttons - CENTERED
-        button_y = 850
-        button_width = 220
-        button_height = 80
-        button_spacing = 40
+        # Buttons NEXT / MENU (dibuat di enter_result)
+        for btn in self.buttons:
+            btn.draw(frame)
+    
+    def draw_result_players(self, frame):
+        """Result dua pemain: pemenang, jawaban dan skor masing-masing"""
+        if self.winner is not None:
+            result_text, result_color = f"PLAYER {self.winner.index + 1} WINS!", self.winner.color
+        else:
+            result_text, result_color = "NO WINNER", (255, 120, 120)
+        self.draw_text_shadow(frame, result_text, (960 - 300, 180), 
+                             self.font, 2.2, result_color, 4)
         
-        total_width = button_width * 2 + button_spacing
-        start_x = (1920 - total_width) // 2
+        self.draw_text_shadow(frame, f"Q: {self.current_question['question']}", 
+                             (150, 300), self.font, 0.9, (255, 255, 255), 2)
+        
+        for player in self.players:
+            y = 400 + player.index * 130
+            answer = player.result["your_answer"] or "(empty)"
+            mark = "correct" if player.result["correct"] else "wrong"
+            self.draw_text_shadow(frame, f"{player.name}  score {player.score}  ({mark})", (150, y), 
+                                 self.font, 0.8, player.color, 2)
+            self.draw_text_shadow(frame, answer, (150, y + 55), self.font, 1.1, (255, 255, 150), 2)
         
-        next_btn = Button(start_x, button_y, button_width, button_height, "NEXT", "next")
-        menu_btn = Button(start_x + button_width + button_spacing, button_y, 
-                         button_width, button_height, "MENU", "menu")
+        self.draw_text_shadow(frame, "Correct Answer:", (150, 680), 
+                             self.font, 0.8, (200, 200, 200), 1)
+        self.draw_text_shadow(frame, self.result["correct_answer"], 
+                             (150, 740), self.font, 1.1, (120, 255, 120), 2)
         
-        for btn in [next_btn, menu_btn]:
-            btn.hovered = (self.finger_pos and 
-                          btn.contains_point(self.finger_pos[0], self.finger_pos[1]))
+        for btn in self.buttons:
             btn.draw(frame)
-            
-            if btn.hovered and self.is_pinching and not self.last_pinch:
-                if btn.id == "next":
-                    self.start_quiz()
-                elif btn.id == "menu":
-                    self.setup_menu()
     
-    def finish_quiz(self):
-        """Finish current quiz"""
-        self.state = "RESULT"
-    
-    def update(self, frame):
-        """Main update loop"""
-        # Update button hovers
-        if self.finger_pos:
-            x, y = self.finger_pos
-            
-            # Update main buttons
-            for btn in self.buttons:
-                btn.hovered = btn.contains_point(x, y)
-                
-                # Handle click
-                if btn.hovered and self.is_pinching and not self.last_pinch and self.pinch_cooldown <= 0:
-                    self.handle_button_click(btn)
-                    self.pinch_cooldown = 15  # Cooldown frames
-        
-        # Update pinch cooldown
-        if self.pinch_cooldown > 0:
-            self.pinch_cooldown -= 1
-        
-        # Draw based on state
-        if self.state == "MENU":
-            self.draw_menu(frame)
-        elif self.state == "DIFFICULTY":
-            self.draw_difficulty(frame)
-        elif self.state == "QUIZ":
-            self.draw_quiz(frame)
-        elif self.state == "RESULT":
-            self.draw_result(frame)
-        
-        # Draw finger pointer - modern style
-        if self.finger_pos:
-            x, y = self.finger_pos
-            if self.is_pinching:
+    def draw_pointer(self, frame):
+        """Draw finger pointer - modern style (dua pemain: cursor berwarna + label pemain)"""
+        two_players = len(self.players) > 1
+        for player, hand in zip(self.players, self.hands):
+            if not hand.pos:
+                continue
+            x, y = hand.pos
+            if hand.pinching:
                 # Pinching - smaller, bright
-                cv2.circle(frame, (x, y), 14, (100, 255, 255), -1, cv2.LINE_AA)
-                cv2.circle(frame, (x, y), 18, (150, 255, 255), 3, cv2.LINE_AA)
+                LAYOUT.circle(frame, (x, y), 14, (100, 255, 255), -1, cv2.LINE_AA)
+                LAYOUT.circle(frame, (x, y), 18, player.color if two_players else (150, 255, 255), 3, cv2.LINE_AA)
             else:
                 # Pointing - larger, subtle
-                cv2.circle(frame, (x, y), 10, (255, 150, 150), -1, cv2.LINE_AA)
-                cv2.circle(frame, (x, y), 15, (255, 200, 200), 2, cv2.LINE_AA)
-    
-    def handle_button_click(self, btn):
-        """Handle button click"""
-        if self.state == "MENU":
-            if btn.id == "edit_quiz":
-                self.open_quiz_editor()
-            else:
-                self.current_category = btn.id
-                self.setup_difficulty()
-        
-        elif self.state == "DIFFICULTY":
-            if btn.id == "back":
-                self.setup_menu()
-            else:
-                self.current_difficulty = btn.id
-                self.start_quiz()
-        
-        elif self.state == "QUIZ":
-            if btn.id.startswith("word_"):
-                # Select word
-                if not btn.selected:
-                    self.answer_sequence.append(btn.text)
-                    btn.selected = True
-                    self.update_answer_display()
-            elif btn.id.startswith("answer_"):
-                # Remove word from answer
-                idx = int(btn.id.split("_")[1])
-                removed_word = self.answer_sequence.pop(idx)
-                # Unselect the word button
-                for word_btn in self.buttons:
-                    if word_btn.text == removed_word and word_btn.selected:
-                        word_btn.selected = False
-                        break
-                self.update_answer_display()
+                LAYOUT.circle(frame, (x, y), 10, player.color if two_players else (255, 150, 150), -1, cv2.LINE_AA)
+                LAYOUT.circle(frame, (x, y), 15, (255, 200, 200), 2, cv2.LINE_AA)
+            if two_players:
+                self.draw_text_shadow(frame, player.name, (x + 22, y - 18), self.font, 0.7, player.color, 2)
+    
+    def draw_overlay(self, frame):
+        """Quit instruction - modern"""
+        LAYOUT.rectangle(frame, (8, 8), (350, 48), (30, 30, 30), -1)
+        LAYOUT.rectangle(frame, (8, 8), (350, 48), (100, 100, 100), 2)
+        self.draw_text_shadow(frame, "Q: Quit | R: Reload", (20, 35), 
+                              self.font, 0.6, (255, 100, 100), 1)
+    
+    def reload(self):
+        """Tombol 'r': paksa reload di background (biasanya sudah otomatis lewat watcher)"""
+        if self.watcher is not None:
+            self.watcher.request()
+    
+    def report(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher.report()
+        self.sampler.save()
+        self.sampler.report()
+        if self.scheduler is not None:
+            self.scheduler.report()
+            self.scheduler.close()
+        self.menu_layer.report()
+        self.difficulty_layer.report()
+        self.quiz_layer.report()
+        self.cards_layer.report()
+        self.card_sprites.report()
+        if len(self.players) > 1:
+            print("[STATS] Scores: " + ", ".join(f"{p.name} {p.score}" for p in self.players))
+    
+    # --- Event handlers (return state tujuan, atau None = tetap) ---
+    def on_menu_click(self, btn, player=0):
+        if btn.id == "edit_quiz":
+            self.open_quiz_editor()
+            return None
+        self.current_category = btn.id
+        return "DIFFICULTY"
+    
+    def on_difficulty_click(self, btn, player=0):
+        if btn.id == "back":
+            return "MENU"
+        self.current_difficulty = btn.id
+        return "QUIZ"
+    
+    def on_quiz_click(self, btn, player=0):
+        player = self.players[player]
+        picked = set(player.picked)
+        if btn.id.startswith("word_"):
+            # Angkat word card (setiap pemain memakai word card bersama, masing-masing sekali);
+            # kata masuk jawaban saat card dilepas (lihat drop)
+            if int(btn.id.split("_")[1]) not in player.picked:
+                self.start_drag(player, btn, "word")
+            return None
+        elif btn.id.startswith("answer_"):
+            # Angkat answer card: dilepas di tempat = buang kata, di baris = pindah posisi
+            self.start_drag(player, btn, "answer")
+            return None
+        elif btn.id == "clear":
+            now = self.clock()
+            for word, card in zip(player.picked, player.answer_buttons):
+                self.return_card(card, word, self.motion.position(card, now))
+            player.picked = []
+            player.answer_buttons = []
+            self.update_answer_display(player)
+        elif btn.id == "submit" and player.picked:
+            player.submitted = True
+            player.correct = self.check_answer(player)
+            # Satu pemain: selalu selesai. Dua pemain: selesai jika benar atau semua sudah salah
+            if len(self.players) == 1 or player.correct or all(p.submitted for p in self.players):
+                return "RESULT"
+        # Word card yang dipakai/dilepas berubah warna (satu pemain) atau strip (dua pemain)
+        self.picked_changed(player, picked)
+        return None
+    
+    def on_quiz_tick(self, now):
+        self.update_drags()
+        self.motion.prune(now)
+        self.flying = [(card, slide) for card, slide in self.flying if not slide.done(now)]
+        self.remaining = max(0, self.time_limit - int(now - self.start_time))
+        # Time up
+        if self.remaining <= 0:
+            return "RESULT"
+        return None
+    
+    def exit_quiz(self):
+        """Soal selesai saat card masih di-drag: answer card kembali ke posisi asalnya"""
+        for player in self.players:
+            drag = player.drag
+            if drag is not None and drag.source == "answer":
+                player.picked.insert(drag.origin, drag.word)
+                player.answer_buttons.insert(drag.origin, drag.button)
+            player.drag = None
+    
+    def on_result_click(self, btn, player=0):
+        if btn.id == "next":
+            return "QUIZ"
+        if btn.id == "menu":
+            return "MENU"
+        return None
 
 def main():
     print("\n" + "=" * 70)
     print("[*] ENGLISH SENTENCE QUIZ - Starting Application (1920x1080)")
     print("=" * 70)
     
-    # Test camera
-    print("[*] Testing camera access...")
-    cap = cv2.VideoCapture(0)
-    
-    if not cap.isOpened():
-        print("[X] ERROR: Cannot access camera!")
-        return
-    
-    print("[OK] Camera accessed successfully!")
-    
-    # Set camera properties to 1920x1080
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-    cap.set(cv2.CAP_PROP_FPS, 30)
+    # --replay memutar rekaman landmark, tanpa kamera dan tanpa MediaPipe
+    # --resolution 1280x720: capture + proses lebih kecil, window tetap 1920x1080
+    args = parse_game_args()
+    # --learner NAME: spaced repetition per learner (progres tersimpan antar sesi)
+    # --players 2: dua pemain di satu kamera, berlomba menjawab soal yang sama
+    quiz_parser = argparse.ArgumentParser(add_help=False)
+    quiz_parser.add_argument("--learner")
+    quiz_parser.add_argument("--players", type=int, choices=(1, 2), default=1)
+    quiz_args = quiz_parser.parse_known_args()[0]
     
     # Initialize game
     print("[*] Initializing quiz game...")
-    game = QuizGame()
-    game.setup_menu()
+    game = QuizGame(learner=quiz_args.learner, players=quiz_args.players)
     print("[OK] Quiz game initialized!")
     
-    # Create window - windowed fullscreen
-    window_name = "English Sentence Quiz - 1920x1080"
-    cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-    cv2.resizeWindow(window_name, 1920, 1080)
-    
-    print("\n[*] Starting main loop...")
-    print("[*] Press 'r' to reload quiz data after editing")
-    print("=" * 70 + "\n")
-    
-    try:
-        with mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        ) as hands:
-            
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                frame = cv2.flip(frame, 1)
-                h, w, c = frame.shape
-                
-                # Process hand
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = hands.process(rgb_frame)
-                
-                game.finger_pos = None
-                game.last_pinch = game.is_pinching
-                game.is_pinching = False
-                
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
-                    
-                    # Get index finger tip
-                    index_tip = hand_landmarks.landmark[8]
-                    thumb_tip = hand_landmarks.landmark[4]
-                    
-                    index_x = int(index_tip.x * w)
-                    index_y = int(index_tip.y * h)
-                    thumb_x = int(thumb_tip.x * w)
-                    thumb_y = int(thumb_tip.y * h)
-                    
-                    game.finger_pos = (index_x, index_y)
-                    
-                    # Check pinch
-                    distance = math.sqrt((index_x - thumb_x)**2 + (index_y - thumb_y)**2)
-                    game.is_pinching = distance < 40
-                    
-                    # Draw hand landmarks (minimal, subtle)
-                    mp_draw.draw_landmarks(
-                        frame, hand_landmarks, mp_hands.HAND_CONNECTIONS,
-                        mp_draw.DrawingSpec(color=(100, 255, 150), thickness=2, circle_radius=2),
-                        mp_draw.DrawingSpec(color=(80, 200, 255), thickness=1)
-                    )
-                
-                # Update game
-                game.update(frame)
-                
-                # Quit instruction - modern
-                cv2.rectangle(frame, (8, 8), (350, 48), (30, 30, 30), -1)
-                cv2.rectangle(frame, (8, 8), (350, 48), (100, 100, 100), 2)
-                game.draw_text_shadow(frame, "Q: Quit | R: Reload", (20, 35), 
-                                     game.font, 0.6, (255, 100, 100), 1)
-
-                # Show frame
-                cv2.imshow(window_name, frame)
-                
-                # Keyboard
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    print("\n[*] Goodbye!\n")
-                    break
-                elif key == ord('r'):
-                    # Reload quiz data
-                    print("\n[*] Reloading quiz data...")
-                    game.load_quiz_data()
-                    game.setup_menu()
-                    print("[OK] Quiz data reloaded!\n")
-    
-    except KeyboardInterrupt:
-        print("\n[*] Interrupted by user")
-    except Exception as e:
-        print(f"\n[X] ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-    finally:
-        print("[*] Cleaning up...")
-        cap.release()
-        cv2.destroyAllWindows()
-        print("[*] Application closed")
+    # Kamera, hand tracking, fixed-timestep loop dan window dari engine
+    run_game(game, "English Sentence Quiz - 1920x1080", args)
 
 if __name__ == "__main__":
     try:
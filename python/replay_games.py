@@ -0,0 +1,233 @@
+"""
+Jalankan logika game secara headless dari rekaman landmark (.hlr).
+
+Tanpa kamera, tanpa MediaPipe dan tanpa window: cocok untuk benchmark throughput
+logika game dan untuk regression test interaksi (misalnya di CI).
+
+Regression suite: replays/expected.json berisi rekaman kecil per game (replays/*.hlr,
+dibuat oleh make_replays.py) beserta hasil yang diharapkan. "all" menjalankan semuanya
+dengan bank soal baru dari quiz_data.json / guess_data.json, jadi hasil tidak bergantung
+pada isi questions.db lokal:
+    python replay_games.py all
+
+Contoh:
+    python replay_games.py quiz sesi.hlr --category Present --difficulty easy
+    python replay_games.py quiz duel.hlr --players 2 --category Present --difficulty easy
+    python replay_games.py guess sesi.hlr --expect-state RESULT --expect-score 1
+    python replay_games.py draw sesi.hlr --expect-detections smile,star
+    python replay_games.py draw kata.hlr --word-mode --expect-words rice
+    python replay_games.py quiz sesi.hlr --immediate   # tanpa UI layer / text cache (A/B)
+    python replay_games.py quiz sesi.hlr --db /tmp/questions.db   # bank soal lain
+
+Exit code 1 jika salah satu --expect-* tidak cocok.
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from engine import GameLoop
+from engine.hand_recording import HandReplay
+from engine.perf_stats import TimingStats
+from engine.text_cache import TEXT_CACHE, TextCache
+from engine.ui_layer import UILayer
+from question_bank import DB_PATH, QuestionBank
+
+REPLAY_DIR = Path(__file__).parent / "replays"
+SUITE_PATH = REPLAY_DIR / "expected.json"
+
+
+def play(replay, loop, stats):
+    """Mainkan semua frame rekaman lewat GameLoop engine (fixed timestep, waktu = timestamp rekaman)"""
+    while True:
+        ret, frame = replay.read()
+        if not ret:
+            break
+        hands = replay.process(frame)
+        start = time.perf_counter()
+        loop.frame_hands(frame, hands, replay.timestamp_ms() / 1000.0)
+        stats.add(time.perf_counter() - start)
+        TEXT_CACHE.end_frame()
+
+
+def run_quiz(replay, args, stats):
+    from quiz_game import QuizGame
+
+    # Tanpa posisi sampler dari sesi sebelumnya, supaya replay deterministik
+    game = QuizGame(sampler_path=None, players=args.players, bank_path=args.db)
+    # Timer memakai waktu simulasi dari timestamp rekaman -> hasil replay deterministik
+    loop = GameLoop(game)
+    game.setup_menu()
+    if args.category:
+        game.current_category = args.category
+        game.setup_difficulty()
+        if args.difficulty:
+            game.current_difficulty = args.difficulty
+            game.start_quiz()
+
+    play(replay, loop, stats)
+    loop.report()
+    if args.players > 1:
+        game.quiz_layer.report()
+        return {"state": game.state, "scores": ",".join(str(p.score) for p in game.players)}
+    return {"state": game.state, "score": game.score}
+
+
+def run_guess(replay, args, stats):
+    from guess_game import GuessGame
+
+    game = GuessGame(sampler_path=None, bank_path=args.db)
+    loop = GameLoop(game)
+    game.setup_menu()
+    game.reveal_mode = args.reveal
+
+    play(replay, loop, stats)
+    loop.report()
+    game.images.shutdown()
+    game.images.report()
+    return {"state": game.state, "score": game.score}
+
+
+def run_draw(replay, args, stats):
+    from finger_draw_emoji import EmojiDrawer, RecognitionWorker
+
+    drawer = EmojiDrawer()
+    recognizer = RecognitionWorker(drawer)
+    if args.word_mode:
+        drawer.toggle_word_mode()
+
+    while True:
+        ret, frame = replay.read()
+        if not ret:
+            break
+        hands = replay.process(frame)
+        start = time.perf_counter()
+        if drawer.canvas is None:
+            drawer.canvas = np.zeros_like(frame)
+        drawer.handle_hand(frame, hands[0] if hands else None, recognizer,
+                           replay.timestamp_ms() / 1000.0)
+        drawer.apply_recognition_results(recognizer)
+        drawer.update_word_mode()
+        drawer.draw_ui(frame)
+        stats.add(time.perf_counter() - start)
+        TEXT_CACHE.end_frame()
+
+    # Tunggu recognition yang masih berjalan di background
+    while recognizer.busy():
+        time.sleep(0.005)
+        drawer.apply_recognition_results(recognizer)
+    recognizer.shutdown()
+
+    if args.word_mode:
+        drawer.update_word_mode(finish_word=True)
+        drawer.writer.recognizer.stats.report()
+        return {"words": ",".join(drawer.word_history)}
+    detections = [d for d in drawer.detection_history if d]
+    return {"detections": ",".join(detections)}
+
+
+GAMES = {"quiz": run_quiz, "guess": run_guess, "draw": run_draw}
+
+
+def run_suite(suite_path=SUITE_PATH):
+    """Jalankan semua kasus di suite, masing-masing di proses sendiri (seed, cache dan
+    state global tidak bocor antar kasus). Return jumlah kasus yang gagal"""
+    suite_path = Path(suite_path)
+    with open(suite_path, encoding="utf-8") as f:
+        cases = json.load(f)
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        # Bank soal baru dari file JSON yang ada di repo
+        db = Path(tmp) / "questions.db"
+        QuestionBank(db).close()
+        for case in cases:
+            cmd = [sys.executable, str(Path(__file__).resolve()), case["game"],
+                   str(suite_path.parent / case["recording"]), *case["args"], "--db", str(db)]
+            start = time.perf_counter()
+            proc = subprocess.run(cmd, cwd=Path(__file__).parent, capture_output=True, text=True)
+            seconds = time.perf_counter() - start
+            if proc.returncode == 0:
+                print(f"[OK] {case['recording']}: {' '.join(case['args'])} ({seconds:.1f} s)")
+                continue
+            failed += 1
+            print(f"[X] {case['recording']}: {' '.join(case['args'])} (exit {proc.returncode})")
+            print(proc.stdout[-2000:] + proc.stderr[-2000:])
+    print(f"[STATS] Replay suite: {len(cases) - failed}/{len(cases)} passed")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless replay of hand-driven games")
+    parser.add_argument("game", choices=sorted(GAMES) + ["all"],
+                        help="Game yang diputar, atau all = regression suite (replays/expected.json)")
+    parser.add_argument("recording", nargs="?",
+                        help="File rekaman .hlr (all: file suite, default replays/expected.json)")
+    parser.add_argument("--db", default=DB_PATH, help="quiz/guess: path questions.db (default: bank soal game)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (urutan soal/opsi)")
+    parser.add_argument("--category", help="quiz: langsung mulai di kategori ini")
+    parser.add_argument("--difficulty", help="quiz: langsung mulai di difficulty ini")
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1,
+                        help="quiz: mode dua pemain (rekaman berisi dua tangan)")
+    parser.add_argument("--expect-state", help="State akhir yang diharapkan (quiz/guess)")
+    parser.add_argument("--expect-score", type=int, help="Skor akhir yang diharapkan (quiz/guess)")
+    parser.add_argument("--expect-detections", help="draw: daftar emoji terdeteksi, dipisah koma")
+    parser.add_argument("--reveal", action="store_true", help="guess: progressive reveal mode")
+    parser.add_argument("--word-mode", action="store_true", help="draw: jalankan mode menulis kata")
+    parser.add_argument("--expect-words", help="draw --word-mode: daftar kata, dipisah koma")
+    parser.add_argument("--immediate", action="store_true",
+                        help="Matikan UI layer + text cache (gambar ulang semua setiap frame, perilaku lama)")
+    args = parser.parse_args()
+
+    if args.game == "all":
+        sys.exit(1 if run_suite(args.recording or SUITE_PATH) else 0)
+    if args.recording is None:
+        parser.error("recording is required")
+
+    if args.immediate:
+        UILayer.enabled = False
+        TextCache.enabled = False
+
+    random.seed(args.seed)
+    replay = HandReplay(args.recording, realtime=False)
+    stats = TimingStats(f"{args.game} logic+draw per frame")
+
+    wall_start = time.perf_counter()
+    result = GAMES[args.game](replay, args, stats)
+    wall = time.perf_counter() - wall_start
+
+    print("\n" + "=" * 70)
+    stats.report()
+    TEXT_CACHE.report(stats)
+    if stats.total > 0:
+        print(f"[STATS] Game-logic throughput: {stats.count / stats.total:.0f} frames/s "
+              f"(wall incl. replay: {stats.count / wall:.0f} frames/s)")
+    for key, value in result.items():
+        print(f"[RESULT] {key}: {value}")
+    print("=" * 70)
+
+    failures = []
+    if args.expect_state is not None and result.get("state") != args.expect_state:
+        failures.append(f"state {result.get('state')!r} != {args.expect_state!r}")
+    if args.expect_score is not None and result.get("score") != args.expect_score:
+        failures.append(f"score {result.get('score')!r} != {args.expect_score!r}")
+    if args.expect_detections is not None and result.get("detections") != args.expect_detections:
+        failures.append(f"detections {result.get('detections')!r} != {args.expect_detections!r}")
+    if args.expect_words is not None and result.get("words") != args.expect_words:
+        failures.append(f"words {result.get('words')!r} != {args.expect_words!r}")
+
+    if failures:
+        for failure in failures:
+            print(f"[X] FAIL: {failure}")
+        sys.exit(1)
+    print("[OK] Replay finished")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Synthetic shape corpus + benchmark untuk shape recognizer finger_draw_emoji.
+
+Generator membuat ribuan stroke (jitter, skala, rotasi, posisi acak) untuk setiap
+entry EMOJI_PATTERNS, merendernya seperti kuas di EmojiDrawer, lalu menjalankan
+recognizer secara paralel (process pool). Hasilnya: confusion matrix, akurasi per
+kelas dan latency per sample. Bisa dipakai sebagai regression gate:
+
+    python shape_corpus.py --samples 300 --min-accuracy 0.70 --max-p95-ms 20
+    python shape_corpus.py --recognizer mymodule:recognize   # recognizer alternatif
+    python shape_corpus.py --json report.json                # simpan laporan
+
+Recognizer alternatif adalah fungsi recognize(canvas) -> emoji_key atau None.
+Exit code 1 jika akurasi / latency melewati batas.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from finger_draw_emoji import EMOJI_PATTERNS, EmojiDrawer
+
+CANVAS_SIZE = (1080, 1920)
+BRUSH_SIZE = 15
+BRUSH_COLOR = (0, 255, 100)
+NONE_LABEL = "none"
+
+
+# ============================
+#   STROKE TEMPLATES (unit box, y ke bawah)
+# ============================
+def _circle(rng):
+    start = rng.uniform(0, 2 * math.pi)
+    ratio = rng.uniform(0.85, 1.15)
+    t = np.linspace(start, start + 2 * math.pi * rng.uniform(1.0, 1.08), 80)
+    return np.stack([0.5 * np.cos(t) * ratio, 0.5 * np.sin(t)], axis=1)
+
+
+def _heart(rng):
+    # Dua lobus (busur lingkaran) bertemu di lekuk atas, sisi lurus turun ke ujung bawah.
+    # Stroke mulai dan selesai di lekuk, seperti orang menggambar hati dalam satu tarikan.
+    r = 0.26
+    c = r * rng.uniform(0.75, 0.95)             # makin besar, lekuk makin dalam
+    cy = -0.5 + r
+    tip = np.array([0.0, rng.uniform(0.45, 0.55)])
+    start = math.atan2(-math.sqrt(r * r - c * c), -c)
+    a = np.linspace(start, math.radians(rng.uniform(15, 35)), 40)
+    lobe = np.stack([c + r * np.cos(a), cy + r * np.sin(a)], axis=1)
+    right = np.concatenate([lobe, tip[None]])
+    left = right[::-1] * np.array([-1, 1])
+    return np.concatenate([left, right[1:]])
+
+
+def _star(rng):
+    # Pentagram satu stroke: sambung setiap titik kedua
+    offset = -math.pi / 2 + rng.uniform(-0.1, 0.1)
+    order = [0, 2, 4, 1, 3, 0]
+    return np.array([[0.5 * math.cos(offset + i * 2 * math.pi / 5),
+                      0.5 * math.sin(offset + i * 2 * math.pi / 5)] for i in order])
+
+
+def _check(rng):
+    bottom_x = rng.uniform(-0.25, -0.05)
+    return np.array([[-0.5, -0.1 + rng.uniform(-0.1, 0.1)],
+                     [bottom_x, 0.4],
+                     [0.5, -0.5 + rng.uniform(0, 0.1)]])
+
+
+def _vertical(rng):
+    # Jempol: kepalan tinggi dan sempit (pojok bawah terpotong), ibu jari di atas
+    w = rng.uniform(0.28, 0.36) / 2
+    tip = rng.uniform(-0.05, 0.05)
+    return np.array([[-w, -0.1], [-w, 0.4], [-w + 0.08, 0.5], [w - 0.08, 0.5], [w, 0.4],
+                     [w, -0.1], [w * 0.8, -0.25], [tip, -0.5], [-w * 0.8, -0.25], [-w, -0.1],
+                     [-w, rng.uniform(0.0, 0.1)]])
+
+
+def _square(rng):
+    # Mulai di tengah sisi atas, searah jarum jam; pojok dibulatkan acak seperti gambar tangan
+    corners = np.array([[0.5, -0.5], [0.5, 0.5], [-0.5, 0.5], [-0.5, -0.5]]) + rng.uniform(-0.04, 0.04, (4, 2))
+    pts = [np.array([0.0, -0.5])]
+    t = np.linspace(0, 1, 6)[:, None]
+    for k, corner in enumerate(corners):
+        prev, nxt = (corners[k - 1] if k else pts[0]), corners[(k + 1) % 4]
+        radius = rng.uniform(0.04, 0.2)
+        a = corner + (prev - corner) / np.linalg.norm(prev - corner) * radius
+        b = corner + (nxt - corner) / np.linalg.norm(nxt - corner) * radius
+        pts.extend((1 - t) ** 2 * a + 2 * (1 - t) * t * corner + t ** 2 * b)
+    # Tutup sedikit melewati titik awal
+    pts.append(np.array([rng.uniform(0.05, 0.15), -0.5]))
+    return np.array(pts)
+
+
+def _triangle(rng):
+    return np.array([[0.0, -0.5], [0.5, 0.45], [-0.5, 0.45], [0.0, -0.48]])
+
+
+TEMPLATES = {
+    "circle": _circle,
+    "heart": _heart,
+    "star": _star,
+    "check": _check,
+    "vertical": _vertical,
+    "square": _square,
+    "triangle": _triangle,
+}
+
+
+def _wobble(rng, count, amount):
+    """Jitter di sepanjang stroke: noise yang dihaluskan (seperti cursor setelah filter),
+    bukan noise per titik yang membuat kontur bergerigi"""
+    noise = rng.normal(0, 1, (count + 24, 2))
+    kernel = np.ones(25) / 5.0
+    smooth = np.stack([np.convolve(noise[:, k], kernel, mode="valid") for k in range(2)], axis=1)
+    return smooth[:count] * amount
+
+
+def _resample(points, spacing):
+    """Interpolasi polyline supaya titik berjarak ~spacing (mirip smooth_line)"""
+    out = [points[0]]
+    for p1, p2 in zip(points[:-1], points[1:]):
+        dist = float(np.hypot(*(p2 - p1)))
+        n = max(int(dist / spacing), 1)
+        for i in range(1, n + 1):
+            out.append(p1 + (p2 - p1) * (i / n))
+    return np.array(out)
+
+
+def generate_stroke(emoji_key, seed):
+    """Buat satu stroke (array Nx2 pixel) untuk emoji_key dengan augmentasi acak"""
+    rng = np.random.default_rng(seed)
+    detection = EMOJI_PATTERNS[emoji_key]["detection"]
+    pts = TEMPLATES[detection](rng).astype(np.float64)
+
+    # Rotasi kecil + skala + aspect jitter
+    angle = math.radians(rng.uniform(-15, 15))
+    rot = np.array([[math.cos(angle), -math.sin(angle)], [math.sin(angle), math.cos(angle)]])
+    pts = pts @ rot.T
+    size = rng.uniform(220, 480)
+    pts = pts * size * np.array([rng.uniform(0.9, 1.1), rng.uniform(0.9, 1.1)])
+
+    # Resample seperti gerakan jari, lalu jitter (tremor tangan)
+    pts = _resample(pts, 6.0)
+    pts = pts + _wobble(rng, len(pts), size * 0.005)
+
+    h, w = CANVAS_SIZE
+    center = np.array([rng.uniform(w * 0.3, w * 0.7), rng.uniform(h * 0.35, h * 0.65)])
+    return pts + center
+
+
+def render_stroke(points):
+    """Render stroke ke canvas kosong dengan kuas yang sama seperti EmojiDrawer"""
+    canvas = np.zeros((CANVAS_SIZE[0], CANVAS_SIZE[1], 3), dtype=np.uint8)
+    pts = np.round(points).astype(np.int32).reshape(-1, 1, 2)
+    cv2.polylines(canvas, [pts], False, BRUSH_COLOR, BRUSH_SIZE * 2, cv2.LINE_AA)
+    return canvas
+
+
+# ============================
+#   RECOGNIZERS
+# ============================
+def _emoji_drawer_recognizer():
+    drawer = EmojiDrawer(verbose=False)
+
+    def recognize(canvas):
+        return drawer.detect_emoji_from_drawing(canvas)[0]
+
+    # Exception di dalam detector ditangkap EmojiDrawer sendiri, jadi dihitung dari counter-nya
+    recognize.error_count = lambda: drawer.errors
+    return recognize
+
+
+def load_recognizer(spec):
+    """spec "emoji_drawer" (default) atau "module:function" """
+    if spec == "emoji_drawer":
+        return _emoji_drawer_recognizer()
+    module_name, func_name = spec.split(":", 1)
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+_worker_recognizer = None
+
+
+def _init_worker(spec):
+    global _worker_recognizer
+    # Satu thread OpenCV per proses, paralelisme dari process pool
+    cv2.setNumThreads(1)
+    _worker_recognizer = load_recognizer(spec)
+
+
+def _run_sample(task):
+    emoji_key, seed = task
+    canvas = render_stroke(generate_stroke(emoji_key, seed))
+    error_count = getattr(_worker_recognizer, "error_count", lambda: 0)
+    errors_before = error_count()
+    start = time.perf_counter()
+    try:
+        predicted = _worker_recognizer(canvas)
+        failed = error_count() > errors_before
+    except Exception:
+        predicted, failed = None, True
+    latency = time.perf_counter() - start
+    return emoji_key, predicted or NONE_LABEL, latency, failed
+
+
+# ============================
+#   REPORT
+# ============================
+def build_report(results, labels):
+    columns = labels + [NONE_LABEL]
+    matrix = {t: {p: 0 for p in columns} for t in labels}
+    errors = {t: 0 for t in labels}
+    for true_label, predicted, _, failed in results:
+        errors[true_label] += failed
+        matrix[true_label][predicted if predicted in matrix[true_label] else NONE_LABEL] += 1
+
+    latencies = np.array([r[2] for r in results]) * 1000.0
+    correct = sum(1 for t, p, _, _ in results if t == p)
+    per_class = {t: matrix[t][t] / max(1, sum(matrix[t].values())) for t in labels}
+    return {
+        "samples": len(results),
+        "accuracy": correct / max(1, len(results)),
+        "per_class_accuracy": per_class,
+        "confusion_matrix": matrix,
+        "recognizer_errors": {"total": sum(errors.values()), "per_class": errors},
+        "latency_ms": {
+            "avg": float(latencies.mean()) if len(latencies) else 0.0,
+            "p50": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p95": float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+            "max": float(latencies.max()) if len(latencies) else 0.0,
+        },
+    }
+
+
+def print_report(report, labels):
+    columns = labels + [NONE_LABEL]
+    width = max(len(c) for c in columns) + 2
+    print("\nConfusion matrix (rows = drawn, cols = recognized):")
+    print(" " * width + "".join(f"{c[:width - 1]:>{width}s}" for c in columns) + f"{'acc':>8s}")
+    for t in labels:
+        row = report["confusion_matrix"][t]
+        print(f"{t:<{width}s}" + "".join(f"{row[c]:>{width}d}" for c in columns) +
+              f"{report['per_class_accuracy'][t] * 100:7.1f}%")
+    lat = report["latency_ms"]
+    print(f"\n[STATS] Samples: {report['samples']}  Accuracy: {report['accuracy'] * 100:.1f}%")
+    print(f"[STATS] Latency per sample: avg={lat['avg']:.2f} ms p50={lat['p50']:.2f} ms "
+          f"p95={lat['p95']:.2f} ms max={lat['max']:.2f} ms")
+    errors = report["recognizer_errors"]
+    if errors["total"]:
+        per_class = ", ".join(f"{t}={n}" for t, n in errors["per_class"].items() if n)
+        print(f"[!] Recognizer errors (exception di detector): {errors['total']} samples ({per_class})")
+    else:
+        print("[STATS] Recognizer errors: 0")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic shape corpus benchmark")
+    parser.add_argument("--samples", type=int, default=300, help="Jumlah sample per emoji")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--recognizer", default="emoji_drawer",
+                        help='"emoji_drawer" atau "module:function" untuk recognizer alternatif')
+    parser.add_argument("--min-accuracy", type=float, help="Gagal jika akurasi total di bawah ini (0..1)")
+    parser.add_argument("--max-p95-ms", type=float, help="Gagal jika p95 latency di atas ini")
+    parser.add_argument("--json", help="Simpan laporan ke file JSON")
+    parser.add_argument("--dump", metavar="DIR", help="Simpan beberapa contoh stroke sebagai PNG")
+    args = parser.parse_args()
+
+    labels = list(EMOJI_PATTERNS.keys())
+
+    if args.dump:
+        os.makedirs(args.dump, exist_ok=True)
+        for key in labels:
+            for i in range(3):
+                cv2.imwrite(os.path.join(args.dump, f"{key}_{i}.png"),
+                            render_stroke(generate_stroke(key, args.seed + i)))
+        print(f"[OK] Example strokes written to: {args.dump}")
+
+    tasks = [(key, args.seed * 1000003 + i * 7919 + j)
+             for j, key in enumerate(labels) for i in range(args.samples)]
+    print(f"[*] Running {len(tasks)} samples with '{args.recognizer}' on {args.workers} workers...")
+
+    wall_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(args.recognizer,)) as pool:
+        results = list(pool.map(_run_sample, tasks, chunksize=32))
+    wall = time.perf_counter() - wall_start
+
+    report = build_report(results, labels)
+    report["recognizer"] = args.recognizer
+    report["wall_seconds"] = wall
+    print_report(report, labels)
+    print(f"[STATS] Wall time: {wall:.1f} s ({len(tasks) / wall:.0f} samples/s)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"[OK] Report saved: {args.json}")
+
+    failed = False
+    if args.min_accuracy is not None and report["accuracy"] < args.min_accuracy:
+        print(f"[X] FAIL: accuracy {report['accuracy']:.3f} < {args.min_accuracy}")
+        failed = True
+    if args.max_p95_ms is not None and report["latency_ms"]["p95"] > args.max_p95_ms:
+        print(f"[X] FAIL: p95 latency {report['latency_ms']['p95']:.2f} ms > {args.max_p95_ms} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Spaced repetition (SM-2) per learner untuk soal kalimat QuizGame.
+
+State per (learner, soal): repetitions, interval (hari), easiness factor (EF) dan
+waktu jatuh tempo (due, epoch detik), disimpan di learner_progress.db (SQLite lokal,
+terpisah dari questions.db supaya jawaban tidak memicu hot reload bank soal).
+
+Pemilihan soal per (learner, category/difficulty):
+- heap (due, id) berisi soal yang pernah dijawab -> soal jatuh tempo paling awal
+  didapat O(log n); entry lama (soal sudah dijadwal ulang) dibuang saat muncul di atas
+- jika tidak ada yang jatuh tempo: soal baru (belum pernah dijawab) dari deck
+  Fisher-Yates tanpa pengulangan (question_sampler.Deck); soal baru baru keluar dari
+  deck saat dijawab (record), soal yang ditampilkan tapi tidak dijawab tetap baru
+- jika soal baru juga habis: soal dengan due paling awal (review lebih cepat)
+
+SM-2: kualitas jawaban 0..5. q < 3 = gagal (repetitions direset, soal diulang lagi
+setelah RELEARN_SECONDS, masih di sesi yang sama). q >= 3: interval 1, 6, lalu
+interval x EF hari. EF disesuaikan dengan q (minimal 1.3).
+
+Satu ReviewScheduler bisa memegang banyak learner sekaligus (mis. server kelas):
+state learner dimuat dari DB saat pertama dipakai.
+
+Contoh:
+    scheduler = ReviewScheduler()
+    learner = scheduler.learner("budi")
+    question_id = scheduler.next_question(learner, "Present/easy", bank.sentence_ids("Present", "easy"))
+    scheduler.record(learner, "Present/easy", question_id, quality=4)
+"""
+
+import heapq
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+
+from question_sampler import Deck
+
+PROGRESS_PATH = Path(__file__).parent / "learner_progress.db"
+
+DAY = 24 * 60 * 60
+# Soal yang gagal diulang lagi setelah 5 menit (dalam sesi yang sama)
+RELEARN_SECONDS = 5 * 60
+MIN_EASINESS = 1.3
+START_EASINESS = 2.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS learners (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    answered INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS reviews (
+    learner_id INTEGER NOT NULL,
+    question_id INTEGER NOT NULL,
+    repetitions INTEGER NOT NULL,
+    interval REAL NOT NULL,
+    easiness REAL NOT NULL,
+    due REAL NOT NULL,
+    PRIMARY KEY (learner_id, question_id)
+) WITHOUT ROWID;
+"""
+
+
+def sm2(repetitions, interval, easiness, quality):
+    """Satu langkah SM-2. Return (repetitions, interval hari, easiness); interval 0 = gagal"""
+    easiness = max(MIN_EASINESS, easiness + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if quality < 3:
+        return 0, 0.0, easiness
+    repetitions += 1
+    if repetitions == 1:
+        interval = 1.0
+    elif repetitions == 2:
+        interval = 6.0
+    else:
+        interval = round(interval * easiness)
+    return repetitions, interval, easiness
+
+
+class ReviewQueue:
+    """Heap due + deck soal baru untuk satu (learner, category/difficulty)"""
+    def __init__(self, reviews, ids):
+        self.source = ids
+        current = np.asarray(ids, dtype=np.int64)
+        seen = np.fromiter((question_id in reviews for question_id in current.tolist()),
+                           dtype=bool, count=len(current))
+        self.heap = [(reviews[question_id][3], question_id) for question_id in current[seen].tolist()]
+        heapq.heapify(self.heap)
+        self.new = Deck(current[~seen].copy())
+
+    def push(self, due, question_id):
+        heapq.heappush(self.heap, (due, question_id))
+
+
+class Learner:
+    def __init__(self, learner_id, name, reviews, answered, correct):
+        self.id = learner_id
+        self.name = name
+        self.reviews = reviews  # question_id -> (repetitions, interval, easiness, due)
+        self.answered = answered
+        self.correct = correct
+        self.last = None  # soal yang terakhir dijawab
+        self.queues = {}  # deck key -> ReviewQueue
+
+
+class ReviewScheduler:
+    def __init__(self, path=PROGRESS_PATH, clock=time.time):
+        self.path = Path(path)
+        self.clock = clock
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(SCHEMA)
+        self.learners = {}
+
+    def close(self):
+        self.conn.close()
+
+    def learner(self, name):
+        """Learner (dibuat jika belum ada), state review dimuat sekali"""
+        if name in self.learners:
+            return self.learners[name]
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO learners (name) VALUES (?)", (name,))
+        learner_id, answered, correct = self.conn.execute(
+            "SELECT id, answered, correct FROM learners WHERE name = ?", (name,)).fetchone()
+        rows = self.conn.execute(
+            "SELECT question_id, repetitions, interval, easiness, due FROM reviews "
+            "WHERE learner_id = ?", (learner_id,))
+        reviews = {row[0]: row[1:] for row in rows}
+        learner = self.learners[name] = Learner(learner_id, name, reviews, answered, correct)
+        return learner
+
+    def _queue(self, learner, key, ids):
+        queue = learner.queues.get(key)
+        if queue is None or queue.source is not ids:
+            # Daftar id berubah (edit / hot reload): bangun ulang, state review tetap
+            queue = learner.queues[key] = ReviewQueue(learner.reviews, ids)
+        return queue
+
+    def next_question(self, learner, key, ids, now=None):
+        """Soal berikutnya untuk learner dari deck key (ids = daftar id terbaru), atau None"""
+        now = self.clock() if now is None else now
+        queue = self._queue(learner, key, ids)
+        heap = queue.heap
+        self._drop_stale(learner, heap)
+        if heap and heap[0][0] <= now:
+            return heap[0][1]
+        if queue.new.cursor < len(queue.new.ids):
+            # peek: soal yang tidak dijawab (keluar / waktu habis) tetap di deck
+            return queue.new.peek(1)[0]
+        if not heap:
+            return None
+        # Review lebih cepat: soal yang baru saja dijawab tidak langsung diulang
+        if heap[0][1] == learner.last and len(heap) > 1:
+            top = heapq.heappop(heap)
+            self._drop_stale(learner, heap)
+            question_id = heap[0][1] if heap else top[1]
+            heapq.heappush(heap, top)
+            return question_id
+        return heap[0][1]
+
+    @staticmethod
+    def _drop_stale(learner, heap):
+        """Buang entry lama di puncak heap: soal sudah dijadwal ulang sejak entry dibuat"""
+        while heap and learner.reviews[heap[0][1]][3] != heap[0][0]:
+            heapq.heappop(heap)
+
+    def record(self, learner, key, question_id, quality, now=None):
+        """Simpan hasil jawaban (kualitas 0..5) dalam satu transaksi. Return due berikutnya"""
+        now = self.clock() if now is None else now
+        repetitions, interval, easiness, _ = learner.reviews.get(
+            question_id, (0, 0.0, START_EASINESS, now))
+        repetitions, interval, easiness = sm2(repetitions, interval, easiness, quality)
+        due = now + (interval * DAY if interval else RELEARN_SECONDS)
+        learner.reviews[question_id] = (repetitions, interval, easiness, due)
+        queue = learner.queues.get(key)
+        if queue is not None:
+            queue.new.take(question_id)
+            queue.push(due, question_id)
+        learner.last = question_id
+        learner.answered += 1
+        learner.correct += quality >= 3
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO reviews (learner_id, question_id, repetitions, interval, "
+                "easiness, due) VALUES (?, ?, ?, ?, ?, ?)",
+                (learner.id, question_id, repetitions, interval, easiness, due))
+            self.conn.execute("UPDATE learners SET answered = ?, correct = ? WHERE id = ?",
+                              (learner.answered, learner.correct, learner.id))
+        return due
+
+    def due_count(self, learner, now=None):
+        now = self.clock() if now is None else now
+        return sum(1 for review in learner.reviews.values() if review[3] <= now)
+
+    def report(self):
+        for learner in self.learners.values():
+            print(f"[STATS] Learner {learner.name}: {learner.correct}/{learner.answered} correct, "
+                  f"{len(learner.reviews)} items scheduled, {self.due_count(learner)} due now")
@@ -0,0 +1,226 @@
+"""
+Cache thumbnail preview untuk editor Tk (guess_editor.py, quiz_editor.py).
+
+Dulu setiap kali soal dipilih, editor membuka gambar full-size lalu thumbnail() di
+event thread Tk. Sekarang thumbnail 200x150 disimpan di disk (assets/thumbnails/),
+nama file = hash isi gambar, jadi:
+- gambar yang sama (nama file berbeda) cukup satu thumbnail
+- gambar yang diganti otomatis mendapat thumbnail baru (hash berubah)
+- thumbnail tetap ada setelah editor ditutup
+
+Thumbnail dibuat di background thread pool saat editor dibuka (semua gambar di bank
+soal) dan saat gambar di-import, sehingga saat soal dipilih editor cukup membuka JPEG
+kecil. Index (path, mtime, ukuran) -> hash disimpan di index.json supaya pembukaan
+editor berikutnya tidak perlu membaca ulang semua gambar.
+
+Contoh:
+    thumbs = ThumbnailCache()
+    thumbs.prefetch(bank_images(bank, assets_path))
+    img = Image.open(thumbs.get(assets_path / "original" / filename))
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from asset_store import content_hash
+from engine.perf_stats import TimingStats
+
+BASE_DIR = Path(__file__).parent
+THUMB_DIR = BASE_DIR / "assets" / "thumbnails"
+
+THUMB_SIZE = (200, 150)
+JPEG_QUALITY = 85
+
+
+def bank_images(bank, assets_path):
+    """Path semua gambar soal guess di bank (blurred + original), untuk prefetch"""
+    assets_path = Path(assets_path)
+    paths = []
+    for question_id in bank.guess_ids():
+        question = bank.get_guess(question_id) or {}
+        for img_type in ("blurred", "original"):
+            if question.get(f"{img_type}_image"):
+                paths.append(assets_path / img_type / question[f"{img_type}_image"])
+    return paths
+
+
+class ThumbnailCache:
+    """Thumbnail on-disk (key = hash isi) dengan pembuatan di background thread pool"""
+
+    def __init__(self, thumb_dir=THUMB_DIR, size=THUMB_SIZE, workers=None):
+        self.thumb_dir = Path(thumb_dir)
+        self.thumb_dir.mkdir(parents=True, exist_ok=True)
+        self.size = size
+        self.index_path = self.thumb_dir / "index.json"
+        # str(path) -> [mtime_ns, ukuran file, hash]
+        self.index = {}
+        self.index_dirty = False
+        self.lock = threading.Lock()
+        # Menulis index.json berurutan: snapshot terakhir selalu yang terakhir ditulis
+        self.save_lock = threading.Lock()
+        # str(path) -> Future prefetch yang belum selesai (get() menunggu, tidak membuat ulang)
+        self.pending = {}
+        # Decode JPEG/PNG di Pillow melepas GIL, jadi thread pool cukup (tanpa proses)
+        self.executor = ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1),
+                                           thread_name_prefix="thumbnail")
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        self.generate_stats = TimingStats("thumbnail generate")
+        self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def save_index(self):
+        """Tulis index.json (atomic: file sementara lalu replace) jika ada perubahan.
+        Dipanggil dari thread prefetch dan dari close(): penulisan diserialkan save_lock"""
+        with self.save_lock:
+            with self.lock:
+                if not self.index_dirty:
+                    return
+                data = json.dumps(self.index)
+                self.index_dirty = False
+            tmp = self.index_path.with_suffix(".tmp")
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, self.index_path)
+
+    def thumb_path(self, digest):
+        return self.thumb_dir / digest[:2] / f"{digest}.jpg"
+
+    def lookup(self, path):
+        """Thumbnail yang sudah ada untuk path (hanya stat, tanpa membaca gambar), atau None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self.lock:
+            entry = self.index.get(str(path))
+        if entry is None or entry[:2] != [st.st_mtime_ns, st.st_size]:
+            return None
+        thumb = self.thumb_path(entry[2])
+        return thumb if thumb.exists() else None
+
+    def get(self, path):
+        """Path thumbnail untuk gambar path. Jika sedang dibuat oleh prefetch, tunggu hasilnya;
+        jika belum ada sama sekali, dibuat sekarang (sekali saja)"""
+        thumb = self.lookup(path)
+        if thumb is not None:
+            self.hits += 1
+            return thumb
+        self.misses += 1
+        with self.lock:
+            future = self.pending.get(str(path))
+        if future is not None:
+            future.result()
+            thumb = self.lookup(path)
+            if thumb is not None:
+                return thumb
+        return self._generate(path)
+
+    def _generate(self, path):
+        start = time.perf_counter()
+        st = os.stat(path)
+        digest = content_hash(path)
+        thumb = self.thumb_path(digest)
+        if not thumb.exists():
+            with Image.open(path) as img:
+                # JPEG: decode langsung di skala kecil (1/2, 1/4, 1/8) sebelum thumbnail()
+                img.draft("RGB", self.size)
+                img.thumbnail(self.size)
+                img = img.convert("RGB")
+                thumb.parent.mkdir(exist_ok=True)
+                # Tulis ke file sementara dulu: thread lain tidak pernah melihat JPEG setengah jadi
+                tmp = thumb.with_name(f"{digest}.{threading.get_ident()}.tmp")
+                img.save(tmp, "JPEG", quality=JPEG_QUALITY)
+                os.replace(tmp, thumb)
+            self.generated += 1
+        with self.lock:
+            self.index[str(path)] = [st.st_mtime_ns, st.st_size, digest]
+            self.index_dirty = True
+        self.generate_stats.add(time.perf_counter() - start)
+        return thumb
+
+    def _prefetch_one(self, path):
+        try:
+            if self.lookup(path) is None:
+                self._generate(path)
+        except Exception as e:
+            print(f"[X] Thumbnail failed for {Path(path).name}: {e}")
+
+    def prefetch(self, paths, done=None):
+        """Buat thumbnail yang belum ada di background. done() dipanggil (dari thread
+        worker) setelah semua selesai; index.json disimpan saat itu"""
+        futures = []
+        submitted = []
+        with self.lock:
+            for path in paths:
+                key = str(path)
+                # Path yang sudah antre tidak di-submit dua kali
+                future = self.pending.get(key)
+                if future is None:
+                    future = self.pending[key] = self.executor.submit(self._prefetch_one, path)
+                    submitted.append((key, future))
+                futures.append(future)
+        # Di luar lock: callback langsung jalan di thread ini jika future sudah selesai
+        for key, future in submitted:
+            future.add_done_callback(lambda _, key=key: self._finished(key))
+
+        def wait():
+            for future in futures:
+                future.result()
+            self.save_index()
+            if done:
+                done()
+
+        threading.Thread(target=wait, daemon=True).start()
+        return futures
+
+    def _finished(self, key):
+        with self.lock:
+            self.pending.pop(key, None)
+
+    def collect_garbage(self, min_age=0, dry_run=False):
+        """Buang entry index untuk gambar yang sudah tidak ada, lalu thumbnail yang tidak
+        dipakai entry mana pun dan lebih tua dari min_age detik. Return (jumlah file, byte)"""
+        with self.lock:
+            gone = [path for path in self.index if not os.path.exists(path)]
+            if not dry_run and gone:
+                for path in gone:
+                    del self.index[path]
+                self.index_dirty = True
+            live = {entry[2] for path, entry in self.index.items() if path not in gone}
+        cutoff = time.time() - min_age
+        count = freed = 0
+        for thumb in self.thumb_dir.glob("*/*.jpg"):
+            st = thumb.stat()
+            if thumb.stem in live or st.st_mtime >= cutoff:
+                continue
+            count += 1
+            freed += st.st_size
+            if not dry_run:
+                thumb.unlink(missing_ok=True)
+        self.save_index()
+        return count, freed
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.save_index()
+
+    def report(self):
+        total = self.hits + self.misses
+        if total == 0 and self.generated == 0:
+            return
+        generate_ms = self.generate_stats.summary()["avg_ms"] if self.generated else 0.0
+        print(f"[STATS] Thumbnails: {len(self.index)} indexed, hit rate "
+              f"{self.hits / max(total, 1):.1%}, {self.generated} generated (avg {generate_ms:.1f} ms)")